@@ -7,5 +7,6 @@ This module contains the database and repository classes for data persistence.
 from .database import Database
 from .path_repository import PathRepository
 from .step_repository import StepRepository
+from .legacy_index import LegacyDocumentIndex
 
-__all__ = ['Database', 'PathRepository', 'StepRepository']
+__all__ = ['Database', 'PathRepository', 'StepRepository', 'LegacyDocumentIndex']
@@ -4,12 +4,42 @@ Database module for FlowPath application.
 Provides SQLite database initialization and connection management.
 """
 
+import itertools
 import sqlite3
 import os
+import threading
+import time
+import weakref
 from pathlib import Path
-from typing import Optional
+from datetime import datetime
+from typing import Dict, List, Optional
 from contextlib import contextmanager
 
+from .migrations import (
+    MIGRATIONS, MigrationContext, MigrationReport, ProgressCallback, create_search_index
+)
+
+
+def parse_timestamp(value) -> Optional[datetime]:
+    """Convert a timestamp column (stored as ISO text) back to a datetime."""
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    return value
+
+
+class _ThreadConnection:
+    """A thread's pooled connection and how deeply connection() is nested on it."""
+    __slots__ = ('conn', 'depth', 'generation', 'key', '__weakref__')
+
+    def __init__(self, key: int):
+        self.conn: Optional[sqlite3.Connection] = None
+        self.depth = 0
+        self.generation = -1
+        self.key = key
+
 
 class Database:
     """
@@ -17,28 +47,65 @@ class Database:
 
     Usage:
         db = Database()  # Uses default location
-        db.initialize()  # Create tables if needed
+        db.initialize()  # Create tables / apply pending migrations
 
         with db.connection() as conn:
             cursor = conn.execute("SELECT * FROM paths")
+
+    By default each thread keeps one long-lived connection that is reused
+    by every connection() call made on that thread, so repositories don't
+    pay the connect/PRAGMA/close cost per query. A thread's connection is
+    closed when the thread exits. Pass pooled=False to get the old
+    open-per-call behaviour.
     """
 
     DEFAULT_DB_NAME = "flowpath.db"
 
-    def __init__(self, db_path: Optional[str] = None):
+    # Column weights used when ranking search results with bm25()
+    SEARCH_WEIGHTS = (10.0, 5.0, 3.0, 1.0)  # title, description, tags, steps
+
+    # Rows per batch when migrations backfill large tables
+    MIGRATION_BATCH_SIZE = 500
+
+    # Every table, children before parents so drops don't trip foreign keys
+    TABLES = (
+        'path_search', 'path_search_dirty', 'path_tags', 'steps', 'paths',
+        'categories', 'tags', 'settings', 'legacy_files', 'legacy_dirs',
+        'schema_version',
+    )
+
+    def __init__(self, db_path: Optional[str] = None, pooled: bool = True):
         """
         Initialize the database manager.
 
         Args:
             db_path: Path to the SQLite database file.
                      If None, uses the default location in user's data directory.
+            pooled: If True, reuse one connection per thread instead of
+                    opening a new connection for every call.
         """
         if db_path is None:
             db_path = self._get_default_db_path()
 
         self.db_path = db_path
+        self.pooled = pooled
+        self.fts_enabled = False  # Set by initialize() if FTS5 is available
         self._ensure_directory_exists()
 
+        # Per-thread connection pool. Entries are keyed by a counter rather
+        # than the thread ident, which is reused once a thread exits.
+        self._local = threading.local()
+        self._pool_lock = threading.Lock()
+        self._pool: Dict[int, sqlite3.Connection] = {}
+        self._pool_keys = itertools.count()
+        self._generation = 0  # Bumped by close_all()
+        self._stats = {
+            'connections_opened': 0,
+            'connections_closed': 0,
+            'checkouts': 0,
+            'reuses': 0,
+        }
+
     def _get_default_db_path(self) -> str:
         """Get the default database path based on the platform."""
         # Use XDG_DATA_HOME on Linux, fallback to ~/.local/share
@@ -59,11 +126,75 @@ class Database:
         if db_dir:
             os.makedirs(db_dir, exist_ok=True)
 
+    def _open_connection(self) -> sqlite3.Connection:
+        """Open and configure a new SQLite connection."""
+        # The pool hands each connection to a single thread, but close_all()
+        # may run on another one, so same-thread checking is disabled.
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row  # Enable dict-like row access
+        conn.execute("PRAGMA foreign_keys = ON")  # Enable foreign key support
+        if self.pooled:
+            # WAL lets readers run alongside a writer; NORMAL sync is safe in WAL
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+        with self._pool_lock:
+            self._stats['connections_opened'] += 1
+        return conn
+
+    def _close_connection(self, conn: sqlite3.Connection) -> None:
+        """Close a connection and record it in the pool stats."""
+        conn.close()
+        with self._pool_lock:
+            self._stats['connections_closed'] += 1
+
+    def _thread_connection(self) -> _ThreadConnection:
+        """The calling thread's pool slot, created on first use."""
+        slot = getattr(self._local, 'slot', None)
+        if slot is None:
+            slot = self._local.slot = _ThreadConnection(next(self._pool_keys))
+            # The thread-local slot is freed when the thread exits; close
+            # the thread's connection with it
+            weakref.finalize(slot, Database._release, weakref.ref(self), slot.key)
+        return slot
+
+    @staticmethod
+    def _release(db_ref: 'weakref.ref[Database]', key: int) -> None:
+        """Close the connection of a thread that has exited."""
+        db = db_ref()
+        if db is None:
+            return
+        with db._pool_lock:
+            conn = db._pool.pop(key, None)
+        if conn is not None:
+            db._close_connection(conn)
+
+    def _checkout(self) -> _ThreadConnection:
+        """Get the calling thread's pool slot, (re)opening its connection if needed."""
+        slot = self._thread_connection()
+        if slot.conn is None or slot.generation != self._generation:
+            # New thread, or close_all() closed the connection it had
+            conn = self._open_connection()
+            with self._pool_lock:
+                stale = self._pool.get(slot.key)
+                self._pool[slot.key] = conn
+                slot.generation = self._generation
+            slot.conn = conn
+            if stale is not None:
+                self._close_connection(stale)
+        else:
+            with self._pool_lock:
+                self._stats['reuses'] += 1
+        return slot
+
     @contextmanager
     def connection(self):
         """
         Context manager for database connections.
 
+        In pooled mode the thread's connection is reused and nested calls
+        share the outermost transaction; only the outermost block commits
+        or rolls back.
+
         Yields:
             sqlite3.Connection: Active database connection
 
@@ -71,123 +202,168 @@ class Database:
             with db.connection() as conn:
                 conn.execute("INSERT INTO paths ...")
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row  # Enable dict-like row access
-        conn.execute("PRAGMA foreign_keys = ON")  # Enable foreign key support
+        with self._pool_lock:
+            self._stats['checkouts'] += 1
+
+        if not self.pooled:
+            conn = self._open_connection()
+            try:
+                yield conn
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                self._close_connection(conn)
+            return
+
+        slot = self._checkout()
+        conn = slot.conn
+        slot.depth += 1
         try:
             yield conn
-            conn.commit()
+            if slot.depth == 1:
+                conn.commit()
         except Exception:
-            conn.rollback()
+            if slot.depth == 1:
+                conn.rollback()
             raise
         finally:
-            conn.close()
+            slot.depth -= 1
+
+    def close(self) -> None:
+        """Close the calling thread's pooled connection, if any."""
+        slot = getattr(self._local, 'slot', None)
+        if slot is None or slot.conn is None:
+            return
+        slot.conn = None
+        with self._pool_lock:
+            conn = self._pool.pop(slot.key, None)
+        if conn is not None:
+            self._close_connection(conn)
+
+    def close_all(self) -> None:
+        """
+        Close every pooled connection, on all threads.
 
-    def initialize(self) -> None:
+        Call this on shutdown, or before replacing the database file.
+        Threads that use the database afterwards transparently reconnect.
         """
-        Initialize the database schema.
+        with self._pool_lock:
+            connections = list(self._pool.values())
+            self._pool.clear()
+            # Other threads notice their connection is gone on next checkout
+            self._generation += 1
+        for conn in connections:
+            self._close_connection(conn)
 
-        Creates all tables if they don't exist.
+    @property
+    def pool_stats(self) -> Dict[str, int]:
         """
-        with self.connection() as conn:
-            self._create_paths_table(conn)
-            self._create_steps_table(conn)
-            self._create_categories_table(conn)
-            self._create_tags_table(conn)
-            self._create_settings_table(conn)
-            self._create_indexes(conn)
-
-    def _create_paths_table(self, conn: sqlite3.Connection) -> None:
-        """Create the paths table."""
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS paths (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                title TEXT NOT NULL,
-                category TEXT DEFAULT '',
-                tags TEXT DEFAULT '',
-                description TEXT DEFAULT '',
-                creator TEXT DEFAULT '',
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
+        Connection pool statistics.
 
-    def _create_steps_table(self, conn: sqlite3.Connection) -> None:
-        """Create the steps table."""
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS steps (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                path_id INTEGER NOT NULL,
-                step_number INTEGER NOT NULL,
-                instructions TEXT DEFAULT '',
-                screenshot_path TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (path_id) REFERENCES paths(id) ON DELETE CASCADE
-            )
-        """)
+        Returns:
+            Dict with connections_opened, connections_closed, open_connections,
+            checkouts and reuses counters
+        """
+        with self._pool_lock:
+            stats = dict(self._stats)
+            stats['open_connections'] = len(self._pool)
+        return stats
 
-    def _create_categories_table(self, conn: sqlite3.Connection) -> None:
-        """Create the categories table for admin-managed categories."""
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS categories (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL UNIQUE,
-                color TEXT DEFAULT '#666666',
-                sort_order INTEGER DEFAULT 0,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
+    def initialize(self, progress: Optional[ProgressCallback] = None) -> None:
+        """
+        Initialize the database schema.
 
-    def _create_tags_table(self, conn: sqlite3.Connection) -> None:
-        """Create the tags table for admin-managed tags."""
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS tags (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL UNIQUE,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
+        Creates the database if needed and applies any pending migrations.
 
-    def _create_settings_table(self, conn: sqlite3.Connection) -> None:
-        """Create the settings table for app configuration."""
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS settings (
-                key TEXT PRIMARY KEY,
-                value TEXT,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
+        Args:
+            progress: Optional callback(migration_name, rows_done, rows_total)
+                      invoked during batched backfills
+        """
+        self.migrate(progress)
+        with self.connection() as conn:
+            self.fts_enabled = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'path_search'"
+            ).fetchone() is not None
+        if not self.fts_enabled:
+            # SQLite lacked FTS5 when the search index migration ran; build
+            # the index now if it has it
+            with self.connection() as conn:
+                if not conn.in_transaction:
+                    conn.execute("BEGIN")
+                ctx = MigrationContext("full-text search index", self.MIGRATION_BATCH_SIZE, progress)
+                self.fts_enabled = create_search_index(conn, ctx)
 
-    def _create_indexes(self, conn: sqlite3.Connection) -> None:
-        """Create database indexes for performance."""
-        # Index for finding steps by path
-        conn.execute("""
-            CREATE INDEX IF NOT EXISTS idx_steps_path_id
-            ON steps(path_id)
-        """)
+    @property
+    def schema_version(self) -> int:
+        """The schema version this database has been migrated to (0 if new)."""
+        with self.connection() as conn:
+            self._create_schema_version_table(conn)
+            return conn.execute(
+                "SELECT COALESCE(MAX(version), 0) FROM schema_version"
+            ).fetchone()[0]
 
-        # Index for ordering steps
-        conn.execute("""
-            CREATE INDEX IF NOT EXISTS idx_steps_path_step
-            ON steps(path_id, step_number)
-        """)
+    def migrate(self, progress: Optional[ProgressCallback] = None) -> List[MigrationReport]:
+        """
+        Apply pending schema migrations in order.
+
+        Each migration runs in its own transaction together with the
+        schema_version row recording it, so a failed migration leaves the
+        database at the previous version. Backfills commit after each
+        batch (see MigrationContext.batches), and are redone if the
+        migration didn't finish.
 
-        # Index for category filtering
+        Args:
+            progress: Optional callback(migration_name, rows_done, rows_total)
+                      invoked during batched backfills
+
+        Returns:
+            A report for each migration applied (empty if up to date)
+        """
+        current = self.schema_version
+        reports = []
+        for migration in MIGRATIONS:
+            if migration.version <= current:
+                continue
+
+            started = time.perf_counter()
+            with self.connection() as conn:
+                # DDL doesn't open a transaction implicitly in sqlite3
+                if not conn.in_transaction:
+                    conn.execute("BEGIN")
+                ctx = MigrationContext(migration.name, self.MIGRATION_BATCH_SIZE, progress)
+                migration.apply(conn, ctx)
+                duration_ms = (time.perf_counter() - started) * 1000
+                conn.execute(
+                    "INSERT INTO schema_version (version, name, duration_ms) VALUES (?, ?, ?)",
+                    (migration.version, migration.name, duration_ms)
+                )
+
+            reports.append(MigrationReport(migration.version, migration.name, duration_ms))
+        return reports
+
+    def _create_schema_version_table(self, conn: sqlite3.Connection) -> None:
+        """Create the table recording applied migrations."""
         conn.execute("""
-            CREATE INDEX IF NOT EXISTS idx_paths_category
-            ON paths(category)
+            CREATE TABLE IF NOT EXISTS schema_version (
+                version INTEGER PRIMARY KEY,
+                name TEXT NOT NULL,
+                applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                duration_ms REAL
+            )
         """)
 
     def reset(self) -> None:
         """
         Reset the database by dropping all tables and recreating them.
 
-        WARNING: This will delete all data!
+        WARNING: This will delete all data, including categories, tags
+        and settings!
         """
         with self.connection() as conn:
-            conn.execute("DROP TABLE IF EXISTS steps")
-            conn.execute("DROP TABLE IF EXISTS paths")
+            for table in self.TABLES:
+                conn.execute(f"DROP TABLE IF EXISTS {table}")
 
         self.initialize()
 
@@ -195,11 +371,18 @@ class Database:
         """
         Create a backup of the database.
 
+        Uses SQLite's online backup API so pages still sitting in the
+        WAL file are included.
+
         Args:
             backup_path: Path where the backup will be saved
         """
-        import shutil
-        shutil.copy2(self.db_path, backup_path)
+        target = sqlite3.connect(backup_path)
+        try:
+            with self.connection() as conn:
+                conn.backup(target)
+        finally:
+            target.close()
 
     @property
     def exists(self) -> bool:
@@ -0,0 +1,232 @@
+"""
+Legacy document index for FlowPath application.
+
+Caches the legacy documents found in the team folder so that listing them
+does not walk a (possibly network-mounted) folder on every call.
+"""
+
+import os
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional, Set
+
+from .database import Database
+from ..models import LegacyDocument, LEGACY_EXTENSIONS
+
+
+class LegacyDocumentIndex:
+    """
+    Incrementally refreshed, persistent index of team-folder documents.
+
+    Every directory under the team folder is recorded with the mtime it had
+    when it was last listed. A scan stats each known directory and only
+    re-lists the ones whose mtime changed (a file or subfolder was added,
+    removed or renamed); unchanged directories are served from the cache.
+    Documents are keyed by path and reused while their (mtime, size) stays
+    the same. The index is stored in the database, so the first scan after
+    startup only stats directories.
+
+    Editing a file in place does not touch its directory's mtime; call
+    invalidate() for such changes, or scan with check_files=True to also
+    stat the known documents of unchanged directories.
+
+    Usage:
+        index = LegacyDocumentIndex(db)
+        docs = index.scan("/mnt/team")
+    """
+
+    # Folders FlowPath writes into itself (conversion output)
+    EXCLUDED_DIRS = {'converted'}
+
+    def __init__(self, database: Database):
+        """
+        Initialize the index.
+
+        Args:
+            database: Database instance for connections
+        """
+        self.db = database
+        self._lock = threading.Lock()
+        self._loaded = False
+        # directory -> mtime_ns when listed, subdirectories, documents by path
+        self._dir_mtimes: Dict[str, int] = {}
+        self._subdirs: Dict[str, List[str]] = {}
+        self._files: Dict[str, Dict[str, LegacyDocument]] = {}
+
+    def scan(self, root: str, check_files: bool = False) -> List[LegacyDocument]:
+        """
+        Get all legacy documents under a folder, refreshing changed directories.
+
+        Subfolders are included; hidden files and folders and EXCLUDED_DIRS
+        are skipped.
+
+        Args:
+            root: Team folder to scan
+            check_files: Also stat every known document, and re-list the
+                         directories of those edited in place. Still much
+                         cheaper than re-listing everything.
+
+        Returns:
+            List of LegacyDocument objects, newest first
+        """
+        root = os.path.normpath(os.path.abspath(root))
+        with self._lock:
+            self._load()
+            docs: List[LegacyDocument] = []
+            pending = [root]
+            while pending:
+                directory = pending.pop()
+                try:
+                    mtime_ns = os.stat(directory).st_mtime_ns
+                except OSError:
+                    self._forget(directory)
+                    continue
+                if (self._dir_mtimes.get(directory) != mtime_ns
+                        or (check_files and self._files_changed(directory))):
+                    self._relist(directory, mtime_ns)
+                docs.extend(self._files.get(directory, {}).values())
+                pending.extend(self._subdirs.get(directory, []))
+
+        docs.sort(key=lambda d: d.modified_at, reverse=True)
+        return docs
+
+    def directories(self, root: str) -> List[str]:
+        """
+        Get the folders under root that the last scan found.
+
+        Args:
+            root: Team folder
+
+        Returns:
+            List of directory paths, root first
+        """
+        root = os.path.normpath(os.path.abspath(root))
+        with self._lock:
+            if root not in self._dir_mtimes:
+                return []
+            found = []
+            pending = [root]
+            while pending:
+                directory = pending.pop()
+                found.append(directory)
+                pending.extend(self._subdirs.get(directory, []))
+        return found
+
+    def invalidate(self, path: Optional[str] = None) -> None:
+        """
+        Force directories to be re-listed on the next scan.
+
+        Args:
+            path: A file or directory that changed. A file invalidates its
+                  directory. If None, every directory is invalidated.
+        """
+        with self._lock:
+            if path is None:
+                self._dir_mtimes.clear()
+                return
+            path = os.path.normpath(os.path.abspath(path))
+            if path not in self._dir_mtimes:
+                path = os.path.dirname(path)
+            self._dir_mtimes.pop(path, None)
+
+    # ==================== Internals ====================
+
+    def _load(self) -> None:
+        """Load the persisted index into memory on first use."""
+        if self._loaded:
+            return
+        with self.db.connection() as conn:
+            for row in conn.execute("SELECT path, parent, mtime_ns FROM legacy_dirs"):
+                self._dir_mtimes[row['path']] = row['mtime_ns']
+                self._subdirs.setdefault(row['path'], [])
+                self._subdirs.setdefault(row['parent'], []).append(row['path'])
+            for row in conn.execute("SELECT filepath, dir, mtime, size FROM legacy_files"):
+                doc = LegacyDocument.from_stat(row['filepath'], row['mtime'], row['size'])
+                if doc:
+                    self._files.setdefault(row['dir'], {})[row['filepath']] = doc
+        self._loaded = True
+
+    def _relist(self, directory: str, mtime_ns: int) -> None:
+        """List one directory and store its documents and subfolders."""
+        cached = self._files.get(directory, {})
+        files: Dict[str, LegacyDocument] = {}
+        subdirs: List[str] = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.startswith('.'):
+                        continue
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in self.EXCLUDED_DIRS:
+                                subdirs.append(os.path.normpath(entry.path))
+                            continue
+                        if os.path.splitext(entry.name)[1].lower() not in LEGACY_EXTENSIONS:
+                            continue
+                        if not entry.is_file():
+                            continue
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    filepath = os.path.normpath(entry.path)
+                    doc = cached.get(filepath)
+                    if (doc is None or doc.size_bytes != stat.st_size
+                            or doc.modified_at != datetime.fromtimestamp(stat.st_mtime)):
+                        doc = LegacyDocument.from_stat(filepath, stat.st_mtime, stat.st_size)
+                    files[filepath] = doc
+        except OSError as e:
+            print(f"Error scanning {directory}: {e}")
+            return
+
+        removed = set(self._subdirs.get(directory, [])) - set(subdirs)
+        for subdir in removed:
+            self._forget(subdir)
+
+        with self.db.connection() as conn:
+            conn.execute("DELETE FROM legacy_files WHERE dir = ?", (directory,))
+            conn.executemany(
+                "INSERT OR REPLACE INTO legacy_files (filepath, dir, mtime, size) VALUES (?, ?, ?, ?)",
+                [(path, directory, doc.modified_at.timestamp(), doc.size_bytes)
+                 for path, doc in files.items()]
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO legacy_dirs (path, parent, mtime_ns) VALUES (?, ?, ?)",
+                (directory, os.path.dirname(directory), mtime_ns)
+            )
+
+        self._dir_mtimes[directory] = mtime_ns
+        self._subdirs[directory] = subdirs
+        self._files[directory] = files
+
+    def _files_changed(self, directory: str) -> bool:
+        """Whether any known document in a directory changed size or mtime."""
+        for filepath, doc in self._files.get(directory, {}).items():
+            try:
+                stat = os.stat(filepath)
+            except OSError:
+                return True
+            if (doc.size_bytes != stat.st_size
+                    or doc.modified_at != datetime.fromtimestamp(stat.st_mtime)):
+                return True
+        return False
+
+    def _forget(self, directory: str) -> None:
+        """Drop a directory and everything below it from the index."""
+        doomed: Set[str] = set()
+        pending = [directory]
+        while pending:
+            current = pending.pop()
+            doomed.add(current)
+            pending.extend(self._subdirs.get(current, []))
+
+        with self.db.connection() as conn:
+            conn.executemany("DELETE FROM legacy_files WHERE dir = ?", [(d,) for d in doomed])
+            conn.executemany("DELETE FROM legacy_dirs WHERE path = ?", [(d,) for d in doomed])
+
+        for current in doomed:
+            self._dir_mtimes.pop(current, None)
+            self._subdirs.pop(current, None)
+            self._files.pop(current, None)
+        parent = self._subdirs.get(os.path.dirname(directory))
+        if parent and directory in parent:
+            parent.remove(directory)
@@ -0,0 +1,421 @@
+"""
+Schema migrations for FlowPath application.
+
+Each migration moves the database schema forward by one version. They are
+applied in order by Database.migrate(), each inside its own transaction.
+
+Rules for adding a migration:
+    - Append it to MIGRATIONS with the next version number
+    - Never edit a migration that has shipped; add a new one instead
+    - Rewrite large tables with MigrationContext.batches() so progress is
+      reported and memory stays bounded
+    - batches() commits after every batch, so a migration using it must be
+      safe to run again over its own partial work (IF NOT EXISTS, OR IGNORE)
+"""
+
+import sqlite3
+import string
+from dataclasses import dataclass
+from typing import Callable, Iterator, List, Optional
+
+
+# Called as progress(migration_name, rows_done, rows_total)
+ProgressCallback = Callable[[str, int, int], None]
+
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+
+def fold_tag(name: str) -> str:
+    """A tag name as SQLite's NOCASE collation compares it (ASCII case folded)."""
+    return name.translate(_ASCII_LOWER)
+
+
+class MigrationContext:
+    """
+    Helpers available to a running migration.
+
+    Attributes:
+        name: Name of the migration being applied
+        batch_size: Rows per batch for batched backfills
+    """
+
+    def __init__(
+        self,
+        name: str,
+        batch_size: int,
+        progress: Optional[ProgressCallback] = None
+    ):
+        self.name = name
+        self.batch_size = batch_size
+        self._progress = progress
+
+    def batches(
+        self,
+        conn: sqlite3.Connection,
+        table: str,
+        columns: str = "",
+        where: str = ""
+    ) -> Iterator[List[sqlite3.Row]]:
+        """
+        Iterate over a table's rows in id order, one batch at a time.
+
+        Uses keyset pagination on the id column, so each batch is an indexed
+        range scan and only one batch is held in memory. Progress is reported
+        and the transaction committed after every batch, so the database
+        isn't locked for the whole backfill; the migration's version is
+        only recorded once it has finished.
+
+        Args:
+            conn: Connection the migration is running on
+            table: Table to read (must have an integer id column)
+            columns: Extra columns to select; id is always included
+            where: Optional extra filter (SQL, without WHERE)
+
+        Yields:
+            Lists of rows, at most batch_size long
+        """
+        select_sql = f"id, {columns}" if columns else "id"
+        filter_sql = f"AND ({where})" if where else ""
+        total = conn.execute(
+            f"SELECT COUNT(*) FROM {table} WHERE 1 {filter_sql}"
+        ).fetchone()[0]
+        done = 0
+        last_id = 0
+        self.report(done, total)
+        while True:
+            rows = conn.execute(
+                f"""
+                SELECT {select_sql} FROM {table}
+                WHERE id > ? {filter_sql}
+                ORDER BY id LIMIT ?
+                """,
+                (last_id, self.batch_size)
+            ).fetchall()
+            if not rows:
+                break
+            yield rows
+            last_id = rows[-1]['id']
+            done += len(rows)
+            if conn.in_transaction:
+                conn.commit()
+                conn.execute("BEGIN")
+            self.report(done, total)
+
+    def report(self, done: int, total: int) -> None:
+        """Forward progress to the caller's callback, if any."""
+        if self._progress is not None:
+            self._progress(self.name, done, total)
+
+
+@dataclass
+class MigrationReport:
+    """
+    Outcome of one applied migration.
+
+    Attributes:
+        version: Schema version reached
+        name: Migration name
+        duration_ms: Wall-clock time the migration took
+    """
+    version: int
+    name: str
+    duration_ms: float
+
+
+@dataclass
+class Migration:
+    """
+    A single schema migration.
+
+    Attributes:
+        version: Schema version this migration upgrades to
+        name: Short description shown in reports
+        apply: Function performing the migration
+    """
+    version: int
+    name: str
+    apply: Callable[[sqlite3.Connection, MigrationContext], None]
+
+
+# ==================== Migrations ====================
+
+def _initial_schema(conn: sqlite3.Connection, ctx: MigrationContext) -> None:
+    """Create the original paths, steps, categories, tags and settings tables."""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS paths (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT NOT NULL,
+            category TEXT DEFAULT '',
+            tags TEXT DEFAULT '',
+            description TEXT DEFAULT '',
+            creator TEXT DEFAULT '',
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS steps (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            path_id INTEGER NOT NULL,
+            step_number INTEGER NOT NULL,
+            instructions TEXT DEFAULT '',
+            screenshot_path TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (path_id) REFERENCES paths(id) ON DELETE CASCADE
+        )
+    """)
+
+    # Admin-managed categories
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS categories (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL UNIQUE,
+            color TEXT DEFAULT '#666666',
+            sort_order INTEGER DEFAULT 0,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+    # Admin-managed tags
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS tags (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL UNIQUE,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+    # App configuration
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS settings (
+            key TEXT PRIMARY KEY,
+            value TEXT,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+    # Index for finding steps by path
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_steps_path_id
+        ON steps(path_id)
+    """)
+
+    # Index for ordering steps
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_steps_path_step
+        ON steps(path_id, step_number)
+    """)
+
+    # Index for category filtering
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_paths_category
+        ON paths(category)
+    """)
+
+
+def _path_tags(conn: sqlite3.Connection, ctx: MigrationContext) -> None:
+    """
+    Add the path_tags join table and fill it from paths.tags.
+
+    paths.tags keeps the comma-separated display string; path_tags is the
+    normalized copy used for filtering and counting. Tags that only exist
+    because a path uses them are stored with managed = 0, so the Admin tag
+    list still shows just the tags an admin added.
+    """
+    columns = [row[1] for row in conn.execute("PRAGMA table_info(tags)")]
+    if 'managed' not in columns:
+        conn.execute("ALTER TABLE tags ADD COLUMN managed INTEGER NOT NULL DEFAULT 1")
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS path_tags (
+            path_id INTEGER NOT NULL,
+            tag_id INTEGER NOT NULL,
+            PRIMARY KEY (path_id, tag_id),
+            FOREIGN KEY (path_id) REFERENCES paths(id) ON DELETE CASCADE,
+            FOREIGN KEY (tag_id) REFERENCES tags(id) ON DELETE CASCADE
+        ) WITHOUT ROWID
+    """)
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_path_tags_tag
+        ON path_tags(tag_id, path_id)
+    """)
+
+    for rows in ctx.batches(conn, "paths", "tags", where="tags != ''"):
+        links = [
+            (row['id'], name)
+            for row in rows
+            for name in {tag.strip() for tag in row['tags'].split(',') if tag.strip()}
+        ]
+        conn.executemany(
+            "INSERT OR IGNORE INTO tags (name, managed) VALUES (?, 0)",
+            [(name,) for _, name in links]
+        )
+        conn.executemany(
+            """
+            INSERT OR IGNORE INTO path_tags (path_id, tag_id)
+            SELECT ?, id FROM tags WHERE name = ?
+            """,
+            links
+        )
+
+
+# Builds search index rows from paths and their step instructions
+_SEARCH_ROW_INSERT = """
+    INSERT INTO path_search (rowid, title, description, tags, steps)
+    SELECT p.id, p.title, p.description, p.tags,
+           COALESCE((SELECT group_concat(s.instructions, ' ')
+                     FROM steps s WHERE s.path_id = p.id), '')
+    FROM paths p
+"""
+
+
+def _search_index(conn: sqlite3.Connection, ctx: MigrationContext) -> None:
+    """Add the path_search full-text index (see create_search_index)."""
+    create_search_index(conn, ctx)
+
+
+def create_search_index(conn: sqlite3.Connection, ctx: MigrationContext) -> bool:
+    """
+    Create and fill the path_search FTS5 index over paths and step instructions.
+
+    The index holds one row per path (rowid = path id) with the path's
+    title, description, tags and all of its step instructions. Rebuilding
+    a row reads every step of the path, so triggers on paths and steps
+    only queue the path in path_search_dirty, and refresh_search_index()
+    rebuilds each queued row once before the index is queried.
+
+    When SQLite lacks FTS5 nothing is created and search falls back to LIKE
+    matching. Database.initialize() calls this again on later starts, so
+    the index is built once SQLite supports it.
+
+    Returns:
+        True if the index was created
+    """
+    try:
+        conn.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS path_search USING fts5(
+                title, description, tags, steps,
+                tokenize = 'unicode61 remove_diacritics 2',
+                prefix = '2 3'
+            )
+        """)
+    except sqlite3.OperationalError:
+        return False
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS path_search_dirty (
+            path_id INTEGER PRIMARY KEY
+        )
+    """)
+
+    # Rebuild from scratch in case an unversioned build left rows behind
+    conn.execute("DELETE FROM path_search")
+    conn.execute("DELETE FROM path_search_dirty")
+    for rows in ctx.batches(conn, "paths"):
+        conn.execute(
+            f"{_SEARCH_ROW_INSERT} WHERE p.id BETWEEN ? AND ?",
+            (rows[0]['id'], rows[-1]['id'])
+        )
+
+    def mark_dirty(path_id: str) -> str:
+        return f"INSERT OR IGNORE INTO path_search_dirty (path_id) VALUES ({path_id});"
+
+    triggers = {
+        'path_search_paths_ai': f"AFTER INSERT ON paths BEGIN {mark_dirty('new.id')} END",
+        'path_search_paths_au': "AFTER UPDATE OF title, description, tags ON paths BEGIN "
+                                f"{mark_dirty('new.id')} END",
+        'path_search_paths_ad': "AFTER DELETE ON paths BEGIN "
+                                "DELETE FROM path_search WHERE rowid = old.id; "
+                                "DELETE FROM path_search_dirty WHERE path_id = old.id; END",
+        'path_search_steps_ai': f"AFTER INSERT ON steps BEGIN {mark_dirty('new.path_id')} END",
+        'path_search_steps_au': "AFTER UPDATE OF instructions, path_id ON steps BEGIN "
+                                f"{mark_dirty('old.path_id')} {mark_dirty('new.path_id')} END",
+        'path_search_steps_ad': f"AFTER DELETE ON steps BEGIN {mark_dirty('old.path_id')} END",
+    }
+    for name, body in triggers.items():
+        conn.execute(f"CREATE TRIGGER IF NOT EXISTS {name} {body}")
+    return True
+
+
+def refresh_search_index(conn: sqlite3.Connection) -> None:
+    """
+    Rebuild the path_search rows of paths changed since the last refresh.
+
+    Call before querying path_search. Does nothing (and doesn't write)
+    when no path has changed.
+    """
+    if conn.execute("SELECT 1 FROM path_search_dirty LIMIT 1").fetchone() is None:
+        return
+    conn.execute("DELETE FROM path_search WHERE rowid IN (SELECT path_id FROM path_search_dirty)")
+    conn.execute(f"{_SEARCH_ROW_INSERT} WHERE p.id IN (SELECT path_id FROM path_search_dirty)")
+    conn.execute("DELETE FROM path_search_dirty")
+
+
+def _legacy_index(conn: sqlite3.Connection, ctx: MigrationContext) -> None:
+    """
+    Add the tables backing LegacyDocumentIndex.
+
+    legacy_dirs records every scanned team-folder directory with the mtime
+    it had when listed; legacy_files holds the documents found in each.
+    """
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS legacy_dirs (
+            path TEXT PRIMARY KEY,
+            parent TEXT,
+            mtime_ns INTEGER NOT NULL
+        )
+    """)
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_legacy_dirs_parent
+        ON legacy_dirs(parent)
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS legacy_files (
+            filepath TEXT PRIMARY KEY,
+            dir TEXT NOT NULL,
+            mtime REAL NOT NULL,
+            size INTEGER NOT NULL
+        )
+    """)
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_legacy_files_dir
+        ON legacy_files(dir)
+    """)
+
+
+def _tag_names_nocase(conn: sqlite3.Connection, ctx: MigrationContext) -> None:
+    """
+    Make tag names unique regardless of case.
+
+    Tags differing only in case are merged into one, keeping the managed
+    one's spelling (or else the oldest), and their path links move to it.
+    A unique NOCASE index then keeps new duplicates out. The name column
+    itself isn't redeclared COLLATE NOCASE: rebuilding the tags table
+    would cascade-delete every path_tags link.
+    """
+    kept = {}
+    for tag_id, name in conn.execute("SELECT id, name FROM tags ORDER BY managed DESC, id").fetchall():
+        keep_id = kept.setdefault(fold_tag(name), tag_id)
+        if keep_id == tag_id:
+            continue
+        conn.execute(
+            """
+            INSERT OR IGNORE INTO path_tags (path_id, tag_id)
+            SELECT path_id, ? FROM path_tags WHERE tag_id = ?
+            """,
+            (keep_id, tag_id)
+        )
+        conn.execute("DELETE FROM tags WHERE id = ?", (tag_id,))
+    conn.execute("""
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_tags_name_nocase
+        ON tags(name COLLATE NOCASE)
+    """)
+
+
+MIGRATIONS: List[Migration] = [
+    Migration(1, "initial schema", _initial_schema),
+    Migration(2, "path_tags join table", _path_tags),
+    Migration(3, "full-text search index", _search_index),
+    Migration(4, "legacy document index", _legacy_index),
+    Migration(5, "case-insensitive tag names", _tag_names_nocase),
+]
@@ -4,11 +4,13 @@ Path Repository for FlowPath application.
 Provides CRUD operations for Path entities.
 """
 
-from typing import List, Optional
+import re
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
-from .database import Database
-from ..models import Path
+from .database import Database, parse_timestamp
+from .migrations import fold_tag, refresh_search_index
+from ..models import Path, PathSummary, PathSearchResult
 
 
 class PathRepository:
@@ -72,6 +74,7 @@ class PathRepository:
                 )
             )
             path.id = cursor.lastrowid
+            self._save_tags(conn, path.id, path.tag_list)
             return path.id
 
     def get_by_id(self, path_id: int) -> Optional[Path]:
@@ -148,7 +151,12 @@ class PathRepository:
 
     def search(self, query: str) -> List[Path]:
         """
-        Search paths by title, description, or tags.
+        Search paths by title, description, tags, or step instructions.
+
+        Uses the full-text index (best matches first) when available. The
+        index matches whole words and word prefixes, so when it finds
+        nothing the query is also tried as a substring of the title,
+        description and tags, as search did before the index existed.
 
         Args:
             query: Search query string
@@ -156,15 +164,76 @@ class PathRepository:
         Returns:
             List of Path objects matching the query
         """
-        search_pattern = f"%{query}%"
+        return [result.path for result in self.search_ranked(query, limit=None)]
+
+    def search_ranked(
+        self,
+        query: str,
+        limit: Optional[int] = 50,
+        highlight_start: str = "**",
+        highlight_end: str = "**"
+    ) -> List[PathSearchResult]:
+        """
+        Full-text search ranked by BM25 relevance.
+
+        Matches whole words and word prefixes in the path title, description,
+        tags and every step's instructions. Title hits rank above description
+        and tag hits, which rank above step hits. If nothing matches (or
+        there is no full-text index), returns unranked substring matches on
+        the title, description and tags, without snippets.
+
+        Args:
+            query: Search query string
+            limit: Maximum number of results (None for all)
+            highlight_start: Marker inserted before each matched term in snippets
+            highlight_end: Marker inserted after each matched term in snippets
+
+        Returns:
+            List of PathSearchResult objects, best match first
+        """
+        if not query.strip():
+            return []
+        match = self._fts_query(query)
+        if not match:
+            return self._like_results(query, limit)
+
+        weights = ", ".join(str(w) for w in Database.SEARCH_WEIGHTS)
         with self.db.connection() as conn:
+            refresh_search_index(conn)
             cursor = conn.execute(
-                """
-                SELECT * FROM paths
-                WHERE title LIKE ? OR description LIKE ? OR tags LIKE ?
-                ORDER BY updated_at DESC
+                f"""
+                SELECT p.*, bm25(path_search, {weights}) AS rank,
+                       snippet(path_search, -1, ?, ?, '…', 12) AS snippet
+                FROM path_search
+                JOIN paths p ON p.id = path_search.rowid
+                WHERE path_search MATCH ?
+                ORDER BY rank
+                LIMIT ?
                 """,
-                (search_pattern, search_pattern, search_pattern)
+                (highlight_start, highlight_end, match, -1 if limit is None else limit)
+            )
+            results = [
+                PathSearchResult(
+                    path=self._row_to_path(row),
+                    score=-row['rank'],  # bm25() is lower-is-better
+                    snippet=row['snippet'] or "",
+                )
+                for row in cursor.fetchall()
+            ]
+        return results or self._like_results(query, limit)
+
+    def _like_results(self, query: str, limit: Optional[int]) -> List[PathSearchResult]:
+        """Unranked substring matches, as search results without snippets."""
+        results = [PathSearchResult(path=path) for path in self._like_search(query)]
+        return results[:limit] if limit is not None else results
+
+    def _like_search(self, query: str) -> List[Path]:
+        """Substring search over title, description and tags."""
+        where, params = self._like_clause(query)
+        with self.db.connection() as conn:
+            cursor = conn.execute(
+                f"SELECT * FROM paths WHERE {where} ORDER BY updated_at DESC",
+                params
             )
             return [self._row_to_path(row) for row in cursor.fetchall()]
 
@@ -178,23 +247,119 @@ class PathRepository:
         Returns:
             List of Path objects with the tag
         """
-        # Search for tag with various possible formats
+        where, params = self._tag_clause(tag)
         with self.db.connection() as conn:
             cursor = conn.execute(
-                """
-                SELECT * FROM paths
-                WHERE tags LIKE ? OR tags LIKE ? OR tags LIKE ? OR tags = ?
-                ORDER BY updated_at DESC
-                """,
-                (
-                    f"%{tag},%",      # tag at start or middle
-                    f"%, {tag},%",    # tag in middle with space
-                    f"%, {tag}",      # tag at end with space
-                    tag               # exact match (single tag)
-                )
+                f"SELECT * FROM paths WHERE {where} ORDER BY updated_at DESC",
+                params
             )
             return [self._row_to_path(row) for row in cursor.fetchall()]
 
+    def get_summaries(
+        self,
+        category: Optional[str] = None,
+        tag: Optional[str] = None,
+        query: Optional[str] = None,
+        include_thumbnails: bool = False
+    ) -> List[PathSummary]:
+        """
+        Get paths with their step counts in a single aggregated query.
+
+        Filters are combined with AND; omit them all to list every path.
+
+        Args:
+            category: Only include paths in this category
+            tag: Only include paths with this tag
+            query: Only include paths matching this search text
+            include_thumbnails: Also fetch the first screenshot of each path
+
+        Returns:
+            List of PathSummary objects, best search match or most
+            recently updated first
+        """
+        match = self._fts_query(query) if query else ""
+        if match:
+            summaries = self._query_summaries(category, tag, match, None, include_thumbnails)
+            if summaries:
+                return summaries
+        # No full-text index or no word matches: try substring matching
+        return self._query_summaries(category, tag, "", query, include_thumbnails)
+
+    def _query_summaries(
+        self,
+        category: Optional[str],
+        tag: Optional[str],
+        match: str,
+        like_query: Optional[str],
+        include_thumbnails: bool
+    ) -> List[PathSummary]:
+        """Run the get_summaries() query with a MATCH expression or a substring filter."""
+        clauses = []
+        params: list = []
+        rank_join = ""
+        order_by = "p.updated_at DESC"
+        if match:
+            # Restrict to full-text hits and list the best matches first.
+            # LIMIT -1 keeps SQLite from flattening the subquery into the
+            # GROUP BY, where bm25() can't be evaluated.
+            weights = ", ".join(str(w) for w in Database.SEARCH_WEIGHTS)
+            rank_join = f"""
+                JOIN (
+                    SELECT rowid AS path_id, bm25(path_search, {weights}) AS rank
+                    FROM path_search WHERE path_search MATCH ?
+                    LIMIT -1
+                ) r ON r.path_id = p.id
+            """
+            params.append(match)
+            order_by = "r.rank"
+        elif like_query:
+            where, query_params = self._like_clause(like_query, alias="p")
+            clauses.append(f"({where})")
+            params.extend(query_params)
+        if category:
+            clauses.append("p.category = ?")
+            params.append(category)
+        if tag:
+            where, tag_params = self._tag_clause(tag, alias="p")
+            clauses.append(f"({where})")
+            params.extend(tag_params)
+
+        thumbnail_column = "NULL"
+        if include_thumbnails:
+            # Correlated lookup served by idx_steps_path_step
+            thumbnail_column = """(
+                SELECT t.screenshot_path FROM steps t
+                WHERE t.path_id = p.id AND t.screenshot_path IS NOT NULL
+                    AND t.screenshot_path != ''
+                ORDER BY t.step_number LIMIT 1
+            )"""
+
+        where_sql = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self.db.connection() as conn:
+            if match:
+                refresh_search_index(conn)
+            cursor = conn.execute(
+                f"""
+                SELECT p.*, COUNT(s.id) AS step_count,
+                       {thumbnail_column} AS thumbnail_path
+                FROM paths p
+                {rank_join}
+                LEFT JOIN steps s ON s.path_id = p.id
+                {where_sql}
+                GROUP BY p.id
+                ORDER BY {order_by}
+                """,
+                params
+            )
+            return [
+                PathSummary(
+                    path=self._row_to_path(row),
+                    step_count=row['step_count'],
+                    thumbnail_path=row['thumbnail_path'],
+                )
+                for row in cursor.fetchall()
+            ]
+
     def update(self, path: Path) -> bool:
         """
         Update an existing path.
@@ -228,7 +393,10 @@ class PathRepository:
                     path.id,
                 )
             )
-            return cursor.rowcount > 0
+            if cursor.rowcount == 0:
+                return False
+            self._save_tags(conn, path.id, path.tag_list)
+            return True
 
     def delete(self, path_id: int) -> bool:
         """
@@ -270,15 +438,71 @@ class PathRepository:
             List of unique tag names
         """
         with self.db.connection() as conn:
-            cursor = conn.execute("SELECT tags FROM paths WHERE tags != ''")
-            all_tags = set()
-            for row in cursor.fetchall():
-                tags = row[0].split(',')
-                for tag in tags:
-                    tag = tag.strip()
-                    if tag:
-                        all_tags.add(tag)
-            return sorted(list(all_tags))
+            cursor = conn.execute(
+                """
+                SELECT t.name FROM tags t
+                WHERE EXISTS (SELECT 1 FROM path_tags pt WHERE pt.tag_id = t.id)
+                ORDER BY t.name COLLATE NOCASE
+                """
+            )
+            return [row[0] for row in cursor.fetchall()]
+
+    def get_tag_counts(self) -> Dict[str, int]:
+        """
+        Get the number of paths using each tag.
+
+        Returns:
+            Dict mapping every known tag name to its path count (possibly 0)
+        """
+        with self.db.connection() as conn:
+            cursor = conn.execute(
+                """
+                SELECT t.name, COUNT(pt.path_id) FROM tags t
+                LEFT JOIN path_tags pt ON pt.tag_id = t.id
+                GROUP BY t.id
+                """
+            )
+            return {row[0]: row[1] for row in cursor.fetchall()}
+
+    def replace_tag(self, tag_id: int, new_name: Optional[str]) -> int:
+        """
+        Rewrite the tag strings of every path linked to a tag.
+
+        Used when a tag is renamed or deleted so paths.tags stays in step
+        with path_tags. Timestamps are left untouched.
+
+        Args:
+            tag_id: ID of the tag being renamed or deleted
+            new_name: Replacement name, or None to drop the tag
+
+        Returns:
+            Number of paths rewritten
+        """
+        with self.db.connection() as conn:
+            row = conn.execute("SELECT name FROM tags WHERE id = ?", (tag_id,)).fetchone()
+            if row is None:
+                return 0
+            old_name = fold_tag(row[0])
+            cursor = conn.execute(
+                """
+                SELECT p.id, p.tags FROM paths p
+                JOIN path_tags pt ON pt.path_id = p.id
+                WHERE pt.tag_id = ?
+                """,
+                (tag_id,)
+            )
+            rows = cursor.fetchall()
+            for path_id, tags in rows:
+                tag_list = Path(title="", tags=tags).tag_list
+                if new_name is None:
+                    tag_list = [tag for tag in tag_list if fold_tag(tag) != old_name]
+                else:
+                    tag_list = [new_name if fold_tag(tag) == old_name else tag for tag in tag_list]
+                conn.execute(
+                    "UPDATE paths SET tags = ? WHERE id = ?",
+                    (', '.join(dict.fromkeys(tag_list)), path_id)
+                )
+            return len(rows)
 
     def count(self) -> int:
         """
@@ -291,6 +515,57 @@ class PathRepository:
             cursor = conn.execute("SELECT COUNT(*) FROM paths")
             return cursor.fetchone()[0]
 
+    def _fts_query(self, query: str) -> str:
+        """
+        Turn free text into a safe FTS5 MATCH expression.
+
+        Every word becomes a quoted prefix term, so user input can't inject
+        FTS operators and partially typed words still match.
+
+        Returns:
+            The MATCH expression, or "" if full-text search can't be used
+        """
+        if not self.db.fts_enabled or not query:
+            return ""
+        words = re.findall(r"\w+", query)
+        return " ".join(f'"{word}"*' for word in words)
+
+    @staticmethod
+    def _like_clause(query: str, alias: str = "") -> Tuple[str, tuple]:
+        """Build the WHERE fragment matching title, description or tags."""
+        prefix = f"{alias}." if alias else ""
+        search_pattern = f"%{query}%"
+        return (
+            f"{prefix}title LIKE ? OR {prefix}description LIKE ? OR {prefix}tags LIKE ?",
+            (search_pattern, search_pattern, search_pattern)
+        )
+
+    @staticmethod
+    def _tag_clause(tag: str, alias: str = "") -> Tuple[str, tuple]:
+        """Build the WHERE fragment matching paths linked to a tag."""
+        prefix = f"{alias}." if alias else ""
+        return (
+            f"""{prefix}id IN (
+                SELECT pt.path_id FROM path_tags pt
+                JOIN tags t ON t.id = pt.tag_id
+                WHERE t.name = ? COLLATE NOCASE
+            )""",
+            (tag.strip(),)
+        )
+
+    def _save_tags(self, conn, path_id: int, tags: List[str]) -> None:
+        """Replace a path's path_tags links, creating (unmanaged) tags as needed."""
+        conn.execute("DELETE FROM path_tags WHERE path_id = ?", (path_id,))
+        for name in dict.fromkeys(tags):
+            conn.execute("INSERT OR IGNORE INTO tags (name, managed) VALUES (?, 0)", (name,))
+            conn.execute(
+                """
+                INSERT OR IGNORE INTO path_tags (path_id, tag_id)
+                SELECT ?, id FROM tags WHERE name = ? COLLATE NOCASE
+                """,
+                (path_id, name)
+            )
+
     def _row_to_path(self, row) -> Path:
         """Convert a database row to a Path object."""
         return Path(
@@ -300,6 +575,6 @@ class PathRepository:
             tags=row['tags'],
             description=row['description'],
             creator=row['creator'],
-            created_at=row['created_at'],
-            updated_at=row['updated_at'],
+            created_at=parse_timestamp(row['created_at']),
+            updated_at=parse_timestamp(row['updated_at']),
         )
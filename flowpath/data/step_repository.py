@@ -7,7 +7,7 @@ Provides CRUD operations for Step entities.
 from typing import List, Optional
 from datetime import datetime
 
-from .database import Database
+from .database import Database, parse_timestamp
 from ..models import Step
 
 
@@ -218,6 +218,25 @@ class StepRepository:
             )
             return cursor.fetchone()[0]
 
+    def count_by_screenshot(self, screenshot_path: str) -> int:
+        """
+        Get the number of steps that show a screenshot.
+
+        Duplicated paths share their screenshot files.
+
+        Args:
+            screenshot_path: Path of the screenshot file
+
+        Returns:
+            Number of steps, across all paths, using the screenshot
+        """
+        with self.db.connection() as conn:
+            cursor = conn.execute(
+                "SELECT COUNT(*) FROM steps WHERE screenshot_path = ?",
+                (screenshot_path,)
+            )
+            return cursor.fetchone()[0]
+
     def get_next_step_number(self, path_id: int) -> int:
         """
         Get the next available step number for a path.
@@ -353,6 +372,6 @@ class StepRepository:
             step_number=row['step_number'],
             instructions=row['instructions'],
             screenshot_path=row['screenshot_path'],
-            created_at=row['created_at'],
-            updated_at=row['updated_at'],
+            created_at=parse_timestamp(row['created_at']),
+            updated_at=parse_timestamp(row['updated_at']),
         )
@@ -6,6 +6,8 @@ This module contains the data model classes for the FlowPath application.
 
 from .path import Path
 from .step import Step
+from .path_summary import PathSummary
+from .search_result import PathSearchResult
 from .legacy_doc import LegacyDocument, LEGACY_EXTENSIONS
 
-__all__ = ['Path', 'Step', 'LegacyDocument', 'LEGACY_EXTENSIONS']
+__all__ = ['Path', 'Step', 'PathSummary', 'PathSearchResult', 'LegacyDocument', 'LEGACY_EXTENSIONS']
@@ -60,27 +60,46 @@ class LegacyDocument:
             LegacyDocument if file is a supported type, None otherwise
         """
         path = Path(filepath)
-        ext = path.suffix.lower()
-        
-        if ext not in LEGACY_EXTENSIONS:
+        if path.suffix.lower() not in LEGACY_EXTENSIONS:
             return None
-            
-        file_type, type_label = LEGACY_EXTENSIONS[ext]
-        
+
         try:
             stat = path.stat()
-            modified_at = datetime.fromtimestamp(stat.st_mtime)
+            mtime = stat.st_mtime
             size_bytes = stat.st_size
         except OSError:
-            modified_at = datetime.now()
+            mtime = datetime.now().timestamp()
             size_bytes = 0
-            
+
+        return cls.from_stat(filepath, mtime, size_bytes)
+
+    @classmethod
+    def from_stat(cls, filepath: str, mtime: float, size_bytes: int) -> Optional['LegacyDocument']:
+        """
+        Create a LegacyDocument from already-known file metadata.
+
+        Args:
+            filepath: Path to the file
+            mtime: Modification time as a POSIX timestamp
+            size_bytes: File size in bytes
+
+        Returns:
+            LegacyDocument if file is a supported type, None otherwise
+        """
+        path = Path(filepath)
+        ext = path.suffix.lower()
+
+        if ext not in LEGACY_EXTENSIONS:
+            return None
+
+        file_type, type_label = LEGACY_EXTENSIONS[ext]
+
         return cls(
             filepath=str(path),
             filename=path.name,
             file_type=file_type,
             type_label=type_label,
-            modified_at=modified_at,
+            modified_at=datetime.fromtimestamp(mtime),
             size_bytes=size_bytes,
         )
     
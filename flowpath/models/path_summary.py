@@ -0,0 +1,33 @@
+"""
+PathSummary model for FlowPath application.
+
+A lightweight view of a Path used for listings, carrying aggregated step data.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+from .path import Path
+
+
+@dataclass
+class PathSummary:
+    """
+    A path together with the aggregate step data needed to list it.
+
+    Attributes:
+        path: The Path itself
+        step_count: Number of steps in the path
+        thumbnail_path: Screenshot of the first step that has one (if requested)
+    """
+    path: Path
+    step_count: int = 0
+    thumbnail_path: Optional[str] = None
+
+    @property
+    def id(self) -> Optional[int]:
+        """ID of the underlying path."""
+        return self.path.id
+
+    def __repr__(self) -> str:
+        return f"PathSummary(id={self.path.id}, title='{self.path.title}', steps={self.step_count})"
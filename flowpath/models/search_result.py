@@ -0,0 +1,33 @@
+"""
+PathSearchResult model for FlowPath application.
+
+A ranked full-text search hit for a Path.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+from .path import Path
+
+
+@dataclass
+class PathSearchResult:
+    """
+    A path matched by full-text search.
+
+    Attributes:
+        path: The matching Path
+        score: Relevance score (higher is better)
+        snippet: Excerpt around the best match with the matched terms marked
+    """
+    path: Path
+    score: float = 0.0
+    snippet: str = ""
+
+    @property
+    def id(self) -> Optional[int]:
+        """ID of the underlying path."""
+        return self.path.id
+
+    def __repr__(self) -> str:
+        return f"PathSearchResult(id={self.path.id}, title='{self.path.title}', score={self.score:.2f})"
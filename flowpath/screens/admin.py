@@ -592,8 +592,9 @@ class AdminScreen(QWidget):
 
         # Add category items
         categories = self.data_service.get_managed_categories()
+        usage_counts = self.data_service.get_category_usage_counts()
         for cat in categories:
-            usage_count = self.data_service.get_category_usage_count(cat['name'])
+            usage_count = usage_counts.get(cat['name'], 0)
             item = CategoryItem(cat['id'], cat['name'], cat['color'], usage_count)
             item.edit_clicked.connect(self._on_edit_category)
             item.delete_clicked.connect(self._on_delete_category)
@@ -618,8 +619,9 @@ class AdminScreen(QWidget):
 
         # Add tag items
         tags = self.data_service.get_managed_tags()
+        usage_counts = self.data_service.get_tag_usage_counts()
         for tag in tags:
-            usage_count = self.data_service.get_tag_usage_count(tag['name'])
+            usage_count = usage_counts.get(tag['name'], 0)
             item = TagItem(tag['id'], tag['name'], usage_count)
             item.edit_clicked.connect(self._on_edit_tag)
             item.delete_clicked.connect(self._on_delete_tag)
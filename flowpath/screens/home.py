@@ -6,17 +6,19 @@ Displays the library of FlowPath paths and legacy documents with filtering optio
 
 import subprocess
 import sys
+from typing import Dict, List, Optional
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QLineEdit, QListWidget, QGridLayout,
-    QFrame, QScrollArea, QListWidgetItem,
+    QFrame, QListWidgetItem,
     QMessageBox, QProgressDialog
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QThread, QTimer, pyqtSignal
 from PyQt6.QtGui import QFont
 
-from ..services import DataService, LegacyConverter
+from ..services import BatchConverter, ConversionResult, DataService, TeamFolderWatcher
 from ..models import Path, LegacyDocument
+from ..widgets.library_list import LibraryListView
 
 
 # Color constants
@@ -35,196 +37,75 @@ COLOR_HOVER_BG = "#F5F5F5"
 COLOR_MAIN_BG = "#FFFFFF"  # Clean white background
 
 
-class PathListRow(QFrame):
-    """A list row displaying a FlowPath path."""
-    clicked = pyqtSignal(int)  # Emits path_id when clicked
-
-    def __init__(self, path: Path, step_count: int = 0, current_user: str = ""):
+class ContentLoadWorker(QThread):
+    """
+    Background worker that runs the home screen's queries.
+
+    Runs the path query and the team folder scan off the GUI thread. A newer
+    load supersedes this one via requestInterruption(); the worker then
+    stops between stages and its results are dropped.
+    """
+    loaded = pyqtSignal(int, object)  # generation, result dict
+
+    def __init__(
+        self,
+        generation: int,
+        tab: str,
+        search: str = "",
+        category: Optional[str] = None,
+        tag: Optional[str] = None
+    ):
         super().__init__()
-        self.path_id = path.id
-        self.step_count = step_count
-
-        self.setObjectName("PathListRow")
-        self.setStyleSheet(f"""
-            #PathListRow {{
-                background-color: transparent;
-                border: none;
-                border-bottom: 1px solid #F0F0F0;
-                margin: 0px;
-                padding: 0px;
-            }}
-            #PathListRow:hover {{
-                background-color: {COLOR_HOVER_BG};
-            }}
-        """)
-        self.setFixedHeight(48)
-        self.setCursor(Qt.CursorShape.PointingHandCursor)
-
-        layout = QHBoxLayout()
-        layout.setContentsMargins(12, 8, 12, 8)
-        layout.setSpacing(12)
-
-        # Title (main content - takes most space, with elide for long text)
-        title_label = QLabel(path.title)
-        title_label.setStyleSheet("""
-            font-size: 14px;
-            color: #333333;
-            background: transparent;
-        """)
-        title_label.setMinimumWidth(100)
-        layout.addWidget(title_label, 1)  # stretch factor 1
-
-        # Category (simple text, no background)
-        if path.category:
-            category_label = QLabel(path.category)
-            category_label.setStyleSheet(f"""
-                color: {COLOR_TEXT_SECONDARY};
-                font-size: 14px;
-                background: transparent;
-            """)
-            layout.addWidget(category_label)
-
-        # Step count (simple text, no background shape)
-        if step_count > 0:
-            step_label = QLabel(f"{step_count} step{'s' if step_count != 1 else ''}")
-            step_label.setStyleSheet(f"""
-                color: {COLOR_PRIMARY_GREEN};
-                font-size: 14px;
-                font-weight: bold;
-                background: transparent;
-            """)
-            layout.addWidget(step_label)
-
-        self.setLayout(layout)
-
-    def mousePressEvent(self, event):
-        """Handle click on the row."""
-        if event.button() == Qt.MouseButton.LeftButton:
-            self.clicked.emit(self.path_id)
-
-
-class LegacyDocListRow(QFrame):
-    """A list row displaying a legacy document."""
-    clicked = pyqtSignal(str)  # Emits filepath when clicked
-    convert_clicked = pyqtSignal(str)  # Emits filepath when convert clicked
-
-    # File type colors (MS Office style)
-    TYPE_COLORS = {
-        'word': '#2B579A',       # Word blue
-        'pdf': '#D32F2F',        # PDF red
-        'powerpoint': '#D24726', # PowerPoint orange
-        'excel': '#217346',      # Excel green
-        'text': '#757575',       # Text gray
-        'html': '#E44D26',       # HTML orange
-        'pages': '#FF9500',      # Pages orange
-        'numbers': '#00A650',    # Numbers green
-        'keynote': '#007AFF',    # Keynote blue
-    }
-    
-    # Types that can be converted to FlowPath
-    CONVERTIBLE_TYPES = {'word', 'powerpoint', 'text'}
-
-    def __init__(self, doc: LegacyDocument):
-        super().__init__()
-        self.filepath = doc.filepath
-        self.doc = doc
-        self.is_convertible = doc.file_type in self.CONVERTIBLE_TYPES
-
-        self.setObjectName("LegacyDocListRow")
-        self.setStyleSheet(f"""
-            #LegacyDocListRow {{
-                background-color: transparent;
-                border: none;
-                border-bottom: 1px solid #F0F0F0;
-                margin: 0px;
-                padding: 0px;
-            }}
-            #LegacyDocListRow:hover {{
-                background-color: {COLOR_HOVER_BG};
-            }}
-        """)
-        self.setFixedHeight(56)
-        self.setCursor(Qt.CursorShape.PointingHandCursor)
-
-        layout = QHBoxLayout()
-        layout.setContentsMargins(12, 8, 12, 8)
-        layout.setSpacing(12)
-
-        # Filename (main content - takes most space)
-        filename_label = QLabel(doc.filename)
-        filename_label.setStyleSheet("""
-            font-size: 14px;
-            color: #333333;
-            background: transparent;
-        """)
-        filename_label.setMinimumWidth(100)
-        filename_label.setMaximumWidth(400)
-        layout.addWidget(filename_label, 1)  # stretch factor 1
-
-        # File type label
-        type_label = QLabel(doc.type_label)
-        type_label.setStyleSheet(f"""
-            color: {COLOR_TEXT_SECONDARY};
-            font-size: 14px;
-            background-color: #F0F0F0;
-            padding: 2px 8px;
-            border-radius: 7px;
-        """)
-        layout.addWidget(type_label)
-
-        # Legacy badge
-        legacy_badge = QLabel("LEGACY")
-        legacy_badge.setStyleSheet(f"""
-            background-color: {COLOR_LEGACY_BADGE};
-            color: white;
-            padding: 2px 8px;
-            border-radius: 7px;
-            font-size: 14px;
-            font-weight: bold;
-        """)
-        layout.addWidget(legacy_badge)
-
-        # Modified date
-        modified_label = QLabel(doc.modified_display)
-        modified_label.setStyleSheet(f"""
-            color: {COLOR_TEXT_MUTED};
-            font-size: 14px;
-            background: transparent;
-        """)
-        modified_label.setFixedWidth(80)
-        layout.addWidget(modified_label)
-
-        # Convert button for convertible types
-        if self.is_convertible:
-            convert_btn = QPushButton("CONVERT")
-            convert_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {COLOR_PRIMARY_GREEN};
-                    color: white;
-                    border: none;
-                    padding: 4px 8px;
-                    font-size: 14px;
-                    font-weight: bold;
-                    border-radius: 7px;
-                }}
-                QPushButton:hover {{
-                    background-color: {COLOR_PRIMARY_GREEN_HOVER};
-                }}
-            """)
-            convert_btn.setFixedWidth(65)
-            convert_btn.clicked.connect(self._on_convert_clicked)
-            layout.addWidget(convert_btn)
+        self.generation = generation
+        self.tab = tab
+        self.search = search
+        self.category = category
+        self.tag = tag
+        self.data_service = DataService.instance()
 
-        self.setLayout(layout)
+    def run(self):
+        try:
+            result = self._load()
+            if result is not None and not self.isInterruptionRequested():
+                self.loaded.emit(self.generation, result)
+        except Exception as e:
+            print(f"Error loading home screen content: {e}")
+        finally:
+            # Don't leave this thread's pooled connection behind
+            self.data_service.db.close()
+
+    def _load(self) -> Optional[dict]:
+        """Run the queries for the current tab; None if interrupted."""
+        result = {'summaries': [], 'files': []}
+        is_filtered = bool(self.search or self.category or self.tag)
+
+        if self.tab == "paths":
+            result['summaries'] = self.data_service.get_path_summaries(
+                category=None if self.search else self.category,
+                tag=None if self.search or self.category else self.tag,
+                search=self.search or None,
+            )
+            if self.isInterruptionRequested():
+                return None
 
-    def _on_convert_clicked(self):
-        """Handle convert button click."""
-        self.convert_clicked.emit(self.filepath)
+        # The unfiltered listing doubles as the total
+        if self.tab == "paths" and not is_filtered:
+            result['path_total'] = len(result['summaries'])
+        else:
+            result['path_total'] = self.data_service.count_paths()
+        if self.isInterruptionRequested():
+            return None
 
-    def mousePressEvent(self, event):
-        """Handle click on the row."""
-        if event.button() == Qt.MouseButton.LeftButton:
-            self.clicked.emit(self.filepath)
+        all_files = self.data_service.get_legacy_documents()
+        result['all_files'] = all_files
+        result['file_total'] = len(all_files)
+        if self.tab == "files":
+            if self.search:
+                query = self.search.lower()
+                result['files'] = [doc for doc in all_files if query in doc.filename.lower()]
+            else:
+                result['files'] = all_files
+        return result
 
 
 # Keep the old card classes for potential future use but they won't be used
@@ -623,6 +504,9 @@ class HomeScreen(QWidget):
     path_clicked = pyqtSignal(int)  # Emits path_id
     new_path_requested = pyqtSignal()  # Emitted when New Path clicked
 
+    # Wait this long after the last keystroke before searching
+    SEARCH_DEBOUNCE_MS = 250
+
     def __init__(self):
         super().__init__()
         self.data_service = DataService.instance()
@@ -631,6 +515,35 @@ class HomeScreen(QWidget):
         self.current_filter_tag = None
         self.current_search = ""
         self.current_tab = "paths"  # "paths" or "files"
+
+        # Background loading: each load gets a new generation so results
+        # from superseded loads can be recognized and dropped
+        self._load_generation = 0
+        self._load_worker: Optional[ContentLoadWorker] = None
+        self._finished_workers: List[ContentLoadWorker] = []
+
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(self.SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self._load_content)
+
+        # Live team folder updates, applied to the last loaded file list
+        self._path_total = 0
+        self._legacy_docs: Dict[str, LegacyDocument] = {}
+        self.folder_watcher = TeamFolderWatcher(self.data_service, self)
+        self.folder_watcher.documents_added.connect(self._on_documents_changed)
+        self.folder_watcher.documents_modified.connect(self._on_documents_changed)
+        self.folder_watcher.documents_removed.connect(self._on_documents_removed)
+
+        # Legacy document conversion, in the background
+        self.batch_converter = BatchConverter(parent=self)
+        self.batch_converter.file_started.connect(self._on_conversion_started)
+        self.batch_converter.file_finished.connect(self._on_conversion_finished)
+        self.batch_converter.progress.connect(self._on_conversion_progress)
+        self.batch_converter.finished.connect(self._on_batch_conversion_finished)
+        self._conversion_dialog: Optional[QProgressDialog] = None
+        self._conversion_results: List[tuple] = []  # (filename, ConversionResult, steps imported)
+
         self.setup_ui()
 
     def setup_ui(self):
@@ -828,6 +741,25 @@ class HomeScreen(QWidget):
         tab_row.addWidget(self.files_tab)
         
         tab_row.addStretch()
+
+        # Convert every supported document in the team folder (Files tab only)
+        self.convert_all_btn = QPushButton("Convert All")
+        self.convert_all_btn.setStyleSheet(f"""
+            QPushButton {{
+                background-color: #F5F5F5;
+                border: 1px solid {COLOR_BORDER};
+                padding: 6px 12px;
+                font-size: 14px;
+                border-radius: 7px;
+                color: #333;
+            }}
+            QPushButton:hover {{
+                background-color: #EEEEEE;
+            }}
+        """)
+        self.convert_all_btn.clicked.connect(self._on_convert_all_clicked)
+        self.convert_all_btn.hide()
+        tab_row.addWidget(self.convert_all_btn)
         
         # Count labels next to tabs
         self.paths_count_label = QLabel("")
@@ -842,28 +774,19 @@ class HomeScreen(QWidget):
         self.filter_label.hide()  # Only show when filtering
         content.addWidget(self.filter_label)
 
-        # List scroll area (changed from grid to vertical list)
-        self.cards_widget = QWidget()
-        self.cards_layout = QVBoxLayout()
-        self.cards_layout.setSpacing(4)
-        self.cards_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
-        self.cards_layout.setContentsMargins(0, 0, 0, 0)
-        self.cards_widget.setLayout(self.cards_layout)
-
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setWidget(self.cards_widget)
-        scroll_area.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background-color: transparent;
-            }
-            QScrollArea > QWidget > QWidget {
-                background-color: transparent;
-            }
-        """)
+        # Virtualized list: rows are painted by a delegate, not built as widgets
+        self.library_list = LibraryListView()
+        self.library_list.path_clicked.connect(self._on_path_clicked)
+        self.library_list.file_clicked.connect(self._on_legacy_doc_clicked)
+        self.library_list.convert_clicked.connect(self._on_convert_doc_clicked)
+        content.addWidget(self.library_list, stretch=1)
 
-        content.addWidget(scroll_area)
+        # Empty state (shown instead of the list when there is nothing to show)
+        self.empty_label = QLabel("")
+        self.empty_label.setAlignment(Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop)
+        self.empty_label.setStyleSheet(f"color: {COLOR_TEXT_SECONDARY}; font-size: 14px; padding: 60px;")
+        self.empty_label.hide()
+        content.addWidget(self.empty_label, stretch=1)
 
         # Content container
         content_widget = QWidget()
@@ -922,6 +845,7 @@ class HomeScreen(QWidget):
         self.files_tab.setChecked(tab == "files")
         self.paths_tab.setStyleSheet(self._get_tab_style(tab == "paths"))
         self.files_tab.setStyleSheet(self._get_tab_style(tab == "files"))
+        self.convert_all_btn.setVisible(tab == "files")
         
         # Clear search and filters when switching tabs
         self.current_search = ""
@@ -953,17 +877,47 @@ class HomeScreen(QWidget):
             self.tag_list.addItems(["authentication", "video", "setup", "troubleshooting"])
 
     def _load_content(self):
-        """Load and display paths or files based on current tab and filters."""
-        # Clear existing items
-        while self.cards_layout.count():
-            item = self.cards_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        """
+        Load paths or files for the current tab and filters.
 
-        # Count both for the tab labels
-        all_paths = self.data_service.get_all_paths()
-        all_files = self.data_service.get_legacy_documents()
-        self.paths_count_label.setText(f"{len(all_paths)} paths · {len(all_files)} files")
+        Queries run on a ContentLoadWorker; any load still in flight is
+        cancelled and its results are ignored.
+        """
+        self._search_timer.stop()
+        self._load_generation += 1
+
+        if self._load_worker is not None:
+            self._load_worker.requestInterruption()
+
+        worker = ContentLoadWorker(
+            self._load_generation,
+            self.current_tab,
+            search=self.current_search,
+            category=self.current_filter_category,
+            tag=self.current_filter_tag,
+        )
+        worker.loaded.connect(self._on_content_loaded)
+        worker.finished.connect(lambda w=worker: self._on_worker_finished(w))
+        self._load_worker = worker
+        self._finished_workers.append(worker)  # Keep alive until finished
+        worker.start()
+
+    def _on_worker_finished(self, worker: ContentLoadWorker):
+        """Release a worker thread once it has stopped."""
+        if worker in self._finished_workers:
+            self._finished_workers.remove(worker)
+        if self._load_worker is worker:
+            self._load_worker = None
+        worker.deleteLater()
+
+    def _on_content_loaded(self, generation: int, result: dict):
+        """Display the results of a background load."""
+        if generation != self._load_generation:
+            return  # A newer load has started since
+
+        self._path_total = result['path_total']
+        self._legacy_docs = {doc.filepath: doc for doc in result['all_files']}
+        self._update_count_label()
 
         # Show/hide clear filter button
         if self.current_filter_category or self.current_filter_tag or self.current_search:
@@ -973,59 +927,78 @@ class HomeScreen(QWidget):
             self.clear_category_btn.hide()
             self.filter_label.hide()
 
+        self.empty_label.hide()
+        self.library_list.show()
+
         if self.current_tab == "paths":
-            # Load paths
+            summaries = result['summaries']
             if self.current_search:
-                paths = self.data_service.search_paths(self.current_search)
-                self.filter_label.setText(f'Search: "{self.current_search}" ({len(paths)} results)')
+                self.filter_label.setText(f'Search: "{self.current_search}" ({len(summaries)} results)')
             elif self.current_filter_category:
-                paths = self.data_service.get_paths_by_category(self.current_filter_category)
                 self.filter_label.setText(f"Category: {self.current_filter_category}")
             elif self.current_filter_tag:
-                paths = self.data_service.get_paths_by_tag(self.current_filter_tag)
                 self.filter_label.setText(f"Tag: {self.current_filter_tag}")
-            else:
-                paths = all_paths
-
-            # Add path rows
-            for path in paths:
-                step_count = self.data_service.count_steps(path.id) if path.id else 0
-                row = PathListRow(path, step_count, self.current_user)
-                row.clicked.connect(self._on_path_clicked)
-                self.cards_layout.addWidget(row)
 
-            # Empty state
-            if not paths:
+            self.library_list.set_items(summaries)
+            if not summaries:
                 self._show_empty_state("No paths found.\n\nClick '+ New Path' to create one!")
 
         else:
-            # Load files
-            if self.current_search:
-                files = self.data_service.search_legacy_documents(self.current_search)
-                self.filter_label.setText(f'Search: "{self.current_search}" ({len(files)} results)')
-            else:
-                files = all_files
+            self._show_files(result['files'])
+
+    def _update_count_label(self):
+        """Show the path and file totals next to the tabs."""
+        self.paths_count_label.setText(
+            f"{self._path_total} paths · {len(self._legacy_docs)} files"
+        )
 
-            # Add file rows
-            for doc in files:
-                row = LegacyDocListRow(doc)
-                row.clicked.connect(self._on_legacy_doc_clicked)
-                row.convert_clicked.connect(self._on_convert_doc_clicked)
-                self.cards_layout.addWidget(row)
+    def _show_files(self, files: List[LegacyDocument]):
+        """Show legacy documents in the list (Files tab)."""
+        if self.current_search:
+            self.filter_label.setText(f'Search: "{self.current_search}" ({len(files)} results)')
+
+        self.library_list.set_items(files)
+        if files:
+            self.empty_label.hide()
+            self.library_list.show()
+        else:
+            self._show_empty_state("No files found.\n\nAdd documents to your team folder to see them here.")
+
+    def _on_documents_changed(self, docs: List[LegacyDocument]):
+        """Apply added or modified team folder documents."""
+        for doc in docs:
+            self._legacy_docs[doc.filepath] = doc
+        self._apply_file_changes()
+
+    def _on_documents_removed(self, filepaths: List[str]):
+        """Apply documents removed from the team folder."""
+        for filepath in filepaths:
+            self._legacy_docs.pop(filepath, None)
+        self._apply_file_changes()
+
+    def _apply_file_changes(self):
+        """Update the file list from the watcher's changes without reloading."""
+        if self._load_worker is not None:
+            # The load in flight may predate the change; start a fresh one
+            self._load_content()
+            return
 
-            # Empty state
-            if not files:
-                self._show_empty_state("No files found.\n\nAdd documents to your team folder to see them here.")
+        self._update_count_label()
+        if self.current_tab != "files":
+            return
 
-        # Add stretch at the end to push items to top
-        self.cards_layout.addStretch()
+        files = sorted(self._legacy_docs.values(), key=lambda d: d.modified_at, reverse=True)
+        if self.current_search:
+            query = self.current_search.lower()
+            files = [doc for doc in files if query in doc.filename.lower()]
+        # The list model diffs against what is shown, so only changed rows update
+        self._show_files(files)
 
     def _show_empty_state(self, message: str):
-        """Show an empty state message."""
-        empty_label = QLabel(message)
-        empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        empty_label.setStyleSheet(f"color: {COLOR_TEXT_SECONDARY}; font-size: 14px; padding: 60px;")
-        self.cards_layout.addWidget(empty_label)
+        """Show an empty state message in place of the list."""
+        self.empty_label.setText(message)
+        self.empty_label.show()
+        self.library_list.hide()
 
     def _on_category_clicked(self, item: QListWidgetItem):
         """Handle category selection."""
@@ -1052,14 +1025,15 @@ class HomeScreen(QWidget):
         self._load_content()
 
     def _on_search_changed(self, text: str):
-        """Handle search text changes."""
+        """Handle search text changes (debounced)."""
         self.current_search = text.strip()
         if self.current_search:
             self.current_filter_category = None
             self.current_filter_tag = None
             self.category_list.clearSelection()
             self.tag_list.clearSelection()
-        self._load_content()
+        # Restarting the timer on each keystroke searches once typing pauses
+        self._search_timer.start()
 
     def _on_path_clicked(self, path_id: int):
         """Handle path card click."""
@@ -1079,8 +1053,33 @@ class HomeScreen(QWidget):
 
     def _on_convert_doc_clicked(self, filepath: str):
         """Handle convert button click - convert legacy doc to FlowPath."""
+        doc = self._legacy_docs.get(filepath) or LegacyDocument.from_path(filepath)
+        if doc is not None:
+            self._start_conversion([doc])
+
+    def _on_convert_all_clicked(self):
+        """Convert every supported document in the team folder."""
+        docs = [doc for doc in self._legacy_docs.values() if BatchConverter.can_convert(doc)]
+        if not docs:
+            QMessageBox.information(
+                self,
+                "Nothing to Convert",
+                "There are no Word, PowerPoint or text documents in the team folder."
+            )
+            return
+        reply = QMessageBox.question(
+            self,
+            "Convert All Documents",
+            f"Convert {len(docs)} documents to FlowPath paths?\n\n"
+            f"Each document becomes a new path in your library."
+        )
+        if reply == QMessageBox.StandardButton.Yes:
+            self._start_conversion(docs)
+
+    def _start_conversion(self, docs: List[LegacyDocument]):
+        """Convert documents in the background, with a cancellable progress dialog."""
         import os
-        
+
         # Get output directory (same as team folder, in a 'converted' subfolder)
         team_folder = self.data_service.team_folder
         if not team_folder:
@@ -1090,36 +1089,53 @@ class HomeScreen(QWidget):
                 "Please set a team folder before converting documents."
             )
             return
-        
-        output_dir = os.path.join(team_folder, "converted")
-        
+        if self.batch_converter.is_running():
+            return
+
         # Show progress
+        label = f"Converting {docs[0].filename}..." if len(docs) == 1 else f"Converting {len(docs)} documents..."
+        self._conversion_dialog = QProgressDialog(label, "Cancel", 0, len(docs), self)
+        self._conversion_dialog.setWindowTitle("Converting Documents" if len(docs) > 1 else "Converting Document")
+        self._conversion_dialog.setModal(True)
+        self._conversion_dialog.setMinimumDuration(0)
+        self._conversion_dialog.setAutoClose(False)
+        self._conversion_dialog.setAutoReset(False)
+        self._conversion_dialog.canceled.connect(self._on_conversion_cancel_requested)
+        self._conversion_dialog.show()
+
+        self._conversion_results = []
+        self.batch_converter.output_dir = os.path.join(team_folder, "converted")
+        self.batch_converter.start(docs)
+
+    def _on_conversion_cancel_requested(self):
+        """Cancel the running conversions."""
+        if self._conversion_dialog is not None:
+            self._conversion_dialog.setLabelText("Cancelling...")
+        self.batch_converter.cancel()
+
+    def _on_conversion_started(self, filepath: str):
+        """Show which document is being converted."""
+        import os
+        dialog = self._conversion_dialog
+        if dialog is not None and not dialog.wasCanceled() and dialog.maximum() > 1:
+            dialog.setLabelText(f"Converting {os.path.basename(filepath)}...")
+
+    def _on_conversion_progress(self, done: int, total: int):
+        """Advance the progress dialog."""
+        if self._conversion_dialog is not None:
+            self._conversion_dialog.setMaximum(total)
+            self._conversion_dialog.setValue(done)
+
+    def _on_conversion_finished(self, filepath: str, result: ConversionResult):
+        """Save a converted document as a new path."""
+        import os
         filename = os.path.basename(filepath)
-        progress = QProgressDialog(
-            f"Converting {filename}...",
-            None,  # No cancel button
-            0, 0,  # Indeterminate progress
-            self
-        )
-        progress.setWindowTitle("Converting Document")
-        progress.setModal(True)
-        progress.show()
-        
-        # Force UI update
-        from PyQt6.QtWidgets import QApplication
-        QApplication.processEvents()
-        
-        try:
-            # Run conversion
-            converter = LegacyConverter(output_dir)
-            result = converter.convert(filepath)
-            
-            progress.close()
-            
-            if result.success:
+        steps_created = 0
+        if result.success:
+            try:
                 # Create a new FlowPath path from the conversion
                 from ..models import Path as FlowPathModel
-                
+
                 new_path = FlowPathModel(
                     title=result.title,
                     category="Imported",
@@ -1127,15 +1143,33 @@ class HomeScreen(QWidget):
                     description=f"Converted from {filename}",
                     creator="converter"
                 )
-                
+
                 # Save to database
                 path_id = self.data_service.create_path(new_path)
-                
+
                 # Import steps from the generated markdown
-                steps_created = 0
                 if result.markdown_path:
                     steps_created = self._import_steps_from_markdown(path_id, result.markdown_path)
-                
+            except Exception as e:
+                result = ConversionResult(success=False, error=f"Could not save the converted path: {e}")
+        self._conversion_results.append((filename, result, steps_created))
+
+    def _on_batch_conversion_finished(self, cancelled: bool):
+        """Close the progress dialog and report the outcome."""
+        if self._conversion_dialog is not None:
+            self._conversion_dialog.canceled.disconnect(self._on_conversion_cancel_requested)
+            self._conversion_dialog.close()
+            self._conversion_dialog.deleteLater()
+            self._conversion_dialog = None
+
+        results = self._conversion_results
+        self._conversion_results = []
+        converted = [r for r in results if r[1].success]
+        failed = [r for r in results if not r[1].success and not r[1].cancelled]
+
+        if len(results) == 1 and not cancelled:
+            filename, result, steps_created = results[0]
+            if result.success:
                 # Show success message
                 QMessageBox.information(
                     self,
@@ -1145,24 +1179,29 @@ class HomeScreen(QWidget):
                     f"Steps imported: {steps_created}\n\n"
                     f"The new path has been added to your library."
                 )
-                
-                # Refresh to show the new path
-                self.refresh()
             else:
                 QMessageBox.critical(
                     self,
                     "Conversion Failed",
                     f"Failed to convert '{filename}':\n\n{result.error}"
                 )
-                
-        except Exception as e:
-            progress.close()
-            QMessageBox.critical(
-                self,
-                "Conversion Error",
-                f"An error occurred during conversion:\n\n{str(e)}"
+        elif results:
+            message = f"Converted {len(converted)} of {len(results)} documents."
+            if cancelled:
+                message += " The rest were cancelled."
+            if failed:
+                details = "\n".join(f"• {name}: {result.error}" for name, result, _ in failed[:10])
+                if len(failed) > 10:
+                    details += f"\n• ...and {len(failed) - 10} more"
+                message += f"\n\nFailed:\n{details}"
+            (QMessageBox.warning if failed else QMessageBox.information)(
+                self, "Conversion Finished", message
             )
 
+        if converted:
+            # Refresh to show the new paths
+            self.refresh()
+
     def _import_steps_from_markdown(self, path_id: int, markdown_path: str) -> int:
         """
         Parse a FlowPath markdown file and create Step records.
@@ -1250,4 +1289,5 @@ class HomeScreen(QWidget):
     def set_team_folder(self, folder_path: str):
         """Set the team folder path for legacy document scanning."""
         self.data_service.team_folder = folder_path
+        self.folder_watcher.start()
         self.refresh()
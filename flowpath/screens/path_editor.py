@@ -1,12 +1,14 @@
+import os
+
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QLineEdit, QComboBox,
     QFrame, QScrollArea, QMessageBox, QSizePolicy
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QSize, pyqtSignal
 from PyQt6.QtGui import QPixmap, QPainter, QColor, QPen, QFont, QPainterPath
 
-from ..services import DataService
+from ..services import DataService, ThumbnailCache
 from ..models import Path, Step
 from ..widgets import MarkdownTextEdit
 from ..widgets.annotation_editor import AnnotationEditor
@@ -18,6 +20,8 @@ class StepCard(QFrame):
     edit_clicked = pyqtSignal(int)  # Emits step index
     screenshot_updated = pyqtSignal()  # Emitted when screenshot is edited
 
+    THUMBNAIL_SIZE = QSize(150, 100)
+
     def __init__(self, step_number: int, step: Step = None):
         super().__init__()
         self.step_number = step_number
@@ -50,12 +54,9 @@ class StepCard(QFrame):
         """)
 
         # Load screenshot if exists
+        ThumbnailCache.instance().thumbnail_ready.connect(self._on_thumbnail_ready)
         if step and step.screenshot_path:
-            pixmap = QPixmap(step.screenshot_path)
-            if not pixmap.isNull():
-                self.screenshot_label.setPixmap(
-                    pixmap.scaled(150, 100, Qt.AspectRatioMode.KeepAspectRatio)
-                )
+            self._load_thumbnail()
 
         screenshot_container.addWidget(self.screenshot_label)
 
@@ -153,14 +154,23 @@ class StepCard(QFrame):
         self.step.screenshot_path = filepath
 
         # Reload the thumbnail
-        pixmap = QPixmap(filepath)
-        if not pixmap.isNull():
-            self.screenshot_label.setPixmap(
-                pixmap.scaled(150, 100, Qt.AspectRatioMode.KeepAspectRatio)
-            )
+        self._load_thumbnail()
 
         self.screenshot_updated.emit()
 
+    def _load_thumbnail(self):
+        """Show the screenshot thumbnail, now if cached or once it's decoded."""
+        pixmap = ThumbnailCache.instance().thumbnail(self.step.screenshot_path, self.THUMBNAIL_SIZE)
+        if pixmap is not None and not pixmap.isNull():
+            self.screenshot_label.setPixmap(pixmap)
+
+    def _on_thumbnail_ready(self, path: str, size: QSize, pixmap: QPixmap):
+        """Show a thumbnail decoded by the thumbnail cache."""
+        if (size == self.THUMBNAIL_SIZE and not pixmap.isNull()
+                and self.step and self.step.screenshot_path
+                and path == os.path.abspath(self.step.screenshot_path)):
+            self.screenshot_label.setPixmap(pixmap)
+
 
 class EmptyStateWidget(QWidget):
     """Attractive empty state shown when no steps exist yet"""
@@ -1,13 +1,16 @@
+import os
+from collections import OrderedDict
+
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QPushButton, QFrame, QScrollArea, QApplication
+    QPushButton, QFrame, QScrollArea, QStackedWidget, QApplication, QWIDGETSIZE_MAX
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QPixmap, QCursor, QPainter, QColor, QFont
+from PyQt6.QtCore import Qt, QSize, QTimer, pyqtSignal
+from PyQt6.QtGui import QPixmap, QImageReader, QCursor, QPainter, QColor, QFont
 
-from ..services import DataService
+from ..services import DataService, ThumbnailCache
 from ..models import Path, Step
-from ..widgets import MarkdownLabel, ExportDialog
+from ..widgets import MarkdownLabel, ExportDialog, PresentationView
 
 # Color constants (matching home screen)
 COLOR_PRIMARY_GREEN = "#4CAF50"
@@ -101,13 +104,60 @@ class ClickableImageLabel(QLabel):
         self.clicked.emit()
 
 
+class FullImageCache:
+    """
+    Least-recently-used cache of full-resolution screenshots.
+
+    Full images are only decoded for the lightbox; keeping the last few
+    means reopening one is instant without holding every step's image.
+    """
+
+    MAX_BYTES = 128 * 1024 * 1024
+
+    def __init__(self):
+        self._pixmaps: 'OrderedDict[tuple, QPixmap]' = OrderedDict()
+        self._bytes = 0
+
+    def pixmap(self, path: str) -> QPixmap:
+        """Get the full-size image for path (null if it can't be read)."""
+        try:
+            key = (os.path.abspath(path), os.stat(path).st_mtime_ns)
+        except OSError:
+            return QPixmap()
+        pixmap = self._pixmaps.get(key)
+        if pixmap is not None:
+            self._pixmaps.move_to_end(key)
+            return pixmap
+
+        pixmap = QPixmap(path)
+        if not pixmap.isNull():
+            self._pixmaps[key] = pixmap
+            self._bytes += self._cost(pixmap)
+            while self._bytes > self.MAX_BYTES and len(self._pixmaps) > 1:
+                _, evicted = self._pixmaps.popitem(last=False)
+                self._bytes -= self._cost(evicted)
+        return pixmap
+
+    def clear(self):
+        """Drop all cached images."""
+        self._pixmaps.clear()
+        self._bytes = 0
+
+    @staticmethod
+    def _cost(pixmap: QPixmap) -> int:
+        return pixmap.width() * pixmap.height() * max(1, pixmap.depth() // 8)
+
+
 class ReaderStepCard(QFrame):
     """A step displayed in read-only mode with image left, text right"""
 
-    def __init__(self, step: Step):
+    IMAGE_SIZE = QSize(340, 240)
+
+    def __init__(self, step: Step, image_cache: FullImageCache = None):
         super().__init__()
         self.step = step
-        self.full_pixmap = None  # Store full-size image for lightbox
+        self.image_cache = image_cache or FullImageCache()
+        self.image_label = None
 
         self.setStyleSheet("""
             ReaderStepCard {
@@ -125,32 +175,37 @@ class ReaderStepCard(QFrame):
 
         # Screenshot - moderate size on left
         if step.screenshot_path:
-            self.full_pixmap = QPixmap(step.screenshot_path)
-            if not self.full_pixmap.isNull():
-                image_label = ClickableImageLabel()
-                image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                
-                # Scale to comfortable size - bigger than thumbnail, smaller than full
-                max_width = 340
-                max_height = 240
-                scaled_pixmap = self.full_pixmap.scaled(
-                    max_width, max_height,
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation
-                )
-                image_label.setPixmap(scaled_pixmap)
-                # Fixed width container for consistent alignment
-                image_label.setFixedWidth(360)
-                image_label.setStyleSheet("""
-                    background-color: white;
-                    border: none;
-                    padding: 0px;
-                """)
-                image_label.setToolTip("Click to enlarge")
-                image_label.clicked.connect(self._show_lightbox)
-                layout.addWidget(image_label, alignment=Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
+            self.image_label = ClickableImageLabel()
+            self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            # Fixed width container for consistent alignment
+            self.image_label.setFixedWidth(360)
+            # Reserve the image's height from its header, so the card doesn't
+            # change size when the thumbnail arrives
+            image_size = QImageReader(step.screenshot_path).size()
+            if image_size.isValid():
+                if (image_size.width() > self.IMAGE_SIZE.width()
+                        or image_size.height() > self.IMAGE_SIZE.height()):
+                    image_size = image_size.scaled(self.IMAGE_SIZE, Qt.AspectRatioMode.KeepAspectRatio)
+                self.image_label.setFixedHeight(max(image_size.height(), 120))
             else:
-                self._add_placeholder(layout)
+                self.image_label.setMinimumHeight(120)
+            self.image_label.setStyleSheet("""
+                background-color: white;
+                border: none;
+                padding: 0px;
+            """)
+            self.image_label.setToolTip("Click to enlarge")
+            self.image_label.clicked.connect(self._show_lightbox)
+            layout.addWidget(self.image_label, alignment=Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
+
+            # Decoded in the background at display size - bigger than
+            # thumbnail, smaller than full
+            thumbnails = ThumbnailCache.instance()
+            pixmap = thumbnails.thumbnail(step.screenshot_path, self.IMAGE_SIZE)
+            if pixmap is None:
+                thumbnails.thumbnail_ready.connect(self._on_thumbnail_ready)
+            else:
+                self._set_thumbnail(pixmap)
         else:
             self._add_placeholder(layout)
 
@@ -194,6 +249,11 @@ class ReaderStepCard(QFrame):
     def _add_placeholder(self, layout):
         """Add a placeholder for steps without screenshots"""
         placeholder = QLabel("No screenshot")
+        self._style_placeholder(placeholder)
+        layout.addWidget(placeholder, alignment=Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
+
+    def _style_placeholder(self, placeholder: QLabel):
+        """Style a label as the no-screenshot placeholder"""
         placeholder.setFixedSize(360, 120)
         placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
         placeholder.setStyleSheet(f"""
@@ -204,20 +264,83 @@ class ReaderStepCard(QFrame):
         placeholder_font = QFont()
         placeholder_font.setPixelSize(14)
         placeholder.setFont(placeholder_font)
-        layout.addWidget(placeholder, alignment=Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
+
+    def _on_thumbnail_ready(self, path: str, size: QSize, pixmap: QPixmap):
+        """Show the screenshot once the thumbnail cache has decoded it"""
+        if size != self.IMAGE_SIZE or path != os.path.abspath(self.step.screenshot_path):
+            return
+        ThumbnailCache.instance().thumbnail_ready.disconnect(self._on_thumbnail_ready)
+        self._set_thumbnail(pixmap)
+
+    def _set_thumbnail(self, pixmap: QPixmap):
+        """Show the decoded screenshot, or the placeholder if it can't be read"""
+        if pixmap.isNull():
+            self.image_label.setText("No screenshot")
+            self.image_label.setToolTip("")
+            self.image_label.setCursor(QCursor(Qt.CursorShape.ArrowCursor))
+            self._style_placeholder(self.image_label)
+            return
+        self.image_label.setPixmap(pixmap)
 
     def _show_lightbox(self):
         """Show the full-size image in a lightbox overlay"""
-        if self.full_pixmap and not self.full_pixmap.isNull():
+        if not self.step.screenshot_path:
+            return
+        # The full image is only decoded when it's actually wanted
+        full_pixmap = self.image_cache.pixmap(self.step.screenshot_path)
+        if not full_pixmap.isNull():
             # Find the top-level window to overlay on
             main_window = self.window()
-            lightbox = ImageLightbox(self.full_pixmap, main_window)
+            lightbox = ImageLightbox(full_pixmap, main_window)
             lightbox.setGeometry(main_window.rect())
             lightbox.show()
             lightbox.raise_()
             lightbox.setFocus()
 
 
+class StepSlot(QWidget):
+    """
+    Keeps the place of one step in the reader.
+
+    The step's card is only created while the slot is near the viewport.
+    A released slot keeps the card's last height so the scroll range
+    stays stable.
+    """
+
+    ESTIMATED_HEIGHT = 280  # Image (240) plus card margins
+
+    def __init__(self, step: Step, image_cache: FullImageCache):
+        super().__init__()
+        self.step = step
+        self.image_cache = image_cache
+        self.card: ReaderStepCard = None
+        self._height = self.ESTIMATED_HEIGHT
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.setFixedHeight(self._height)
+
+    def load(self):
+        """Create the step card if it isn't shown yet"""
+        if self.card is not None:
+            return
+        self.card = ReaderStepCard(self.step, self.image_cache)
+        self.layout().addWidget(self.card)
+        self.setMinimumHeight(0)
+        self.setMaximumHeight(QWIDGETSIZE_MAX)
+
+    def release(self):
+        """Delete the step card, keeping its height"""
+        if self.card is None:
+            return
+        if self.card.height() > 0:
+            self._height = self.height()
+        self.layout().removeWidget(self.card)
+        self.card.deleteLater()
+        self.card = None
+        self.setFixedHeight(self._height)
+
+
 class PathReaderScreen(QWidget):
     exit_clicked = pyqtSignal()
     edit_clicked = pyqtSignal(int)  # Emits path_id
@@ -229,6 +352,15 @@ class PathReaderScreen(QWidget):
         self.current_path_id: int = None
         self.current_steps: list = []  # Store steps for export
         self.current_user = ""  # Will be set by main window if needed
+        self.step_slots: list = []
+        self.image_cache = FullImageCache()
+
+        # Coalesces scroll and resize events into one pass over the slots
+        self._visibility_timer = QTimer(self)
+        self._visibility_timer.setSingleShot(True)
+        self._visibility_timer.setInterval(0)
+        self._visibility_timer.timeout.connect(self._update_visible_steps)
+
         self.setup_ui()
 
     def setup_ui(self):
@@ -237,9 +369,9 @@ class PathReaderScreen(QWidget):
         self.main_layout.setSpacing(0)
 
         # === HEADER BAR ===
-        header_widget = QWidget()
-        header_widget.setStyleSheet(f"background-color: {COLOR_CARD_BG};")
-        header_layout = QVBoxLayout(header_widget)
+        self.header_widget = QWidget()
+        self.header_widget.setStyleSheet(f"background-color: {COLOR_CARD_BG};")
+        header_layout = QVBoxLayout(self.header_widget)
         header_layout.setContentsMargins(24, 16, 24, 16)
         header_layout.setSpacing(8)
 
@@ -375,6 +507,22 @@ class PathReaderScreen(QWidget):
         """)
         self.export_btn.clicked.connect(self._on_export)
 
+        self.present_btn = QPushButton("Present")
+        self.present_btn.setStyleSheet(f"""
+            QPushButton {{
+                background-color: transparent;
+                color: {COLOR_TEXT_SECONDARY};
+                border: 1px solid {COLOR_BORDER};
+                padding: 6px 14px;
+                border-radius: 4px;
+                font-size: 14px;
+            }}
+            QPushButton:hover {{
+                background-color: #f5f5f5;
+            }}
+        """)
+        self.present_btn.clicked.connect(self._on_present)
+
         self.edit_btn = QPushButton("Edit")
         self.edit_btn.setStyleSheet(f"""
             QPushButton {{
@@ -394,11 +542,12 @@ class PathReaderScreen(QWidget):
 
         buttons_row.addWidget(share_btn)
         buttons_row.addWidget(self.export_btn)
+        buttons_row.addWidget(self.present_btn)
         buttons_row.addWidget(self.edit_btn)
         buttons_row.addStretch()
         header_layout.addLayout(buttons_row)
 
-        self.main_layout.addWidget(header_widget)
+        self.main_layout.addWidget(self.header_widget)
 
         # Separator line (90% width, centered, light gray)
         separator_layout = QHBoxLayout()
@@ -410,9 +559,9 @@ class PathReaderScreen(QWidget):
         separator_layout.addWidget(separator, 18)  # 90% center
         separator_layout.addStretch(1)  # 5% right
         
-        separator_container = QWidget()
-        separator_container.setLayout(separator_layout)
-        self.main_layout.addWidget(separator_container)
+        self.separator_container = QWidget()
+        self.separator_container.setLayout(separator_layout)
+        self.main_layout.addWidget(self.separator_container)
 
         # === STEPS AREA ===
         self.steps_container = QVBoxLayout()
@@ -420,13 +569,13 @@ class PathReaderScreen(QWidget):
         self.steps_container.setSpacing(0)
         self.steps_container.addStretch()
 
-        steps_widget = QWidget()
-        steps_widget.setLayout(self.steps_container)
-        steps_widget.setStyleSheet("background-color: white;")
+        self.steps_widget = QWidget()
+        self.steps_widget.setLayout(self.steps_container)
+        self.steps_widget.setStyleSheet("background-color: white;")
 
         self.scroll_area = QScrollArea()
         self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setWidget(steps_widget)
+        self.scroll_area.setWidget(self.steps_widget)
         self.scroll_area.setStyleSheet("""
             QScrollArea {
                 border: none;
@@ -434,7 +583,19 @@ class PathReaderScreen(QWidget):
             }
         """)
 
-        self.main_layout.addWidget(self.scroll_area)
+        # Presentation mode replaces the scrolling list
+        self.presentation = PresentationView()
+        self.presentation.exit_requested.connect(self._exit_presentation)
+
+        self.steps_stack = QStackedWidget()
+        self.steps_stack.addWidget(self.scroll_area)
+        self.steps_stack.addWidget(self.presentation)
+        self.main_layout.addWidget(self.steps_stack)
+
+        # Create and release step cards as the viewport moves
+        scroll_bar = self.scroll_area.verticalScrollBar()
+        scroll_bar.valueChanged.connect(self._schedule_visibility_update)
+        scroll_bar.rangeChanged.connect(self._schedule_visibility_update)
 
         self.setLayout(self.main_layout)
 
@@ -462,13 +623,18 @@ class PathReaderScreen(QWidget):
         self.edit_btn.setVisible(is_creator)
 
         # Clear existing steps
+        self._exit_presentation()
+        self.present_btn.setEnabled(bool(steps))
         self._clear_steps()
 
-        # Add step cards
+        # Add step slots; cards are created as they scroll into view
         if steps:
             for step in steps:
-                step_card = ReaderStepCard(step)
-                self.steps_container.insertWidget(self.steps_container.count() - 1, step_card)
+                slot = StepSlot(step, self.image_cache)
+                self.steps_container.insertWidget(self.steps_container.count() - 1, slot)
+                self.step_slots.append(slot)
+            self.scroll_area.verticalScrollBar().setValue(0)
+            self._visibility_timer.start()
         else:
             empty_label = QLabel("This path has no steps yet.")
             empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -480,11 +646,45 @@ class PathReaderScreen(QWidget):
 
     def _clear_steps(self):
         """Remove all step cards"""
+        self.step_slots = []
+        self.image_cache.clear()
         while self.steps_container.count() > 1:
             item = self.steps_container.takeAt(0)
             if item.widget():
                 item.widget().deleteLater()
 
+    def _schedule_visibility_update(self, *args):
+        """Update the loaded cards once pending scroll/layout events settle"""
+        self._visibility_timer.start()
+
+    def _update_visible_steps(self):
+        """Create cards near the viewport and release those far from it"""
+        if not self.step_slots:
+            return
+        viewport_height = self.scroll_area.viewport().height()
+        top = self.scroll_area.verticalScrollBar().value()
+        bottom = top + viewport_height
+        # Load one screen ahead either way; release beyond three, so
+        # scrolling back and forth doesn't rebuild the same cards
+        load_top, load_bottom = top - viewport_height, bottom + viewport_height
+        keep_top, keep_bottom = top - 3 * viewport_height, bottom + 3 * viewport_height
+
+        for slot in self.step_slots:
+            slot_top = slot.y()
+            slot_bottom = slot_top + slot.height()
+            if slot_bottom >= load_top and slot_top <= load_bottom:
+                slot.load()
+            elif slot_bottom < keep_top or slot_top > keep_bottom:
+                slot.release()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._visibility_timer.start()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._visibility_timer.start()
+
     def _on_exit(self):
         """Handle exit button"""
         self.exit_clicked.emit()
@@ -494,6 +694,33 @@ class PathReaderScreen(QWidget):
         if self.current_path_id:
             self.edit_clicked.emit(self.current_path_id)
 
+    def _on_present(self):
+        """Present the path step by step, from the step at the top of the view"""
+        if not self.current_steps:
+            return
+        top = self.scroll_area.verticalScrollBar().value()
+        index = next(
+            (i for i, slot in enumerate(self.step_slots) if slot.y() + slot.height() > top),
+            0
+        )
+        self.header_widget.hide()
+        self.separator_container.hide()
+        self.steps_stack.setCurrentWidget(self.presentation)
+        self.presentation.set_steps(self.current_steps, index)
+        self.presentation.setFocus()
+
+    def _exit_presentation(self):
+        """Return to the scrolling list at the step that was being presented"""
+        if self.steps_stack.currentWidget() is not self.presentation:
+            return
+        self.steps_stack.setCurrentWidget(self.scroll_area)
+        self.header_widget.show()
+        self.separator_container.show()
+        if self.presentation.index < len(self.step_slots):
+            slot = self.step_slots[self.presentation.index]
+            self.scroll_area.verticalScrollBar().setValue(slot.y())
+        self.presentation.set_steps([])
+
     def _on_export(self):
         """Handle export button"""
         if self.current_path:
@@ -1,11 +1,14 @@
+import os
+
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QFrame, QMessageBox, QMenu
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QSize, pyqtSignal
 from PyQt6.QtGui import QPixmap, QAction
 
 from ..models import Step
+from ..services import DataService, ThumbnailCache
 from ..widgets import MarkdownTextEdit, ScreenCapture
 from ..widgets.annotation_editor import AnnotationEditor
 
@@ -18,7 +21,9 @@ class StepCreatorScreen(QWidget):
     def __init__(self):
         super().__init__()
         self.screenshot_path = None
+        self._thumbnail_size = QSize()
         self.step_number = 1  # Will be set by the caller
+        ThumbnailCache.instance().thumbnail_ready.connect(self._on_thumbnail_ready)
         self.screen_capture = ScreenCapture()
         self.screen_capture.captured.connect(self._on_screenshot_captured)
         self.screen_capture.cancelled.connect(self._on_screenshot_cancelled)
@@ -223,25 +228,35 @@ class StepCreatorScreen(QWidget):
 
     def _on_annotation_complete(self, filepath: str):
         """Handle completion of annotation editing."""
+        if self.screenshot_path and self.screenshot_path != filepath:
+            # A new capture replaced the previous one
+            DataService.instance().release_screenshots([self.screenshot_path])
         self.screenshot_path = filepath
 
-        # Load and display the screenshot
-        pixmap = QPixmap(filepath)
+        # Decode at display size in the background; the label shows it when ready
+        self._thumbnail_size = QSize(
+            self.screenshot_frame.width() - 20,
+            self.screenshot_frame.height() - 60  # Leave room for edit button
+        )
+        pixmap = ThumbnailCache.instance().thumbnail(filepath, self._thumbnail_size)
+        if pixmap is not None:
+            self._show_screenshot(pixmap)
+        self.edit_screenshot_btn.show()
+
+    def _on_thumbnail_ready(self, path: str, size: QSize, pixmap: QPixmap):
+        """Show the screenshot once the thumbnail cache has decoded it."""
+        if (self.screenshot_path and size == self._thumbnail_size
+                and path == os.path.abspath(self.screenshot_path)):
+            self._show_screenshot(pixmap)
+
+    def _show_screenshot(self, pixmap: QPixmap):
+        """Display a screenshot thumbnail."""
         if not pixmap.isNull():
-            # Scale to fit the frame while maintaining aspect ratio
-            scaled = pixmap.scaled(
-                self.screenshot_frame.width() - 20,
-                self.screenshot_frame.height() - 60,  # Leave room for edit button
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
-            self.screenshot_label.setPixmap(scaled)
+            self.screenshot_label.setPixmap(pixmap)
             self.screenshot_label.setStyleSheet("border: none;")
-            self.edit_screenshot_btn.show()
         else:
             self.screenshot_label.setText("Screenshot saved!")
             self.screenshot_label.setStyleSheet("color: #4CAF50; font-size: 16px; border: none;")
-            self.edit_screenshot_btn.show()
 
     def _on_edit_screenshot(self):
         """Open the annotation editor to edit the current screenshot."""
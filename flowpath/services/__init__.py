@@ -7,5 +7,11 @@ This module contains service classes for the application.
 from .data_service import DataService
 from .converter import LegacyConverter, ConversionResult
 from .export_service import ExportService
+from .folder_watcher import TeamFolderWatcher
+from .thumbnail_cache import ThumbnailCache
+from .image_optimizer import ImageOptimizer
+from .batch_converter import BatchConverter
+from .office_server import OfficeServer
 
-__all__ = ['DataService', 'LegacyConverter', 'ConversionResult', 'ExportService']
+__all__ = ['DataService', 'LegacyConverter', 'ConversionResult', 'ExportService', 'TeamFolderWatcher',
+           'ThumbnailCache', 'ImageOptimizer', 'BatchConverter', 'OfficeServer']
@@ -0,0 +1,128 @@
+"""
+Annotation layers for FlowPath application.
+
+Screenshots are annotated non-destructively. Next to an annotated
+screenshot FlowPath keeps:
+
+    shot.png                the rendered result, used by the app and exports
+    shot.original.png       the untouched capture
+    shot.annotations.json   the edits, replayed over the original: pixel
+                            operations (blur, crop) and vector annotations
+    shot.clean.png          the render without vector annotations; only
+                            written when there are pixel operations,
+                            otherwise the original is the clean image
+
+Screenshots without a sidecar are plain images, as before. The extra
+files are removed with remove_layers() once no step uses the screenshot.
+"""
+
+import json
+import os
+from typing import Optional
+
+
+LAYERS_VERSION = 1
+
+
+def original_path(image_path: str) -> str:
+    """Path of the untouched capture for a screenshot."""
+    base, ext = os.path.splitext(image_path)
+    return f"{base}.original{ext}"
+
+
+def sidecar_path(image_path: str) -> str:
+    """Path of the annotation sidecar for a screenshot."""
+    base, _ = os.path.splitext(image_path)
+    return f"{base}.annotations.json"
+
+
+def clean_path(image_path: str) -> str:
+    """Path of the annotation-free render for a screenshot."""
+    base, ext = os.path.splitext(image_path)
+    return f"{base}.clean{ext}"
+
+
+def load_layers(image_path: str) -> Optional[dict]:
+    """
+    Load the annotation layers for a screenshot.
+
+    Args:
+        image_path: Path to the rendered screenshot
+
+    Returns:
+        Layers dict (version, edits, annotations, callout_counter), or None
+        if the screenshot has no usable sidecar and original
+    """
+    sidecar = sidecar_path(image_path)
+    if not os.path.exists(sidecar) or not os.path.exists(original_path(image_path)):
+        return None
+    try:
+        with open(sidecar, 'r', encoding='utf-8') as f:
+            layers = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Error reading annotation layers {sidecar}: {e}")
+        return None
+    if layers.get('version') != LAYERS_VERSION:
+        return None
+    return layers
+
+
+def save_layers(image_path: str, layers: dict) -> bool:
+    """
+    Write the annotation sidecar for a screenshot.
+
+    Args:
+        image_path: Path to the rendered screenshot
+        layers: Layers dict as produced by the annotation canvas
+
+    Returns:
+        True if the sidecar was written
+    """
+    sidecar = sidecar_path(image_path)
+    temp = f"{sidecar}.tmp"
+    try:
+        with open(temp, 'w', encoding='utf-8') as f:
+            json.dump(dict(layers, version=LAYERS_VERSION), f, separators=(',', ':'))
+        os.replace(temp, sidecar)
+        return True
+    except OSError as e:
+        print(f"Error writing annotation layers {sidecar}: {e}")
+        return False
+
+
+def remove_layers(image_path: str) -> None:
+    """
+    Delete the original, sidecar and clean render kept for a screenshot.
+
+    The screenshot itself is left alone. Call this when no step uses the
+    screenshot any more, or when it has been replaced by a new capture.
+
+    Args:
+        image_path: Path to the rendered screenshot
+    """
+    for path in (original_path(image_path), sidecar_path(image_path), clean_path(image_path)):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"Error removing annotation layer {path}: {e}")
+
+
+def export_image_path(image_path: str, annotated: bool = True) -> str:
+    """
+    Pick the image file to export for a screenshot.
+
+    Args:
+        image_path: Path to the rendered screenshot
+        annotated: If False, prefer the render without vector annotations
+
+    Returns:
+        Path of an existing image file (image_path if there is no choice)
+    """
+    if annotated or not os.path.exists(sidecar_path(image_path)):
+        return image_path
+    for candidate in (clean_path(image_path), original_path(image_path)):
+        if os.path.exists(candidate):
+            return candidate
+    return image_path
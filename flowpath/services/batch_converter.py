@@ -0,0 +1,223 @@
+"""
+Batch conversion of legacy documents for FlowPath application.
+
+Converting a document shells out to LibreOffice and pandoc and can take a
+minute or more, so documents are converted in a pool of background
+threads, several at once, with progress reported per file.
+"""
+
+import os
+import queue
+import threading
+from typing import Dict, List, Optional
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+from ..models import LegacyDocument
+from .converter import CONVERTIBLE_EXTENSIONS, ConversionResult, LegacyConverter
+from .office_server import OfficeServer
+from .thumbnail_cache import cache_home
+
+
+class _JobSignals(QObject):
+    """Signals for conversion jobs (QRunnable can't emit signals itself)."""
+    started = pyqtSignal(str)  # filepath
+    done = pyqtSignal(str, object)  # filepath, ConversionResult
+
+
+class _ConversionJob(QRunnable):
+    """Converts one document with its own converter and LibreOffice profile."""
+
+    def __init__(self, manager: 'BatchConverter', filepath: str):
+        super().__init__()
+        self.manager = manager
+        self.filepath = filepath
+
+    def run(self):
+        manager = self.manager
+        if manager._cancelled:
+            # Queued before cancel(); report it without starting
+            manager._signals.done.emit(
+                self.filepath, ConversionResult(success=False, error="Conversion cancelled", cancelled=True)
+            )
+            return
+
+        manager._signals.started.emit(self.filepath)
+        try:
+            # Documents with the same name convert into the same folder
+            with manager._name_lock(self.filepath):
+                profile_dir = manager._profiles.get()
+                try:
+                    result = self._convert(profile_dir)
+                finally:
+                    manager._profiles.put(profile_dir)
+        except Exception as e:
+            result = ConversionResult(success=False, error=str(e))
+        manager._signals.done.emit(self.filepath, result)
+
+    def _convert(self, profile_dir: str) -> ConversionResult:
+        """Run the conversion with a converter cancel() can reach."""
+        manager = self.manager
+        converter = LegacyConverter(manager.output_dir, profile_dir)
+        with manager._lock:
+            manager._active.add(converter)
+            cancelled = manager._cancelled
+        if cancelled:
+            converter.cancel()
+        try:
+            return converter.convert(self.filepath)
+        finally:
+            with manager._lock:
+                manager._active.discard(converter)
+
+
+class _StopServersJob(QRunnable):
+    """Stops the LibreOffice servers of the worker profiles."""
+
+    def __init__(self, profile_dirs: List[str]):
+        super().__init__()
+        self.profile_dirs = profile_dirs
+
+    def run(self):
+        try:
+            OfficeServer.stop_profiles(self.profile_dirs)
+        except Exception as e:
+            print(f"Error stopping LibreOffice servers: {e}")
+
+
+class BatchConverter(QObject):
+    """
+    Converts many legacy documents in parallel.
+
+    Up to max_workers documents are converted at a time, each by its own
+    LegacyConverter. Each one runs a LibreOffice instance of several
+    hundred MB, so by default at most DEFAULT_MAX_WORKERS run at once,
+    however many CPUs there are. Each worker slot has its own LibreOffice user profile,
+    because soffice instances can't share one. The profiles are kept between
+    runs, so LibreOffice only sets them up the first time, but their
+    LibreOffice servers are stopped when the batch finishes. Signals are
+    emitted on the GUI thread.
+
+    cancel() drops the documents still waiting and terminates the tools
+    running for the others; every document still gets a file_finished,
+    with a failed result if it failed and a cancelled one if it was
+    cancelled.
+
+    Usage:
+        batch = BatchConverter(output_dir)
+        batch.file_finished.connect(on_file_finished)
+        batch.finished.connect(on_all_finished)
+        batch.start(documents)
+    """
+    file_started = pyqtSignal(str)  # filepath
+    file_finished = pyqtSignal(str, object)  # filepath, ConversionResult
+    progress = pyqtSignal(int, int)  # documents done, total
+    finished = pyqtSignal(bool)  # True if cancelled
+
+    DEFAULT_MAX_WORKERS = 4
+
+    def __init__(
+        self,
+        output_dir: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        profile_root: Optional[str] = None,
+        parent: Optional[QObject] = None
+    ):
+        """
+        Initialize the batch converter.
+
+        Args:
+            output_dir: Directory converted documents are written to; may
+                        also be set before each start()
+            max_workers: Documents converted at once (default: the CPU
+                         count, up to DEFAULT_MAX_WORKERS)
+            profile_root: Directory for the per-worker LibreOffice profiles.
+                          If None, uses the default cache location.
+        """
+        super().__init__(parent)
+        self.output_dir = output_dir
+        self.max_workers = max(1, max_workers or min(self.DEFAULT_MAX_WORKERS, os.cpu_count() or 1))
+        self.profile_root = profile_root or os.path.join(cache_home(), 'flowpath', 'libreoffice')
+
+        self._lock = threading.Lock()
+        self._cancelled = False
+        self._active: set = set()
+        self._name_locks: Dict[str, threading.Lock] = {}
+        self._total = 0
+        self._done = 0
+        self._profile_dirs = [os.path.join(self.profile_root, f"worker-{slot}") for slot in range(self.max_workers)]
+        self._profiles: 'queue.Queue[str]' = queue.Queue()
+        for profile_dir in self._profile_dirs:
+            self._profiles.put(profile_dir)
+
+        # The pool is created first so it is destroyed (waiting for running
+        # jobs) before the signals object the jobs emit through
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(self.max_workers)
+        self._signals = _JobSignals(self)
+        self._signals.started.connect(self.file_started)
+        self._signals.done.connect(self._on_done)
+
+    @staticmethod
+    def can_convert(document: LegacyDocument) -> bool:
+        """Whether LegacyConverter supports a document's format."""
+        return os.path.splitext(document.filepath)[1].lower() in CONVERTIBLE_EXTENSIONS
+
+    def is_running(self) -> bool:
+        """Whether a batch is in progress."""
+        return self._done < self._total
+
+    def start(self, documents: List[LegacyDocument]) -> None:
+        """
+        Start converting documents. Only one batch runs at a time.
+
+        Args:
+            documents: Documents to convert; unsupported formats are skipped
+        """
+        if self.is_running():
+            raise RuntimeError("A batch conversion is already running")
+        if not self.output_dir:
+            raise ValueError("No output directory set")
+        filepaths = [doc.filepath for doc in documents if self.can_convert(doc)]
+        self._cancelled = False
+        self._total = len(filepaths)
+        self._done = 0
+        if not filepaths:
+            self.finished.emit(False)
+            return
+        for filepath in filepaths:
+            self._pool.start(_ConversionJob(self, filepath))
+        self.progress.emit(0, self._total)
+
+    def cancel(self) -> None:
+        """Stop the batch: skip waiting documents and terminate running ones."""
+        with self._lock:
+            self._cancelled = True
+            active = list(self._active)
+        for converter in active:
+            converter.cancel()
+
+    def stop(self) -> None:
+        """Cancel the batch and wait for its threads to finish."""
+        self.cancel()
+        self._pool.waitForDone()
+
+    # ==================== Internals ====================
+
+    def _name_lock(self, filepath: str) -> threading.Lock:
+        """Lock shared by documents that would be written to the same folder."""
+        name = os.path.splitext(os.path.basename(filepath))[0].lower()
+        with self._lock:
+            return self._name_locks.setdefault(name, threading.Lock())
+
+    def _on_done(self, filepath: str, result: ConversionResult) -> None:
+        """Count a finished document and announce it."""
+        self._done += 1
+        self.file_finished.emit(filepath, result)
+        self.progress.emit(self._done, self._total)
+        if self._done == self._total:
+            self._name_locks.clear()
+            # Don't keep a LibreOffice per worker running between batches;
+            # stopping them can take a while, so not on the GUI thread
+            self._pool.start(_StopServersJob(self._profile_dirs))
+            self.finished.emit(self._cancelled)
@@ -0,0 +1,410 @@
+"""
+Batch export for FlowPath application.
+
+Exports many paths at once, for example a nightly HTML/JSON snapshot of
+the whole library, and writes an index page linking them. Paths are
+exported in parallel in a process pool; screenshots shared between paths
+are base64-encoded once and reused through an on-disk encode cache.
+
+Command line:
+    python -m flowpath.services.batch_export OUTPUT_DIR [--format html --format json]
+        [--path-id ID ...] [--category NAME] [--tag NAME] [--db DATABASE] [--workers N]
+        [--image-format webp|jpeg|original] [--max-size PIXELS] [--quality 0-100]
+"""
+
+import argparse
+import html
+import multiprocessing
+import os
+import shutil
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from ..models import Path, Step
+from .data_service import DataService
+from .export_service import ExportService
+from .image_optimizer import ImageOptimizer
+
+
+BATCH_FORMATS = ('html', 'json')
+INDEX_FILENAME = 'index.html'
+ENCODE_CACHE_DIRNAME = '.encode-cache'
+
+# Jobs queued per worker; steps are read for this many paths ahead only
+JOBS_PER_WORKER = 2
+
+
+@dataclass
+class BatchExportEntry:
+    """One exported path: its metadata and the files written for it."""
+    path: Path
+    step_count: int
+    files: Dict[str, str] = field(default_factory=dict)  # format -> file name in the output folder
+    error: Optional[str] = None
+
+
+@dataclass
+class BatchExportResult:
+    """Result of a batch export."""
+    entries: List[BatchExportEntry] = field(default_factory=list)
+    index_path: Optional[str] = None
+    elapsed: float = 0.0
+
+    @property
+    def exported(self) -> List[BatchExportEntry]:
+        return [entry for entry in self.entries if entry.error is None]
+
+    @property
+    def failed(self) -> List[BatchExportEntry]:
+        return [entry for entry in self.entries if entry.error is not None]
+
+    @property
+    def paths_per_second(self) -> float:
+        return len(self.entries) / self.elapsed if self.elapsed > 0 else 0.0
+
+
+# (paths done, total paths, entry just finished)
+ProgressCallback = Callable[[int, int, BatchExportEntry], None]
+
+
+def select_paths(
+    data_service: DataService,
+    path_ids: Optional[Sequence[int]] = None,
+    category: Optional[str] = None,
+    tag: Optional[str] = None
+) -> List[Path]:
+    """
+    Choose the paths to export.
+
+    Args:
+        data_service: DataService to read paths from
+        path_ids: Export exactly these paths (unknown IDs are reported and skipped)
+        category: Otherwise, only paths in this category
+        tag: Otherwise, only paths with this tag
+
+    Returns:
+        List of Path objects; all paths if nothing is specified
+    """
+    if path_ids:
+        paths = []
+        for path_id in path_ids:
+            path = data_service.get_path(path_id)
+            if path is None:
+                print(f"Batch export: no path with ID {path_id}")
+            else:
+                paths.append(path)
+        return paths
+    summaries = data_service.get_path_summaries(category=category or None, tag=tag or None)
+    return [summary.path for summary in summaries]
+
+
+def batch_export(
+    data_service: DataService,
+    paths: List[Path],
+    output_dir: str,
+    formats: Sequence[str] = BATCH_FORMATS,
+    annotated: bool = True,
+    embed_images: bool = True,
+    workers: Optional[int] = None,
+    progress: Optional[ProgressCallback] = None,
+    optimizer: Optional[ImageOptimizer] = None
+) -> BatchExportResult:
+    """
+    Export paths into a folder, in parallel, with an index page.
+
+    Each path is written as <id>-<title>.<format>. Exports run in a pool
+    of worker processes; steps are read here and handed to the workers,
+    so only this process uses the database. A path's steps are read just
+    before its job is queued, and only JOBS_PER_WORKER jobs per worker
+    are queued at a time, so exports start (and report progress) right
+    away and only the steps of paths in flight are held in memory.
+    Encoded screenshots are kept in a cache folder inside output_dir while
+    the batch runs.
+
+    Args:
+        data_service: DataService to read steps from
+        paths: Paths to export (see select_paths)
+        output_dir: Folder for the exports and index.html
+        formats: Any of BATCH_FORMATS
+        annotated: If False, use screenshots without their annotations
+        embed_images: If False, JSON exports reference screenshots by path
+        workers: Number of worker processes (default: CPU count)
+        progress: Called in this process as each path finishes
+        optimizer: If given, HTML exports embed screenshots optimized by
+                   it; its cache is shared by the workers. JSON exports,
+                   which can be re-imported, keep the originals.
+
+    Returns:
+        BatchExportResult with one entry per path and the timing
+    """
+    unknown = [fmt for fmt in formats if fmt not in BATCH_FORMATS]
+    if unknown:
+        raise ValueError(f"Unsupported batch export format: {', '.join(unknown)}")
+
+    start = time.perf_counter()
+    os.makedirs(output_dir, exist_ok=True)
+    encode_cache_dir = os.path.join(output_dir, ENCODE_CACHE_DIRNAME)
+    os.makedirs(encode_cache_dir, exist_ok=True)
+
+    result = BatchExportResult()
+    workers = max(1, min(workers or os.cpu_count() or 1, len(paths) or 1))
+    try:
+        # Spawned rather than forked: the parent may hold database connections
+        # and Qt state that must not be duplicated into the workers
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            queued = iter(paths)
+            running = {}
+
+            def submit_next() -> bool:
+                path = next(queued, None)
+                if path is None:
+                    return False
+                steps = data_service.get_steps_for_path(path.id)
+                entry = BatchExportEntry(path=path, step_count=len(steps))
+                result.entries.append(entry)
+                files = {
+                    fmt: f"{path.id}-{ExportService.get_suggested_filename(path, fmt)}"
+                    for fmt in formats
+                }
+                job = (path, steps, output_dir, files, annotated, embed_images, encode_cache_dir, optimizer)
+                running[pool.submit(_export_path, job)] = (entry, files)
+                return True
+
+            while len(running) < workers * JOBS_PER_WORKER and submit_next():
+                pass
+
+            done = 0
+            while running:
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    entry, files = running.pop(future)
+                    try:
+                        failed = future.result()
+                    except Exception as e:
+                        failed = list(files)
+                        print(f"Batch export error for '{entry.path.title}': {e}")
+                    entry.files = {fmt: name for fmt, name in files.items() if fmt not in failed}
+                    if failed:
+                        entry.error = f"Could not export {', '.join(failed)}"
+                    done += 1
+                    if progress:
+                        progress(done, len(paths), entry)
+                    submit_next()
+    finally:
+        shutil.rmtree(encode_cache_dir, ignore_errors=True)
+
+    result.index_path = os.path.join(output_dir, INDEX_FILENAME)
+    if not write_index(result.index_path, result.entries):
+        result.index_path = None
+    result.elapsed = time.perf_counter() - start
+    return result
+
+
+def _export_path(
+    job: Tuple[Path, List[Step], str, Dict[str, str], bool, bool, str, Optional[ImageOptimizer]]
+) -> List[str]:
+    """Worker: export one path in each format. Returns the formats that failed."""
+    path, steps, output_dir, files, annotated, embed_images, encode_cache_dir, optimizer = job
+    failed = []
+    for fmt, name in files.items():
+        output_path = os.path.join(output_dir, name)
+        if fmt == 'html':
+            ok = ExportService.export_html(
+                path, steps, output_path, annotated=annotated,
+                encode_cache_dir=encode_cache_dir, optimizer=optimizer
+            )
+        else:
+            ok = ExportService.export_json(
+                path, steps, output_path, embed_images=embed_images,
+                annotated=annotated, encode_cache_dir=encode_cache_dir
+            )
+        if not ok:
+            failed.append(fmt)
+    return failed
+
+
+def write_index(index_path: str, entries: List[BatchExportEntry]) -> bool:
+    """
+    Write an HTML page listing exported paths with links to their files.
+
+    Args:
+        index_path: File path to save the index
+        entries: Entries from a batch export, listed by category then title
+
+    Returns:
+        True if the index was written
+    """
+    rows = []
+    for entry in sorted(entries, key=lambda e: (e.path.category.lower(), e.path.title.lower())):
+        links = ' '.join(
+            f'<a href="{html.escape(name)}">{fmt.upper()}</a>' for fmt, name in sorted(entry.files.items())
+        )
+        if entry.error:
+            links += f' <span class="error">{html.escape(entry.error)}</span>'
+        updated = entry.path.updated_at.strftime('%Y-%m-%d') if entry.path.updated_at else ''
+        rows.append(f'''            <tr>
+                <td>{html.escape(entry.path.title)}</td>
+                <td>{html.escape(entry.path.category)}</td>
+                <td>{html.escape(', '.join(entry.path.tag_list))}</td>
+                <td class="number">{entry.step_count}</td>
+                <td>{updated}</td>
+                <td>{links}</td>
+            </tr>''')
+
+    page = f'''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>FlowPath Library</title>
+    <style>
+        body {{
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+            color: #333;
+            background: #f5f5f5;
+            margin: 0;
+            padding: 20px;
+        }}
+        .container {{
+            max-width: 1100px;
+            margin: 0 auto;
+            background: white;
+            padding: 32px;
+            border-radius: 8px;
+            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
+        }}
+        h1 {{
+            font-size: 26px;
+            margin: 0 0 8px 0;
+        }}
+        .summary {{
+            color: #666;
+            margin-bottom: 24px;
+        }}
+        table {{
+            width: 100%;
+            border-collapse: collapse;
+            font-size: 14px;
+        }}
+        th, td {{
+            text-align: left;
+            padding: 8px 10px;
+            border-bottom: 1px solid #eee;
+        }}
+        th {{
+            color: #444;
+            border-bottom: 2px solid #e0e0e0;
+        }}
+        .number {{
+            text-align: right;
+        }}
+        a {{
+            color: #1976D2;
+            text-decoration: none;
+            margin-right: 8px;
+        }}
+        .error {{
+            color: #c62828;
+        }}
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>FlowPath Library</h1>
+        <div class="summary">{len(entries)} paths, exported {datetime.now().strftime('%B %d, %Y at %I:%M %p')}</div>
+        <table>
+            <tr>
+                <th>Title</th>
+                <th>Category</th>
+                <th>Tags</th>
+                <th class="number">Steps</th>
+                <th>Updated</th>
+                <th>Files</th>
+            </tr>
+{chr(10).join(rows)}
+        </table>
+    </div>
+</body>
+</html>
+'''
+    temp_path = f"{index_path}.tmp"
+    try:
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(page)
+        os.replace(temp_path, index_path)
+        return True
+    except OSError as e:
+        print(f"Error writing export index: {e}")
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        return False
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point. Returns the process exit code."""
+    parser = argparse.ArgumentParser(
+        prog='python -m flowpath.services.batch_export',
+        description='Export FlowPath paths to HTML/JSON with an index page.'
+    )
+    parser.add_argument('output_dir', help='folder to write the exports and index.html to')
+    parser.add_argument('--format', dest='formats', action='append', choices=BATCH_FORMATS,
+                        help='export format; may be repeated (default: html and json)')
+    parser.add_argument('--path-id', dest='path_ids', type=int, action='append',
+                        help='export this path; may be repeated (default: all paths)')
+    parser.add_argument('--category', help='only export paths in this category')
+    parser.add_argument('--tag', help='only export paths with this tag')
+    parser.add_argument('--db', help='database file (default: the application database)')
+    parser.add_argument('--workers', type=int, help='worker processes (default: CPU count)')
+    parser.add_argument('--clean', action='store_true', help='export screenshots without annotations')
+    parser.add_argument('--no-embed', action='store_true', help="don't embed screenshots in JSON exports")
+    parser.add_argument('--image-format', choices=('webp', 'jpeg', 'original'), default='webp',
+                        help="re-encode HTML screenshots to this format, or embed them as they are "
+                             "(default: webp; JSON always keeps the originals)")
+    parser.add_argument('--max-size', type=int, default=ImageOptimizer.DEFAULT_MAX_DIMENSION,
+                        help='longest side of HTML screenshots, in pixels (default: %(default)s)')
+    parser.add_argument('--quality', type=int, default=ImageOptimizer.DEFAULT_QUALITY,
+                        help='image quality, 0-100 (default: %(default)s)')
+    args = parser.parse_args(argv)
+
+    optimizer = None
+    if args.image_format != 'original':
+        optimizer = ImageOptimizer(args.max_size, args.image_format, args.quality)
+        optimizer.prune_cache()
+
+    data_service = DataService(args.db)
+    try:
+        paths = select_paths(data_service, args.path_ids, args.category, args.tag)
+        if not paths:
+            print("No paths to export.")
+            return 1
+
+        def on_progress(done: int, total: int, entry: BatchExportEntry):
+            status = entry.error or ', '.join(sorted(entry.files.values()))
+            print(f"[{done}/{total}] {entry.path.title}: {status}")
+
+        result = batch_export(
+            data_service, paths, args.output_dir,
+            formats=tuple(dict.fromkeys(args.formats or BATCH_FORMATS)),
+            annotated=not args.clean,
+            embed_images=not args.no_embed,
+            workers=args.workers,
+            progress=on_progress,
+            optimizer=optimizer
+        )
+    finally:
+        data_service.db.close_all()
+
+    print(f"Exported {len(result.exported)} of {len(result.entries)} paths in {result.elapsed:.1f}s "
+          f"({result.paths_per_second:.1f} paths/sec)")
+    if result.index_path:
+        print(f"Index: {result.index_path}")
+    return 0 if not result.failed and result.index_path else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
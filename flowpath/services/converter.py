@@ -10,11 +10,23 @@ import subprocess
 import shutil
 import zipfile
 import platform
+import signal
+import threading
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Tuple, List
 from dataclasses import dataclass
 
+from .office_server import OfficeServer, OfficeServerUnavailable
+
+
+# Extensions LegacyConverter.convert() accepts
+CONVERTIBLE_EXTENSIONS = {'.docx', '.doc', '.pptx', '.ppt', '.txt'}
+
+
+class ConversionCancelled(Exception):
+    """Raised inside a conversion once LegacyConverter.cancel() is called."""
+
 
 @dataclass
 class ConversionResult:
@@ -25,6 +37,7 @@ class ConversionResult:
     error: Optional[str] = None
     title: str = ""
     step_count: int = 0
+    cancelled: bool = False  # Stopped by cancel() rather than failed
 
 
 def _find_executable(name: str, extra_paths: List[str] = None) -> Optional[str]:
@@ -85,14 +98,22 @@ class LegacyConverter:
     - .txt  -> Markdown with frontmatter wrapper
     """
     
-    def __init__(self, output_dir: str):
+    def __init__(self, output_dir: str, profile_dir: Optional[str] = None):
         """
         Initialize the converter.
         
         Args:
             output_dir: Directory where converted files will be saved
+            profile_dir: LibreOffice user profile to run soffice with. soffice
+                         instances sharing a profile can't run at the same
+                         time, so concurrent converters each need their own.
+                         If None, uses the user's default profile.
         """
         self.output_dir = Path(output_dir)
+        self.profile_dir = profile_dir
+        self._process: Optional[subprocess.Popen] = None
+        self._cancelled = False
+        self._lock = threading.Lock()
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self._is_macos = platform.system() == 'Darwin'
         
@@ -126,13 +147,111 @@ class LegacyConverter:
         ext = path.suffix.lower()
         
         if ext in ('.docx', '.doc'):
-            return self._convert_docx(path)
+            result = self._convert_docx(path)
         elif ext in ('.pptx', '.ppt'):
-            return self._convert_pptx(path)
+            result = self._convert_pptx(path)
         elif ext == '.txt':
-            return self._convert_txt(path)
+            result = self._convert_txt(path)
         else:
             return ConversionResult(success=False, error=f"Unsupported format: {ext}")
+        
+        if self._cancelled:
+            return ConversionResult(success=False, error="Conversion cancelled", cancelled=True)
+        return result
+    
+    def cancel(self) -> None:
+        """
+        Stop the conversion in progress from another thread.
+        
+        The running tool is terminated and convert() returns a failed
+        result; the converter can't be used afterwards.
+        """
+        with self._lock:
+            self._cancelled = True
+            if self._process is not None:
+                self._signal_process(self._process, signal.SIGTERM)
+    
+    def _run(self, args: List[str], timeout: float, text: bool = False) -> subprocess.CompletedProcess:
+        """
+        Run an external tool, capturing its output, like subprocess.run().
+        
+        The process is tracked so cancel() can terminate it. Raises
+        subprocess.TimeoutExpired after killing it if it runs too long, and
+        ConversionCancelled once the conversion has been cancelled.
+        """
+        with self._lock:
+            if self._cancelled:
+                raise ConversionCancelled()
+            # In its own process group, so helpers it starts (soffice.bin)
+            # are stopped with it
+            process = subprocess.Popen(
+                args, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=text,
+                start_new_session=(os.name == 'posix')
+            )
+            self._process = process
+        try:
+            stdout, stderr = process.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            self._signal_process(process, signal.SIGKILL if os.name == 'posix' else signal.SIGTERM)
+            process.communicate()
+            raise
+        finally:
+            with self._lock:
+                self._process = None
+        if self._cancelled:
+            raise ConversionCancelled()
+        return subprocess.CompletedProcess(args, process.returncode, stdout, stderr)
+    
+    @staticmethod
+    def _signal_process(process: subprocess.Popen, sig: int) -> None:
+        """Send a signal to a tool and, on POSIX, everything it started."""
+        if process.poll() is not None:
+            return
+        try:
+            if os.name == 'posix':
+                os.killpg(process.pid, sig)
+            else:
+                process.terminate()
+        except (ProcessLookupError, PermissionError):
+            pass
+    
+    def _soffice_to_pdf_args(self, path: Path, output_dir: Path) -> List[str]:
+        """soffice command line converting a document to PDF in output_dir."""
+        args = [self._soffice]
+        if self.profile_dir:
+            args.append(f"-env:UserInstallation={Path(self.profile_dir).resolve().as_uri()}")
+        return args + ['--headless', '--convert-to', 'pdf', '--outdir', str(output_dir), str(path)]
+    
+    def _convert_to_pdf(self, path: Path, output_dir: Path) -> Optional[Path]:
+        """
+        Convert a document to PDF in output_dir with LibreOffice.
+        
+        Uses the shared LibreOffice server when it can be started, and
+        otherwise starts soffice just for this document.
+        
+        Returns:
+            Path of the PDF, or None if it could not be created
+        """
+        pdf_path = output_dir / f"{path.stem}.pdf"
+        server = OfficeServer.for_profile(self._soffice, self.profile_dir)
+        if server is not None and server.is_available():
+            try:
+                print("Converting to PDF using LibreOffice server")
+                if server.convert_to_pdf(path, pdf_path, self._run):
+                    return pdf_path
+                return None
+            except OfficeServerUnavailable as e:
+                print(f"LibreOffice server unavailable, starting soffice instead: {e}")
+        
+        print(f"Converting to PDF using: {self._soffice}")
+        result = self._run(self._soffice_to_pdf_args(path, output_dir), timeout=120)
+        if result.returncode != 0:
+            print(f"LibreOffice PDF conversion failed: {result.stderr}")
+            return None
+        if not pdf_path.exists():
+            print(f"PDF not created at expected path: {pdf_path}")
+            return None
+        return pdf_path
     
     def _convert_docx(self, path: Path) -> ConversionResult:
         """Convert a Word document to FlowPath markdown."""
@@ -307,11 +426,10 @@ class LegacyConverter:
             return None
         
         try:
-            result = subprocess.run(
+            result = self._run(
                 [self._pandoc, str(path), '-t', 'markdown', '--wrap=none'],
-                capture_output=True,
-                text=True,
-                timeout=60
+                timeout=60,
+                text=True
             )
             if result.returncode == 0:
                 return result.stdout
@@ -375,6 +493,11 @@ class LegacyConverter:
         # Embedded media (ppt/media/*) contains images USED IN slides (logos, photos, icons),
         # not screenshots OF the slides. Using them is misleading.
         
+        # Remove a PDF left for methods that then failed
+        pdf_path = output_dir / f"{path.stem}.pdf"
+        if pdf_path.exists():
+            pdf_path.unlink()
+        
         # No images extracted - return empty strings for each slide
         print("Warning: Could not extract slide images.")
         print("  For slide screenshots, install LibreOffice: brew install --cask libreoffice")
@@ -394,30 +517,16 @@ class LegacyConverter:
                 return []
             
             # Convert to PDF first
-            print(f"Converting to PDF using: {self._soffice}")
-            pdf_result = subprocess.run(
-                [self._soffice, '--headless', '--convert-to', 'pdf', 
-                 '--outdir', str(output_dir), str(path)],
-                capture_output=True,
-                timeout=120
-            )
-            
-            if pdf_result.returncode != 0:
-                print(f"LibreOffice PDF conversion failed: {pdf_result.stderr}")
-                return []
-            
-            pdf_path = output_dir / f"{path.stem}.pdf"
-            if not pdf_path.exists():
-                print(f"PDF not created at expected path: {pdf_path}")
+            pdf_path = self._convert_to_pdf(path, output_dir)
+            if pdf_path is None:
                 return []
             
             print(f"PDF created, converting to images using: {self._pdftoppm}")
             
             # Convert PDF to images with pdftoppm
-            pdftoppm_result = subprocess.run(
+            pdftoppm_result = self._run(
                 [self._pdftoppm, '-jpeg', '-r', '150', 
                  str(pdf_path), str(output_dir / 'slide')],
-                capture_output=True,
                 timeout=120
             )
             
@@ -442,11 +551,8 @@ class LegacyConverter:
                 
                 return sorted(renamed_images)
             else:
+                # Keep the PDF for the other methods instead of converting again
                 print(f"pdftoppm failed: {pdftoppm_result.stderr}")
-            
-            # pdftoppm failed, clean up PDF
-            if pdf_path.exists():
-                pdf_path.unlink()
                 
         except subprocess.TimeoutExpired:
             print("LibreOffice conversion timed out")
@@ -464,12 +570,7 @@ class LegacyConverter:
             # Try to create PDF if it doesn't exist
             if not pdf_path.exists() and self._soffice:
                 try:
-                    subprocess.run(
-                        [self._soffice, '--headless', '--convert-to', 'pdf', 
-                         '--outdir', str(output_dir), str(path)],
-                        capture_output=True,
-                        timeout=120
-                    )
+                    self._convert_to_pdf(path, output_dir)
                 except:
                     pass
             
@@ -484,9 +585,8 @@ class LegacyConverter:
             # This is complex, so let's try qlmanage for a thumbnail at least
             try:
                 # qlmanage can generate thumbnails
-                ql_result = subprocess.run(
+                ql_result = self._run(
                     ['qlmanage', '-t', '-s', '1024', '-o', str(output_dir), str(path)],
-                    capture_output=True,
                     timeout=30
                 )
                 
@@ -524,12 +624,7 @@ class LegacyConverter:
             # Try to create PDF if it doesn't exist
             if not pdf_path.exists() and self._soffice:
                 try:
-                    subprocess.run(
-                        [self._soffice, '--headless', '--convert-to', 'pdf', 
-                         '--outdir', str(output_dir), str(path)],
-                        capture_output=True,
-                        timeout=120
-                    )
+                    self._convert_to_pdf(path, output_dir)
                 except:
                     return []
             
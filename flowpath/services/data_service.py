@@ -6,10 +6,10 @@ This is the primary interface that UI components use to interact with the databa
 """
 
 import os
-from pathlib import Path as FilePath
-from typing import List, Optional, Tuple
-from ..models import Path, Step, LegacyDocument, LEGACY_EXTENSIONS
-from ..data import Database, PathRepository, StepRepository
+from typing import Dict, Iterable, List, Optional, Tuple
+from . import annotation_layers
+from ..models import Path, PathSummary, PathSearchResult, Step, LegacyDocument, LEGACY_EXTENSIONS
+from ..data import Database, PathRepository, StepRepository, LegacyDocumentIndex
 
 
 class DataService:
@@ -50,6 +50,7 @@ class DataService:
         self.db.initialize()
         self._path_repo = PathRepository(self.db)
         self._step_repo = StepRepository(self.db)
+        self._legacy_index = LegacyDocumentIndex(self.db)
         self._team_folder: Optional[str] = None
 
     @property
@@ -80,6 +81,8 @@ class DataService:
     @classmethod
     def reset_instance(cls) -> None:
         """Reset the singleton instance (useful for testing)."""
+        if cls._instance is not None:
+            cls._instance.db.close_all()
         cls._instance = None
 
     # ==================== Path Operations ====================
@@ -133,6 +136,34 @@ class DataService:
         """
         return self._path_repo.get_all()
 
+    def get_path_summaries(
+        self,
+        category: Optional[str] = None,
+        tag: Optional[str] = None,
+        search: Optional[str] = None,
+        include_thumbnails: bool = False
+    ) -> List[PathSummary]:
+        """
+        Get paths with their step counts in a single query.
+
+        Use this for listings instead of calling count_steps() per path.
+
+        Args:
+            category: Optional category to filter by
+            tag: Optional tag to filter by
+            search: Optional search query
+            include_thumbnails: Also fetch each path's first screenshot
+
+        Returns:
+            List of PathSummary objects, most recently updated first
+        """
+        return self._path_repo.get_summaries(
+            category=category,
+            tag=tag,
+            query=search,
+            include_thumbnails=include_thumbnails,
+        )
+
     def get_paths_by_category(self, category: str) -> List[Path]:
         """
         Get paths filtered by category.
@@ -159,7 +190,7 @@ class DataService:
 
     def search_paths(self, query: str) -> List[Path]:
         """
-        Search paths by title, description, or tags.
+        Search paths by title, description, tags, or step instructions.
 
         Args:
             query: Search query
@@ -169,6 +200,34 @@ class DataService:
         """
         return self._path_repo.search(query)
 
+    def search_paths_ranked(
+        self,
+        query: str,
+        limit: Optional[int] = 50,
+        highlight_start: str = "**",
+        highlight_end: str = "**"
+    ) -> List[PathSearchResult]:
+        """
+        Full-text search ranked by relevance, with highlighted snippets.
+
+        Snippets use Markdown bold by default so they render in MarkdownLabel.
+
+        Args:
+            query: Search query
+            limit: Maximum number of results (None for all)
+            highlight_start: Marker placed before matched terms
+            highlight_end: Marker placed after matched terms
+
+        Returns:
+            List of PathSearchResult objects, best match first
+        """
+        return self._path_repo.search_ranked(
+            query,
+            limit=limit,
+            highlight_start=highlight_start,
+            highlight_end=highlight_end,
+        )
+
     def update_path(self, path: Path) -> bool:
         """
         Update an existing path.
@@ -191,7 +250,11 @@ class DataService:
         Returns:
             True if deletion was successful
         """
-        return self._path_repo.delete(path_id)
+        screenshots = [step.screenshot_path for step in self._step_repo.get_by_path_id(path_id)]
+        deleted = self._path_repo.delete(path_id)
+        if deleted:
+            self.release_screenshots(screenshots)
+        return deleted
 
     def get_categories(self) -> List[str]:
         """
@@ -268,7 +331,11 @@ class DataService:
         Returns:
             True if update was successful
         """
-        return self._step_repo.update(step)
+        previous = self._step_repo.get_by_id(step.id) if step.id is not None else None
+        updated = self._step_repo.update(step)
+        if updated and previous and previous.screenshot_path != step.screenshot_path:
+            self.release_screenshots([previous.screenshot_path])
+        return updated
 
     def delete_step(self, step_id: int) -> bool:
         """
@@ -280,7 +347,25 @@ class DataService:
         Returns:
             True if deletion was successful
         """
-        return self._step_repo.delete(step_id)
+        step = self._step_repo.get_by_id(step_id)
+        deleted = self._step_repo.delete(step_id)
+        if deleted and step:
+            self.release_screenshots([step.screenshot_path])
+        return deleted
+
+    def release_screenshots(self, screenshot_paths: Iterable[Optional[str]]) -> None:
+        """
+        Remove the annotation layers of screenshots no step uses any more.
+
+        Call after steps were deleted or their screenshots replaced. The
+        screenshot files themselves are kept.
+
+        Args:
+            screenshot_paths: Screenshots that may have become unused
+        """
+        for screenshot_path in set(filter(None, screenshot_paths)):
+            if self._step_repo.count_by_screenshot(screenshot_path) == 0:
+                annotation_layers.remove_layers(screenshot_path)
 
     def get_next_step_number(self, path_id: int) -> int:
         """
@@ -322,6 +407,7 @@ class DataService:
         Returns:
             The ID of the saved path
         """
+        previous_screenshots = []
         if path.id is None:
             # New path
             path_id = self.create_path(path)
@@ -330,6 +416,7 @@ class DataService:
             self.update_path(path)
             path_id = path.id
             # Delete existing steps
+            previous_screenshots = [s.screenshot_path for s in self._step_repo.get_by_path_id(path_id)]
             self._step_repo.delete_by_path_id(path_id)
 
         # Create new steps
@@ -338,6 +425,8 @@ class DataService:
             step.step_number = i
             self.create_step(step)
 
+        # Steps removed or given a new screenshot leave layers behind
+        self.release_screenshots(previous_screenshots)
         return path_id
 
     def duplicate_path(self, path_id: int, new_title: Optional[str] = None) -> Optional[int]:
@@ -381,39 +470,42 @@ class DataService:
 
     # ==================== Legacy Document Operations ====================
 
-    def get_legacy_documents(self) -> List[LegacyDocument]:
+    def get_legacy_documents(self, check_files: bool = False) -> List[LegacyDocument]:
         """
-        Scan the team folder for legacy documents.
-        
+        Get the legacy documents in the team folder and its subfolders.
+
+        Served from the legacy document index, which only re-lists folders
+        that changed since the last scan.
+
+        Args:
+            check_files: Also stat each known document to catch in-place edits
+
         Returns:
-            List of LegacyDocument objects found in the team folder
+            List of LegacyDocument objects, newest first
         """
         if not self._team_folder or not os.path.isdir(self._team_folder):
             return []
-        
-        legacy_docs = []
-        team_path = FilePath(self._team_folder)
-        
-        # Scan for legacy files (not in paths/ subdirectory, not .md files)
-        for item in team_path.iterdir():
-            if item.is_file():
-                # Skip markdown files (those are FlowPath paths)
-                if item.suffix.lower() == '.md':
-                    continue
-                # Skip hidden files
-                if item.name.startswith('.'):
-                    continue
-                # Skip JSON config files
-                if item.suffix.lower() == '.json':
-                    continue
-                    
-                doc = LegacyDocument.from_path(str(item))
-                if doc:
-                    legacy_docs.append(doc)
-        
-        # Sort by modified date, newest first
-        legacy_docs.sort(key=lambda d: d.modified_at, reverse=True)
-        return legacy_docs
+        return self._legacy_index.scan(self._team_folder, check_files=check_files)
+
+    def get_legacy_document_folders(self) -> List[str]:
+        """
+        Get the team folder and the subfolders found by the last scan.
+
+        Returns:
+            List of directory paths, team folder first
+        """
+        if not self._team_folder:
+            return []
+        return self._legacy_index.directories(self._team_folder)
+
+    def invalidate_legacy_documents(self, path: Optional[str] = None) -> None:
+        """
+        Force a re-scan of changed team folder contents on the next listing.
+
+        Args:
+            path: File or folder that changed, or None to re-scan everything
+        """
+        self._legacy_index.invalidate(path)
 
     def search_legacy_documents(self, query: str) -> List[LegacyDocument]:
         """
@@ -537,7 +629,7 @@ class DataService:
         """
         with self.db.connection() as conn:
             cursor = conn.execute(
-                "SELECT id, name FROM tags ORDER BY name"
+                "SELECT id, name FROM tags WHERE managed = 1 ORDER BY name COLLATE NOCASE"
             )
             return [dict(row) for row in cursor.fetchall()]
 
@@ -545,6 +637,9 @@ class DataService:
         """
         Add a new tag.
 
+        A tag that paths already use but an admin hasn't added yet, in
+        any letter case, is added to the managed list as is.
+
         Args:
             name: Tag name
 
@@ -552,6 +647,13 @@ class DataService:
             ID of the created tag
         """
         with self.db.connection() as conn:
+            row = conn.execute(
+                "SELECT id FROM tags WHERE name = ? COLLATE NOCASE AND managed = 0",
+                (name.strip(),)
+            ).fetchone()
+            if row is not None:
+                conn.execute("UPDATE tags SET managed = 1 WHERE id = ?", (row[0],))
+                return row[0]
             cursor = conn.execute(
                 "INSERT INTO tags (name) VALUES (?)",
                 (name.strip(),)
@@ -560,7 +662,7 @@ class DataService:
 
     def delete_tag(self, tag_id: int) -> bool:
         """
-        Delete a tag.
+        Delete a tag and remove it from every path that uses it.
 
         Args:
             tag_id: ID of the tag to delete
@@ -569,12 +671,17 @@ class DataService:
             True if deletion was successful
         """
         with self.db.connection() as conn:
+            self._path_repo.replace_tag(tag_id, None)
             cursor = conn.execute("DELETE FROM tags WHERE id = ?", (tag_id,))
             return cursor.rowcount > 0
 
     def rename_tag(self, tag_id: int, new_name: str) -> bool:
         """
-        Rename a tag.
+        Rename a tag, updating every path that uses it.
+
+        Renaming onto a tag that paths use but the Admin list doesn't show
+        merges the two: the paths move to that tag, which becomes managed.
+        Renaming onto another managed tag raises sqlite3.IntegrityError.
 
         Args:
             tag_id: ID of the tag to rename
@@ -583,11 +690,30 @@ class DataService:
         Returns:
             True if rename was successful
         """
+        new_name = new_name.strip()
         with self.db.connection() as conn:
-            cursor = conn.execute(
-                "UPDATE tags SET name = ? WHERE id = ?",
-                (new_name.strip(), tag_id)
+            row = conn.execute(
+                "SELECT id FROM tags WHERE name = ? COLLATE NOCASE AND managed = 0 AND id != ?",
+                (new_name, tag_id)
+            ).fetchone()
+            self._path_repo.replace_tag(tag_id, new_name)
+            if row is None:
+                cursor = conn.execute(
+                    "UPDATE tags SET name = ? WHERE id = ?",
+                    (new_name, tag_id)
+                )
+                return cursor.rowcount > 0
+
+            existing_id = row[0]
+            conn.execute(
+                """
+                INSERT OR IGNORE INTO path_tags (path_id, tag_id)
+                SELECT path_id, ? FROM path_tags WHERE tag_id = ?
+                """,
+                (existing_id, tag_id)
             )
+            conn.execute("UPDATE tags SET managed = 1, name = ? WHERE id = ?", (new_name, existing_id))
+            cursor = conn.execute("DELETE FROM tags WHERE id = ?", (tag_id,))
             return cursor.rowcount > 0
 
     def get_category_usage_count(self, category_name: str) -> int:
@@ -619,11 +745,37 @@ class DataService:
         """
         with self.db.connection() as conn:
             cursor = conn.execute(
-                "SELECT COUNT(*) FROM paths WHERE tags LIKE ?",
-                (f"%{tag_name}%",)
+                """
+                SELECT COUNT(*) FROM path_tags pt
+                JOIN tags t ON t.id = pt.tag_id
+                WHERE t.name = ? COLLATE NOCASE
+                """,
+                (tag_name,)
             )
             return cursor.fetchone()[0]
 
+    def get_tag_usage_counts(self) -> Dict[str, int]:
+        """
+        Get the number of paths using each tag in one query.
+
+        Returns:
+            Dict mapping tag name to number of paths
+        """
+        return self._path_repo.get_tag_counts()
+
+    def get_category_usage_counts(self) -> Dict[str, int]:
+        """
+        Get the number of paths in each category in one query.
+
+        Returns:
+            Dict mapping category name to number of paths
+        """
+        with self.db.connection() as conn:
+            cursor = conn.execute(
+                "SELECT category, COUNT(*) FROM paths GROUP BY category"
+            )
+            return {row[0]: row[1] for row in cursor.fetchall()}
+
     # ==================== Settings Operations ====================
 
     def get_setting(self, key: str, default: str = "") -> str:
@@ -1,18 +1,29 @@
 """
 Export service for FlowPath application.
 
-Provides export functionality for paths in JSON, HTML, and PDF formats.
+Provides export functionality for paths in JSON, HTML, and PDF formats,
+and .flowpath bundles for moving paths between installations.
 """
 
 import base64
+import hashlib
 import json
 import os
 import re
+import shutil
+import uuid
+import zipfile
 from datetime import datetime
 from pathlib import Path as FilePath
-from typing import List, Optional, Tuple
+from typing import TYPE_CHECKING, Callable, Iterator, List, Optional, TextIO, Tuple
 
 from ..models import Path, Step
+from . import annotation_layers
+from .data_service import DataService
+from .json_stream import JsonStreamReader
+
+if TYPE_CHECKING:
+    from .image_optimizer import ImageOptimizer
 
 
 def _markdown_to_html(text: str) -> str:
@@ -48,30 +59,110 @@ def _markdown_to_html(text: str) -> str:
     return html
 
 
-def _image_to_base64(image_path: str) -> Optional[str]:
-    """Convert an image file to base64 data URI."""
-    if not image_path or not os.path.exists(image_path):
-        return None
-
+# Bytes of image read per base64 chunk; a multiple of 3 so chunks encode
+# without padding and can simply be concatenated
+BASE64_CHUNK_BYTES = 3 * 64 * 1024
+
+# .flowpath bundles
+BUNDLE_FORMAT = 'flowpath-bundle'
+BUNDLE_VERSION = 1
+BUNDLE_CHUNK_BYTES = 1024 * 1024
+# Formats that are already compressed; deflating them again only costs time
+COMPRESSED_IMAGE_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.gif', '.webp'}
+_BUNDLE_IMAGE_NAME = re.compile(r'^images/([0-9a-f]{64})(\.[a-z0-9]{1,5})$')
+
+IMAGE_MIME_TYPES = {
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.gif': 'image/gif',
+    '.webp': 'image/webp',
+}
+
+
+def _image_mime_type(image_path: str) -> str:
+    """MIME type of an image file, from its extension."""
+    return IMAGE_MIME_TYPES.get(FilePath(image_path).suffix.lower(), 'image/png')
+
+
+def _write_base64_image(out: TextIO, image_path: str, encode_cache_dir: Optional[str] = None) -> None:
+    """
+    Write an image file to out as a base64 data URI, a chunk at a time.
+
+    Only one chunk of the image is in memory at once, however large it is.
+    With encode_cache_dir, the encoded text is kept there (keyed by file,
+    size and modification time) and reused by later exports of the same
+    screenshot, including ones running in other processes.
+    """
+    out.write(f"data:{_image_mime_type(image_path)};base64,")
+    cache_file = _encoded_image_cache_file(image_path, encode_cache_dir) if encode_cache_dir else None
+    if cache_file and os.path.exists(cache_file):
+        with open(cache_file, 'r', encoding='ascii') as cached:
+            shutil.copyfileobj(cached, out, BASE64_CHUNK_BYTES // 3 * 4)
+        return
+
+    cache = None
+    if cache_file:
+        # Unique per process: several exporters may encode the same image at once
+        cache_temp = f"{cache_file}.{os.getpid()}.tmp"
+        try:
+            cache = open(cache_temp, 'w', encoding='ascii')
+        except OSError as e:
+            print(f"Image encode cache disabled for {os.path.basename(image_path)}: {e}")
     try:
         with open(image_path, 'rb') as f:
-            data = f.read()
-
-        # Determine MIME type from extension
-        ext = FilePath(image_path).suffix.lower()
-        mime_types = {
-            '.png': 'image/png',
-            '.jpg': 'image/jpeg',
-            '.jpeg': 'image/jpeg',
-            '.gif': 'image/gif',
-            '.webp': 'image/webp',
-        }
-        mime_type = mime_types.get(ext, 'image/png')
+            while True:
+                chunk = f.read(BASE64_CHUNK_BYTES)
+                if not chunk:
+                    break
+                encoded = base64.b64encode(chunk).decode('ascii')
+                out.write(encoded)
+                if cache:
+                    cache.write(encoded)
+    except BaseException:
+        if cache:
+            cache.close()
+            os.remove(cache_temp)
+        raise
+    if cache:
+        cache.close()
+        os.replace(cache_temp, cache_file)
+
+
+def _encoded_image_cache_file(image_path: str, encode_cache_dir: str) -> Optional[str]:
+    """File holding the base64 text of an image in the encode cache, or None if it can't be stat'ed."""
+    try:
+        stat = os.stat(image_path)
+    except OSError:
+        return None
+    key = f"{os.path.abspath(image_path)}\0{stat.st_size}\0{stat.st_mtime_ns}"
+    return os.path.join(encode_cache_dir, f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.b64")
+
 
-        encoded = base64.b64encode(data).decode('utf-8')
-        return f"data:{mime_type};base64,{encoded}"
-    except Exception:
+def _default_image_dir(data_service: DataService) -> str:
+    """Folder imported screenshots are saved to: screenshots/ beside the database."""
+    return os.path.join(os.path.dirname(os.path.abspath(data_service.db.db_path)), 'screenshots')
+
+
+def _hash_file(file_path: str) -> str:
+    """SHA-256 hex digest of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(BUNDLE_CHUNK_BYTES), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _screenshot_for_export(
+    step: Step,
+    annotated: bool,
+    optimizer: Optional['ImageOptimizer'] = None
+) -> Optional[str]:
+    """Image file to export for a step, or None if it has no screenshot."""
+    if not step.screenshot_path or not os.path.exists(step.screenshot_path):
         return None
+    image_path = annotation_layers.export_image_path(step.screenshot_path, annotated)
+    return optimizer.optimize(image_path) if optimizer else image_path
 
 
 class ExportService:
@@ -82,77 +173,440 @@ class ExportService:
         path: Path,
         steps: List[Step],
         output_path: str,
-        embed_images: bool = False
+        embed_images: bool = False,
+        annotated: bool = True,
+        compact: bool = False,
+        encode_cache_dir: Optional[str] = None,
+        optimizer: Optional['ImageOptimizer'] = None
     ) -> bool:
         """
         Export a path to JSON format.
 
+        Steps are written one at a time and embedded images are encoded
+        straight from disk, so memory use doesn't grow with the export.
+
         Args:
             path: The Path object to export
             steps: List of Step objects for the path
             output_path: File path to save the JSON
             embed_images: If True, embed images as base64 in the JSON
+            annotated: If False, embed screenshots without their annotations
+            compact: If True, write without indentation or spaces
+            encode_cache_dir: Directory of base64-encoded images shared
+                              between exports (see batch_export)
+            optimizer: If given, embed screenshots scaled down and re-encoded
+                       by it instead of the original files
 
         Returns:
             True if export was successful
         """
+        temp_path = f"{output_path}.tmp"
         try:
-            export_data = {
-                'version': '1.0',
-                'exported_at': datetime.now().isoformat(),
-                'path': path.to_dict(),
-                'steps': []
-            }
-
-            for step in steps:
-                step_data = step.to_dict()
-                if embed_images and step.screenshot_path:
-                    base64_image = _image_to_base64(step.screenshot_path)
-                    if base64_image:
-                        step_data['screenshot_base64'] = base64_image
-                export_data['steps'].append(step_data)
-
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False)
-
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                ExportService._write_json(
+                    f, path, steps, embed_images, annotated, compact, encode_cache_dir, optimizer
+                )
+            os.replace(temp_path, output_path)
             return True
         except Exception as e:
             print(f"JSON export error: {e}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
             return False
 
+    @staticmethod
+    def _write_json(
+        out: TextIO,
+        path: Path,
+        steps: List[Step],
+        embed_images: bool,
+        annotated: bool,
+        compact: bool,
+        encode_cache_dir: Optional[str] = None,
+        optimizer: Optional['ImageOptimizer'] = None
+    ) -> None:
+        """Write the JSON document for a path to out, a step at a time."""
+        indent = None if compact else 2
+        separators = (',', ':') if compact else (',', ': ')
+
+        def newline(level: int) -> str:
+            return '' if compact else '\n' + ' ' * (2 * level)
+
+        def dump(value, level: int) -> str:
+            text = json.dumps(value, indent=indent, separators=separators, ensure_ascii=False)
+            return text.replace('\n', newline(level)) if not compact else text
+
+        header = {
+            'version': '1.0',
+            'exported_at': datetime.now().isoformat(),
+            'path': path.to_dict(),
+        }
+        out.write('{')
+        for key, value in header.items():
+            out.write(f"{newline(1)}{dump(key, 1)}{separators[1]}{dump(value, 1)},")
+        out.write(f"{newline(1)}\"steps\"{separators[1]}[")
+
+        for i, step in enumerate(steps):
+            step_text = dump(step.to_dict(), 2)
+            image_path = _screenshot_for_export(step, annotated, optimizer) if embed_images else None
+            if image_path and not os.access(image_path, os.R_OK):
+                image_path = None
+            out.write(f"{',' if i else ''}{newline(2)}")
+            if not image_path:
+                out.write(step_text)
+                continue
+            # Re-open the step object to append the image without building it in memory
+            out.write(step_text[:step_text.rindex('}')].rstrip())
+            out.write(f",{newline(3)}\"screenshot_base64\"{separators[1]}\"")
+            _write_base64_image(out, image_path, encode_cache_dir)
+            out.write(f"\"{newline(2)}}}")
+
+        out.write(f"{newline(1) if steps else ''}]{newline(0)}}}")
+
+    @staticmethod
+    def import_json(
+        input_path: str,
+        data_service: DataService,
+        image_dir: Optional[str] = None
+    ) -> Optional[int]:
+        """
+        Import a path from a FlowPath JSON export as a new path.
+
+        The file is read incrementally: embedded screenshots are decoded
+        to image files in chunks as they are read, so neither the file nor
+        its images are held in memory. Steps without an embedded image
+        keep their screenshot_path if that file exists.
+
+        Args:
+            input_path: JSON file exported by export_json
+            data_service: DataService to save the path into
+            image_dir: Directory for decoded screenshots. If None, uses the
+                       screenshots folder next to the database.
+
+        Returns:
+            ID of the new path, or None if the import failed
+        """
+        if image_dir is None:
+            image_dir = _default_image_dir(data_service)
+        written: List[str] = []
+        try:
+            os.makedirs(image_dir, exist_ok=True)
+            path: Optional[Path] = None
+            steps: List[Step] = []
+            with open(input_path, 'r', encoding='utf-8') as f:
+                reader = JsonStreamReader(f)
+                for key in reader.iter_object():
+                    if key == 'path':
+                        path = Path.from_dict(reader.read_value())
+                    elif key == 'steps':
+                        for _ in reader.iter_array():
+                            steps.append(ExportService._read_json_step(reader, image_dir, written))
+                    else:
+                        reader.skip_value()
+
+            if path is None:
+                raise ValueError("No path in file")
+            path.id = None
+            path.created_at = path.updated_at = None
+            return data_service.save_path_with_steps(path, steps)
+        except Exception as e:
+            print(f"JSON import error: {e}")
+            for image_path in written:
+                if os.path.exists(image_path):
+                    os.remove(image_path)
+            return None
+
+    @staticmethod
+    def _read_json_step(reader: JsonStreamReader, image_dir: str, written: List[str]) -> Step:
+        """Read one step object, decoding an embedded screenshot to image_dir."""
+        data = {}
+        image_path = None
+        for key in reader.iter_object():
+            if key != 'screenshot_base64':
+                data[key] = reader.read_value()
+                continue
+            if reader.peek_type() != '"':
+                reader.skip_value()
+                continue
+            image_path = ExportService._decode_data_uri(reader.iter_string(), image_dir, written)
+
+        step = Step.from_dict(data)
+        step.id = None
+        step.created_at = step.updated_at = None
+        if image_path:
+            step.screenshot_path = image_path
+        elif step.screenshot_path and not os.path.exists(step.screenshot_path):
+            step.screenshot_path = None
+        return step
+
+    @staticmethod
+    def _decode_data_uri(pieces: Iterator[str], image_dir: str, written: List[str]) -> str:
+        """Decode a streamed base64 data URI into a new file in image_dir, recorded in written."""
+        pending = ''
+        header = None
+        image_path = None
+        f = None
+        try:
+            for piece in pieces:
+                pending += piece
+                if header is None:
+                    if ',' not in pending:
+                        continue
+                    header, pending = pending.split(',', 1)
+                    mime_type = header[len('data:'):].split(';')[0]
+                    extension = next(
+                        (ext for ext, mime in IMAGE_MIME_TYPES.items() if mime == mime_type), '.png'
+                    )
+                    image_path = os.path.join(image_dir, f"import_{uuid.uuid4().hex}{extension}")
+                    written.append(image_path)
+                    f = open(image_path, 'wb')
+                # Decode whole 4-character groups; keep the rest for the next piece
+                usable = len(pending) - len(pending) % 4
+                f.write(base64.b64decode(pending[:usable]))
+                pending = pending[usable:]
+            if f is None:
+                raise ValueError("Embedded screenshot is not a data URI")
+            if pending:
+                f.write(base64.b64decode(pending))
+        finally:
+            if f is not None:
+                f.close()
+        return image_path
+
+    @staticmethod
+    def export_bundle(
+        paths: List[Tuple[Path, List[Step]]],
+        output_path: str,
+        annotated: bool = True
+    ) -> bool:
+        """
+        Export paths to a .flowpath bundle.
+
+        A bundle is a zip archive containing:
+            manifest.json        format, version and one record per path
+            paths/<n>.json       the path's metadata and step records
+            images/<sha256>.ext  screenshots, stored once by content hash
+
+        A screenshot used by several steps or paths is stored once.
+        Already-compressed images (PNG, JPEG...) are stored as they are,
+        and other files are deflated. Images are copied into the archive
+        in chunks, without base64.
+
+        Args:
+            paths: (Path, steps) pairs to export
+            output_path: File path to save the bundle
+            annotated: If False, use screenshots without their annotations
+
+        Returns:
+            True if export was successful
+        """
+        temp_path = f"{output_path}.tmp"
+        try:
+            # Hashes by file, so an image shared by steps is only read once
+            hashes = {}
+            with zipfile.ZipFile(temp_path, 'w', zipfile.ZIP_DEFLATED) as bundle:
+                stored = set()
+                manifest = {
+                    'format': BUNDLE_FORMAT,
+                    'version': BUNDLE_VERSION,
+                    'exported_at': datetime.now().isoformat(),
+                    'paths': [],
+                }
+                for n, (path, steps) in enumerate(paths):
+                    step_records = []
+                    for step in steps:
+                        record = step.to_dict()
+                        record['screenshot_path'] = None
+                        image_path = _screenshot_for_export(step, annotated)
+                        if image_path:
+                            key = os.path.abspath(image_path)
+                            if key not in hashes:
+                                hashes[key] = _hash_file(image_path)
+                            extension = os.path.splitext(image_path)[1].lower() or '.png'
+                            name = f"images/{hashes[key]}{extension}"
+                            if name not in stored:
+                                compression = (zipfile.ZIP_STORED if extension in COMPRESSED_IMAGE_EXTENSIONS
+                                               else zipfile.ZIP_DEFLATED)
+                                bundle.write(image_path, name, compress_type=compression)
+                                stored.add(name)
+                            record['image'] = name
+                        step_records.append(record)
+
+                    records_name = f"paths/{n}.json"
+                    bundle.writestr(records_name, json.dumps(
+                        {'path': path.to_dict(), 'steps': step_records},
+                        separators=(',', ':'), ensure_ascii=False
+                    ))
+                    manifest['paths'].append({
+                        'title': path.title,
+                        'steps': len(steps),
+                        'records': records_name,
+                    })
+                bundle.writestr('manifest.json', json.dumps(manifest, indent=2, ensure_ascii=False))
+            os.replace(temp_path, output_path)
+            return True
+        except Exception as e:
+            print(f"Bundle export error: {e}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            return False
+
+    @staticmethod
+    def import_bundle(
+        input_path: str,
+        data_service: DataService,
+        image_dir: Optional[str] = None
+    ) -> Optional[List[int]]:
+        """
+        Import the paths in a .flowpath bundle as new paths.
+
+        Images are extracted in chunks, checked against their hash and
+        named by it. An image that is already in image_dir (from an
+        earlier import) is reused, not copied again.
+
+        Args:
+            input_path: Bundle written by export_bundle
+            data_service: DataService to save the paths into
+            image_dir: Directory for screenshots. If None, uses the
+                       screenshots folder next to the database.
+
+        Returns:
+            IDs of the new paths, or None if the import failed
+        """
+        if image_dir is None:
+            image_dir = _default_image_dir(data_service)
+        written: List[str] = []
+        created: List[int] = []
+        try:
+            os.makedirs(image_dir, exist_ok=True)
+            with zipfile.ZipFile(input_path, 'r') as bundle:
+                manifest = json.loads(bundle.read('manifest.json'))
+                if manifest.get('format') != BUNDLE_FORMAT:
+                    raise ValueError("Not a FlowPath bundle")
+                if manifest.get('version', 0) > BUNDLE_VERSION:
+                    raise ValueError(f"Bundle version {manifest.get('version')} is newer than supported")
+
+                # Extract first, so a bad archive fails before anything is saved
+                imports = []
+                extracted = {}
+                for entry in manifest['paths']:
+                    with bundle.open(entry['records']) as f:
+                        records = json.load(f)
+                    steps = []
+                    for record in records['steps']:
+                        name = record.pop('image', None)
+                        step = Step.from_dict(record)
+                        step.id = None
+                        step.created_at = step.updated_at = None
+                        if name:
+                            if name not in extracted:
+                                extracted[name] = ExportService._extract_bundle_image(
+                                    bundle, name, image_dir, written
+                                )
+                            step.screenshot_path = extracted[name]
+                        steps.append(step)
+                    path = Path.from_dict(records['path'])
+                    path.id = None
+                    path.created_at = path.updated_at = None
+                    imports.append((path, steps))
+
+            for path, steps in imports:
+                created.append(data_service.save_path_with_steps(path, steps))
+            return created
+        except Exception as e:
+            print(f"Bundle import error: {e}")
+            for path_id in created:
+                data_service.delete_path(path_id)
+            for image_path in written:
+                if os.path.exists(image_path):
+                    os.remove(image_path)
+            return None
+
+    @staticmethod
+    def _extract_bundle_image(
+        bundle: zipfile.ZipFile,
+        name: str,
+        image_dir: str,
+        written: List[str]
+    ) -> str:
+        """Extract a content-addressed image into image_dir, verifying its hash."""
+        match = _BUNDLE_IMAGE_NAME.match(name)
+        if not match:
+            raise ValueError(f"Invalid image name in bundle: {name}")
+        expected, extension = match.groups()
+        image_path = os.path.join(image_dir, f"{expected}{extension}")
+        if os.path.exists(image_path):
+            return image_path
+
+        temp_path = f"{image_path}.tmp"
+        digest = hashlib.sha256()
+        try:
+            with bundle.open(name) as source, open(temp_path, 'wb') as target:
+                for chunk in iter(lambda: source.read(BUNDLE_CHUNK_BYTES), b''):
+                    digest.update(chunk)
+                    target.write(chunk)
+            if digest.hexdigest() != expected:
+                raise ValueError(f"Image {name} is corrupt")
+            os.replace(temp_path, image_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        written.append(image_path)
+        return image_path
+
     @staticmethod
     def export_html(
         path: Path,
         steps: List[Step],
-        output_path: str
+        output_path: str,
+        annotated: bool = True,
+        encode_cache_dir: Optional[str] = None,
+        optimizer: Optional['ImageOptimizer'] = None
     ) -> bool:
         """
         Export a path to a self-contained HTML file.
 
-        Images are embedded as base64 data URIs for portability.
+        Images are embedded as base64 data URIs for portability. The file
+        is written as it is generated, so memory use doesn't grow with the
+        number or size of the screenshots.
 
         Args:
             path: The Path object to export
             steps: List of Step objects for the path
             output_path: File path to save the HTML
+            annotated: If False, use screenshots without their annotations
+            encode_cache_dir: Directory of base64-encoded images shared
+                              between exports (see batch_export)
+            optimizer: If given, embed screenshots scaled down and re-encoded
+                       by it instead of the original files
 
         Returns:
             True if export was successful
         """
+        # Written next to the destination and moved into place when complete,
+        # so a failed export doesn't leave a truncated file behind
+        temp_path = f"{output_path}.tmp"
         try:
-            html = ExportService._generate_html(path, steps)
-
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(html)
-
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                ExportService._write_html(f, path, steps, annotated, encode_cache_dir, optimizer)
+            os.replace(temp_path, output_path)
             return True
         except Exception as e:
             print(f"HTML export error: {e}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
             return False
 
     @staticmethod
-    def _generate_html(path: Path, steps: List[Step]) -> str:
-        """Generate HTML content for a path."""
+    def _write_html(
+        out: TextIO,
+        path: Path,
+        steps: List[Step],
+        annotated: bool = True,
+        encode_cache_dir: Optional[str] = None,
+        optimizer: Optional['ImageOptimizer'] = None
+    ) -> None:
+        """Write the HTML document for a path to out: header, each step, footer."""
         # Format metadata
         created_date = path.created_at.strftime('%B %d, %Y') if path.created_at else 'Unknown'
         updated_date = path.updated_at.strftime('%B %d, %Y') if path.updated_at else 'Unknown'
@@ -164,27 +618,7 @@ class ExportService:
             tags = [tag.strip() for tag in path.tags.split(',') if tag.strip()]
             tags_html = ' '.join(f'<span class="tag">{tag}</span>' for tag in tags)
 
-        # Build steps HTML
-        steps_html = ''
-        for step in steps:
-            instructions_html = _markdown_to_html(step.instructions) if step.instructions else ''
-
-            # Handle screenshot
-            image_html = ''
-            if step.screenshot_path and os.path.exists(step.screenshot_path):
-                base64_img = _image_to_base64(step.screenshot_path)
-                if base64_img:
-                    image_html = f'<img src="{base64_img}" alt="Step {step.step_number} screenshot" class="screenshot">'
-
-            steps_html += f'''
-            <div class="step">
-                <h2>Step {step.step_number}</h2>
-                {f'<div class="screenshot-container">{image_html}</div>' if image_html else ''}
-                <div class="instructions">{instructions_html}</div>
-            </div>
-            '''
-
-        html = f'''<!DOCTYPE html>
+        out.write(f'''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -337,7 +771,29 @@ class ExportService:
         </header>
 
         <main>
-            {steps_html if steps_html else '<p style="color: #666; text-align: center;">This path has no steps yet.</p>'}
+''')
+
+        # Steps, one at a time, with images streamed from disk
+        for step in steps:
+            instructions_html = _markdown_to_html(step.instructions) if step.instructions else ''
+
+            out.write(f'''
+            <div class="step">
+                <h2>Step {step.step_number}</h2>
+                ''')
+            image_path = _screenshot_for_export(step, annotated, optimizer)
+            if image_path and os.access(image_path, os.R_OK):
+                out.write('<div class="screenshot-container"><img src="')
+                _write_base64_image(out, image_path, encode_cache_dir)
+                out.write(f'" alt="Step {step.step_number} screenshot" class="screenshot"></div>')
+            out.write(f'''
+                <div class="instructions">{instructions_html}</div>
+            </div>
+            ''')
+        if not steps:
+            out.write('<p style="color: #666; text-align: center;">This path has no steps yet.</p>')
+
+        out.write(f'''
         </main>
 
         <footer>
@@ -345,158 +801,50 @@ class ExportService:
         </footer>
     </div>
 </body>
-</html>'''
-
-        return html
+</html>''')
 
     @staticmethod
     def export_pdf(
         path: Path,
         steps: List[Step],
-        output_path: str
+        output_path: str,
+        annotated: bool = True,
+        progress: Optional[Callable[[int, int, int], None]] = None
     ) -> bool:
         """
         Export a path to PDF format.
 
-        Uses Qt's print functionality to render HTML to PDF.
+        Pages are drawn directly with QPainter on a QPdfWriter (see
+        PdfExporter), which is safe to run on a worker thread. The return
+        value reflects the finished file.
 
         Args:
             path: The Path object to export
             steps: List of Step objects for the path
             output_path: File path to save the PDF
+            annotated: If False, use screenshots without their annotations
+            progress: Called after each step with (steps done, total steps,
+                      pages written)
 
         Returns:
             True if export was successful
         """
+        temp_path = f"{output_path}.tmp"
         try:
-            from PyQt6.QtCore import QMarginsF, QSizeF
-            from PyQt6.QtGui import QPageLayout, QPageSize
-            from PyQt6.QtWidgets import QApplication
-            from PyQt6.QtPrintSupport import QPrinter
-            from PyQt6.QtWebEngineWidgets import QWebEngineView
-
-            # Generate HTML content
-            html = ExportService._generate_html(path, steps)
-
-            # Set up printer
-            printer = QPrinter(QPrinter.PrinterMode.HighResolution)
-            printer.setOutputFormat(QPrinter.OutputFormat.PdfFormat)
-            printer.setOutputFileName(output_path)
-
-            # Set page layout
-            page_layout = QPageLayout(
-                QPageSize(QPageSize.StandardPageSize.Letter),
-                QPageLayout.Orientation.Portrait,
-                QMarginsF(20, 20, 20, 20)
-            )
-            printer.setPageLayout(page_layout)
-
-            # Create a web view to render the HTML
-            # Note: This requires QWebEngineView which may need to be installed
-            view = QWebEngineView()
-            view.setHtml(html)
-
-            # Wait for the page to load and then print
-            def handle_print_finished(success):
-                pass  # PDF writing is handled by QPrinter
-
-            def handle_load_finished(ok):
-                if ok:
-                    view.page().printToPdf(output_path)
-
-            view.loadFinished.connect(handle_load_finished)
+            # Imported here so the other formats don't need Qt's GUI module
+            from .pdf_export import PdfExporter
 
+            exporter = PdfExporter(path, steps, lambda step: _screenshot_for_export(step, annotated))
+            if not exporter.write(temp_path, progress):
+                raise IOError(f"Could not write {output_path}")
+            os.replace(temp_path, output_path)
             return True
-
-        except ImportError:
-            # Fall back to simple PDF generation without WebEngine
-            return ExportService._export_pdf_simple(path, steps, output_path)
         except Exception as e:
             print(f"PDF export error: {e}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
             return False
 
-    @staticmethod
-    def _export_pdf_simple(
-        path: Path,
-        steps: List[Step],
-        output_path: str
-    ) -> bool:
-        """
-        Simple PDF export using QTextDocument.
-
-        This is a fallback when QWebEngineView is not available.
-        """
-        try:
-            from PyQt6.QtCore import QMarginsF
-            from PyQt6.QtGui import (
-                QPageLayout, QPageSize, QTextDocument, QFont
-            )
-            from PyQt6.QtPrintSupport import QPrinter
-            from PyQt6.QtWidgets import QApplication
-
-            # Generate simplified HTML (without complex CSS)
-            html = ExportService._generate_simple_html(path, steps)
-
-            # Set up printer
-            printer = QPrinter(QPrinter.PrinterMode.HighResolution)
-            printer.setOutputFormat(QPrinter.OutputFormat.PdfFormat)
-            printer.setOutputFileName(output_path)
-
-            # Set page layout
-            page_layout = QPageLayout(
-                QPageSize(QPageSize.StandardPageSize.Letter),
-                QPageLayout.Orientation.Portrait,
-                QMarginsF(40, 40, 40, 40)
-            )
-            printer.setPageLayout(page_layout)
-
-            # Create document and print
-            doc = QTextDocument()
-            doc.setDefaultFont(QFont('Arial', 11))
-            doc.setHtml(html)
-            doc.print(printer)
-
-            return True
-        except Exception as e:
-            print(f"Simple PDF export error: {e}")
-            return False
-
-    @staticmethod
-    def _generate_simple_html(path: Path, steps: List[Step]) -> str:
-        """Generate simplified HTML for QTextDocument rendering."""
-        # Format metadata
-        created_date = path.created_at.strftime('%B %d, %Y') if path.created_at else 'Unknown'
-
-        # Build steps HTML
-        steps_html = ''
-        for step in steps:
-            instructions_html = _markdown_to_html(step.instructions) if step.instructions else ''
-
-            # Handle screenshot - embed as base64
-            image_html = ''
-            if step.screenshot_path and os.path.exists(step.screenshot_path):
-                base64_img = _image_to_base64(step.screenshot_path)
-                if base64_img:
-                    image_html = f'<img src="{base64_img}" width="500"><br>'
-
-            steps_html += f'''
-            <h2>Step {step.step_number}</h2>
-            {image_html}
-            <p>{instructions_html}</p>
-            <hr>
-            '''
-
-        html = f'''
-        <h1>{path.title}</h1>
-        <p><b>Category:</b> {path.category or 'None'} | <b>Created:</b> {created_date}</p>
-        {f'<p>{_markdown_to_html(path.description)}</p>' if path.description else ''}
-        <hr>
-        {steps_html if steps_html else '<p>This path has no steps yet.</p>'}
-        <p style="color: gray; font-size: 10px;">Exported from FlowPath</p>
-        '''
-
-        return html
-
     @staticmethod
     def get_suggested_filename(path: Path, extension: str) -> str:
         """
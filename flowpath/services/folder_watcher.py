@@ -0,0 +1,204 @@
+"""
+Team folder watcher for FlowPath application.
+
+Watches the team folder for legacy documents being added, removed or
+modified and reports the changes as fine-grained signals.
+"""
+
+import os
+from typing import Dict, List, Optional, Tuple
+
+from PyQt6.QtCore import (
+    QFileSystemWatcher, QObject, QStorageInfo, QThread, QTimer, pyqtSignal
+)
+
+from .data_service import DataService
+from ..models import LegacyDocument
+
+
+# File systems where change notifications are unreliable or absent
+NETWORK_FILESYSTEMS = {
+    'cifs', 'smb', 'smb2', 'smbfs', 'nfs', 'nfs4', 'afpfs', 'webdav',
+    'davfs', 'fuse.sshfs', '9p',
+}
+
+
+class FolderScanWorker(QThread):
+    """Rescans the team folder through the legacy document index."""
+    scanned = pyqtSignal(object, object)  # documents, folders
+
+    def __init__(self, data_service: DataService, check_files: bool = False):
+        super().__init__()
+        self.data_service = data_service
+        self.check_files = check_files
+
+    def run(self):
+        try:
+            docs = self.data_service.get_legacy_documents(check_files=self.check_files)
+            folders = self.data_service.get_legacy_document_folders()
+            self.scanned.emit(docs, folders)
+        except Exception as e:
+            print(f"Error scanning team folder: {e}")
+        finally:
+            # Don't leave this thread's pooled connection behind
+            self.data_service.db.close()
+
+
+class TeamFolderWatcher(QObject):
+    """
+    Watches DataService.team_folder and reports document changes.
+
+    Local folders are watched with QFileSystemWatcher: every folder under
+    the team folder, so additions in subfolders are seen. Documents aren't
+    watched individually (with kqueue on macOS each would hold a file
+    descriptor), so in-place edits, which don't change the folder, are
+    found by periodically statting the known documents. Network shares
+    rarely deliver notifications, so they are polled the same way, more
+    often: folders whose mtime changed are re-listed and the documents of
+    the others are statted. Bursts of events (a copy of many files, an
+    editor's save dance) are coalesced into one rescan, which runs on a
+    worker thread and is compared against the previous result.
+
+    Signals carry lists so a burst arrives as one update:
+        documents_added: new LegacyDocument objects
+        documents_removed: file paths that disappeared
+        documents_modified: LegacyDocument objects whose size or mtime changed
+
+    Usage:
+        watcher = TeamFolderWatcher(DataService.instance())
+        watcher.documents_added.connect(on_added)
+        watcher.start()
+    """
+    documents_added = pyqtSignal(list)
+    documents_removed = pyqtSignal(list)
+    documents_modified = pyqtSignal(list)
+
+    COALESCE_MS = 500
+    POLL_INTERVAL_MS = 10000  # Folders without notifications
+    EDIT_CHECK_INTERVAL_MS = 30000  # Watched folders, for in-place edits
+
+    def __init__(self, data_service: DataService, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self.data_service = data_service
+        self._snapshot: Optional[Dict[str, Tuple[float, int]]] = None
+        self._worker: Optional[FolderScanWorker] = None
+        self._rescan_pending = False
+        self._pending_check_files = False
+        self._polling = False
+
+        self._fs_watcher = QFileSystemWatcher(self)
+        self._fs_watcher.directoryChanged.connect(self._on_path_changed)
+
+        self._coalesce_timer = QTimer(self)
+        self._coalesce_timer.setSingleShot(True)
+        self._coalesce_timer.setInterval(self.COALESCE_MS)
+        self._coalesce_timer.timeout.connect(self._rescan)
+
+        self._poll_timer = QTimer(self)
+        self._poll_timer.setInterval(self.POLL_INTERVAL_MS)
+        self._poll_timer.timeout.connect(self._poll)
+
+    @property
+    def is_polling(self) -> bool:
+        """Whether the folder is polled rather than watched."""
+        return self._polling
+
+    def start(self) -> None:
+        """Start watching the current team folder, replacing any previous one."""
+        self.stop()
+        folder = self.data_service.team_folder
+        if not folder or not os.path.isdir(folder):
+            return
+
+        fs_type = bytes(QStorageInfo(folder).fileSystemType()).decode(errors='ignore')
+        self._polling = fs_type.lower() in NETWORK_FILESYSTEMS
+        self._poll_timer.start(self.POLL_INTERVAL_MS if self._polling else self.EDIT_CHECK_INTERVAL_MS)
+        self._rescan()
+
+    def stop(self) -> None:
+        """Stop watching and wait for any scan in progress."""
+        self._coalesce_timer.stop()
+        self._poll_timer.stop()
+        watched = self._fs_watcher.directories()
+        if watched:
+            self._fs_watcher.removePaths(watched)
+        self._snapshot = None
+        self._rescan_pending = False
+        self._pending_check_files = False
+        if self._worker is not None:
+            self._worker.scanned.disconnect()
+            self._worker.wait()
+            self._worker = None
+
+    def _on_path_changed(self, path: str) -> None:
+        """Mark a folder for re-listing and schedule a rescan."""
+        self.data_service.invalidate_legacy_documents(path)
+        # Restarting the timer folds a burst of events into one rescan
+        self._coalesce_timer.start()
+
+    def _poll(self) -> None:
+        """Periodic rescan that also catches documents edited in place."""
+        # Only changed folders are re-listed; documents are just statted
+        self._rescan(check_files=True)
+
+    def _rescan(self, check_files: bool = False) -> None:
+        """Start a background rescan, or queue one if a scan is running."""
+        if self._worker is not None:
+            self._rescan_pending = True
+            self._pending_check_files = self._pending_check_files or check_files
+            return
+        worker = FolderScanWorker(self.data_service, check_files=check_files)
+        worker.scanned.connect(self._on_scanned)
+        worker.finished.connect(lambda w=worker: self._on_worker_finished(w))
+        self._worker = worker
+        worker.start()
+
+    def _on_worker_finished(self, worker: FolderScanWorker) -> None:
+        """Release a finished worker and run any rescan queued meanwhile."""
+        if self._worker is worker:
+            self._worker = None
+        worker.deleteLater()
+        if self._rescan_pending:
+            check_files = self._pending_check_files
+            self._rescan_pending = False
+            self._pending_check_files = False
+            self._rescan(check_files)
+
+    def _on_scanned(self, docs: List[LegacyDocument], folders: List[str]) -> None:
+        """Diff a scan against the previous one and emit the changes."""
+        if not self._polling:
+            self._watch(folders)
+
+        current = {doc.filepath: (doc.modified_at.timestamp(), doc.size_bytes) for doc in docs}
+        previous = self._snapshot
+        self._snapshot = current
+        if previous is None:
+            return  # First scan only establishes the baseline
+
+        added = [doc for doc in docs if doc.filepath not in previous]
+        modified = [
+            doc for doc in docs
+            if doc.filepath in previous and previous[doc.filepath] != current[doc.filepath]
+        ]
+        removed = [path for path in previous if path not in current]
+
+        if removed:
+            self.documents_removed.emit(removed)
+        if added:
+            self.documents_added.emit(added)
+        if modified:
+            self.documents_modified.emit(modified)
+
+    def _watch(self, paths: List[str]) -> None:
+        """Make the set of watched folders match the scanned ones."""
+        watched = set(self._fs_watcher.directories())
+        wanted = set(paths)
+        if watched - wanted:
+            self._fs_watcher.removePaths(list(watched - wanted))
+        if wanted - watched:
+            failed = self._fs_watcher.addPaths(list(wanted - watched))
+            if failed and not self._polling:
+                # Out of watch handles (or unsupported): fall back to polling
+                print(f"Could not watch {len(failed)} folders, polling instead")
+                self._polling = True
+                self._poll_timer.start(self.POLL_INTERVAL_MS)
@@ -0,0 +1,156 @@
+"""
+Image optimization for FlowPath exports.
+
+Screenshots are captured at full screen resolution, often as large PNGs,
+but HTML and JSON exports show them no wider than a page. Before they are
+embedded, the optimizer scales them down, re-encodes them as WebP or JPEG
+and drops their metadata. Results are cached on disk by the content hash
+of the source image, so each screenshot is only re-encoded once.
+"""
+
+import os
+from typing import Dict, Optional, Tuple
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QColor, QImage, QImageReader, QImageWriter, QPainter
+
+from .export_service import _hash_file
+from .thumbnail_cache import cache_home
+
+
+class ImageOptimizer:
+    """
+    Scales, re-encodes and caches screenshots for export.
+
+    optimize() returns the path of the optimized image, encoding it on
+    first use. Only the decoded pixels (and colour space) are written out,
+    so EXIF, text chunks and comments are stripped. Images are never
+    enlarged. The cache is keyed by the source's SHA-256 and the settings,
+    so an edited screenshot is encoded again and copies of the same image
+    share one result. It is safe to use from several threads or processes.
+
+    Usage:
+        optimizer = ImageOptimizer(max_dimension=1800, image_format='webp')
+        ExportService.export_html(path, steps, "out.html", optimizer=optimizer)
+    """
+
+    FORMATS = {'webp': '.webp', 'jpeg': '.jpg'}
+    DEFAULT_MAX_DIMENSION = 1800  # Twice the HTML export's 900px content width
+    DEFAULT_QUALITY = 80
+    DISK_LIMIT_BYTES = 512 * 1024 * 1024
+
+    def __init__(
+        self,
+        max_dimension: int = DEFAULT_MAX_DIMENSION,
+        image_format: str = 'webp',
+        quality: int = DEFAULT_QUALITY,
+        cache_dir: Optional[str] = None
+    ):
+        """
+        Initialize the optimizer.
+
+        Args:
+            max_dimension: Longest side of an optimized image, in pixels
+            image_format: 'webp' or 'jpeg'
+            quality: Encoder quality, 0-100
+            cache_dir: Directory for optimized images. If None, uses the
+                       default location.
+        """
+        if image_format not in self.FORMATS:
+            raise ValueError(f"Unsupported image format: {image_format}")
+        self.max_dimension = max(1, max_dimension)
+        self.image_format = image_format
+        self.quality = max(0, min(100, quality))
+        self.cache_dir = cache_dir or os.path.join(cache_home(), 'flowpath', 'optimized')
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+        except OSError as e:
+            print(f"Image optimization disabled: {e}")
+            self.cache_dir = ''
+        # (absolute path, size, mtime_ns) -> SHA-256, so unchanged files aren't re-hashed
+        self._hashes: Dict[Tuple[str, int, int], str] = {}
+
+    def optimize(self, image_path: str) -> str:
+        """
+        Get the optimized version of an image.
+
+        Args:
+            image_path: Source image file
+
+        Returns:
+            Path of the optimized image, or image_path itself if it could
+            not be optimized
+        """
+        if not self.cache_dir:
+            return image_path
+        try:
+            target = os.path.join(self.cache_dir, self._cache_name(image_path))
+            if os.path.exists(target):
+                os.utime(target)  # Mark as recently used for prune_cache()
+                return target
+            if self._encode(image_path, target):
+                return target
+        except OSError as e:
+            print(f"Error optimizing {os.path.basename(image_path)}: {e}")
+        return image_path
+
+    def prune_cache(self) -> None:
+        """Delete the least recently used optimized images above DISK_LIMIT_BYTES."""
+        if not self.cache_dir:
+            return
+        try:
+            entries = [entry for entry in os.scandir(self.cache_dir) if entry.is_file()]
+            entries.sort(key=lambda e: e.stat().st_mtime, reverse=True)
+            total = 0
+            for entry in entries:
+                total += entry.stat().st_size
+                if total > self.DISK_LIMIT_BYTES:
+                    os.remove(entry.path)
+        except OSError as e:
+            print(f"Error pruning optimized image cache: {e}")
+
+    # ==================== Internals ====================
+
+    def _cache_name(self, image_path: str) -> str:
+        """File name of the optimized image: source hash and settings."""
+        stat = os.stat(image_path)
+        key = (os.path.abspath(image_path), stat.st_size, stat.st_mtime_ns)
+        digest = self._hashes.get(key)
+        if digest is None:
+            digest = self._hashes[key] = _hash_file(image_path)
+        extension = self.FORMATS[self.image_format]
+        return f"{digest}-{self.max_dimension}-q{self.quality}{extension}"
+
+    def _encode(self, image_path: str, target: str) -> bool:
+        """Decode the source at its optimized size and write it to target."""
+        reader = QImageReader(image_path)
+        reader.setAutoTransform(True)  # Apply EXIF orientation before it's dropped
+        size = reader.size()
+        if size.isValid() and max(size.width(), size.height()) > self.max_dimension:
+            reader.setScaledSize(size.scaled(self.max_dimension, self.max_dimension, Qt.AspectRatioMode.KeepAspectRatio))
+        source = reader.read()
+        if source.isNull():
+            print(f"Could not read {os.path.basename(image_path)} to optimize: {reader.errorString()}")
+            return False
+
+        # Paint into a fresh image so no metadata comes along; JPEG has no
+        # alpha channel, so transparent areas become white
+        keep_alpha = source.hasAlphaChannel() and self.image_format == 'webp'
+        image = QImage(source.size(), QImage.Format.Format_ARGB32 if keep_alpha else QImage.Format.Format_RGB32)
+        image.setColorSpace(source.colorSpace())
+        image.fill(QColor(0, 0, 0, 0) if keep_alpha else QColor('white'))
+        painter = QPainter(image)
+        painter.drawImage(0, 0, source)
+        painter.end()
+
+        # Unique per process: several exporters may encode the same image at once
+        temp = f"{target}.{os.getpid()}.tmp"
+        writer = QImageWriter(temp, self.image_format.encode('ascii'))
+        writer.setQuality(self.quality)
+        if not writer.write(image):
+            print(f"Could not write optimized {os.path.basename(image_path)}: {writer.errorString()}")
+            if os.path.exists(temp):
+                os.remove(temp)
+            return False
+        os.replace(temp, target)
+        return True
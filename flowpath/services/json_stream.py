@@ -0,0 +1,205 @@
+"""
+Streaming JSON reader for FlowPath application.
+
+Reads FlowPath JSON exports a value at a time, so embedded screenshots can
+be decoded straight to disk instead of being held in memory as strings.
+"""
+
+import json
+from typing import Any, Iterator, TextIO
+
+
+_ESCAPES = {
+    '"': '"', '\\': '\\', '/': '/', 'b': '\b',
+    'f': '\f', 'n': '\n', 'r': '\r', 't': '\t',
+}
+
+
+class JsonStreamReader:
+    """
+    Pull parser over a JSON text file.
+
+    Containers are walked with iter_object() and iter_array(); values
+    inside them are either read whole with read_value() or, for long
+    strings, in pieces with iter_string().
+
+    Usage:
+        reader = JsonStreamReader(f)
+        for key in reader.iter_object():
+            if key == 'steps':
+                for _ in reader.iter_array():
+                    ...
+            else:
+                value = reader.read_value()
+    """
+
+    CHUNK_CHARS = 64 * 1024
+
+    def __init__(self, stream: TextIO):
+        self._stream = stream
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+
+    # ==================== Structure ====================
+
+    def iter_object(self) -> Iterator[str]:
+        """
+        Iterate over the keys of the object at the current position.
+
+        After each key is yielded, the caller must consume its value.
+        """
+        self._expect('{')
+        if self._peek() == '}':
+            self._pos += 1
+            return
+        while True:
+            if self._peek() != '"':
+                raise ValueError(f"Expected object key, found {self._peek()!r}")
+            key = ''.join(self.iter_string())
+            self._expect(':')
+            yield key
+            if self._next_separator('}'):
+                return
+
+    def iter_array(self) -> Iterator[None]:
+        """
+        Iterate over the elements of the array at the current position.
+
+        Yields once per element; the caller must consume each element.
+        """
+        self._expect('[')
+        if self._peek() == ']':
+            self._pos += 1
+            return
+        while True:
+            yield None
+            if self._next_separator(']'):
+                return
+
+    def peek_type(self) -> str:
+        """First character of the next value ('{', '[', '"', 'n', digit...)."""
+        return self._peek()
+
+    # ==================== Values ====================
+
+    def read_value(self) -> Any:
+        """Read the next value whole."""
+        self._skip_whitespace()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+                self._fill()
+                continue
+            # A number running to the end of the buffer may continue past it
+            if end == len(self._buffer) and not self._eof:
+                self._fill()
+                continue
+            self._pos = end
+            return value
+
+    def iter_string(self) -> Iterator[str]:
+        """Read the next string value in pieces, without holding it whole."""
+        self._expect('"')
+        while True:
+            if self._pos >= len(self._buffer):
+                if not self._fill():
+                    raise ValueError("Unterminated string")
+            buffer = self._buffer
+            quote = buffer.find('"', self._pos)
+            backslash = buffer.find('\\', self._pos)
+            if quote == -1 and backslash == -1:
+                yield buffer[self._pos:]
+                self._pos = len(buffer)
+                continue
+            if backslash == -1 or (quote != -1 and quote < backslash):
+                if quote > self._pos:
+                    yield buffer[self._pos:quote]
+                self._pos = quote + 1
+                return
+            if backslash > self._pos:
+                yield buffer[self._pos:backslash]
+            self._pos = backslash
+            yield self._read_escape()
+
+    def skip_value(self) -> None:
+        """Skip the next value, streaming over long strings."""
+        kind = self._peek()
+        if kind == '"':
+            for _ in self.iter_string():
+                pass
+        elif kind == '{':
+            for _ in self.iter_object():
+                self.skip_value()
+        elif kind == '[':
+            for _ in self.iter_array():
+                self.skip_value()
+        else:
+            self.read_value()
+
+    # ==================== Internals ====================
+
+    def _fill(self) -> bool:
+        """Read more text, dropping what has been consumed. False at EOF."""
+        if self._eof:
+            return False
+        chunk = self._stream.read(self.CHUNK_CHARS)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def _skip_whitespace(self) -> None:
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in ' \t\r\n':
+                self._pos += 1
+            if self._pos < len(self._buffer) or not self._fill():
+                return
+
+    def _peek(self) -> str:
+        self._skip_whitespace()
+        if self._pos >= len(self._buffer):
+            raise ValueError("Unexpected end of JSON")
+        return self._buffer[self._pos]
+
+    def _expect(self, char: str) -> None:
+        found = self._peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r}, found {found!r}")
+        self._pos += 1
+
+    def _next_separator(self, closing: str) -> bool:
+        """Consume ',' (returns False) or the closing bracket (returns True)."""
+        found = self._peek()
+        self._pos += 1
+        if found == ',':
+            return False
+        if found == closing:
+            return True
+        raise ValueError(f"Expected ',' or {closing!r}, found {found!r}")
+
+    def _read_escape(self) -> str:
+        """Decode the escape sequence at the current position."""
+        while len(self._buffer) - self._pos < 12 and self._fill():
+            pass
+        buffer = self._buffer
+        code = buffer[self._pos + 1:self._pos + 2]
+        if code in _ESCAPES:
+            self._pos += 2
+            return _ESCAPES[code]
+        if code != 'u':
+            raise ValueError(f"Invalid escape \\{code}")
+        # \uXXXX, possibly a surrogate pair
+        length = 12 if buffer[self._pos + 6:self._pos + 8] == '\\u' else 6
+        text = json.loads(f'"{buffer[self._pos:self._pos + length]}"')
+        if length == 12 and len(text) == 2:
+            # Not a surrogate pair after all; take only the first escape
+            text, length = text[0], 6
+        self._pos += length
+        return text
@@ -0,0 +1,382 @@
+"""
+Persistent LibreOffice conversion server for FlowPath application.
+
+Starting soffice takes several seconds, and converting one presentation
+could start it more than once. Instead, a headless LibreOffice is started
+once, listening on a local UNO socket, and documents are converted through
+it by uno_convert.py. It is checked before each use and restarted if it
+has died or stopped responding. LegacyConverter falls back to starting
+soffice per document when the server can't be used.
+"""
+
+import atexit
+import os
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from .thumbnail_cache import cache_home
+
+
+CLIENT_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'uno_convert.py')
+
+# Exit codes of uno_convert.py
+CLIENT_OK = 0
+CLIENT_UNREACHABLE = 2
+
+# Runs a command like subprocess.run(capture_output=True, timeout=...)
+RunCallable = Callable[[List[str], float], subprocess.CompletedProcess]
+
+# soffice path -> Python interpreter that can import uno (None if there is none)
+_uno_pythons: Dict[str, Optional[str]] = {}
+_uno_pythons_lock = threading.Lock()
+
+
+class OfficeServerUnavailable(Exception):
+    """The server could not be started or reached; convert another way."""
+
+
+def find_uno_python(soffice: str) -> Optional[str]:
+    """
+    Find a Python interpreter that can import LibreOffice's uno module.
+
+    Checks LibreOffice's bundled python (Windows, macOS), then the system
+    python3 (Linux distributions package uno for it) and the app's own
+    interpreter. The result is remembered per soffice.
+
+    Args:
+        soffice: Path to the soffice executable
+
+    Returns:
+        Path of the interpreter, or None if none can import uno
+    """
+    with _uno_pythons_lock:
+        if soffice in _uno_pythons:
+            return _uno_pythons[soffice]
+
+        program_dir = Path(os.path.realpath(soffice)).parent
+        candidates = [
+            program_dir / 'python',
+            program_dir / 'python.exe',
+            program_dir.parent / 'Resources' / 'python',  # macOS app bundle
+            Path('/usr/bin/python3'),
+            Path(sys.executable),
+        ]
+        found = None
+        for candidate in candidates:
+            if not (candidate.is_file() and os.access(candidate, os.X_OK)):
+                continue
+            try:
+                result = subprocess.run(
+                    [str(candidate), '-c', 'import uno'],
+                    capture_output=True,
+                    timeout=20
+                )
+            except (OSError, subprocess.TimeoutExpired):
+                continue
+            if result.returncode == 0:
+                found = str(candidate)
+                break
+        _uno_pythons[soffice] = found
+        return found
+
+
+class OfficeServer:
+    """
+    A long-lived headless LibreOffice that converts documents to PDF.
+
+    There is one server per LibreOffice profile, shared by every converter
+    using that profile (a profile can only be used by one soffice at a
+    time). Conversions through one server run one after another;
+    BatchConverter gives each worker its own profile, and so its own
+    server, to convert in parallel.
+
+    The server starts on first use. Before each conversion it is checked
+    to still be running and accepting connections, and restarted if not;
+    a conversion that finds it unreachable restarts it and tries once
+    more. After MAX_START_FAILURES failed starts in a row the server is
+    given up on, and convert_to_pdf() raises OfficeServerUnavailable.
+    A server left unused for IDLE_TIMEOUT is stopped, and started again
+    by the next conversion.
+
+    Usage:
+        server = OfficeServer.for_profile(soffice, profile_dir)
+        if server:
+            ok = server.convert_to_pdf(document, pdf_path, run)
+    """
+
+    START_TIMEOUT = 60  # seconds; a first start also creates the profile
+    PING_TIMEOUT = 15
+    CONVERT_TIMEOUT = 120
+    STOP_TIMEOUT = 10
+    IDLE_TIMEOUT = 300
+    MAX_START_FAILURES = 2
+
+    _servers: Dict[str, 'OfficeServer'] = {}
+    _servers_lock = threading.Lock()
+
+    def __init__(self, soffice: str, python: str, profile_dir: str):
+        """
+        Initialize the server (it is started on first use).
+
+        Args:
+            soffice: Path to the soffice executable
+            python: Interpreter that can import uno (see find_uno_python)
+            profile_dir: LibreOffice user profile for this server only
+        """
+        self.soffice = soffice
+        self.python = python
+        self.profile_dir = profile_dir
+        self.port: Optional[int] = None
+        self._process: Optional[subprocess.Popen] = None
+        self._start_failures = 0
+        self._idle_timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_profile(cls, soffice: str, profile_dir: Optional[str] = None) -> Optional['OfficeServer']:
+        """
+        Get the shared server for a LibreOffice profile.
+
+        Args:
+            soffice: Path to the soffice executable
+            profile_dir: Profile to run the server with. If None, uses a
+                         profile of its own rather than the user's, so a
+                         LibreOffice the user has open isn't affected.
+
+        Returns:
+            The server, or None if LibreOffice's Python bridge isn't installed
+        """
+        python = find_uno_python(soffice)
+        if python is None:
+            return None
+        if profile_dir is None:
+            profile_dir = cls.default_profile_dir()
+        key = os.path.abspath(profile_dir)
+        with cls._servers_lock:
+            server = cls._servers.get(key)
+            if server is None:
+                server = cls._servers[key] = cls(soffice, python, key)
+            return server
+
+    @staticmethod
+    def default_profile_dir() -> str:
+        """Profile used by the server when no profile is given."""
+        return os.path.join(cache_home(), 'flowpath', 'libreoffice', 'server')
+
+    @classmethod
+    def stop_all(cls) -> None:
+        """Stop every running server (on application exit)."""
+        with cls._servers_lock:
+            servers = list(cls._servers.values())
+        for server in servers:
+            server.stop()
+
+    @classmethod
+    def stop_profiles(cls, profile_dirs: List[str]) -> None:
+        """Stop the servers running with the given profiles, if any."""
+        keys = {os.path.abspath(profile_dir) for profile_dir in profile_dirs}
+        with cls._servers_lock:
+            servers = [server for key, server in cls._servers.items() if key in keys]
+        for server in servers:
+            server.stop()
+
+    def is_available(self) -> bool:
+        """False once the server has failed to start too often."""
+        return self._start_failures < self.MAX_START_FAILURES
+
+    def convert_to_pdf(self, input_path: Path, output_path: Path, run: RunCallable) -> bool:
+        """
+        Convert a document to PDF through the server.
+
+        Args:
+            input_path: Document to convert
+            output_path: PDF file to write
+            run: Runs the client process; LegacyConverter passes its own
+                 so the conversion can be cancelled
+
+        Returns:
+            True if the PDF was written, False if LibreOffice couldn't
+            convert the document
+
+        Raises:
+            OfficeServerUnavailable: if the server can't be started or reached
+            subprocess.TimeoutExpired: if the conversion hangs; the server
+                is restarted on next use. Other exceptions raised by run
+                (such as cancellation) are passed on the same way.
+        """
+        with self._lock:
+            try:
+                return self._convert(input_path, output_path, run)
+            finally:
+                self._schedule_idle_stop()
+
+    def stop(self) -> None:
+        """Stop the server process, if running."""
+        with self._lock:
+            self._stop_process()
+
+    # ==================== Internals ====================
+
+    def _convert(self, input_path: Path, output_path: Path, run: RunCallable) -> bool:
+        """convert_to_pdf() with the lock held."""
+        for attempt in range(2):
+            self._ensure_running()
+            args = [self.python, CLIENT_SCRIPT, '--port', str(self.port), str(input_path), str(output_path)]
+            try:
+                result = run(args, self.CONVERT_TIMEOUT)
+            except Exception:
+                # Timed out or cancelled: LibreOffice may still be busy
+                # with the document, so don't reuse it
+                self._stop_process()
+                raise
+            if result.returncode == CLIENT_UNREACHABLE:
+                # Died or stopped answering: restart and try once more
+                print(f"LibreOffice server not responding, restarting: {_decode(result.stderr)}")
+                self._stop_process()
+                continue
+            if result.returncode != CLIENT_OK:
+                print(f"LibreOffice server could not convert {input_path.name}: {_decode(result.stderr)}")
+                return False
+            return output_path.exists()
+        raise OfficeServerUnavailable("LibreOffice server stopped responding")
+
+    def _schedule_idle_stop(self) -> None:
+        """Stop the server IDLE_TIMEOUT from now unless it is used again."""
+        if self._idle_timer is not None:
+            self._idle_timer.cancel()
+            self._idle_timer = None
+        if self._process is None:
+            return
+        self._idle_timer = threading.Timer(self.IDLE_TIMEOUT, self._stop_if_idle)
+        self._idle_timer.daemon = True
+        self._idle_timer.start()
+
+    def _stop_if_idle(self) -> None:
+        """Idle timer callback: stop the server unless it was used meanwhile."""
+        with self._lock:
+            # A conversion that finished while this waited for the lock
+            # has started a new timer
+            if threading.current_thread() is not self._idle_timer:
+                return
+            self._idle_timer = None
+            if self._process is not None:
+                print(f"Stopping idle LibreOffice server on port {self.port}")
+                self._stop_process()
+
+    def _ensure_running(self) -> None:
+        """Health-check the server, (re)starting it if needed."""
+        if self._is_healthy():
+            return
+        self._stop_process()
+        if not self.is_available():
+            raise OfficeServerUnavailable("LibreOffice server failed to start")
+        try:
+            self._start()
+            self._start_failures = 0
+        except OfficeServerUnavailable:
+            self._start_failures += 1
+            self._stop_process()
+            raise
+
+    def _is_healthy(self) -> bool:
+        """Whether the process is running and its socket accepts connections."""
+        if self._process is None or self._process.poll() is not None or self.port is None:
+            return False
+        try:
+            with socket.create_connection(('127.0.0.1', self.port), timeout=2):
+                return True
+        except OSError:
+            return False
+
+    def _start(self) -> None:
+        """Start soffice listening on a free port and wait until it answers."""
+        self.port = _free_port()
+        args = [
+            self.soffice,
+            f"-env:UserInstallation={Path(self.profile_dir).as_uri()}",
+            '--headless', '--invisible', '--nologo', '--nodefault',
+            '--norestore', '--nolockcheck',
+            f"--accept=socket,host=127.0.0.1,port={self.port};urp;StarOffice.ComponentContext",
+        ]
+        print(f"Starting LibreOffice server on port {self.port}")
+        started = time.monotonic()
+        try:
+            # In its own process group, so stopping it also stops soffice.bin
+            self._process = subprocess.Popen(
+                args, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                start_new_session=(os.name == 'posix')
+            )
+        except OSError as e:
+            raise OfficeServerUnavailable(f"Could not start soffice: {e}")
+
+        deadline = started + self.START_TIMEOUT
+        while time.monotonic() < deadline:
+            if self._process.poll() is not None:
+                raise OfficeServerUnavailable(f"soffice exited with status {self._process.returncode}")
+            if self._is_healthy() and self._ping():
+                print(f"LibreOffice server ready in {time.monotonic() - started:.1f}s")
+                return
+            time.sleep(0.25)
+        raise OfficeServerUnavailable(f"LibreOffice server did not start within {self.START_TIMEOUT}s")
+
+    def _ping(self) -> bool:
+        """Check that the server answers over UNO, not just on the socket."""
+        try:
+            result = subprocess.run(
+                [self.python, CLIENT_SCRIPT, '--port', str(self.port), '--ping'],
+                capture_output=True,
+                timeout=self.PING_TIMEOUT
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            return False
+        return result.returncode == CLIENT_OK
+
+    def _stop_process(self) -> None:
+        """Terminate the server process group, killing it if it doesn't exit."""
+        if self._idle_timer is not None:
+            self._idle_timer.cancel()
+            self._idle_timer = None
+        process, self._process = self._process, None
+        if process is None or process.poll() is not None:
+            return
+        _signal_group(process, signal.SIGTERM)
+        try:
+            process.wait(timeout=self.STOP_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            _signal_group(process, signal.SIGKILL if os.name == 'posix' else signal.SIGTERM)
+            process.wait()
+
+
+def _signal_group(process: subprocess.Popen, sig: int) -> None:
+    """Send a signal to a process and, on POSIX, everything it started."""
+    try:
+        if os.name == 'posix':
+            os.killpg(process.pid, sig)
+        else:
+            process.terminate()
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+def _free_port() -> int:
+    """A TCP port on localhost that is free right now."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def _decode(output) -> str:
+    """Client output as text for logging."""
+    if isinstance(output, bytes):
+        output = output.decode('utf-8', errors='replace')
+    return (output or '').strip()
+
+
+# Don't leave soffice running if the app exits without stopping the servers
+atexit.register(OfficeServer.stop_all)
@@ -0,0 +1,288 @@
+"""
+PDF export for FlowPath application.
+
+Lays out a path directly onto a QPdfWriter with QPainter: no browser
+engine and no HTML round trip for the images. Paint devices other than
+widgets and pixmaps may be used from any thread, so this runs in the
+export worker.
+"""
+
+import os
+from datetime import datetime
+from typing import Callable, List, Optional
+
+from PyQt6.QtCore import QMarginsF, QRectF, QSize, Qt
+from PyQt6.QtGui import (
+    QColor, QFont, QImage, QImageReader, QPageLayout, QPageSize, QPainter,
+    QPdfWriter, QPen, QTextDocument
+)
+
+from ..models import Path, Step
+from .export_service import _markdown_to_html
+
+
+# (steps done, total steps, pages written)
+ProgressCallback = Callable[[int, int, int], None]
+
+
+class PdfExporter:
+    """
+    Writes a path to a PDF, a step at a time.
+
+    Each step is laid out as a block: heading, screenshot, instructions.
+    A block that doesn't fit in the rest of the page starts a new one;
+    instructions longer than a page continue over several. Screenshots
+    are decoded already scaled to the size they are printed at, so no
+    full-size image is held and the PDF stays small. Pages are written out
+    as they are finished.
+
+    Usage:
+        exporter = PdfExporter(path, steps, image_for_step)
+        ok = exporter.write("out.pdf", progress=on_progress)
+    """
+
+    RESOLUTION = 150  # dpi; screenshots are embedded at this density
+    MARGIN_POINTS = 40
+    MAX_IMAGE_PAGE_FRACTION = 0.55  # Leave room for the instructions
+    BLOCK_SPACING_POINTS = 18
+
+    def __init__(
+        self,
+        path: Path,
+        steps: List[Step],
+        image_for_step: Callable[[Step], Optional[str]]
+    ):
+        """
+        Initialize the exporter.
+
+        Args:
+            path: The Path object to export
+            steps: List of Step objects for the path
+            image_for_step: Returns the image file to print for a step, or None
+        """
+        self.path = path
+        self.steps = steps
+        self.image_for_step = image_for_step
+
+    def write(self, output_path: str, progress: Optional[ProgressCallback] = None) -> bool:
+        """
+        Write the PDF.
+
+        Args:
+            output_path: File path to save the PDF
+            progress: Called after each step with (steps done, total, pages)
+
+        Returns:
+            True once the PDF has been completely written
+        """
+        writer = QPdfWriter(output_path)
+        writer.setResolution(self.RESOLUTION)
+        writer.setTitle(self.path.title)
+        writer.setCreator("FlowPath")
+        writer.setPageLayout(QPageLayout(
+            QPageSize(QPageSize.PageSizeId.Letter),
+            QPageLayout.Orientation.Portrait,
+            QMarginsF(self.MARGIN_POINTS, self.MARGIN_POINTS, self.MARGIN_POINTS, self.MARGIN_POINTS),
+            QPageLayout.Unit.Point
+        ))
+
+        painter = QPainter()
+        if not painter.begin(writer):
+            print(f"PDF export error: could not open {output_path} for writing")
+            return False
+
+        self._writer = writer
+        self._painter = painter
+        content = writer.pageLayout().paintRectPixels(self.RESOLUTION)
+        self._width = content.width()
+        self._height = content.height()
+        self._spacing = self._points(self.BLOCK_SPACING_POINTS)
+        self._y = 0
+        self._pages = 1
+
+        try:
+            self._draw_header()
+            if not self.steps:
+                self._draw_document(self._text_document(
+                    '<p style="color: #666666;">This path has no steps yet.</p>'
+                ))
+            for done, step in enumerate(self.steps, start=1):
+                self._draw_step(step)
+                if progress:
+                    progress(done, len(self.steps), self._pages)
+            self._draw_footer()
+        finally:
+            ok = painter.end()
+        return ok
+
+    # ==================== Blocks ====================
+
+    def _draw_header(self):
+        """Title, metadata and description."""
+        meta = []
+        if self.path.category:
+            meta.append(f"<b>Category:</b> {_escape(self.path.category)}")
+        if self.path.created_at:
+            meta.append(f"<b>Created:</b> {self.path.created_at.strftime('%B %d, %Y')}")
+        if self.path.creator:
+            meta.append(f"<b>By:</b> {_escape(self.path.creator)}")
+        if self.path.tags:
+            meta.append(f"<b>Tags:</b> {_escape(self.path.tags)}")
+
+        html = f'<h1>{_escape(self.path.title)}</h1>'
+        if meta:
+            html += f'<p style="color: #666666;">{" &nbsp;|&nbsp; ".join(meta)}</p>'
+        if self.path.description:
+            html += f'<p>{_markdown_to_html(self.path.description)}</p>'
+        self._draw_document(self._text_document(html, base_size=11))
+
+        # Rule under the header
+        self._painter.setPen(QPen(QColor("#E0E0E0"), self._points(0.75)))
+        self._painter.drawLine(0, self._y, self._width, self._y)
+        self._y += self._spacing
+
+    def _draw_step(self, step: Step):
+        """One step: heading, screenshot and instructions, kept together if they fit."""
+        heading = self._text_document(f'<h2>Step {step.step_number}</h2>')
+        instructions = self._text_document(_markdown_to_html(step.instructions)) if step.instructions else None
+        image = self._load_image(step)
+
+        image_size = self._image_size(image) if image is not None else QSize(0, 0)
+        image_height = image_size.height() + self._points(8) if image is not None else 0
+        heading_height = round(heading.size().height())
+        text_height = round(instructions.size().height()) if instructions else 0
+        block_height = heading_height + image_height + text_height
+
+        # Start a new page if the step doesn't fit; if it's longer than a
+        # page anyway, only keep the heading with the screenshot
+        if self._y > 0 and self._y + block_height > self._height:
+            self._new_page()
+
+        self._draw_document(heading)
+        if image is not None:
+            target = QRectF(0, self._y, image_size.width(), image_size.height())
+            self._painter.drawImage(target, image)
+            self._painter.setPen(QPen(QColor("#E0E0E0"), self._points(0.5)))
+            self._painter.drawRect(target)
+            self._y += image_height
+        if instructions:
+            self._draw_document(instructions)
+        self._y += self._spacing
+
+    def _draw_footer(self):
+        """Export note after the last step."""
+        footer = self._text_document(
+            f'<p style="color: #999999;">Exported from FlowPath on '
+            f'{datetime.now().strftime("%B %d, %Y at %I:%M %p")}</p>',
+            base_size=8
+        )
+        if self._y + footer.size().height() > self._height:
+            self._new_page()
+        self._draw_document(footer)
+
+    # ==================== Drawing ====================
+
+    def _draw_document(self, document: QTextDocument):
+        """Draw rich text at the current position, continuing onto new pages."""
+        total = document.size().height()
+        offset = 0.0
+        while offset < total:
+            available = self._height - self._y
+            if available <= 0:
+                self._new_page()
+                continue
+            chunk = min(available, total - offset)
+            if chunk < total - offset:
+                # Break between lines, not through one
+                line_break = _line_break_before(document, offset + chunk)
+                if line_break > offset:
+                    chunk = line_break - offset
+            self._painter.save()
+            self._painter.translate(0, self._y - offset)
+            document.drawContents(self._painter, QRectF(0, offset, self._width, chunk))
+            self._painter.restore()
+            offset += chunk
+            self._y += round(chunk)
+            if offset < total:
+                self._new_page()
+
+    def _new_page(self):
+        """Finish the current page and start the next."""
+        self._writer.newPage()
+        self._pages += 1
+        self._y = 0
+
+    # ==================== Helpers ====================
+
+    def _text_document(self, html: str, base_size: int = 10) -> QTextDocument:
+        """Rich text laid out for the PDF's resolution and content width."""
+        document = QTextDocument()
+        document.documentLayout().setPaintDevice(self._writer)
+        font = QFont("Arial")
+        font.setPointSize(base_size)
+        document.setDefaultFont(font)
+        document.setDocumentMargin(0)
+        document.setHtml(html)
+        document.setTextWidth(self._width)
+        return document
+
+    def _image_bounds(self) -> QSize:
+        """Largest printed screenshot: content width, and not too tall."""
+        return QSize(self._width, round(self._height * self.MAX_IMAGE_PAGE_FRACTION))
+
+    def _image_size(self, image: QImage) -> QSize:
+        """Printed size of a screenshot; like the HTML export, never enlarged."""
+        return _fit(image.size(), self._image_bounds())
+
+    def _load_image(self, step: Step) -> Optional[QImage]:
+        """Decode a step's screenshot no larger than it will be printed."""
+        image_path = self.image_for_step(step)
+        if not image_path:
+            return None
+        reader = QImageReader(image_path)
+        reader.setAutoTransform(True)
+        size = reader.size()
+        if size.isValid():
+            target = _fit(size, self._image_bounds())
+            if target != size:
+                reader.setScaledSize(target)
+        image = reader.read()
+        if image.isNull():
+            print(f"Could not read {os.path.basename(image_path)} for PDF: {reader.errorString()}")
+            return None
+        return image
+
+    def _points(self, points: float) -> int:
+        """Convert points to device pixels."""
+        return round(points * self.RESOLUTION / 72)
+
+
+def _line_break_before(document: QTextDocument, limit: float) -> float:
+    """Bottom of the last line of document that ends at or above limit (0 if none)."""
+    best = 0.0
+    layout = document.documentLayout()
+    block = document.begin()
+    while block.isValid():
+        top = layout.blockBoundingRect(block).top()
+        if top > limit:
+            break
+        lines = block.layout()
+        for i in range(lines.lineCount()):
+            line = lines.lineAt(i)
+            bottom = top + line.y() + line.height()
+            if bottom > limit:
+                return best
+            best = bottom
+        block = block.next()
+    return best
+
+
+def _fit(size: QSize, bounds: QSize) -> QSize:
+    """Scale size down to fit within bounds, keeping the aspect ratio."""
+    if size.width() <= bounds.width() and size.height() <= bounds.height():
+        return size
+    return size.scaled(bounds, Qt.AspectRatioMode.KeepAspectRatio)
+
+
+def _escape(text: str) -> str:
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
@@ -0,0 +1,260 @@
+"""
+Thumbnail cache for FlowPath application.
+
+Screenshots are shown at card size in the reader, the path editor and the
+step creator. Decoding a full-resolution PNG and scaling it down on the GUI
+thread for every card makes opening a long path slow, so thumbnails are
+decoded in the background at their target size and cached in memory and
+on disk.
+"""
+
+import hashlib
+import os
+import sys
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from PyQt6.QtCore import (
+    QObject, QRunnable, QSize, QThreadPool, Qt, pyqtSignal
+)
+from PyQt6.QtGui import QImage, QImageReader, QPixmap
+
+
+# (absolute path, mtime_ns, width, height)
+ThumbnailKey = Tuple[str, int, int, int]
+
+
+def cache_home() -> str:
+    """The platform's folder for per-user cache data."""
+    if sys.platform == 'darwin':
+        return os.path.expanduser('~/Library/Caches')
+    if os.name == 'posix':
+        return os.environ.get('XDG_CACHE_HOME', os.path.expanduser('~/.cache'))
+    return os.environ.get('LOCALAPPDATA', os.path.expanduser('~'))
+
+
+class _JobSignals(QObject):
+    """Signals for thumbnail jobs (QRunnable can't emit signals itself)."""
+    done = pyqtSignal(object, QImage, bool)  # key, image (null on failure), read from disk cache
+
+
+class _ThumbnailJob(QRunnable):
+    """Decodes one thumbnail, from the disk cache if possible."""
+
+    def __init__(self, key: ThumbnailKey, cache_file: Optional[str], signals: _JobSignals):
+        super().__init__()
+        self.key = key
+        self.cache_file = cache_file
+        self.signals = signals
+
+    def run(self):
+        from_disk = False
+        try:
+            image, from_disk = self._load()
+        except Exception as e:
+            print(f"Error creating thumbnail for {self.key[0]}: {e}")
+            image = QImage()
+        self.signals.done.emit(self.key, image, from_disk)
+
+    def _load(self) -> Tuple[QImage, bool]:
+        if self.cache_file and os.path.exists(self.cache_file):
+            image = QImageReader(self.cache_file).read()
+            if not image.isNull():
+                return image, True
+
+        path, _, width, height = self.key
+        reader = QImageReader(path)
+        reader.setAutoTransform(True)
+        size = reader.size()
+        if not size.isValid():
+            return reader.read(), False
+        # Let the decoder produce the target size directly; never upscale
+        if size.width() > width or size.height() > height:
+            reader.setScaledSize(size.scaled(width, height, Qt.AspectRatioMode.KeepAspectRatio))
+        image = reader.read()
+        if image.isNull():
+            print(f"Error reading {path}: {reader.errorString()}")
+        return image, False
+
+
+class _CacheWriteJob(QRunnable):
+    """Writes a decoded thumbnail to the disk cache."""
+
+    def __init__(self, image: QImage, cache_file: str):
+        super().__init__()
+        self.image = image
+        self.cache_file = cache_file
+
+    def run(self):
+        temp = f"{self.cache_file}.tmp"
+        try:
+            if self.image.save(temp, 'PNG'):
+                os.replace(temp, self.cache_file)
+        except OSError as e:
+            print(f"Error writing thumbnail cache {self.cache_file}: {e}")
+
+
+class ThumbnailCache(QObject):
+    """
+    Shared, asynchronous thumbnail provider.
+
+    thumbnail() returns a cached pixmap right away, or None after queueing
+    a background decode; thumbnail_ready is emitted (on the GUI thread)
+    when it finishes, with a null pixmap if the image could not be read.
+
+    Thumbnails are keyed by file path, modification time and target size,
+    so an edited screenshot gets a fresh thumbnail without explicit
+    invalidation. Recently used pixmaps are kept in memory up to
+    MEMORY_LIMIT_BYTES; decoded thumbnails are also written to a disk cache
+    so reopening a path doesn't decode the full images again.
+
+    Usage:
+        cache = ThumbnailCache.instance()
+        cache.thumbnail_ready.connect(on_ready)
+        pixmap = cache.thumbnail(step.screenshot_path, QSize(340, 240))
+    """
+    thumbnail_ready = pyqtSignal(str, QSize, QPixmap)  # path, requested size, pixmap
+
+    MEMORY_LIMIT_BYTES = 48 * 1024 * 1024
+    DISK_LIMIT_BYTES = 256 * 1024 * 1024
+    MAX_THREADS = 4
+
+    _instance: Optional['ThumbnailCache'] = None
+
+    def __init__(self, cache_dir: Optional[str] = None, parent: Optional[QObject] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory for cached thumbnails. If None, uses the
+                       default location. An empty string disables the disk cache.
+        """
+        super().__init__(parent)
+        if cache_dir is None:
+            cache_dir = self._get_default_cache_dir()
+        self.cache_dir = cache_dir
+        if self.cache_dir:
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+            except OSError as e:
+                print(f"Thumbnail disk cache disabled: {e}")
+                self.cache_dir = ''
+
+        self._pixmaps: 'OrderedDict[ThumbnailKey, QPixmap]' = OrderedDict()
+        self._memory_bytes = 0
+        # key -> (requested size, keep in memory and on disk)
+        self._pending: Dict[ThumbnailKey, Tuple[QSize, bool]] = {}
+
+        # The pool is created first so it is destroyed (waiting for running
+        # jobs) before the signals object the jobs emit through
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(max(1, min(self.MAX_THREADS, QThreadPool.globalInstance().maxThreadCount())))
+        self._signals = _JobSignals(self)
+        self._signals.done.connect(self._on_done)
+
+    @classmethod
+    def instance(cls) -> 'ThumbnailCache':
+        """Get the shared thumbnail cache."""
+        if cls._instance is None:
+            cls._instance = cls()
+            cls._instance.prune_disk_cache()
+        return cls._instance
+
+    def _get_default_cache_dir(self) -> str:
+        """Get the default thumbnail cache directory for the platform."""
+        return os.path.join(cache_home(), 'flowpath', 'thumbnails')
+
+    def thumbnail(self, path: str, size: QSize, cache: bool = True) -> Optional[QPixmap]:
+        """
+        Get a thumbnail that fits within size, keeping the aspect ratio.
+
+        Args:
+            path: Image file path
+            size: Bounding size of the thumbnail
+            cache: If False, the decoded image is only delivered through
+                   thumbnail_ready and not kept in memory or on disk (for
+                   large images the caller holds on to itself)
+
+        Returns:
+            The cached pixmap, or None if it is being loaded (thumbnail_ready
+            follows). A missing file gives a null pixmap.
+        """
+        key = self._key(path, size)
+        if key is None:
+            return QPixmap()
+        pixmap = self._pixmaps.get(key)
+        if pixmap is not None:
+            self._pixmaps.move_to_end(key)
+            return pixmap
+        if key in self._pending:
+            requested, cached = self._pending[key]
+            self._pending[key] = (requested, cached or cache)
+        else:
+            # Whether to keep the result is decided when the job finishes;
+            # another request may ask for it to be cached meanwhile
+            self._pending[key] = (QSize(size), cache)
+            self._pool.start(_ThumbnailJob(key, self._cache_file(key), self._signals))
+        return None
+
+    def clear(self) -> None:
+        """Drop queued jobs and the in-memory cache, and wait for running jobs."""
+        self._pool.clear()
+        self._pool.waitForDone()
+        self._pending.clear()
+        self._pixmaps.clear()
+        self._memory_bytes = 0
+
+    def prune_disk_cache(self) -> None:
+        """Delete the least recently written thumbnails above DISK_LIMIT_BYTES."""
+        if not self.cache_dir:
+            return
+        try:
+            entries = [entry for entry in os.scandir(self.cache_dir) if entry.is_file()]
+            entries.sort(key=lambda e: e.stat().st_mtime, reverse=True)
+            total = 0
+            for entry in entries:
+                total += entry.stat().st_size
+                if total > self.DISK_LIMIT_BYTES:
+                    os.remove(entry.path)
+        except OSError as e:
+            print(f"Error pruning thumbnail cache: {e}")
+
+    # ==================== Internals ====================
+
+    def _key(self, path: str, size: QSize) -> Optional[ThumbnailKey]:
+        """Build the cache key for a file, or None if it can't be stat'ed."""
+        path = os.path.abspath(path)
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+        return (path, mtime_ns, size.width(), size.height())
+
+    def _cache_file(self, key: ThumbnailKey) -> Optional[str]:
+        """Disk cache file for a key, or None without a disk cache."""
+        if not self.cache_dir:
+            return None
+        digest = hashlib.sha1(repr(key).encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.png")
+
+    def _on_done(self, key: ThumbnailKey, image: QImage, from_disk: bool) -> None:
+        """Store a finished thumbnail and announce it."""
+        pending = self._pending.pop(key, None)
+        if pending is None:
+            return  # Cleared meanwhile
+        size, cache = pending
+        cache_file = self._cache_file(key)
+        if cache and cache_file and not from_disk and not image.isNull():
+            self._pool.start(_CacheWriteJob(image, cache_file))
+        pixmap = QPixmap.fromImage(image)
+        if cache and not pixmap.isNull():
+            self._pixmaps[key] = pixmap
+            self._memory_bytes += self._cost(pixmap)
+            while self._memory_bytes > self.MEMORY_LIMIT_BYTES and len(self._pixmaps) > 1:
+                _, evicted = self._pixmaps.popitem(last=False)
+                self._memory_bytes -= self._cost(evicted)
+        self.thumbnail_ready.emit(key[0], size, pixmap)
+
+    @staticmethod
+    def _cost(pixmap: QPixmap) -> int:
+        return pixmap.width() * pixmap.height() * max(1, pixmap.depth() // 8)
@@ -0,0 +1,108 @@
+"""
+UNO conversion client for FlowPath's LibreOffice server.
+
+This script is not imported by the app: OfficeServer runs it with a Python
+interpreter that can import LibreOffice's uno module (LibreOffice's bundled
+python, or python3 with the python3-uno package), which is usually not the
+interpreter the app runs in. It only uses the standard library and uno.
+
+    python uno_convert.py --port PORT INPUT OUTPUT_PDF
+    python uno_convert.py --port PORT --ping
+
+Exit status: 0 on success, 1 if the document could not be converted,
+2 if the server could not be reached.
+"""
+
+import argparse
+import os
+import sys
+
+
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_UNREACHABLE = 2
+
+# Document service -> PDF export filter; text documents are the default
+PDF_FILTERS = [
+    ('com.sun.star.presentation.PresentationDocument', 'impress_pdf_Export'),
+    ('com.sun.star.sheet.SpreadsheetDocument', 'calc_pdf_Export'),
+    ('com.sun.star.drawing.DrawingDocument', 'draw_pdf_Export'),
+]
+DEFAULT_PDF_FILTER = 'writer_pdf_Export'
+
+
+def _property(name, value):
+    from com.sun.star.beans import PropertyValue
+    prop = PropertyValue()
+    prop.Name = name
+    prop.Value = value
+    return prop
+
+
+def connect(port):
+    """Get the Desktop of the LibreOffice listening on port."""
+    import uno
+    local = uno.getComponentContext()
+    resolver = local.ServiceManager.createInstanceWithContext('com.sun.star.bridge.UnoUrlResolver', local)
+    context = resolver.resolve(
+        'uno:socket,host=127.0.0.1,port={};urp;StarOffice.ComponentContext'.format(port)
+    )
+    return context.ServiceManager.createInstanceWithContext('com.sun.star.frame.Desktop', context)
+
+
+def convert(desktop, input_path, output_path):
+    """Open a document hidden and read-only, and export it as PDF."""
+    import uno
+    document = desktop.loadComponentFromURL(
+        uno.systemPathToFileUrl(os.path.abspath(input_path)), '_blank', 0,
+        (_property('Hidden', True), _property('ReadOnly', True))
+    )
+    if document is None:
+        return False
+    try:
+        filter_name = DEFAULT_PDF_FILTER
+        for service, name in PDF_FILTERS:
+            if document.supportsService(service):
+                filter_name = name
+                break
+        document.storeToURL(
+            uno.systemPathToFileUrl(os.path.abspath(output_path)),
+            (_property('FilterName', filter_name),)
+        )
+    finally:
+        try:
+            document.close(True)
+        except Exception:
+            document.dispose()
+    return True
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Convert a document to PDF with a running LibreOffice.')
+    parser.add_argument('--port', type=int, required=True)
+    parser.add_argument('--ping', action='store_true', help='only check that the server responds')
+    parser.add_argument('input', nargs='?')
+    parser.add_argument('output', nargs='?')
+    args = parser.parse_args(argv)
+
+    try:
+        desktop = connect(args.port)
+    except Exception as e:
+        print('Could not reach LibreOffice: {}'.format(e), file=sys.stderr)
+        return EXIT_UNREACHABLE
+    if args.ping:
+        return EXIT_OK
+    if not args.input or not args.output:
+        parser.error('INPUT and OUTPUT_PDF are required')
+
+    try:
+        ok = convert(desktop, args.input, args.output)
+    except Exception as e:
+        print('Conversion failed: {}'.format(e), file=sys.stderr)
+        # The bridge is disposed if LibreOffice went away mid-conversion
+        return EXIT_UNREACHABLE if type(e).__name__ == 'DisposedException' else EXIT_FAILED
+    return EXIT_OK if ok and os.path.exists(args.output) else EXIT_FAILED
+
+
+if __name__ == '__main__':
+    sys.exit(main())
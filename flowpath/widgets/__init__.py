@@ -9,6 +9,8 @@ from .markdown_label import MarkdownLabel, render_markdown
 from .screen_capture import ScreenCapture
 from .annotation_editor import AnnotationEditor
 from .export_dialog import ExportDialog
+from .library_list import LibraryListModel, LibraryListView
+from .presentation_view import PresentationView
 
 __all__ = [
     'MarkdownTextEdit',
@@ -17,4 +19,7 @@ __all__ = [
     'ScreenCapture',
     'AnnotationEditor',
     'ExportDialog',
+    'LibraryListModel',
+    'LibraryListView',
+    'PresentationView',
 ]
@@ -8,22 +8,31 @@ Display is scaled to fit within the editor window while maintaining full resolut
 for the saved output.
 """
 
+import itertools
 import math
+import os
+import shutil
+import zlib
+from abc import ABC, abstractmethod
 from enum import Enum, auto
 from dataclasses import dataclass
-from typing import Optional, List
+from collections.abc import MutableSequence
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
     QDialog, QLineEdit, QDialogButtonBox, QButtonGroup, QFrame,
-    QScrollArea, QMessageBox, QApplication
+    QScrollArea, QMessageBox, QApplication, QComboBox, QSpinBox,
+    QGraphicsScene, QGraphicsPixmapItem, QGraphicsBlurEffect
 )
-from PyQt6.QtCore import Qt, QPoint, QRect, pyqtSignal, QPointF
+from PyQt6.QtCore import Qt, QPoint, QRect, QRectF, pyqtSignal, QPointF
 from PyQt6.QtGui import (
-    QPixmap, QPainter, QColor, QPen, QBrush, QFont,
+    QPixmap, QImage, QPainter, QColor, QPen, QBrush, QFont,
     QPolygon, QFontMetrics, QCursor, QTransform
 )
 
+from ..services import annotation_layers
+
 
 class Tool(Enum):
     """Available annotation tools."""
@@ -36,6 +45,164 @@ class Tool(Enum):
     CROP = auto()
 
 
+class BlurMode(Enum):
+    """How the Blur tool obscures a region."""
+    PIXELATE = auto()
+    GAUSSIAN = auto()
+
+
+def pixelate_region(image: QImage, rect: QRect, block_size: int) -> None:
+    """
+    Pixelate part of an image in place.
+
+    Blocks start at the region's top-left corner. Each is averaged down to
+    one pixel with Qt's smooth (area-averaging) scaler and scaled back up
+    without filtering, so the work happens in Qt's C++ image code rather
+    than per pixel in Python. Blocks cut off by the region's right or
+    bottom edge average only the pixels they cover.
+
+    Args:
+        image: Image to modify
+        rect: Region to pixelate, in image coordinates
+        block_size: Edge length of the averaged blocks, in pixels
+    """
+    rect = rect.normalized().intersected(image.rect())
+    if rect.isEmpty():
+        return
+
+    block_size = max(1, block_size)
+    region = image.copy(rect)
+    full_width = rect.width() // block_size * block_size
+    full_height = rect.height() // block_size * block_size
+
+    # Whole blocks, then the partial column, row and corner at the edges,
+    # each scaled on its own so no output pixel averages across blocks
+    xs = [(0, full_width, full_width // block_size)]
+    if full_width < rect.width():
+        xs.append((full_width, rect.width() - full_width, 1))
+    ys = [(0, full_height, full_height // block_size)]
+    if full_height < rect.height():
+        ys.append((full_height, rect.height() - full_height, 1))
+
+    painter = QPainter(image)
+    painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+    for x, width, cols in xs:
+        for y, height, rows in ys:
+            if not (width and height):
+                continue
+            averaged = region.copy(x, y, width, height).scaled(
+                cols, rows,
+                Qt.AspectRatioMode.IgnoreAspectRatio,
+                Qt.TransformationMode.SmoothTransformation
+            )
+            blocks = averaged.scaled(
+                width, height,
+                Qt.AspectRatioMode.IgnoreAspectRatio,
+                Qt.TransformationMode.FastTransformation
+            )
+            painter.drawImage(rect.left() + x, rect.top() + y, blocks)
+    painter.end()
+
+
+def _clamped_copy(image: QImage, area: QRect) -> QImage:
+    """
+    Copy part of an image, extending its edge pixels into any part of
+    area that lies outside it.
+    """
+    inner = area.intersected(image.rect())
+    copy = QImage(area.size(), QImage.Format.Format_ARGB32_Premultiplied)
+    copy.fill(Qt.GlobalColor.transparent)
+    if inner.isEmpty():
+        return copy
+
+    inner_at = inner.translated(-area.topLeft())
+    painter = QPainter(copy)
+    painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+    painter.drawImage(inner_at.topLeft(), image, inner)
+    # Stretch the outermost column, then the outermost row, over the margins
+    if inner_at.left() > 0:
+        painter.drawImage(QRect(0, inner_at.top(), inner_at.left(), inner_at.height()),
+                          image, QRect(inner.left(), inner.top(), 1, inner.height()))
+    if inner_at.right() < area.width() - 1:
+        painter.drawImage(
+            QRect(inner_at.right() + 1, inner_at.top(), area.width() - inner_at.right() - 1, inner_at.height()),
+            image, QRect(inner.right(), inner.top(), 1, inner.height()))
+    painter.end()
+
+    filled = copy.copy()
+    painter = QPainter(copy)
+    painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+    if inner_at.top() > 0:
+        painter.drawImage(QRect(0, 0, area.width(), inner_at.top()),
+                          filled, QRect(0, inner_at.top(), area.width(), 1))
+    if inner_at.bottom() < area.height() - 1:
+        painter.drawImage(
+            QRect(0, inner_at.bottom() + 1, area.width(), area.height() - inner_at.bottom() - 1),
+            filled, QRect(0, inner_at.bottom(), area.width(), 1))
+    painter.end()
+    return copy
+
+
+def gaussian_blur_region(image: QImage, rect: QRect, radius: int) -> None:
+    """
+    Gaussian-blur part of an image in place.
+
+    Uses Qt's blur (QGraphicsBlurEffect at quality setting). Pixels around
+    the region are included as input so its edges blend with their
+    surroundings instead of fading out; past the image border the edge
+    pixels are repeated, so regions touching it are blurred just as fully.
+
+    Args:
+        image: Image to modify
+        rect: Region to blur, in image coordinates
+        radius: Blur radius, in pixels
+    """
+    rect = rect.normalized().intersected(image.rect())
+    if rect.isEmpty() or radius < 1:
+        return
+
+    # The blur fades out near the edge of its input; a margin of twice the
+    # radius keeps that out of the region
+    margin = 2 * radius
+    source = rect.adjusted(-margin, -margin, margin, margin)
+
+    scene = QGraphicsScene()
+    item = QGraphicsPixmapItem(QPixmap.fromImage(_clamped_copy(image, source)))
+    effect = QGraphicsBlurEffect()
+    effect.setBlurRadius(radius)
+    effect.setBlurHints(QGraphicsBlurEffect.BlurHint.QualityHint)
+    item.setGraphicsEffect(effect)
+    scene.addItem(item)
+
+    blurred = QImage(source.size(), QImage.Format.Format_ARGB32_Premultiplied)
+    blurred.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(blurred)
+    bounds = QRectF(0, 0, source.width(), source.height())
+    scene.render(painter, bounds, bounds)
+    painter.end()
+
+    painter = QPainter(image)
+    painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+    painter.drawImage(rect.topLeft(), blurred, rect.translated(-source.topLeft()))
+    painter.end()
+
+
+def blur_region(image: QImage, rect: QRect, mode: BlurMode, strength: int) -> None:
+    """
+    Obscure part of an image in place.
+
+    Args:
+        image: Image to modify
+        rect: Region to obscure, in image coordinates
+        mode: Pixelate or Gaussian blur
+        strength: Block size (pixelate) or radius (Gaussian), in pixels
+    """
+    if mode == BlurMode.GAUSSIAN:
+        gaussian_blur_region(image, rect, strength)
+    else:
+        pixelate_region(image, rect, strength)
+
+
 @dataclass
 class Annotation:
     """Represents a single annotation."""
@@ -57,6 +224,29 @@ class Annotation:
             number=self.number
         )
 
+    def to_dict(self) -> dict:
+        """Convert to a JSON-serializable dict (for the annotation sidecar)."""
+        return {
+            'tool': self.tool.name.lower(),
+            'color': self.color.name(),
+            'start': [self.start.x(), self.start.y()],
+            'end': [self.end.x(), self.end.y()],
+            'text': self.text,
+            'number': self.number,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Annotation':
+        """Create an Annotation from a dict produced by to_dict()."""
+        return cls(
+            tool=Tool[data['tool'].upper()],
+            color=QColor(data['color']),
+            start=QPoint(*data['start']),
+            end=QPoint(*data['end']),
+            text=data.get('text', ''),
+            number=data.get('number', 0),
+        )
+
     def get_bounding_rect(self) -> QRect:
         """Get the bounding rectangle for hit testing."""
         if self.tool == Tool.ARROW:
@@ -106,6 +296,118 @@ class Annotation:
         self.end = QPoint(self.end.x() + delta.x(), self.end.y() + delta.y())
 
 
+class AnnotationStore(MutableSequence):
+    """
+    Ordered list of annotations with a uniform-grid spatial index.
+
+    Behaves like a list (later annotations draw on top). Each annotation is
+    registered in the grid cells its bounding rect overlaps, so a hit test
+    only checks the few annotations near the point instead of all of them.
+    The grid is kept up to date on insert, replace and delete; call
+    refresh() after moving an annotation in place.
+
+    The grid refers to annotations by a key the store hands out when they
+    are added, never reused, rather than by id(), which Python recycles
+    once an object is freed.
+    """
+
+    CELL_SIZE = 128  # Image pixels per grid cell
+
+    def __init__(self, annotations: Iterable[Annotation] = ()):
+        self._items: List[Annotation] = []
+        self._keys: List[int] = []  # Store key of each item, in order
+        self._next_key = itertools.count()
+        self._cells: Dict[Tuple[int, int], Set[int]] = {}   # cell -> keys
+        self._cells_of: Dict[int, List[Tuple[int, int]]] = {}  # key -> cells
+        self._positions: Optional[Dict[int, int]] = None      # key -> index
+        self.reset(annotations)
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+    def __setitem__(self, index: int, annotation: Annotation):
+        self._unindex(self._keys[index])
+        key = next(self._next_key)
+        self._items[index] = annotation
+        self._keys[index] = key
+        self._index(key, annotation)
+        self._positions = None
+
+    def __delitem__(self, index: int):
+        self._unindex(self._keys[index])
+        del self._items[index]
+        del self._keys[index]
+        self._positions = None
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def insert(self, index: int, annotation: Annotation):
+        key = next(self._next_key)
+        self._items.insert(index, annotation)
+        self._keys.insert(index, key)
+        self._index(key, annotation)
+        self._positions = None
+
+    def reset(self, annotations: Iterable[Annotation]):
+        """Replace all annotations."""
+        self._items = list(annotations)
+        self._keys = [next(self._next_key) for _ in self._items]
+        self._cells.clear()
+        self._cells_of.clear()
+        for key, annotation in zip(self._keys, self._items):
+            self._index(key, annotation)
+        self._positions = None
+
+    def refresh(self, index: int):
+        """Re-index an annotation whose position changed in place."""
+        key = self._keys[index]
+        self._unindex(key)
+        self._index(key, self._items[index])
+
+    def hit_test(self, point: QPoint) -> Optional[int]:
+        """
+        Find the topmost annotation containing a point.
+
+        Args:
+            point: Point in image coordinates
+
+        Returns:
+            Index of the annotation, or None
+        """
+        candidates = self._cells.get(self._cell(point.x(), point.y()))
+        if not candidates:
+            return None
+        if self._positions is None:
+            self._positions = {key: i for i, key in enumerate(self._keys)}
+        for index in sorted((self._positions[c] for c in candidates), reverse=True):
+            if self._items[index].contains_point(point):
+                return index
+        return None
+
+    def _cell(self, x: int, y: int) -> Tuple[int, int]:
+        return (x // self.CELL_SIZE, y // self.CELL_SIZE)
+
+    def _index(self, key: int, annotation: Annotation):
+        rect = annotation.get_bounding_rect()
+        if rect.isEmpty():
+            cells = []
+        else:
+            left, top = self._cell(rect.left(), rect.top())
+            right, bottom = self._cell(rect.right(), rect.bottom())
+            cells = [(cx, cy) for cx in range(left, right + 1) for cy in range(top, bottom + 1)]
+        for cell in cells:
+            self._cells.setdefault(cell, set()).add(key)
+        self._cells_of[key] = cells
+
+    def _unindex(self, key: int):
+        for cell in self._cells_of.pop(key, []):
+            keys = self._cells[cell]
+            keys.discard(key)
+            if not keys:
+                del self._cells[cell]
+
+
 class ColorButton(QPushButton):
     """A button that displays a color."""
 
@@ -162,19 +464,182 @@ class ToolButton(QPushButton):
         """)
 
 
-@dataclass
-class CanvasState:
-    """Represents the complete state of the canvas for undo/redo."""
-    pixmap: QPixmap
-    annotations: List[Annotation]
-    callout_counter: int
-
-    def copy(self) -> 'CanvasState':
-        return CanvasState(
-            pixmap=self.pixmap.copy(),
-            annotations=[a.copy() for a in self.annotations],
-            callout_counter=self.callout_counter
-        )
+class PixelPatch:
+    """
+    A rectangle of pixels kept for undo.
+
+    Patches above COMPRESS_THRESHOLD bytes are stored zlib-compressed;
+    screenshots are mostly flat colour and compress very well.
+    """
+
+    COMPRESS_THRESHOLD = 64 * 1024
+
+    def __init__(self, image: QImage, pos: QPoint):
+        """
+        Args:
+            image: The pixels to keep
+            pos: Where the patch sits in the canvas image
+        """
+        self.pos = QPoint(pos)
+        self.width = image.width()
+        self.height = image.height()
+        self.format = image.format()
+        self.bytes_per_line = image.bytesPerLine()
+        raw = image.constBits().asstring(image.sizeInBytes())
+        self.compressed = len(raw) > self.COMPRESS_THRESHOLD
+        self.data = zlib.compress(raw, 1) if self.compressed else raw
+
+    @property
+    def cost(self) -> int:
+        """Bytes held by this patch."""
+        return len(self.data)
+
+    def to_image(self) -> QImage:
+        """Decode the patch into a standalone image."""
+        raw = zlib.decompress(self.data) if self.compressed else self.data
+        image = QImage(raw, self.width, self.height, self.bytes_per_line, self.format)
+        return image.copy()  # Detach from the raw buffer
+
+    def paste_into(self, pixmap: QPixmap) -> None:
+        """Write the patch back into a pixmap at its original position."""
+        painter = QPainter(pixmap)
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+        painter.drawImage(self.pos, self.to_image())
+        painter.end()
+
+
+class CanvasCommand(ABC):
+    """
+    One undoable edit on a ScaledAnnotationCanvas.
+
+    Commands are recorded after the edit has been applied; undo() and
+    redo() move the canvas between the before and after states.
+    """
+
+    # Rough size of a vector-only command, for the history budget
+    VECTOR_COST = 256
+
+    @property
+    def cost(self) -> int:
+        """Approximate bytes held by this command."""
+        return self.VECTOR_COST
+
+    @abstractmethod
+    def undo(self, canvas: 'ScaledAnnotationCanvas') -> None:
+        """Put the canvas back in the state before the edit."""
+
+    @abstractmethod
+    def redo(self, canvas: 'ScaledAnnotationCanvas') -> None:
+        """Re-apply the edit to the canvas."""
+
+
+class AddAnnotationCommand(CanvasCommand):
+    """An annotation was added (arrow, rectangle, text or callout)."""
+
+    def __init__(self, index: int, annotation: Annotation, counter_before: int, counter_after: int):
+        self.index = index
+        self.annotation = annotation.copy()
+        self.counter_before = counter_before
+        self.counter_after = counter_after
+
+    def undo(self, canvas: 'ScaledAnnotationCanvas') -> None:
+        del canvas.annotations[self.index]
+        canvas.callout_counter = self.counter_before
+
+    def redo(self, canvas: 'ScaledAnnotationCanvas') -> None:
+        canvas.annotations.insert(self.index, self.annotation.copy())
+        canvas.callout_counter = self.counter_after
+
+
+class RemoveAnnotationCommand(CanvasCommand):
+    """An annotation was deleted."""
+
+    def __init__(self, index: int, annotation: Annotation):
+        self.index = index
+        self.annotation = annotation.copy()
+
+    def undo(self, canvas: 'ScaledAnnotationCanvas') -> None:
+        canvas.annotations.insert(self.index, self.annotation.copy())
+
+    def redo(self, canvas: 'ScaledAnnotationCanvas') -> None:
+        del canvas.annotations[self.index]
+
+
+class ModifyAnnotationCommand(CanvasCommand):
+    """An annotation was moved or its text/number edited."""
+
+    def __init__(self, index: int, before: Annotation, after: Annotation):
+        self.index = index
+        self.before = before.copy()
+        self.after = after.copy()
+
+    def undo(self, canvas: 'ScaledAnnotationCanvas') -> None:
+        canvas.annotations[self.index] = self.before.copy()
+
+    def redo(self, canvas: 'ScaledAnnotationCanvas') -> None:
+        canvas.annotations[self.index] = self.after.copy()
+
+
+class BlurCommand(CanvasCommand):
+    """A region was blurred; keeps only that region's pixels."""
+
+    def __init__(self, before: PixelPatch, after: PixelPatch, edit: dict):
+        self.before = before
+        self.after = after
+        self.edit = edit
+
+    @property
+    def cost(self) -> int:
+        return self.VECTOR_COST + self.before.cost + self.after.cost
+
+    def undo(self, canvas: 'ScaledAnnotationCanvas') -> None:
+        self.before.paste_into(canvas.base_pixmap)
+        canvas.pixel_edits.pop()
+
+    def redo(self, canvas: 'ScaledAnnotationCanvas') -> None:
+        self.after.paste_into(canvas.base_pixmap)
+        canvas.pixel_edits.append(self.edit)
+
+
+class CropCommand(CanvasCommand):
+    """
+    The image was cropped.
+
+    Cropping discards pixels, so the pre-crop image is kept (compressed).
+    Redo re-crops from it rather than storing a second copy.
+    """
+
+    def __init__(
+        self,
+        rect: QRect,
+        image_before: PixelPatch,
+        annotations_before: List[Annotation],
+        annotations_after: List[Annotation],
+        edit: dict
+    ):
+        self.rect = QRect(rect)
+        self.edit = edit
+        self.image_before = image_before
+        self.annotations_before = [a.copy() for a in annotations_before]
+        self.annotations_after = [a.copy() for a in annotations_after]
+
+    @property
+    def cost(self) -> int:
+        return self.VECTOR_COST * (1 + len(self.annotations_before)) + self.image_before.cost
+
+    def undo(self, canvas: 'ScaledAnnotationCanvas') -> None:
+        canvas.base_pixmap = QPixmap.fromImage(self.image_before.to_image())
+        canvas.annotations.reset(a.copy() for a in self.annotations_before)
+        canvas.pixel_edits.pop()
+
+    def redo(self, canvas: 'ScaledAnnotationCanvas') -> None:
+        canvas.base_pixmap = canvas.base_pixmap.copy(self.rect)
+        canvas.annotations.reset(a.copy() for a in self.annotations_after)
+        canvas.pixel_edits.append(self.edit)
+
+
+def _rect_to_list(rect: QRect) -> List[int]:
+    return [rect.x(), rect.y(), rect.width(), rect.height()]
 
 
 class ScaledAnnotationCanvas(QWidget):
@@ -191,24 +656,47 @@ class ScaledAnnotationCanvas(QWidget):
     MAX_DISPLAY_WIDTH = 950
     MAX_DISPLAY_HEIGHT = 550
 
+    # Extra widget pixels repainted around a moving annotation (pen width,
+    # arrow head, selection handles)
+    DIRTY_MARGIN = 20
+
+    # Memory the undo/redo history may hold before old edits are dropped
+    HISTORY_BUDGET_BYTES = 64 * 1024 * 1024
+
+    # Blur tool block size (pixelate) or radius (Gaussian), in image pixels
+    DEFAULT_BLUR_STRENGTH = 10
+
     def __init__(self, pixmap: QPixmap, parent=None):
         super().__init__(parent)
         self.base_pixmap = pixmap.copy()
-        self.annotations: List[Annotation] = []
+        self.annotations = AnnotationStore()
+        # Blur/crop operations applied to the original, in order
+        self.pixel_edits: List[dict] = []
         self.current_annotation: Optional[Annotation] = None
         self.current_tool = Tool.ARROW
         self.current_color = QColor("#FF0000")
         self.callout_counter = 1
+        self.blur_mode = BlurMode.PIXELATE
+        self.blur_strength = self.DEFAULT_BLUR_STRENGTH
+
+        # Render caches: the display-scale image and the committed
+        # annotations drawn over it, rebuilt only when their inputs change
+        self._display_pixmap: Optional[QPixmap] = None
+        self._display_key: Optional[tuple] = None
+        self._overlay_pixmap: Optional[QPixmap] = None
+        self._overlay_key: Optional[tuple] = None
+        self._annotations_version = 0
 
         # Selection state
         self.selected_index: Optional[int] = None
         self.dragging = False
         self.drag_start: Optional[QPoint] = None
 
-        # Undo/redo stacks
-        self.undo_stack: List[CanvasState] = []
-        self.redo_stack: List[CanvasState] = []
-        self.max_history = 50
+        # Undo/redo history of edit commands, bounded by memory use
+        self.undo_stack: List[CanvasCommand] = []
+        self.redo_stack: List[CanvasCommand] = []
+        self.history_budget = self.HISTORY_BUDGET_BYTES
+        self._drag_before: Optional[Annotation] = None
 
         # Calculate scale factor
         self._update_scale()
@@ -243,27 +731,30 @@ class ScaledAnnotationCanvas(QWidget):
             int(image_point.y() * self.scale)
         )
 
-    def _save_state(self):
-        state = CanvasState(
-            pixmap=self.base_pixmap.copy(),
-            annotations=[a.copy() for a in self.annotations],
-            callout_counter=self.callout_counter
-        )
-        self.undo_stack.append(state)
+    def _push_command(self, command: CanvasCommand):
+        """Record an edit that has just been applied."""
+        self._annotations_version += 1
+        self.undo_stack.append(command)
         self.redo_stack.clear()
 
-        if len(self.undo_stack) > self.max_history:
-            self.undo_stack.pop(0)
+        # Drop the oldest edits once over budget, but always keep the latest
+        total = sum(c.cost for c in self.undo_stack)
+        while total > self.history_budget and len(self.undo_stack) > 1:
+            total -= self.undo_stack.pop(0).cost
 
         self.state_changed.emit()
 
-    def _restore_state(self, state: CanvasState):
-        self.base_pixmap = state.pixmap.copy()
-        self.annotations = [a.copy() for a in state.annotations]
-        self.callout_counter = state.callout_counter
+    @property
+    def history_cost(self) -> int:
+        """Approximate bytes held by the undo/redo history."""
+        return sum(c.cost for c in self.undo_stack) + sum(c.cost for c in self.redo_stack)
+
+    def _after_history_step(self):
+        self._annotations_version += 1
         self.selected_index = None
         self._update_scale()
         self.update()
+        self.state_changed.emit()
 
     def can_undo(self) -> bool:
         return len(self.undo_stack) > 0
@@ -275,32 +766,20 @@ class ScaledAnnotationCanvas(QWidget):
         if not self.undo_stack:
             return False
 
-        current_state = CanvasState(
-            pixmap=self.base_pixmap.copy(),
-            annotations=[a.copy() for a in self.annotations],
-            callout_counter=self.callout_counter
-        )
-        self.redo_stack.append(current_state)
-
-        previous_state = self.undo_stack.pop()
-        self._restore_state(previous_state)
-        self.state_changed.emit()
+        command = self.undo_stack.pop()
+        command.undo(self)
+        self.redo_stack.append(command)
+        self._after_history_step()
         return True
 
     def redo(self) -> bool:
         if not self.redo_stack:
             return False
 
-        current_state = CanvasState(
-            pixmap=self.base_pixmap.copy(),
-            annotations=[a.copy() for a in self.annotations],
-            callout_counter=self.callout_counter
-        )
-        self.undo_stack.append(current_state)
-
-        next_state = self.redo_stack.pop()
-        self._restore_state(next_state)
-        self.state_changed.emit()
+        command = self.redo_stack.pop()
+        command.redo(self)
+        self.undo_stack.append(command)
+        self._after_history_step()
         return True
 
     def set_tool(self, tool: Tool):
@@ -312,22 +791,32 @@ class ScaledAnnotationCanvas(QWidget):
     def set_color(self, color: QColor):
         self.current_color = color
 
+    def set_blur_mode(self, mode: BlurMode):
+        self.blur_mode = mode
+
+    def set_blur_strength(self, strength: int):
+        self.blur_strength = max(1, strength)
+
     def delete_selected(self):
         if self.selected_index is not None and 0 <= self.selected_index < len(self.annotations):
-            self._save_state()
-            del self.annotations[self.selected_index]
+            index = self.selected_index
+            annotation = self.annotations.pop(index)
             self.selected_index = None
+            self._push_command(RemoveAnnotationCommand(index, annotation))
             self.update()
 
     def _find_annotation_at(self, image_point: QPoint) -> Optional[int]:
         """Find annotation at the given image coordinates."""
-        for i in range(len(self.annotations) - 1, -1, -1):
-            if self.annotations[i].contains_point(image_point):
-                return i
-        return None
+        return self.annotations.hit_test(image_point)
+
+    def _add_annotation(self, annotation: Annotation, counter_before: int):
+        self.annotations.append(annotation)
+        self._push_command(AddAnnotationCommand(
+            len(self.annotations) - 1, annotation, counter_before, self.callout_counter
+        ))
+        self.update()
 
     def add_text_annotation(self, pos: QPoint, text: str):
-        self._save_state()
         annotation = Annotation(
             tool=Tool.TEXT,
             color=QColor(self.current_color),
@@ -335,11 +824,9 @@ class ScaledAnnotationCanvas(QWidget):
             end=pos,
             text=text
         )
-        self.annotations.append(annotation)
-        self.update()
+        self._add_annotation(annotation, self.callout_counter)
 
     def add_callout_annotation(self, pos: QPoint):
-        self._save_state()
         annotation = Annotation(
             tool=Tool.CALLOUT,
             color=QColor(self.current_color),
@@ -347,12 +834,12 @@ class ScaledAnnotationCanvas(QWidget):
             end=pos,
             number=self.callout_counter
         )
-        self.annotations.append(annotation)
         self.callout_counter += 1
-        self.update()
+        self._add_annotation(annotation, annotation.number)
 
     def apply_crop(self, rect: QRect):
-        self._save_state()
+        image_before = PixelPatch(self.base_pixmap.toImage(), QPoint(0, 0))
+        annotations_before = list(self.annotations)
         self.base_pixmap = self.base_pixmap.copy(rect)
 
         offset = rect.topLeft()
@@ -367,45 +854,83 @@ class ScaledAnnotationCanvas(QWidget):
                 ann_copy.end = new_end
                 adjusted_annotations.append(ann_copy)
 
-        self.annotations = adjusted_annotations
+        self.annotations.reset(adjusted_annotations)
+        edit = {'op': 'crop', 'rect': _rect_to_list(rect)}
+        self.pixel_edits.append(edit)
+        self._push_command(CropCommand(rect, image_before, annotations_before, adjusted_annotations, edit))
         self.selected_index = None
         self._update_scale()
         self.update()
 
     def apply_blur(self, rect: QRect):
-        self._save_state()
-
-        rect = rect.normalized()
+        rect = rect.normalized().intersected(self.base_pixmap.rect())
         if rect.width() < 5 or rect.height() < 5:
             return
 
-        image = self.base_pixmap.toImage()
-        block_size = 10
-
-        for y in range(rect.top(), rect.bottom(), block_size):
-            for x in range(rect.left(), rect.right(), block_size):
-                r_sum, g_sum, b_sum, count = 0, 0, 0, 0
-
-                for by in range(block_size):
-                    for bx in range(block_size):
-                        px, py = x + bx, y + by
-                        if 0 <= px < image.width() and 0 <= py < image.height():
-                            pixel = image.pixelColor(px, py)
-                            r_sum += pixel.red()
-                            g_sum += pixel.green()
-                            b_sum += pixel.blue()
-                            count += 1
-
-                if count > 0:
-                    avg_color = QColor(r_sum // count, g_sum // count, b_sum // count)
-
-                    for by in range(block_size):
-                        for bx in range(block_size):
-                            px, py = x + bx, y + by
-                            if 0 <= px < image.width() and 0 <= py < image.height():
-                                image.setPixelColor(px, py, avg_color)
-
-        self.base_pixmap = QPixmap.fromImage(image)
+        before = PixelPatch(self.base_pixmap.copy(rect).toImage(), rect.topLeft())
+        self._blur_pixels(rect, self.blur_mode, self.blur_strength)
+        after = PixelPatch(self.base_pixmap.copy(rect).toImage(), rect.topLeft())
+
+        edit = {
+            'op': 'blur',
+            'rect': _rect_to_list(rect),
+            'mode': self.blur_mode.name.lower(),
+            'strength': self.blur_strength,
+        }
+        self.pixel_edits.append(edit)
+        self._push_command(BlurCommand(before, after, edit))
+        self.update()
+
+    def _blur_pixels(self, rect: QRect, mode: BlurMode, strength: int):
+        """Blur a region of the base pixmap in place."""
+        # Work on the region (plus the margin a Gaussian blur samples) only
+        margin = 2 * strength if mode == BlurMode.GAUSSIAN else 0
+        source = rect.adjusted(-margin, -margin, margin, margin).intersected(self.base_pixmap.rect())
+        image = self.base_pixmap.copy(source).toImage()
+        local = rect.translated(-source.topLeft())
+        blur_region(image, local, mode, strength)
+
+        painter = QPainter(self.base_pixmap)
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+        painter.drawImage(rect.topLeft(), image, local)
+        painter.end()
+
+    def to_layers(self) -> dict:
+        """
+        Describe the current edits as annotation layers.
+
+        Returns:
+            Dict with the pixel edits and vector annotations, suitable for
+            annotation_layers.save_layers()
+        """
+        return {
+            'edits': [dict(edit) for edit in self.pixel_edits],
+            'annotations': [a.to_dict() for a in self.annotations],
+            'callout_counter': self.callout_counter,
+        }
+
+    def load_layers(self, layers: dict):
+        """
+        Replay saved layers over the original image.
+
+        Pixel edits are re-applied in order and the annotations restored as
+        editable objects. Nothing is added to the undo history.
+
+        Args:
+            layers: Dict as produced by to_layers()
+        """
+        for edit in layers.get('edits', []):
+            rect = QRect(*edit['rect'])
+            if edit['op'] == 'blur':
+                self._blur_pixels(rect, BlurMode[edit['mode'].upper()], edit['strength'])
+            elif edit['op'] == 'crop':
+                self.base_pixmap = self.base_pixmap.copy(rect)
+            self.pixel_edits.append(dict(edit))
+
+        self.annotations.reset(Annotation.from_dict(a) for a in layers.get('annotations', []))
+        self.callout_counter = layers.get('callout_counter', len(self.annotations) + 1)
+        self._annotations_version += 1
+        self._update_scale()
         self.update()
 
     def get_annotated_pixmap(self) -> QPixmap:
@@ -421,24 +946,86 @@ class ScaledAnnotationCanvas(QWidget):
         painter.end()
         return result
 
+    def _display_image(self) -> QPixmap:
+        """The base image scaled to the widget, cached until either changes."""
+        # cacheKey() changes whenever the pixmap is painted on or replaced
+        ratio = self.devicePixelRatioF()
+        key = (self.base_pixmap.cacheKey(), self.width(), self.height(), ratio)
+        if key != self._display_key:
+            # Scaled to device pixels so HiDPI screens get full detail
+            self._display_pixmap = self.base_pixmap.scaled(
+                self.size() * ratio,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation
+            )
+            self._display_pixmap.setDevicePixelRatio(ratio)
+            self._display_key = key
+        return self._display_pixmap
+
+    def _overlay_image(self, skip_index: Optional[int]) -> QPixmap:
+        """
+        Committed annotations drawn at display scale, cached.
+
+        The annotation at skip_index (the one being dragged) is left out so
+        it can be drawn live on top.
+        """
+        ratio = self.devicePixelRatioF()
+        key = (self._annotations_version, skip_index, self.width(), self.height(), ratio)
+        if key != self._overlay_key:
+            # Allocated in device pixels; the painter still works in widget
+            # coordinates, so annotations stay sharp on HiDPI screens
+            overlay = QPixmap(self.size() * ratio)
+            overlay.setDevicePixelRatio(ratio)
+            overlay.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(overlay)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            for i, annotation in enumerate(self.annotations):
+                if i != skip_index:
+                    self._draw_annotation(painter, annotation, scale=self.scale)
+            painter.end()
+            self._overlay_pixmap = overlay
+            self._overlay_key = key
+        return self._overlay_pixmap
+
+    def _annotation_widget_rect(self, annotation: Annotation) -> QRect:
+        """Widget area an annotation (and its selection outline) may paint."""
+        if annotation.tool == Tool.TEXT:
+            font = QFont("Arial", max(10, int(14 * self.scale)), QFont.Weight.Bold)
+            metrics = QFontMetrics(font)
+            pos = self._to_widget_coords(annotation.start)
+            rect = QRect(pos.x(), pos.y() - metrics.height(),
+                         metrics.horizontalAdvance(annotation.text), metrics.height())
+            rect = rect.united(self._scaled_rect(annotation.get_bounding_rect()))
+        elif annotation.tool in (Tool.BLUR, Tool.CROP):
+            rect = self._scaled_rect(QRect(annotation.start, annotation.end).normalized())
+        else:
+            rect = self._scaled_rect(annotation.get_bounding_rect())
+        margin = self.DIRTY_MARGIN
+        return rect.adjusted(-margin, -margin, margin, margin)
+
+    def _scaled_rect(self, rect: QRect) -> QRect:
+        return QRect(self._to_widget_coords(rect.topLeft()), self._to_widget_coords(rect.bottomRight()))
+
     def paintEvent(self, event):
         """Paint the scaled canvas with image and annotations."""
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
-
-        # Draw scaled pixmap
-        scaled_pixmap = self.base_pixmap.scaled(
-            self.size(),
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation
-        )
-        painter.drawPixmap(0, 0, scaled_pixmap)
-
-        # Draw annotations at display scale
-        for i, annotation in enumerate(self.annotations):
-            is_selected = (i == self.selected_index)
-            self._draw_annotation(painter, annotation, selected=is_selected, scale=self.scale)
+        dirty = event.rect()
+
+        # Cached layers, copied for the dirty area only
+        dragged = self.selected_index if self.dragging else None
+        target = QRectF(dirty)
+        ratio = self.devicePixelRatioF()
+        source = QRectF(target.x() * ratio, target.y() * ratio,
+                        target.width() * ratio, target.height() * ratio)  # Device pixels
+        painter.drawPixmap(target, self._display_image(), source)
+        painter.drawPixmap(target, self._overlay_image(dragged), source)
+
+        # Live layers: the annotation being dragged, selection, annotation being drawn
+        if dragged is not None and 0 <= dragged < len(self.annotations):
+            self._draw_annotation(painter, self.annotations[dragged], scale=self.scale)
+        if self.selected_index is not None and 0 <= self.selected_index < len(self.annotations):
+            self._draw_selection_highlight(painter, self.annotations[self.selected_index], self.scale)
 
         if self.current_annotation:
             self._draw_annotation(painter, self.current_annotation, selected=False, scale=self.scale)
@@ -610,19 +1197,30 @@ class ScaledAnnotationCanvas(QWidget):
         painter.drawText(text_x, text_y, text)
 
     def _draw_blur_preview(self, painter: QPainter, annotation: Annotation, scale: float):
-        pen = QPen(QColor("#888888"), 2, Qt.PenStyle.DashLine)
-        painter.setPen(pen)
-        painter.setBrush(QColor(128, 128, 128, 50))
-
         start = self._scale_point(annotation.start, scale)
         end = self._scale_point(annotation.end, scale)
         rect = QRect(start, end).normalized()
-        painter.drawRect(rect)
 
-        font = QFont("Arial", 10)
-        painter.setFont(font)
-        painter.setPen(QColor("#666666"))
-        painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, "BLUR")
+        # Live preview: apply the blur to the on-screen copy of the region
+        if scale == self.scale:
+            # The display pixmap is in device pixels (see _display_image)
+            display = self._display_image()
+            ratio = display.devicePixelRatio()
+            region = QRectF(rect.x() * ratio, rect.y() * ratio, rect.width() * ratio, rect.height() * ratio)
+            region = region.toAlignedRect().intersected(QRect(QPoint(0, 0), display.size()))
+            if not region.isEmpty():
+                preview = display.copy(region).toImage()
+                # Blurred in device pixels, then drawn back at the display's ratio
+                preview.setDevicePixelRatio(1.0)
+                strength = max(1, round(self.blur_strength * scale * ratio))
+                blur_region(preview, preview.rect(), self.blur_mode, strength)
+                preview.setDevicePixelRatio(ratio)
+                painter.drawImage(QPointF(region.x() / ratio, region.y() / ratio), preview)
+
+        pen = QPen(QColor("#888888"), 2, Qt.PenStyle.DashLine)
+        painter.setPen(pen)
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.drawRect(rect)
 
     def _draw_crop_preview(self, painter: QPainter, annotation: Annotation, scale: float):
         pen = QPen(QColor("#4CAF50"), 2, Qt.PenStyle.DashLine)
@@ -645,6 +1243,7 @@ class ScaledAnnotationCanvas(QWidget):
                     self.selected_index = clicked_index
                     self.dragging = True
                     self.drag_start = image_pos
+                    self._drag_before = self.annotations[clicked_index].copy()
                 else:
                     self.selected_index = None
                 self.update()
@@ -670,13 +1269,20 @@ class ScaledAnnotationCanvas(QWidget):
 
         if self.dragging and self.selected_index is not None and self.drag_start is not None:
             delta = QPoint(image_pos.x() - self.drag_start.x(), image_pos.y() - self.drag_start.y())
-            self.annotations[self.selected_index].move_by(delta)
+            annotation = self.annotations[self.selected_index]
+            old_rect = self._annotation_widget_rect(annotation)
+            annotation.move_by(delta)
+            self.annotations.refresh(self.selected_index)
             self.drag_start = image_pos
-            self.update()
+            self.update(old_rect.united(self._annotation_widget_rect(annotation)))
 
         elif self.current_annotation:
+            old_rect = self._annotation_widget_rect(self.current_annotation)
             self.current_annotation.end = image_pos
-            self.update()
+            if self.current_annotation.tool == Tool.CROP:
+                self.update()  # The shade covers everything outside the crop
+            else:
+                self.update(old_rect.united(self._annotation_widget_rect(self.current_annotation)))
 
         if self.current_tool == Tool.SELECT:
             if self._find_annotation_at(image_pos) is not None:
@@ -687,10 +1293,15 @@ class ScaledAnnotationCanvas(QWidget):
     def mouseReleaseEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
             if self.dragging:
-                if self.drag_start is not None:
-                    self._save_state()
+                index = self.selected_index
+                if (self._drag_before is not None and index is not None
+                        and self.annotations[index] != self._drag_before):
+                    self._push_command(ModifyAnnotationCommand(
+                        index, self._drag_before, self.annotations[index]
+                    ))
                 self.dragging = False
                 self.drag_start = None
+                self._drag_before = None
 
             elif self.current_annotation:
                 start = self.current_annotation.start
@@ -703,8 +1314,7 @@ class ScaledAnnotationCanvas(QWidget):
                     elif self.current_annotation.tool == Tool.CROP:
                         self.apply_crop(rect)
                     else:
-                        self._save_state()
-                        self.annotations.append(self.current_annotation)
+                        self._add_annotation(self.current_annotation, self.callout_counter)
 
                 self.current_annotation = None
                 self.update()
@@ -771,8 +1381,9 @@ class ScaledAnnotationCanvas(QWidget):
         layout.addWidget(buttons)
 
         if dialog.exec() == QDialog.DialogCode.Accepted and text_input.text():
-            self._save_state()
-            self.annotations[index].text = text_input.text()
+            before = annotation.copy()
+            annotation.text = text_input.text()
+            self._push_command(ModifyAnnotationCommand(index, before, annotation))
             self.update()
 
     def _edit_callout_annotation(self, index: int):
@@ -802,8 +1413,9 @@ class ScaledAnnotationCanvas(QWidget):
         if dialog.exec() == QDialog.DialogCode.Accepted:
             try:
                 new_number = int(text_input.text())
-                self._save_state()
-                self.annotations[index].number = new_number
+                before = annotation.copy()
+                annotation.number = new_number
+                self._push_command(ModifyAnnotationCommand(index, before, annotation))
                 self.update()
             except ValueError:
                 pass
@@ -826,11 +1438,22 @@ class AnnotationEditor(QDialog):
         self.setWindowTitle("Annotate Screenshot")
         self.setModal(True)
 
-        self.original_pixmap = QPixmap(image_path)
+        # Previously annotated screenshots reopen from the untouched original
+        # with their edits replayed, so annotations stay editable
+        self.saved_layers = annotation_layers.load_layers(image_path)
+        source_path = annotation_layers.original_path(image_path) if self.saved_layers else image_path
+
+        self.original_pixmap = QPixmap(source_path)
+        if self.original_pixmap.isNull() and self.saved_layers:
+            # Unreadable original: edit the rendered image, as if unannotated
+            self.saved_layers = None
+            self.original_pixmap = QPixmap(image_path)
         if self.original_pixmap.isNull():
             raise ValueError(f"Could not load image: {image_path}")
 
         self._setup_ui()
+        if self.saved_layers:
+            self.canvas.load_layers(self.saved_layers)
         self._connect_signals()
         self._update_undo_redo_buttons()
         self._adjust_dialog_size()
@@ -924,6 +1547,25 @@ class AnnotationEditor(QDialog):
 
         self.color_buttons[0].setChecked(True)
 
+        layout.addSpacing(10)
+
+        blur_label = QLabel("Blur:")
+        blur_label.setStyleSheet("font-weight: bold; color: #333;")
+        layout.addWidget(blur_label)
+
+        self.blur_mode_combo = QComboBox()
+        self.blur_mode_combo.addItem("Pixelate", BlurMode.PIXELATE)
+        self.blur_mode_combo.addItem("Gaussian", BlurMode.GAUSSIAN)
+        self.blur_mode_combo.setToolTip("How the Blur tool hides a region")
+        layout.addWidget(self.blur_mode_combo)
+
+        self.blur_strength_spin = QSpinBox()
+        self.blur_strength_spin.setRange(2, 64)
+        self.blur_strength_spin.setSuffix(" px")
+        self.blur_strength_spin.setValue(ScaledAnnotationCanvas.DEFAULT_BLUR_STRENGTH)
+        self.blur_strength_spin.setToolTip("Block size (pixelate) or radius (Gaussian)")
+        layout.addWidget(self.blur_strength_spin)
+
         layout.addStretch()
 
         self.undo_btn = QPushButton("↶ Undo")
@@ -1013,6 +1655,10 @@ class AnnotationEditor(QDialog):
         self.undo_btn.clicked.connect(self._on_undo)
         self.redo_btn.clicked.connect(self._on_redo)
         self.canvas.state_changed.connect(self._update_undo_redo_buttons)
+        self.blur_mode_combo.currentIndexChanged.connect(
+            lambda: self.canvas.set_blur_mode(self.blur_mode_combo.currentData())
+        )
+        self.blur_strength_spin.valueChanged.connect(self.canvas.set_blur_strength)
 
     def _adjust_dialog_size(self):
         """Set dialog size to fit the scaled canvas plus chrome."""
@@ -1058,14 +1704,50 @@ class AnnotationEditor(QDialog):
         self.canvas.redo()
 
     def _on_save(self):
-        """Save the annotated image at full resolution."""
-        annotated = self.canvas.get_annotated_pixmap()
-
-        if annotated.save(self.image_path, 'PNG'):
+        """
+        Save the edits as layers and the rendered image at full resolution.
+
+        The image the edits were made on is kept beside the screenshot and
+        the edits go to a small JSON sidecar. If nothing changed since the
+        last save the image is not re-rendered.
+        """
+        layers = self.canvas.to_layers()
+        previous = self.saved_layers or {'edits': [], 'annotations': []}
+        if (layers['edits'] == previous.get('edits')
+                and layers['annotations'] == previous.get('annotations')):
             self.completed.emit(self.image_path)
             self.accept()
-        else:
+            return
+
+        try:
+            rebased = self.saved_layers is None
+            if rebased:
+                # The edits were made on the file on disk; it becomes the
+                # original they are replayed over. An .original.png left
+                # from a lost or unreadable sidecar doesn't match them.
+                shutil.copy2(self.image_path, annotation_layers.original_path(self.image_path))
+
+            if not self.canvas.get_annotated_pixmap().save(self.image_path, 'PNG'):
+                raise OSError(f"could not write {self.image_path}")
+
+            # Clean render for exports without annotations
+            clean = annotation_layers.clean_path(self.image_path)
+            if rebased or layers['edits'] != previous.get('edits'):
+                if layers['edits']:
+                    self.canvas.base_pixmap.save(clean, 'PNG')
+                elif os.path.exists(clean):
+                    os.remove(clean)
+
+            if not annotation_layers.save_layers(self.image_path, layers):
+                raise OSError("could not write annotation layers")
+        except OSError as e:
+            print(f"Error saving annotated image: {e}")
             QMessageBox.warning(self, "Error", "Failed to save annotated image.")
+            return
+
+        self.saved_layers = layers
+        self.completed.emit(self.image_path)
+        self.accept()
 
     def _on_cancel(self):
         self.cancelled.emit()
@@ -10,12 +10,12 @@ from typing import List, Optional
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QRadioButton, QButtonGroup, QFileDialog, QMessageBox,
-    QFrame, QProgressBar
+    QFrame, QProgressBar, QCheckBox
 )
 from PyQt6.QtCore import Qt, QThread, pyqtSignal
 
 from ..models import Path, Step
-from ..services import ExportService
+from ..services import ExportService, ImageOptimizer
 
 
 # Style constants
@@ -28,38 +28,57 @@ COLOR_BORDER = "#E0E0E0"
 class ExportWorker(QThread):
     """Background worker for export operations."""
     finished = pyqtSignal(bool, str)  # success, message
+    progress = pyqtSignal(int, int, int)  # steps done, total steps, pages written
 
     def __init__(
         self,
         export_format: str,
         path: Path,
         steps: List[Step],
-        output_path: str
+        output_path: str,
+        annotated: bool = True,
+        compact: bool = False,
+        optimize_images: bool = False
     ):
         super().__init__()
         self.export_format = export_format
         self.path = path
         self.steps = steps
         self.output_path = output_path
+        self.annotated = annotated
+        self.compact = compact
+        self.optimize_images = optimize_images
 
     def run(self):
         try:
+            optimizer = ImageOptimizer() if self.optimize_images else None
             if self.export_format == 'json':
                 success = ExportService.export_json(
                     self.path, self.steps, self.output_path,
-                    embed_images=True
+                    embed_images=True, annotated=self.annotated,
+                    compact=self.compact, optimizer=optimizer
                 )
             elif self.export_format == 'html':
                 success = ExportService.export_html(
-                    self.path, self.steps, self.output_path
+                    self.path, self.steps, self.output_path,
+                    annotated=self.annotated, optimizer=optimizer
                 )
             elif self.export_format == 'pdf':
                 success = ExportService.export_pdf(
-                    self.path, self.steps, self.output_path
+                    self.path, self.steps, self.output_path,
+                    annotated=self.annotated,
+                    progress=self.progress.emit
+                )
+            elif self.export_format == 'flowpath':
+                success = ExportService.export_bundle(
+                    [(self.path, self.steps)], self.output_path,
+                    annotated=self.annotated
                 )
             else:
                 success = False
 
+            if optimizer:
+                optimizer.prune_cache()
             if success:
                 self.finished.emit(True, f"Exported successfully to:\n{self.output_path}")
             else:
@@ -128,9 +147,17 @@ class ExportDialog(QDialog):
         pdf_desc.setStyleSheet(f"font-size: 12px; color: {COLOR_TEXT_SECONDARY}; margin-left: 24px;")
         pdf_desc.setWordWrap(True)
 
+        # FlowPath bundle option
+        self.bundle_radio = QRadioButton("FlowPath Bundle")
+        self.bundle_radio.setStyleSheet("font-size: 14px;")
+        bundle_desc = QLabel("Compact archive for sharing with other FlowPath users. Can be re-imported.")
+        bundle_desc.setStyleSheet(f"font-size: 12px; color: {COLOR_TEXT_SECONDARY}; margin-left: 24px;")
+        bundle_desc.setWordWrap(True)
+
         self.format_group.addButton(self.json_radio)
         self.format_group.addButton(self.html_radio)
         self.format_group.addButton(self.pdf_radio)
+        self.format_group.addButton(self.bundle_radio)
 
         layout.addWidget(self.json_radio)
         layout.addWidget(json_desc)
@@ -140,6 +167,31 @@ class ExportDialog(QDialog):
         layout.addSpacing(8)
         layout.addWidget(self.pdf_radio)
         layout.addWidget(pdf_desc)
+        layout.addSpacing(8)
+        layout.addWidget(self.bundle_radio)
+        layout.addWidget(bundle_desc)
+
+        layout.addSpacing(8)
+
+        # Screenshot annotations
+        self.annotations_check = QCheckBox("Include screenshot annotations")
+        self.annotations_check.setStyleSheet("font-size: 14px;")
+        self.annotations_check.setChecked(True)
+        layout.addWidget(self.annotations_check)
+
+        # Compact JSON (only applies to the JSON format)
+        self.compact_check = QCheckBox("Compact JSON (smaller file, not indented)")
+        self.compact_check.setStyleSheet("font-size: 14px;")
+        layout.addWidget(self.compact_check)
+
+        # Image optimization (HTML only: JSON is re-imported, so it keeps
+        # the screenshots as they are)
+        self.optimize_check = QCheckBox("Optimize images (scaled to page width, WebP)")
+        self.optimize_check.setStyleSheet("font-size: 14px;")
+        self.optimize_check.setChecked(True)
+        self.json_radio.toggled.connect(self._update_option_states)
+        self.html_radio.toggled.connect(self._update_option_states)
+        layout.addWidget(self.optimize_check)
 
         layout.addSpacing(8)
 
@@ -212,6 +264,12 @@ class ExportDialog(QDialog):
 
         layout.addLayout(button_layout)
         self.setLayout(layout)
+        self._update_option_states()
+
+    def _update_option_states(self):
+        """Enable the options that apply to the selected format."""
+        self.compact_check.setEnabled(self.json_radio.isChecked())
+        self.optimize_check.setEnabled(self.html_radio.isChecked())
 
     def get_selected_format(self) -> str:
         """Return the selected export format."""
@@ -221,6 +279,8 @@ class ExportDialog(QDialog):
             return 'html'
         elif self.pdf_radio.isChecked():
             return 'pdf'
+        elif self.bundle_radio.isChecked():
+            return 'flowpath'
         return 'html'
 
     def do_export(self):
@@ -232,6 +292,7 @@ class ExportDialog(QDialog):
             'json': ('JSON Files (*.json)', 'json'),
             'html': ('HTML Files (*.html)', 'html'),
             'pdf': ('PDF Files (*.pdf)', 'pdf'),
+            'flowpath': ('FlowPath Bundles (*.flowpath)', 'flowpath'),
         }
         filter_str, ext = format_info[export_format]
         suggested_name = ExportService.get_suggested_filename(self.path, ext)
@@ -252,6 +313,7 @@ class ExportDialog(QDialog):
             file_path += f'.{ext}'
 
         # Show progress
+        self.progress.setRange(0, 0)  # Indeterminate until the worker reports
         self.progress.setVisible(True)
         self.status_label.setText("Exporting...")
         self.status_label.setVisible(True)
@@ -262,12 +324,30 @@ class ExportDialog(QDialog):
         self.json_radio.setEnabled(False)
         self.html_radio.setEnabled(False)
         self.pdf_radio.setEnabled(False)
+        self.bundle_radio.setEnabled(False)
+        self.annotations_check.setEnabled(False)
+        self.compact_check.setEnabled(False)
+        self.optimize_check.setEnabled(False)
 
         # Run export in background
-        self.worker = ExportWorker(export_format, self.path, self.steps, file_path)
+        self.worker = ExportWorker(
+            export_format, self.path, self.steps, file_path,
+            annotated=self.annotations_check.isChecked(),
+            compact=self.compact_check.isChecked(),
+            optimize_images=export_format == 'html' and self.optimize_check.isChecked()
+        )
         self.worker.finished.connect(self._on_export_finished)
+        self.worker.progress.connect(self._on_export_progress)
         self.worker.start()
 
+    def _on_export_progress(self, done: int, total: int, pages: int):
+        """Show how far a paged export has got."""
+        self.progress.setRange(0, total)
+        self.progress.setValue(done)
+        self.status_label.setText(
+            f"Exporting step {done} of {total} ({pages} page{'s' if pages != 1 else ''})..."
+        )
+
     def _on_export_finished(self, success: bool, message: str):
         """Handle export completion."""
         self.progress.setVisible(False)
@@ -277,6 +357,9 @@ class ExportDialog(QDialog):
         self.json_radio.setEnabled(True)
         self.html_radio.setEnabled(True)
         self.pdf_radio.setEnabled(True)
+        self.bundle_radio.setEnabled(True)
+        self.annotations_check.setEnabled(True)
+        self._update_option_states()
 
         if success:
             QMessageBox.information(self, "Export Complete", message)
@@ -0,0 +1,358 @@
+"""
+Library list widgets for FlowPath.
+
+A model/view list of paths and legacy documents. Rows are painted by a
+delegate instead of being built from widgets, so only visible rows cost
+anything and refreshing a large library only touches the rows that changed.
+"""
+
+from bisect import bisect_left
+from typing import Any, Hashable, List, Optional
+
+from PyQt6.QtWidgets import QListView, QStyledItemDelegate, QStyle, QAbstractItemView
+from PyQt6.QtCore import (
+    Qt, QAbstractListModel, QModelIndex, QRect, QSize, pyqtSignal
+)
+from PyQt6.QtGui import QColor, QFont, QFontMetrics, QPainter, QPen
+
+from ..models import PathSummary, LegacyDocument
+
+
+# Style constants (match the home screen)
+COLOR_PRIMARY_GREEN = "#4CAF50"
+COLOR_TEXT_PRIMARY = "#333333"
+COLOR_TEXT_SECONDARY = "#666666"
+COLOR_TEXT_MUTED = "#999999"
+COLOR_LEGACY_BADGE = "#757575"
+COLOR_PILL_BG = "#F0F0F0"
+COLOR_ROW_DIVIDER = "#F0F0F0"
+COLOR_HOVER_BG = "#F5F5F5"
+
+PATH_ROW_HEIGHT = 48
+FILE_ROW_HEIGHT = 56
+
+# Types that can be converted to FlowPath
+CONVERTIBLE_TYPES = {'word', 'powerpoint', 'text'}
+
+
+def _item_key(item: Any) -> Hashable:
+    """Stable identity of a list item, used to diff refreshes."""
+    if isinstance(item, PathSummary):
+        return ('path', item.path.id)
+    return ('file', item.filepath)
+
+
+def _increasing_run(values: List[int]) -> List[int]:
+    """
+    Longest strictly increasing subsequence of the non-negative values.
+
+    Patience sorting, O(n log n). Negative values are skipped.
+    """
+    tail_values: List[int] = []  # smallest tail value of a run of each length
+    tail_indexes: List[int] = []
+    previous = [-1] * len(values)
+    for i, value in enumerate(values):
+        if value < 0:
+            continue
+        pos = bisect_left(tail_values, value)
+        if pos > 0:
+            previous[i] = tail_indexes[pos - 1]
+        if pos == len(tail_values):
+            tail_values.append(value)
+            tail_indexes.append(i)
+        else:
+            tail_values[pos] = value
+            tail_indexes[pos] = i
+
+    run: List[int] = []
+    i = tail_indexes[-1] if tail_indexes else -1
+    while i >= 0:
+        run.append(values[i])
+        i = previous[i]
+    run.reverse()
+    return run
+
+
+class LibraryListModel(QAbstractListModel):
+    """
+    List model holding PathSummary and LegacyDocument items.
+
+    set_items() diffs the new list against the current one and emits
+    fine-grained remove/insert/dataChanged notifications, so attached
+    views keep their scroll position and only repaint what changed.
+    """
+
+    ItemRole = Qt.ItemDataRole.UserRole + 1
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._items: List[Any] = []
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._items)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._items):
+            return None
+        item = self._items[index.row()]
+        if role == self.ItemRole:
+            return item
+        if role == Qt.ItemDataRole.DisplayRole:
+            return item.path.title if isinstance(item, PathSummary) else item.filename
+        if role == Qt.ItemDataRole.ToolTipRole and isinstance(item, LegacyDocument):
+            return item.filepath
+        return None
+
+    def item_at(self, row: int) -> Optional[Any]:
+        """Get the item at a row, or None if out of range."""
+        if 0 <= row < len(self._items):
+            return self._items[row]
+        return None
+
+    def set_items(self, items: List[Any]) -> None:
+        """
+        Replace the model contents, emitting incremental change signals.
+
+        Rows whose keys disappeared are removed, new keys are inserted in
+        place and rows whose data changed are refreshed. Rows that moved
+        are removed and re-inserted; the longest run of rows that kept
+        their relative order stays put.
+        """
+        new_items = list(items)
+        new_keys = [_item_key(item) for item in new_items]
+
+        if not self._items:
+            if new_items:
+                self.beginInsertRows(QModelIndex(), 0, len(new_items) - 1)
+                self._items = new_items
+                self.endInsertRows()
+            return
+
+        # Rows that can stay: present in both lists and in the same order
+        new_positions = {key: pos for pos, key in enumerate(new_keys)}
+        old_positions = [new_positions.get(_item_key(item), -1) for item in self._items]
+        kept_keys = {new_keys[pos] for pos in _increasing_run(old_positions)}
+
+        # Remove every other row, bottom up, in contiguous runs
+        row = len(self._items) - 1
+        while row >= 0:
+            if _item_key(self._items[row]) in kept_keys:
+                row -= 1
+                continue
+            last = row
+            while row >= 0 and _item_key(self._items[row]) not in kept_keys:
+                row -= 1
+            self.beginRemoveRows(QModelIndex(), row + 1, last)
+            del self._items[row + 1:last + 1]
+            self.endRemoveRows()
+
+        # Insert new rows in contiguous runs and refresh changed ones, top down
+        row = 0
+        while row < len(new_items):
+            if new_keys[row] not in kept_keys:
+                end = row
+                while end + 1 < len(new_items) and new_keys[end + 1] not in kept_keys:
+                    end += 1
+                self.beginInsertRows(QModelIndex(), row, end)
+                self._items[row:row] = new_items[row:end + 1]
+                self.endInsertRows()
+                row = end + 1
+                continue
+            if self._items[row] != new_items[row]:
+                self._items[row] = new_items[row]
+                index = self.index(row)
+                self.dataChanged.emit(index, index)
+            row += 1
+
+    def clear(self) -> None:
+        """Remove all items."""
+        self.set_items([])
+
+
+class LibraryItemDelegate(QStyledItemDelegate):
+    """Paints path and legacy document rows in the home screen style."""
+
+    def sizeHint(self, option, index: QModelIndex) -> QSize:
+        item = index.data(LibraryListModel.ItemRole)
+        height = PATH_ROW_HEIGHT if isinstance(item, PathSummary) else FILE_ROW_HEIGHT
+        return QSize(option.rect.width(), height)
+
+    @staticmethod
+    def convert_button_rect(row_rect: QRect) -> QRect:
+        """Where the CONVERT button sits within a legacy document row."""
+        return QRect(row_rect.right() - 12 - 65, row_rect.center().y() - 13, 65, 26)
+
+    def paint(self, painter: QPainter, option, index: QModelIndex) -> None:
+        item = index.data(LibraryListModel.ItemRole)
+        if item is None:
+            return
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        rect = option.rect
+
+        if option.state & QStyle.StateFlag.State_MouseOver:
+            painter.fillRect(rect, QColor(COLOR_HOVER_BG))
+
+        painter.setPen(QPen(QColor(COLOR_ROW_DIVIDER), 1))
+        painter.drawLine(rect.bottomLeft(), rect.bottomRight())
+
+        content = rect.adjusted(12, 8, -12, -8)
+        if isinstance(item, PathSummary):
+            self._paint_path(painter, content, item)
+        else:
+            self._paint_file(painter, content, item)
+        painter.restore()
+
+    def _paint_path(self, painter: QPainter, rect: QRect, summary: PathSummary) -> None:
+        """Paint a path row: title, category, step count."""
+        font = QFont(painter.font())
+        font.setPixelSize(14)
+        bold = QFont(font)
+        bold.setBold(True)
+        metrics = QFontMetrics(font)
+        bold_metrics = QFontMetrics(bold)
+
+        # Right-aligned parts, laid out right to left
+        right = rect.right()
+        if summary.step_count > 0:
+            count = summary.step_count
+            text = f"{count} step{'s' if count != 1 else ''}"
+            width = bold_metrics.horizontalAdvance(text)
+            painter.setFont(bold)
+            painter.setPen(QColor(COLOR_PRIMARY_GREEN))
+            painter.drawText(QRect(right - width, rect.top(), width, rect.height()),
+                             Qt.AlignmentFlag.AlignVCenter, text)
+            right -= width + 12
+
+        category = summary.path.category
+        if category:
+            width = metrics.horizontalAdvance(category)
+            painter.setFont(font)
+            painter.setPen(QColor(COLOR_TEXT_SECONDARY))
+            painter.drawText(QRect(right - width, rect.top(), width, rect.height()),
+                             Qt.AlignmentFlag.AlignVCenter, category)
+            right -= width + 12
+
+        # Title takes the remaining space
+        title_rect = QRect(rect.left(), rect.top(), max(right - rect.left(), 100), rect.height())
+        painter.setFont(font)
+        painter.setPen(QColor(COLOR_TEXT_PRIMARY))
+        painter.drawText(title_rect, Qt.AlignmentFlag.AlignVCenter,
+                         metrics.elidedText(summary.path.title, Qt.TextElideMode.ElideRight,
+                                            title_rect.width()))
+
+    def _paint_file(self, painter: QPainter, rect: QRect, doc: LegacyDocument) -> None:
+        """Paint a legacy document row: name, type, badge, date, convert button."""
+        font = QFont(painter.font())
+        font.setPixelSize(14)
+        bold = QFont(font)
+        bold.setBold(True)
+        metrics = QFontMetrics(font)
+        bold_metrics = QFontMetrics(bold)
+
+        right = rect.right()
+        if doc.file_type in CONVERTIBLE_TYPES:
+            button = self.convert_button_rect(rect.adjusted(-12, -8, 12, 8))
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QColor(COLOR_PRIMARY_GREEN))
+            painter.drawRoundedRect(button, 7, 7)
+            painter.setFont(bold)
+            painter.setPen(QColor("white"))
+            painter.drawText(button, Qt.AlignmentFlag.AlignCenter, "CONVERT")
+            right = button.left() - 12
+
+        # Modified date (fixed width column)
+        date_rect = QRect(right - 80, rect.top(), 80, rect.height())
+        painter.setFont(font)
+        painter.setPen(QColor(COLOR_TEXT_MUTED))
+        painter.drawText(date_rect, Qt.AlignmentFlag.AlignVCenter, doc.modified_display)
+        right = date_rect.left() - 12
+
+        # LEGACY badge
+        right = self._paint_pill(painter, bold, bold_metrics, "LEGACY", right, rect,
+                                 QColor(COLOR_LEGACY_BADGE), QColor("white")) - 12
+
+        # File type pill
+        right = self._paint_pill(painter, font, metrics, doc.type_label, right, rect,
+                                 QColor(COLOR_PILL_BG), QColor(COLOR_TEXT_SECONDARY)) - 12
+
+        # Filename takes the remaining space (capped like the old row widget)
+        name_width = max(min(right - rect.left(), 400), 100)
+        name_rect = QRect(rect.left(), rect.top(), name_width, rect.height())
+        painter.setFont(font)
+        painter.setPen(QColor(COLOR_TEXT_PRIMARY))
+        painter.drawText(name_rect, Qt.AlignmentFlag.AlignVCenter,
+                         metrics.elidedText(doc.filename, Qt.TextElideMode.ElideRight,
+                                            name_rect.width()))
+
+    @staticmethod
+    def _paint_pill(painter: QPainter, font: QFont, metrics: QFontMetrics, text: str,
+                    right: int, rect: QRect, background: QColor, foreground: QColor) -> int:
+        """Paint a rounded label ending at `right`; returns its left edge."""
+        width = metrics.horizontalAdvance(text) + 16
+        height = metrics.height() + 4
+        pill = QRect(right - width, rect.center().y() - height // 2, width, height)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(background)
+        painter.drawRoundedRect(pill, 7, 7)
+        painter.setFont(font)
+        painter.setPen(foreground)
+        painter.drawText(pill, Qt.AlignmentFlag.AlignCenter, text)
+        return pill.left()
+
+
+class LibraryListView(QListView):
+    """
+    Virtualized list of paths and legacy documents.
+
+    Signals mirror the old per-row widgets so callers can connect the same
+    handlers.
+    """
+    path_clicked = pyqtSignal(int)  # Emits path_id
+    file_clicked = pyqtSignal(str)  # Emits filepath
+    convert_clicked = pyqtSignal(str)  # Emits filepath
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.library_model = LibraryListModel(self)
+        self.setModel(self.library_model)
+        self.setItemDelegate(LibraryItemDelegate(self))
+
+        # All rows in one tab share a height, which lets Qt skip measuring
+        self.setUniformItemSizes(True)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.setMouseTracking(True)
+        self.viewport().setAttribute(Qt.WidgetAttribute.WA_Hover)
+        self.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.setStyleSheet("""
+            QListView {
+                border: none;
+                background-color: transparent;
+            }
+        """)
+
+    def set_items(self, items: List[Any]) -> None:
+        """Show these items, updating only the rows that changed."""
+        self.library_model.set_items(items)
+
+    def mousePressEvent(self, event):
+        """Handle a click on a row or on a row's CONVERT button."""
+        if event.button() != Qt.MouseButton.LeftButton:
+            super().mousePressEvent(event)
+            return
+
+        index = self.indexAt(event.position().toPoint())
+        item = self.library_model.item_at(index.row()) if index.isValid() else None
+        if isinstance(item, PathSummary):
+            self.path_clicked.emit(item.path.id)
+        elif isinstance(item, LegacyDocument):
+            button = LibraryItemDelegate.convert_button_rect(self.visualRect(index))
+            if item.file_type in CONVERTIBLE_TYPES and button.contains(event.position().toPoint()):
+                self.convert_clicked.emit(item.filepath)
+            else:
+                self.file_clicked.emit(item.filepath)
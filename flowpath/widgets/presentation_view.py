@@ -0,0 +1,284 @@
+"""
+PresentationView widget for FlowPath.
+
+Shows a path one step at a time, for walking an audience through it.
+"""
+
+import os
+from typing import Dict, List, Optional
+
+from PyQt6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QSizePolicy
+)
+from PyQt6.QtCore import Qt, QSize, QTimer, pyqtSignal
+from PyQt6.QtGui import QFont, QPixmap
+
+from .markdown_label import MarkdownLabel
+from ..models import Step
+from ..services import ThumbnailCache
+
+
+class PresentationView(QWidget):
+    """
+    Paged, one-step-at-a-time view of a path.
+
+    Screenshots are decoded in the background at the size they are shown
+    at, for the current step and its neighbours (PREFETCH_AHEAD after,
+    PREFETCH_BEHIND before), so moving between steps shows an image that
+    is already decoded. Images outside that window are dropped.
+
+    Keys: Right/Space/Page Down for next, Left/Page Up for previous,
+    Home/End for first/last, Escape to exit.
+
+    Usage:
+        view = PresentationView()
+        view.exit_requested.connect(on_exit)
+        view.set_steps(steps, index)
+    """
+    exit_requested = pyqtSignal()
+    step_changed = pyqtSignal(int)  # Emits step index
+
+    PREFETCH_AHEAD = 3
+    PREFETCH_BEHIND = 1
+    RESIZE_DELAY_MS = 150
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.steps: List[Step] = []
+        self.index = 0
+        self._paths: List[Optional[str]] = []
+        # Step index -> screenshot decoded at _target_size
+        self._images: Dict[int, QPixmap] = {}
+        self._target_size = QSize()
+
+        self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
+        self.setStyleSheet("background-color: white;")
+        self._setup_ui()
+
+        ThumbnailCache.instance().thumbnail_ready.connect(self._on_image_ready)
+
+        # Re-decode for the new size only once resizing settles
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(self.RESIZE_DELAY_MS)
+        self._resize_timer.timeout.connect(self._on_resized)
+
+    def _setup_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(24, 12, 24, 16)
+        layout.setSpacing(12)
+
+        # Top bar: step counter and exit
+        top_bar = QHBoxLayout()
+        self.counter_label = QLabel("")
+        counter_font = QFont()
+        counter_font.setPixelSize(18)
+        counter_font.setBold(True)
+        self.counter_label.setFont(counter_font)
+        self.counter_label.setStyleSheet("color: #333;")
+        top_bar.addWidget(self.counter_label)
+        top_bar.addStretch()
+
+        exit_btn = QPushButton("Exit Presentation")
+        exit_btn.setStyleSheet("""
+            QPushButton {
+                background-color: transparent;
+                color: #666;
+                border: 1px solid #E0E0E0;
+                padding: 6px 14px;
+                border-radius: 4px;
+                font-size: 14px;
+            }
+            QPushButton:hover {
+                background-color: #f5f5f5;
+            }
+        """)
+        exit_btn.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        exit_btn.clicked.connect(self.exit_requested.emit)
+        top_bar.addWidget(exit_btn)
+        layout.addLayout(top_bar)
+
+        # Screenshot, filling the available space
+        self.image_label = QLabel()
+        self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.image_label.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Ignored)
+        self.image_label.setStyleSheet("color: #666;")
+        layout.addWidget(self.image_label, 1)
+
+        # Instructions
+        self.instructions_label = MarkdownLabel()
+        body_font = QFont()
+        body_font.setPixelSize(16)
+        self.instructions_label.setFont(body_font)
+        self.instructions_label.setStyleSheet("color: #444;")
+        self.instructions_label.setAlignment(Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop)
+        layout.addWidget(self.instructions_label)
+
+        # Navigation
+        nav_layout = QHBoxLayout()
+        nav_style = """
+            QPushButton {
+                background-color: #4CAF50;
+                color: white;
+                border: none;
+                padding: 8px 18px;
+                border-radius: 4px;
+                font-size: 14px;
+                font-weight: bold;
+            }
+            QPushButton:hover {
+                background-color: #45a049;
+            }
+            QPushButton:disabled {
+                background-color: #cccccc;
+            }
+        """
+        self.prev_btn = QPushButton("← Previous")
+        self.prev_btn.setStyleSheet(nav_style)
+        self.prev_btn.clicked.connect(self.previous_step)
+        self.next_btn = QPushButton("Next →")
+        self.next_btn.setStyleSheet(nav_style)
+        self.next_btn.clicked.connect(self.next_step)
+        # Keep keyboard focus on the view so the arrow keys always navigate
+        self.prev_btn.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.next_btn.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        nav_layout.addStretch()
+        nav_layout.addWidget(self.prev_btn)
+        nav_layout.addSpacing(12)
+        nav_layout.addWidget(self.next_btn)
+        nav_layout.addStretch()
+        layout.addLayout(nav_layout)
+
+    def set_steps(self, steps: List[Step], index: int = 0):
+        """Present a list of steps, starting at index."""
+        self.steps = list(steps)
+        self._paths = [
+            os.path.abspath(step.screenshot_path) if step.screenshot_path else None
+            for step in self.steps
+        ]
+        self._images.clear()
+        self.show_step(index)
+
+    def show_step(self, index: int):
+        """Show the step at index and prefetch its neighbours."""
+        if not self.steps:
+            self.counter_label.setText("")
+            self.instructions_label.setMarkdown("This path has no steps yet.")
+            self.image_label.clear()
+            self.prev_btn.setEnabled(False)
+            self.next_btn.setEnabled(False)
+            return
+
+        self.index = max(0, min(index, len(self.steps) - 1))
+        step = self.steps[self.index]
+        self.counter_label.setText(f"Step {step.step_number} of {len(self.steps)}")
+        self.instructions_label.setMarkdown(step.instructions or "")
+        self.prev_btn.setEnabled(self.index > 0)
+        self.next_btn.setEnabled(self.index < len(self.steps) - 1)
+
+        self._prefetch()
+        self._show_image()
+        self.step_changed.emit(self.index)
+
+    def next_step(self):
+        """Go to the next step."""
+        if self.index < len(self.steps) - 1:
+            self.show_step(self.index + 1)
+
+    def previous_step(self):
+        """Go to the previous step."""
+        if self.index > 0:
+            self.show_step(self.index - 1)
+
+    def keyPressEvent(self, event):
+        """Navigate with the keyboard."""
+        key = event.key()
+        if key in (Qt.Key.Key_Right, Qt.Key.Key_Space, Qt.Key.Key_PageDown, Qt.Key.Key_Down):
+            self.next_step()
+        elif key in (Qt.Key.Key_Left, Qt.Key.Key_PageUp, Qt.Key.Key_Up, Qt.Key.Key_Backspace):
+            self.previous_step()
+        elif key == Qt.Key.Key_Home:
+            self.show_step(0)
+        elif key == Qt.Key.Key_End:
+            self.show_step(len(self.steps) - 1)
+        elif key == Qt.Key.Key_Escape:
+            self.exit_requested.emit()
+        else:
+            super().keyPressEvent(event)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._resize_timer.start()
+
+    # ==================== Prefetching ====================
+
+    def _current_target_size(self) -> QSize:
+        """Size in device pixels that screenshots are decoded to."""
+        ratio = self.devicePixelRatioF()
+        size = self.image_label.size()
+        return QSize(max(1, round(size.width() * ratio)), max(1, round(size.height() * ratio)))
+
+    def _prefetch(self):
+        """Request the current step's neighbourhood; drop images outside it."""
+        self._target_size = self._current_target_size()
+        first = max(0, self.index - self.PREFETCH_BEHIND)
+        last = min(len(self.steps) - 1, self.index + self.PREFETCH_AHEAD)
+        for index in list(self._images):
+            if index < first or index > last:
+                del self._images[index]
+
+        # Current step first, then outward, next before previous
+        order = [self.index]
+        for distance in range(1, max(self.PREFETCH_AHEAD, self.PREFETCH_BEHIND) + 1):
+            if self.index + distance <= last:
+                order.append(self.index + distance)
+            if self.index - distance >= first:
+                order.append(self.index - distance)
+
+        thumbnails = ThumbnailCache.instance()
+        for index in order:
+            path = self._paths[index]
+            if path and index not in self._images:
+                # Screen-sized images are held here, not in the shared cache
+                pixmap = thumbnails.thumbnail(path, self._target_size, cache=False)
+                if pixmap is not None:
+                    # Already cached, or a missing file: no thumbnail_ready follows
+                    self._store_image(index, pixmap)
+
+    def _store_image(self, index: int, pixmap: QPixmap):
+        """Keep a decoded screenshot and show it if it is the current step's."""
+        pixmap = QPixmap(pixmap)  # May be the shared cache's; don't alter that one
+        pixmap.setDevicePixelRatio(self.devicePixelRatioF())
+        self._images[index] = pixmap
+        if index == self.index:
+            self._show_image()
+
+    def _on_image_ready(self, path: str, size: QSize, pixmap: QPixmap):
+        """Keep a decoded screenshot if it belongs to the prefetch window."""
+        if size != self._target_size or not self.steps:
+            return
+        first = max(0, self.index - self.PREFETCH_BEHIND)
+        last = min(len(self.steps) - 1, self.index + self.PREFETCH_AHEAD)
+        for index in range(first, last + 1):
+            if self._paths[index] == path:
+                self._store_image(index, pixmap)
+
+    def _show_image(self):
+        """Display the current step's screenshot, if decoded."""
+        if not self._paths[self.index]:
+            self.image_label.setText("No screenshot")
+            return
+        pixmap = self._images.get(self.index)
+        if pixmap is None:
+            self.image_label.setText("Loading…")
+        elif pixmap.isNull():
+            self.image_label.setText("Screenshot could not be loaded")
+        else:
+            self.image_label.setPixmap(pixmap)
+
+    def _on_resized(self):
+        """Re-decode the window for the new image area size."""
+        if self.steps and self._current_target_size() != self._target_size:
+            # The old image stays up until the new one arrives
+            self._images.clear()
+            self._prefetch()
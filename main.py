@@ -11,7 +11,7 @@ from flowpath.screens.path_editor import PathEditorScreen
 from flowpath.screens.step_creator import StepCreatorScreen
 from flowpath.screens.path_reader import PathReaderScreen
 from flowpath.screens.admin import AdminScreen
-from flowpath.services import DataService
+from flowpath.services import DataService, ExportService, OfficeServer, ThumbnailCache
 
 __version__ = "0.5"
 
@@ -88,6 +88,13 @@ class FlowPathWindow(QMainWindow):
         
         file_menu.addSeparator()
 
+        # Import a path exported as JSON
+        import_action = QAction("Import Path...", self)
+        import_action.triggered.connect(self._on_import_path)
+        file_menu.addAction(import_action)
+
+        file_menu.addSeparator()
+
         # Settings/Admin action
         settings_action = QAction("Manage Categories && Tags...", self)
         settings_action.triggered.connect(self._on_show_admin)
@@ -123,6 +130,39 @@ class FlowPathWindow(QMainWindow):
             self.home_screen.set_team_folder(folder)
             self._update_window_title(folder)
 
+    def _on_import_path(self):
+        """Handle Import Path menu action."""
+        file_path, _ = QFileDialog.getOpenFileName(
+            self,
+            "Import Path",
+            "",
+            "FlowPath Files (*.flowpath *.json)"
+        )
+        if not file_path:
+            return
+
+        QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+        try:
+            if file_path.lower().endswith('.flowpath'):
+                path_ids = ExportService.import_bundle(file_path, self.data_service)
+            else:
+                path_id = ExportService.import_json(file_path, self.data_service)
+                path_ids = [path_id] if path_id is not None else None
+        finally:
+            QApplication.restoreOverrideCursor()
+
+        if not path_ids:
+            QMessageBox.warning(
+                self,
+                "Import Failed",
+                "The file could not be imported. Is it a FlowPath export?"
+            )
+            return
+        if len(path_ids) == 1:
+            self._on_view_path(path_ids[0])
+        else:
+            self._show_home()
+
     def _on_show_team_folder(self):
         """Show the current team folder location."""
         team_folder = self.settings.value("team_folder", "")
@@ -324,4 +364,9 @@ if __name__ == "__main__":
     
     window = FlowPathWindow()
     window.show()
+    app.aboutToQuit.connect(window.home_screen.folder_watcher.stop)
+    app.aboutToQuit.connect(window.home_screen.batch_converter.stop)
+    app.aboutToQuit.connect(OfficeServer.stop_all)
+    app.aboutToQuit.connect(ThumbnailCache.instance().clear)
+    app.aboutToQuit.connect(window.data_service.db.close_all)
     sys.exit(app.exec())
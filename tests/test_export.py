@@ -5,18 +5,22 @@ Run with: python -m pytest tests/test_export.py -v
 Or simply: python tests/test_export.py
 """
 
+import base64
 import json
 import os
 import sys
 import tempfile
 import unittest
+import zipfile
 from datetime import datetime
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from flowpath.models import Path, Step
-from flowpath.services.export_service import ExportService, _markdown_to_html
+from flowpath.services.export_service import ExportService, _markdown_to_html, BASE64_CHUNK_BYTES
+from flowpath.services import annotation_layers, DataService
+from flowpath.services.batch_export import batch_export, select_paths
 
 
 class TestMarkdownToHtml(unittest.TestCase):
@@ -140,6 +144,267 @@ class TestExportJson(unittest.TestCase):
         self.assertIn('2024-01-15', data['path']['created_at'])
 
 
+class TestImportJson(unittest.TestCase):
+    """Test streaming JSON export and import."""
+
+    def setUp(self):
+        """Create a data service and a path with an embedded screenshot."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.service = DataService(os.path.join(self.temp_dir, "test.db"))
+        self.image_data = os.urandom(BASE64_CHUNK_BYTES * 2 + 5)
+        self.image = os.path.join(self.temp_dir, "shot.jpg")
+        with open(self.image, 'wb') as f:
+            f.write(self.image_data)
+        self.path = Path(id=7, title="Imported \u00e9", tags="a, b", creator="TestUser")
+        self.steps = [
+            Step(id=1, path_id=7, step_number=1, instructions='Say "hi"\n**now**',
+                 screenshot_path=self.image),
+            Step(id=2, path_id=7, step_number=2, instructions="No image"),
+        ]
+        self.image_dir = os.path.join(self.temp_dir, "images")
+
+    def tearDown(self):
+        """Clean up temp files."""
+        import shutil
+        self.service.db.close_all()
+        shutil.rmtree(self.temp_dir)
+
+    def _round_trip(self, compact: bool) -> int:
+        output_path = os.path.join(self.temp_dir, "export.json")
+        self.assertTrue(ExportService.export_json(
+            self.path, self.steps, output_path, embed_images=True, compact=compact
+        ))
+        path_id = ExportService.import_json(output_path, self.service, self.image_dir)
+        self.assertIsNotNone(path_id)
+        return path_id
+
+    def test_round_trip_creates_new_path(self):
+        """Test that an import recreates the path, steps and screenshot."""
+        path_id = self._round_trip(compact=False)
+        path, steps = self.service.get_path_with_steps(path_id)
+        self.assertEqual(path.title, "Imported \u00e9")
+        self.assertEqual(path.tags, "a, b")
+        self.assertEqual([s.instructions for s in steps], ['Say "hi"\n**now**', "No image"])
+        self.assertTrue(steps[0].screenshot_path.startswith(self.image_dir))
+        self.assertTrue(steps[0].screenshot_path.endswith('.jpg'))
+        with open(steps[0].screenshot_path, 'rb') as f:
+            self.assertEqual(f.read(), self.image_data)
+        self.assertIsNone(steps[1].screenshot_path)
+
+    def test_compact_export(self):
+        """Test that compact output has no indentation and still imports."""
+        path_id = self._round_trip(compact=True)
+        with open(os.path.join(self.temp_dir, "export.json")) as f:
+            text = f.read()
+        self.assertNotIn('\n', text)
+        self.assertEqual(len(json.loads(text)['steps']), 2)
+        self.assertEqual(self.service.count_steps(path_id), 2)
+
+    def test_indented_export_matches_json_dump(self):
+        """Test that the streamed indented output is what json.dump would write."""
+        output_path = os.path.join(self.temp_dir, "export.json")
+        ExportService.export_json(self.path, self.steps, output_path, embed_images=True)
+        with open(output_path) as f:
+            text = f.read()
+        self.assertEqual(text, json.dumps(json.loads(text), indent=2, ensure_ascii=False))
+
+    def test_invalid_file_imports_nothing(self):
+        """Test that a truncated file fails without leaving images behind."""
+        output_path = os.path.join(self.temp_dir, "export.json")
+        ExportService.export_json(self.path, self.steps, output_path, embed_images=True)
+        with open(output_path, 'r+') as f:
+            f.truncate(os.path.getsize(output_path) // 2)
+
+        self.assertIsNone(ExportService.import_json(output_path, self.service, self.image_dir))
+        self.assertEqual(self.service.count_paths(), 0)
+        self.assertEqual(os.listdir(self.image_dir), [])
+
+
+class TestBundle(unittest.TestCase):
+    """Test .flowpath bundle export and import."""
+
+    def setUp(self):
+        """Create a data service and two paths sharing a screenshot."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.service = DataService(os.path.join(self.temp_dir, "test.db"))
+        self.shared = os.path.join(self.temp_dir, "shared.png")
+        with open(self.shared, 'wb') as f:
+            f.write(b"\x89PNG shared" * 1000)
+        self.other = os.path.join(self.temp_dir, "other.bmp")
+        with open(self.other, 'wb') as f:
+            f.write(b"BM other" * 1000)
+        self.paths = [
+            (Path(id=1, title="First"), [
+                Step(id=1, path_id=1, step_number=1, instructions="One", screenshot_path=self.shared),
+                Step(id=2, path_id=1, step_number=2, instructions="Two", screenshot_path=self.other),
+            ]),
+            (Path(id=2, title="Copy"), [
+                Step(id=3, path_id=2, step_number=1, instructions="One", screenshot_path=self.shared),
+            ]),
+        ]
+        self.bundle = os.path.join(self.temp_dir, "paths.flowpath")
+        self.image_dir = os.path.join(self.temp_dir, "images")
+
+    def tearDown(self):
+        """Clean up temp files."""
+        import shutil
+        self.service.db.close_all()
+        shutil.rmtree(self.temp_dir)
+
+    def test_images_stored_once_by_hash(self):
+        """Test that shared images are stored once, compressed only when useful."""
+        self.assertTrue(ExportService.export_bundle(self.paths, self.bundle))
+        with zipfile.ZipFile(self.bundle) as bundle:
+            images = [info for info in bundle.infolist() if info.filename.startswith('images/')]
+            manifest = json.loads(bundle.read('manifest.json'))
+        self.assertEqual(len(images), 2)
+        compression = {os.path.splitext(info.filename)[1]: info.compress_type for info in images}
+        self.assertEqual(compression['.png'], zipfile.ZIP_STORED)
+        self.assertEqual(compression['.bmp'], zipfile.ZIP_DEFLATED)
+        self.assertEqual([entry['title'] for entry in manifest['paths']], ["First", "Copy"])
+
+    def test_round_trip(self):
+        """Test that importing a bundle recreates its paths and images."""
+        ExportService.export_bundle(self.paths, self.bundle)
+        path_ids = ExportService.import_bundle(self.bundle, self.service, self.image_dir)
+        self.assertEqual(len(path_ids), 2)
+
+        path, steps = self.service.get_path_with_steps(path_ids[0])
+        self.assertEqual(path.title, "First")
+        self.assertEqual([s.instructions for s in steps], ["One", "Two"])
+        with open(steps[1].screenshot_path, 'rb') as f:
+            self.assertEqual(f.read(), b"BM other" * 1000)
+        _, copy_steps = self.service.get_path_with_steps(path_ids[1])
+        self.assertEqual(copy_steps[0].screenshot_path, steps[0].screenshot_path)
+        self.assertEqual(len(os.listdir(self.image_dir)), 2)
+
+        # Importing again reuses the images already there
+        ExportService.import_bundle(self.bundle, self.service, self.image_dir)
+        self.assertEqual(len(os.listdir(self.image_dir)), 2)
+        self.assertEqual(self.service.count_paths(), 4)
+
+    def test_corrupt_image_imports_nothing(self):
+        """Test that an image not matching its hash fails the whole import."""
+        ExportService.export_bundle(self.paths, self.bundle)
+        corrupt = os.path.join(self.temp_dir, "corrupt.flowpath")
+        with zipfile.ZipFile(self.bundle) as source, zipfile.ZipFile(corrupt, 'w') as target:
+            for info in source.infolist():
+                data = source.read(info.filename)
+                if info.filename.endswith('.bmp'):
+                    data = b"tampered"
+                target.writestr(info, data)
+
+        self.assertIsNone(ExportService.import_bundle(corrupt, self.service, self.image_dir))
+        self.assertEqual(self.service.count_paths(), 0)
+        self.assertEqual(os.listdir(self.image_dir), [])
+
+
+class TestBatchExport(unittest.TestCase):
+    """Test exporting many paths at once."""
+
+    def setUp(self):
+        """Create a database with three paths sharing a screenshot."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.service = DataService(os.path.join(self.temp_dir, "test.db"))
+        self.shared = os.path.join(self.temp_dir, "shared.png")
+        with open(self.shared, 'wb') as f:
+            f.write(os.urandom(BASE64_CHUNK_BYTES + 5))
+        for title, category in (("First", "LMS"), ("Second", "LMS"), ("Third", "Admin")):
+            self.service.save_path_with_steps(
+                Path(title=title, category=category, tags="nightly"),
+                [Step(path_id=0, step_number=1, instructions="Open it", screenshot_path=self.shared)]
+            )
+        self.output_dir = os.path.join(self.temp_dir, "out")
+
+    def tearDown(self):
+        """Clean up temp files."""
+        import shutil
+        self.service.db.close_all()
+        shutil.rmtree(self.temp_dir)
+
+    def test_select_paths(self):
+        """Test choosing paths by ID, category and tag."""
+        self.assertEqual(len(select_paths(self.service)), 3)
+        self.assertEqual({p.title for p in select_paths(self.service, category="LMS")}, {"First", "Second"})
+        self.assertEqual(len(select_paths(self.service, tag="nightly")), 3)
+        self.assertEqual([p.title for p in select_paths(self.service, path_ids=[3, 99])], ["Third"])
+
+    def test_exports_every_path_with_index(self):
+        """Test that each path is exported in each format and listed in the index."""
+        paths = select_paths(self.service)
+        result = batch_export(self.service, paths, self.output_dir, workers=2)
+
+        self.assertEqual(len(result.exported), 3)
+        self.assertEqual(result.failed, [])
+        self.assertGreater(result.paths_per_second, 0)
+        with open(result.index_path, encoding='utf-8') as f:
+            index = f.read()
+        with open(self.shared, 'rb') as f:
+            expected = base64.b64encode(f.read()).decode('ascii')
+        for entry in result.entries:
+            self.assertEqual(set(entry.files), {'html', 'json'})
+            for name in entry.files.values():
+                self.assertIn(f'href="{name}"', index)
+            with open(os.path.join(self.output_dir, entry.files['json']), encoding='utf-8') as f:
+                data = json.load(f)
+            self.assertEqual(data['steps'][0]['screenshot_base64'], f"data:image/png;base64,{expected}")
+            with open(os.path.join(self.output_dir, entry.files['html']), encoding='utf-8') as f:
+                self.assertIn(expected, f.read())
+        # The shared encode cache is removed afterwards
+        self.assertEqual(
+            sorted(os.listdir(self.output_dir)),
+            sorted(['index.html'] + [name for entry in result.entries for name in entry.files.values()])
+        )
+
+    def test_encode_cache_reused(self):
+        """Test that a screenshot encoded for one export is reused by the next."""
+        cache_dir = os.path.join(self.temp_dir, "cache")
+        os.makedirs(cache_dir)
+        path, steps = self.service.get_path_with_steps(1)
+        first = os.path.join(self.temp_dir, "first.html")
+        self.assertTrue(ExportService.export_html(path, steps, first, encode_cache_dir=cache_dir))
+        cached = [os.path.join(cache_dir, name) for name in os.listdir(cache_dir)]
+        self.assertEqual(len(cached), 1)
+
+        with open(cached[0], 'w', encoding='ascii') as f:
+            f.write("CACHED")
+        second = os.path.join(self.temp_dir, "second.html")
+        ExportService.export_html(path, steps, second, encode_cache_dir=cache_dir)
+        with open(second, encoding='utf-8') as f:
+            self.assertIn("data:image/png;base64,CACHED", f.read())
+
+    def test_steps_read_as_jobs_are_queued(self):
+        """Test that progress starts before the steps of every path are read."""
+        for i in range(5):
+            self.service.save_path_with_steps(Path(title=f"Extra {i}"), [Step(path_id=0, step_number=1)])
+        paths = select_paths(self.service)
+        reads = []
+        read_steps = self.service.get_steps_for_path
+
+        def get_steps_for_path(path_id):
+            reads.append(path_id)
+            return read_steps(path_id)
+
+        reads_at_progress = []
+        self.service.get_steps_for_path = get_steps_for_path
+        result = batch_export(
+            self.service, paths, self.output_dir, formats=('json',), workers=1,
+            progress=lambda done, total, entry: reads_at_progress.append((done, total, len(reads)))
+        )
+
+        self.assertEqual(len(result.exported), 8)
+        self.assertEqual(sorted(reads), sorted(p.id for p in paths))
+        self.assertEqual([(done, total) for done, total, _ in reads_at_progress], [(i, 8) for i in range(1, 9)])
+        # One worker holds at most two paths' steps at a time
+        self.assertEqual(reads_at_progress[0][2], 2)
+        self.assertEqual([e.path.id for e in result.entries], [p.id for p in paths])
+
+    def test_unknown_format_rejected(self):
+        """Test that formats the workers can't produce are refused up front."""
+        with self.assertRaises(ValueError):
+            batch_export(self.service, select_paths(self.service), self.output_dir, formats=('pdf',))
+
+
 class TestExportHtml(unittest.TestCase):
     """Test HTML export functionality."""
 
@@ -229,6 +494,175 @@ class TestExportHtml(unittest.TestCase):
 
         self.assertIn('@media print', html)
 
+    def test_html_export_streams_images_intact(self):
+        """Test that images spanning several base64 chunks embed correctly."""
+        image_path = os.path.join(self.temp_dir, "shot.png")
+        data = bytes(range(256)) * (BASE64_CHUNK_BYTES // 256 * 2 + 1) + b'tail'
+        with open(image_path, 'wb') as f:
+            f.write(data)
+        self.steps[0].screenshot_path = image_path
+
+        output_path = os.path.join(self.temp_dir, "test.html")
+        self.assertTrue(ExportService.export_html(self.path, self.steps, output_path))
+
+        with open(output_path, 'r') as f:
+            html = f.read()
+        prefix = 'src="data:image/png;base64,'
+        start = html.index(prefix) + len(prefix)
+        encoded = html[start:html.index('"', start)]
+        self.assertEqual(base64.b64decode(encoded), data)
+        self.assertFalse(os.path.exists(output_path + '.tmp'))
+
+
+class TestImageOptimizer(unittest.TestCase):
+    """Test scaling and re-encoding screenshots for export."""
+
+    def setUp(self):
+        """Create a large screenshot with metadata."""
+        from PyQt6.QtGui import QColor, QImage
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.temp_dir, "cache")
+        self.image_path = os.path.join(self.temp_dir, "shot.png")
+        image = QImage(4000, 2000, QImage.Format.Format_ARGB32)
+        image.fill(QColor(0, 0, 0, 0))
+        image.setText("Author", "someone")
+        image.save(self.image_path)
+
+    def tearDown(self):
+        """Clean up temp files."""
+        import shutil
+        shutil.rmtree(self.temp_dir)
+
+    def test_scales_down_and_strips_metadata(self):
+        """Test that images are scaled to the maximum size without metadata."""
+        from PyQt6.QtGui import QImageReader
+        from flowpath.services import ImageOptimizer
+        optimizer = ImageOptimizer(max_dimension=800, cache_dir=self.cache_dir)
+        optimized = optimizer.optimize(self.image_path)
+        self.assertTrue(optimized.endswith(".webp"))
+        reader = QImageReader(optimized)
+        self.assertEqual((reader.size().width(), reader.size().height()), (800, 400))
+        self.assertEqual(reader.textKeys(), [])
+
+    def test_jpeg_flattens_transparency(self):
+        """Test that JPEG output has transparent areas made white."""
+        from PyQt6.QtGui import QImage
+        from flowpath.services import ImageOptimizer
+        optimizer = ImageOptimizer(image_format='jpeg', cache_dir=self.cache_dir)
+        image = QImage(optimizer.optimize(self.image_path))
+        self.assertGreater(image.pixelColor(10, 10).lightness(), 240)
+
+    def test_cached_by_source_hash(self):
+        """Test that copies of an image share one optimized file, made once."""
+        import shutil
+        from flowpath.services import ImageOptimizer
+        optimizer = ImageOptimizer(cache_dir=self.cache_dir)
+        first = optimizer.optimize(self.image_path)
+        copy_path = os.path.join(self.temp_dir, "copy.png")
+        shutil.copy(self.image_path, copy_path)
+        self.assertEqual(ImageOptimizer(cache_dir=self.cache_dir).optimize(copy_path), first)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+
+        # Other settings get their own file
+        other = ImageOptimizer(max_dimension=100, cache_dir=self.cache_dir).optimize(self.image_path)
+        self.assertNotEqual(other, first)
+
+    def test_unreadable_image_used_as_is(self):
+        """Test that an image that can't be decoded is exported unchanged."""
+        from flowpath.services import ImageOptimizer
+        broken = os.path.join(self.temp_dir, "broken.png")
+        with open(broken, 'wb') as f:
+            f.write(b"not an image")
+        self.assertEqual(ImageOptimizer(cache_dir=self.cache_dir).optimize(broken), broken)
+
+    def test_html_export_embeds_optimized_image(self):
+        """Test that the HTML export embeds the optimized image."""
+        from flowpath.services import ImageOptimizer
+        steps = [Step(path_id=1, step_number=1, instructions="Look", screenshot_path=self.image_path)]
+        output_path = os.path.join(self.temp_dir, "out.html")
+        optimizer = ImageOptimizer(cache_dir=self.cache_dir)
+        self.assertTrue(ExportService.export_html(Path(id=1, title="T"), steps, output_path, optimizer=optimizer))
+        with open(output_path, encoding='utf-8') as f:
+            content = f.read()
+        with open(optimizer.optimize(self.image_path), 'rb') as f:
+            expected = base64.b64encode(f.read()).decode('ascii')
+        self.assertIn(f'src="data:image/webp;base64,{expected}"', content)
+
+    def test_batch_json_keeps_originals(self):
+        """Test that a batch export optimizes HTML screenshots but not the re-importable JSON."""
+        from flowpath.services import ImageOptimizer
+        service = DataService(os.path.join(self.temp_dir, "test.db"))
+        try:
+            service.save_path_with_steps(
+                Path(title="T"), [Step(path_id=0, step_number=1, screenshot_path=self.image_path)]
+            )
+            output_dir = os.path.join(self.temp_dir, "out")
+            optimizer = ImageOptimizer(cache_dir=self.cache_dir)
+            result = batch_export(service, select_paths(service), output_dir, workers=1, optimizer=optimizer)
+        finally:
+            service.db.close_all()
+
+        entry = result.entries[0]
+        with open(os.path.join(output_dir, entry.files['json']), encoding='utf-8') as f:
+            self.assertTrue(json.load(f)['steps'][0]['screenshot_base64'].startswith("data:image/png;base64,"))
+        with open(os.path.join(output_dir, entry.files['html']), encoding='utf-8') as f:
+            self.assertIn('src="data:image/webp;base64,', f.read())
+
+
+class TestExportPdf(unittest.TestCase):
+    """Test PDF export."""
+
+    @classmethod
+    def setUpClass(cls):
+        """PDF layout needs a GUI application for fonts."""
+        os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+        # A QApplication, so widget tests in the same run can share it
+        from PyQt6.QtWidgets import QApplication
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        """Create a path with screenshots."""
+        from PyQt6.QtGui import QColor, QImage
+        self.temp_dir = tempfile.mkdtemp()
+        self.steps = []
+        for number in range(1, 6):
+            image_path = os.path.join(self.temp_dir, f"shot{number}.png")
+            image = QImage(1600, 900, QImage.Format.Format_RGB32)
+            image.fill(QColor("#336699"))
+            image.save(image_path)
+            self.steps.append(Step(
+                path_id=1, step_number=number,
+                instructions="Click **Save**\n" * (80 if number == 3 else 1),
+                screenshot_path=image_path
+            ))
+        self.path = Path(id=1, title="PDF Path", creator="TestUser")
+
+    def tearDown(self):
+        """Clean up temp files."""
+        import shutil
+        shutil.rmtree(self.temp_dir)
+
+    def test_pdf_export_reports_progress(self):
+        """Test that the PDF is written and progress is reported per step."""
+        output_path = os.path.join(self.temp_dir, "test.pdf")
+        reports = []
+        result = ExportService.export_pdf(
+            self.path, self.steps, output_path, progress=lambda *args: reports.append(args)
+        )
+        self.assertTrue(result)
+        with open(output_path, 'rb') as f:
+            self.assertTrue(f.read(5).startswith(b'%PDF'))
+        self.assertEqual([r[:2] for r in reports], [(n, 5) for n in range(1, 6)])
+        pages = [r[2] for r in reports]
+        self.assertEqual(pages, sorted(pages))
+        self.assertGreater(pages[-1], 1)
+        self.assertFalse(os.path.exists(output_path + '.tmp'))
+
+    def test_pdf_export_unwritable_path_fails(self):
+        """Test that a PDF that can't be written reports failure."""
+        output_path = os.path.join(self.temp_dir, "missing", "test.pdf")
+        self.assertFalse(ExportService.export_pdf(self.path, self.steps, output_path))
+
 
 class TestSuggestedFilename(unittest.TestCase):
     """Test filename suggestion."""
@@ -260,5 +694,62 @@ class TestSuggestedFilename(unittest.TestCase):
         self.assertNotIn('  ', filename)  # No double spaces
 
 
+class TestAnnotatedExports(unittest.TestCase):
+    """Test choosing annotated or clean screenshots for export."""
+
+    def setUp(self):
+        """Create a screenshot with annotation layers."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.image = os.path.join(self.temp_dir, "shot.png")
+        for path, data in ((self.image, b"annotated"),
+                           (annotation_layers.original_path(self.image), b"original")):
+            with open(path, 'wb') as f:
+                f.write(data)
+        self.layers = {'edits': [], 'annotations': [{'tool': 'callout'}], 'callout_counter': 2}
+        annotation_layers.save_layers(self.image, self.layers)
+
+    def tearDown(self):
+        """Clean up temp files."""
+        import shutil
+        shutil.rmtree(self.temp_dir)
+
+    def test_layers_round_trip(self):
+        """Test that saved layers load back with a version stamp."""
+        loaded = annotation_layers.load_layers(self.image)
+        self.assertEqual(loaded['annotations'], self.layers['annotations'])
+        self.assertEqual(loaded['version'], annotation_layers.LAYERS_VERSION)
+
+    def test_clean_export_prefers_clean_render(self):
+        """Test the clean image choice: clean render, then original."""
+        self.assertEqual(annotation_layers.export_image_path(self.image), self.image)
+        self.assertEqual(
+            annotation_layers.export_image_path(self.image, annotated=False),
+            annotation_layers.original_path(self.image)
+        )
+        with open(annotation_layers.clean_path(self.image), 'wb') as f:
+            f.write(b"clean")
+        self.assertEqual(
+            annotation_layers.export_image_path(self.image, annotated=False),
+            annotation_layers.clean_path(self.image)
+        )
+
+    def test_plain_screenshot_exports_itself(self):
+        """Test that screenshots without layers are exported unchanged."""
+        os.remove(annotation_layers.sidecar_path(self.image))
+        self.assertIsNone(annotation_layers.load_layers(self.image))
+        self.assertEqual(annotation_layers.export_image_path(self.image, annotated=False), self.image)
+
+    def test_json_export_embeds_clean_image(self):
+        """Test that JSON export embeds the clean image when asked."""
+        output_path = os.path.join(self.temp_dir, "test.json")
+        step = Step(id=1, path_id=1, step_number=1, screenshot_path=self.image)
+        ExportService.export_json(
+            Path(id=1, title="T"), [step], output_path, embed_images=True, annotated=False
+        )
+        with open(output_path) as f:
+            data = json.load(f)
+        self.assertIn(base64.b64encode(b"original").decode(), data['steps'][0]['screenshot_base64'])
+
+
 if __name__ == '__main__':
     unittest.main()
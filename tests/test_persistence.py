@@ -6,15 +6,20 @@ Or simply: python tests/test_persistence.py
 """
 
 import os
+import shutil
+import sqlite3
 import sys
 import tempfile
 import unittest
+import unittest.mock
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from flowpath.models import Path, Step
-from flowpath.data import Database, PathRepository, StepRepository
+from flowpath.data import Database, PathRepository, StepRepository, LegacyDocumentIndex
+from flowpath.services import annotation_layers
+from flowpath.services.data_service import DataService
 
 
 class TestDatabase(unittest.TestCase):
@@ -29,6 +34,7 @@ class TestDatabase(unittest.TestCase):
 
     def tearDown(self):
         """Clean up the temporary database."""
+        self.db.close_all()
         os.unlink(self.temp_file.name)
 
     def test_database_creation(self):
@@ -46,6 +52,217 @@ class TestDatabase(unittest.TestCase):
             self.assertIn('paths', tables)
             self.assertIn('steps', tables)
 
+    def test_schema_version(self):
+        """Test that all migrations are recorded with timings."""
+        from flowpath.data.migrations import MIGRATIONS
+
+        self.assertEqual(self.db.schema_version, MIGRATIONS[-1].version)
+        with self.db.connection() as conn:
+            rows = conn.execute("SELECT version, duration_ms FROM schema_version").fetchall()
+        self.assertEqual(len(rows), len(MIGRATIONS))
+        self.assertTrue(all(row['duration_ms'] is not None for row in rows))
+        self.assertEqual(self.db.migrate(), [])
+
+    def test_unversioned_database_upgrade(self):
+        """Test that a database created before versioning is migrated in place."""
+        with self.db.connection() as conn:
+            conn.execute("INSERT INTO paths (title, tags) VALUES ('Old', 'a, b')")
+            for table in ('path_search', 'path_tags', 'schema_version'):
+                conn.execute(f"DROP TABLE {table}")
+
+        progress = []
+        self.db.initialize(progress=lambda name, done, total: progress.append((name, done, total)))
+
+        self.assertEqual(PathRepository(self.db).get_all_tags(), ['a', 'b'])
+        self.assertIn(("path_tags join table", 1, 1), progress)
+
+    def test_backfill_commits_each_batch(self):
+        """Test that batched backfills are visible to other connections as they go."""
+        with self.db.connection() as conn:
+            for title in ('A', 'B', 'C'):
+                conn.execute("INSERT INTO paths (title, tags) VALUES (?, 'x')", (title,))
+            conn.execute("DROP TABLE path_tags")
+            conn.execute("DELETE FROM schema_version WHERE version >= 2")
+
+        seen = []
+
+        def progress(name, done, total):
+            if name == "path_tags join table" and done:
+                other = sqlite3.connect(self.temp_file.name)
+                try:
+                    seen.append(other.execute("SELECT COUNT(*) FROM path_tags").fetchone()[0])
+                finally:
+                    other.close()
+
+        self.db.MIGRATION_BATCH_SIZE = 1
+        self.db.initialize(progress=progress)
+        self.assertEqual(seen, [1, 2, 3])
+
+    def test_search_index_built_later(self):
+        """Test that a search index skipped for lack of FTS5 is built on a later start."""
+        if not self.db.fts_enabled:
+            self.skipTest("SQLite built without FTS5")
+        with self.db.connection() as conn:
+            conn.execute("INSERT INTO paths (title) VALUES ('Printer setup')")
+            for (trigger,) in conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'trigger'").fetchall():
+                conn.execute(f"DROP TRIGGER {trigger}")
+            conn.execute("DROP TABLE path_search")
+            conn.execute("DROP TABLE path_search_dirty")
+
+        db = Database(self.temp_file.name)
+        try:
+            db.initialize()
+            self.assertTrue(db.fts_enabled)
+            results = PathRepository(db).search_ranked("printer")
+            self.assertEqual([r.path.title for r in results], ["Printer setup"])
+            self.assertGreater(results[0].score, 0)  # Ranked, so from the index
+        finally:
+            db.close_all()
+
+    def test_failed_migration_rolls_back(self):
+        """Test that a failing migration leaves the version unchanged."""
+        from flowpath.data import migrations
+
+        def broken(conn, ctx):
+            conn.execute("CREATE TABLE half_done (id INTEGER)")
+            raise RuntimeError("boom")
+
+        migrations.MIGRATIONS.append(migrations.Migration(999, "broken", broken))
+        try:
+            version = self.db.schema_version
+            with self.assertRaises(RuntimeError):
+                self.db.migrate()
+            self.assertEqual(self.db.schema_version, version)
+            with self.db.connection() as conn:
+                tables = [row[0] for row in conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type='table'")]
+            self.assertNotIn('half_done', tables)
+        finally:
+            migrations.MIGRATIONS.pop()
+
+    def test_reset_clears_everything(self):
+        """Test that reset also clears categories, tags and settings."""
+        with self.db.connection() as conn:
+            conn.execute("INSERT INTO categories (name) VALUES ('LMS')")
+            conn.execute("INSERT INTO tags (name) VALUES ('auth')")
+            conn.execute("INSERT INTO settings (key, value) VALUES ('team_name', 'X')")
+        self.db.reset()
+        with self.db.connection() as conn:
+            for table in ('categories', 'tags', 'settings'):
+                count = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                self.assertEqual(count, 0)
+
+    def test_connection_reused(self):
+        """Test that pooled connections are reused within a thread."""
+        with self.db.connection() as first:
+            pass
+        with self.db.connection() as second:
+            pass
+        self.assertIs(first, second)
+        stats = self.db.pool_stats
+        self.assertEqual(stats['open_connections'], 1)
+        self.assertGreater(stats['reuses'], 0)
+
+    def test_connection_per_thread(self):
+        """Test that each thread gets its own pooled connection."""
+        import threading
+
+        seen = []
+
+        def worker():
+            with self.db.connection() as conn:
+                seen.append(conn)
+
+        with self.db.connection() as main_conn:
+            pass
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        self.assertIsNot(seen[0], main_conn)
+        # The worker's connection is closed when the thread exits
+        stats = self.db.pool_stats
+        self.assertEqual(stats['open_connections'], 1)
+        self.assertEqual(stats['connections_closed'], 1)
+
+    def test_close_all_during_use(self):
+        """Test that close_all() doesn't break a thread inside connection()."""
+        import threading
+
+        inside = threading.Event()
+        closed = threading.Event()
+        errors = []
+
+        def worker():
+            try:
+                with self.db.connection():
+                    inside.set()
+                    closed.wait(5)
+            except Exception as e:  # The connection itself is gone
+                if not isinstance(e, sqlite3.ProgrammingError):
+                    errors.append(e)
+            try:
+                with self.db.connection() as conn:
+                    conn.execute("SELECT 1")
+            except Exception as e:
+                errors.append(e)
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        inside.wait(5)
+        self.db.close_all()
+        closed.set()
+        thread.join()
+        self.assertEqual(errors, [])
+
+        # This thread reconnects too
+        with self.db.connection() as conn:
+            conn.execute("SELECT 1")
+
+    def test_wal_mode(self):
+        """Test that pooled connections use WAL journaling."""
+        with self.db.connection() as conn:
+            mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        self.assertEqual(mode.lower(), 'wal')
+
+    def test_nested_rollback(self):
+        """Test that an error in a nested block rolls back the outer one."""
+        with self.assertRaises(RuntimeError):
+            with self.db.connection() as conn:
+                conn.execute("INSERT INTO paths (title) VALUES ('Outer')")
+                with self.db.connection() as inner:
+                    inner.execute("INSERT INTO paths (title) VALUES ('Inner')")
+                raise RuntimeError("boom")
+        with self.db.connection() as conn:
+            count = conn.execute("SELECT COUNT(*) FROM paths").fetchone()[0]
+        self.assertEqual(count, 0)
+
+    def test_unpooled_connection(self):
+        """Test that unpooled mode opens and closes per call."""
+        db = Database(self.temp_file.name, pooled=False)
+        with db.connection():
+            pass
+        with db.connection():
+            pass
+        stats = db.pool_stats
+        self.assertEqual(stats['connections_opened'], 2)
+        self.assertEqual(stats['connections_closed'], 2)
+        self.assertEqual(stats['open_connections'], 0)
+
+    def test_backup(self):
+        """Test that backup includes data still in the WAL."""
+        with self.db.connection() as conn:
+            conn.execute("INSERT INTO paths (title) VALUES ('Backed up')")
+        backup_path = self.temp_file.name + '.bak'
+        try:
+            self.db.backup(backup_path)
+            backup = Database(backup_path, pooled=False)
+            with backup.connection() as conn:
+                count = conn.execute("SELECT COUNT(*) FROM paths").fetchone()[0]
+            self.assertEqual(count, 1)
+        finally:
+            os.unlink(backup_path)
+
 
 class TestPathModel(unittest.TestCase):
     """Test the Path model."""
@@ -115,6 +332,7 @@ class TestPathRepository(unittest.TestCase):
 
     def tearDown(self):
         """Clean up the temporary database."""
+        self.db.close_all()
         os.unlink(self.temp_file.name)
 
     def test_create_path(self):
@@ -197,6 +415,343 @@ class TestPathRepository(unittest.TestCase):
         tags = self.repo.get_all_tags()
         self.assertEqual(sorted(tags), ['auth', 'setup', 'video'])
 
+    def test_get_summaries(self):
+        """Test listing paths with step counts and thumbnails."""
+        step_repo = StepRepository(self.db)
+        full_id = self.repo.create(Path(title="Full", category="LMS"))
+        empty_id = self.repo.create(Path(title="Empty", category="Admin"))
+        step_repo.create(Step(path_id=full_id, step_number=1))
+        step_repo.create(Step(path_id=full_id, step_number=2, screenshot_path="/tmp/two.png"))
+        step_repo.create(Step(path_id=full_id, step_number=3, screenshot_path="/tmp/three.png"))
+
+        summaries = {s.id: s for s in self.repo.get_summaries(include_thumbnails=True)}
+        self.assertEqual(summaries[full_id].step_count, 3)
+        self.assertEqual(summaries[full_id].thumbnail_path, "/tmp/two.png")
+        self.assertEqual(summaries[empty_id].step_count, 0)
+        self.assertIsNone(summaries[empty_id].thumbnail_path)
+
+        lms = self.repo.get_summaries(category="LMS")
+        self.assertEqual([s.path.title for s in lms], ["Full"])
+
+
+class TestPathTags(unittest.TestCase):
+    """Test the normalized path_tags table."""
+
+    def setUp(self):
+        """Create a temporary data service."""
+        self.temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        self.temp_file.close()
+        self.service = DataService(self.temp_file.name)
+        self.repo = self.service._path_repo
+
+    def tearDown(self):
+        """Clean up the temporary database."""
+        self.service.db.close_all()
+        os.unlink(self.temp_file.name)
+
+    def test_get_by_tag_exact(self):
+        """Test that tag filtering doesn't match substrings."""
+        self.repo.create(Path(title="P1", tags="setup, auth"))
+        self.repo.create(Path(title="P2", tags="setup-advanced"))
+
+        self.assertEqual([p.title for p in self.repo.get_by_tag("setup")], ["P1"])
+        self.assertEqual(self.service.get_tag_usage_count("setup"), 1)
+        self.assertEqual(self.service.get_tag_usage_counts()["setup-advanced"], 1)
+
+    def test_get_by_tag_ignores_case(self):
+        """Test that tag filtering is case-insensitive."""
+        self.repo.create(Path(title="P1", tags="Setup"))
+
+        self.assertEqual([p.title for p in self.repo.get_by_tag("setup")], ["P1"])
+        self.assertEqual(self.service.get_tag_usage_count("SETUP"), 1)
+
+    def test_path_tags_stay_out_of_managed_list(self):
+        """Test that tags typed on a path aren't added to the Admin tag list."""
+        self.service.add_tag("official")
+        self.repo.create(Path(title="P1", tags="official, adhoc"))
+
+        self.assertEqual([t['name'] for t in self.service.get_managed_tags()], ["official"])
+        self.assertEqual(self.repo.get_all_tags(), ["adhoc", "official"])
+
+        # Adding an ad-hoc tag in Admin keeps its links
+        tag_id = self.service.add_tag("adhoc")
+        self.assertEqual(len(self.service.get_managed_tags()), 2)
+        self.assertEqual(self.service.get_tag_usage_counts()["adhoc"], 1)
+        self.assertIn(tag_id, [t['id'] for t in self.service.get_managed_tags()])
+
+    def test_update_relinks_tags(self):
+        """Test that updating a path's tag string updates its links."""
+        path = Path(title="P1", tags="old")
+        self.repo.create(path)
+        path.tags = "new"
+        self.repo.update(path)
+
+        self.assertEqual(self.repo.get_all_tags(), ["new"])
+        self.assertEqual(self.repo.get_by_tag("old"), [])
+
+    def test_rename_and_delete_tag(self):
+        """Test that renaming and deleting a tag rewrites path tag strings."""
+        path_id = self.repo.create(Path(title="P1", tags="alpha, beta"))
+        tag_id = self.service.add_tag("alpha")
+
+        self.service.rename_tag(tag_id, "gamma")
+        self.assertEqual(self.repo.get_by_id(path_id).tag_list, ["gamma", "beta"])
+
+        self.service.delete_tag(tag_id)
+        self.assertEqual(self.repo.get_by_id(path_id).tag_list, ["beta"])
+        self.assertEqual(self.repo.get_all_tags(), ["beta"])
+
+    def test_backfill_from_tag_strings(self):
+        """Test that existing tag strings are migrated into path_tags."""
+        with self.service.db.connection() as conn:
+            conn.execute("DROP TABLE path_tags")
+            conn.execute("DELETE FROM schema_version WHERE version >= 2")
+            conn.execute("INSERT INTO paths (title, tags) VALUES ('Legacy', 'video, setup')")
+        self.service.db.initialize()
+
+        self.assertEqual([p.title for p in self.repo.get_by_tag("video")], ["Legacy"])
+
+    def test_mixed_case_tags(self):
+        """Test that tags differing only in case are one tag."""
+        path_id = self.repo.create(Path(title="P1", tags="python"))
+        self.repo.create(Path(title="P2", tags="PYTHON, Web"))
+        tag_id = self.service.add_tag("Python")
+
+        self.assertEqual(self.service.get_tag_usage_counts(), {"python": 2, "Web": 1})
+        self.assertEqual([t['id'] for t in self.service.get_managed_tags()], [tag_id])
+        self.assertEqual(self.repo.get_all_tags(), ["python", "Web"])
+
+        self.service.rename_tag(tag_id, "py")
+        self.assertEqual(self.repo.get_by_id(path_id).tag_list, ["py"])
+        self.assertEqual(sorted(p.title for p in self.repo.get_by_tag("py")), ["P1", "P2"])
+        self.service.delete_tag(tag_id)
+        self.assertEqual(self.service.get_tag_usage_counts(), {"Web": 1})
+        self.assertEqual(self.repo.get_all_tags(), ["Web"])
+
+    def test_migration_merges_case_duplicates(self):
+        """Test that upgrading merges tags that differ only in case."""
+        with self.service.db.connection() as conn:
+            conn.execute("DROP INDEX idx_tags_name_nocase")
+            conn.execute("DELETE FROM schema_version WHERE version >= 5")
+            conn.execute("INSERT INTO paths (id, title, tags) VALUES (1, 'P1', 'python'), (2, 'P2', 'Python')")
+            conn.execute("INSERT INTO tags (id, name, managed) VALUES (1, 'python', 0), (2, 'Python', 0), (3, 'PYTHON', 1)")
+            conn.execute("INSERT INTO path_tags (path_id, tag_id) VALUES (1, 1), (2, 2)")
+        tag_id = 3
+        self.service.db.initialize()
+
+        self.assertEqual(self.repo.get_tag_counts(), {"PYTHON": 2})
+        self.assertEqual(self.service.get_managed_tags(), [{'id': tag_id, 'name': "PYTHON"}])
+
+    def test_rename_onto_unmanaged_tag(self):
+        """Test that renaming onto a tag only paths use merges the two."""
+        first = self.repo.create(Path(title="P1", tags="old"))
+        second = self.repo.create(Path(title="P2", tags="Docs, extra"))
+        tag_id = self.service.add_tag("old")
+
+        self.assertTrue(self.service.rename_tag(tag_id, "docs"))
+        managed = self.service.get_managed_tags()
+        self.assertEqual([t['name'] for t in managed], ["docs"])
+        self.assertNotEqual(managed[0]['id'], tag_id)
+        self.assertEqual(self.repo.get_by_id(first).tag_list, ["docs"])
+        self.assertEqual(self.repo.get_by_id(second).tag_list, ["Docs", "extra"])
+        self.assertEqual(self.service.get_tag_usage_counts(), {"docs": 2, "extra": 1})
+
+        other = self.service.add_tag("other")
+        with self.assertRaises(sqlite3.IntegrityError):
+            self.service.rename_tag(other, "DOCS")
+
+
+class TestFullTextSearch(unittest.TestCase):
+    """Test the FTS5 search index."""
+
+    def setUp(self):
+        """Create a temporary database with a few paths and steps."""
+        self.temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        self.temp_file.close()
+        self.db = Database(self.temp_file.name)
+        self.db.initialize()
+        if not self.db.fts_enabled:
+            self.skipTest("SQLite built without FTS5")
+        self.path_repo = PathRepository(self.db)
+        self.step_repo = StepRepository(self.db)
+
+        self.vpn_id = self.path_repo.create(Path(title="Connect to VPN"))
+        self.step_repo.create(Step(path_id=self.vpn_id, step_number=1,
+                                   instructions="Open the client"))
+        self.step_repo.create(Step(path_id=self.vpn_id, step_number=2,
+                                   instructions="Enter the gateway address"))
+        self.other_id = self.path_repo.create(Path(title="Gateway settings",
+                                                   description="Admin only"))
+
+    def tearDown(self):
+        """Clean up the temporary database."""
+        self.db.close_all()
+        os.unlink(self.temp_file.name)
+
+    def test_search_step_instructions(self):
+        """Test that step instructions are searchable."""
+        results = self.path_repo.search_ranked("client")
+        self.assertEqual([r.id for r in results], [self.vpn_id])
+
+    def test_title_ranks_above_steps(self):
+        """Test that title matches outrank step matches."""
+        results = self.path_repo.search_ranked("gateway")
+        self.assertEqual([r.id for r in results], [self.other_id, self.vpn_id])
+
+    def test_prefix_and_snippet(self):
+        """Test prefix matching and highlighted snippets."""
+        results = self.path_repo.search_ranked("gatew", highlight_start="[", highlight_end="]")
+        snippets = {r.id: r.snippet for r in results}
+        self.assertIn("[gateway]", snippets[self.vpn_id])
+
+    def test_index_follows_updates(self):
+        """Test that edits and deletes keep the index in sync."""
+        step = self.step_repo.get_by_path_id(self.vpn_id)[0]
+        step.instructions = "Launch the tunnel app"
+        self.step_repo.update(step)
+        self.assertEqual(self.path_repo.search_ranked("client"), [])
+        self.assertEqual(len(self.path_repo.search_ranked("tunnel")), 1)
+
+        self.path_repo.delete(self.vpn_id)
+        self.assertEqual(self.path_repo.search_ranked("tunnel"), [])
+        with self.db.connection() as conn:
+            count = conn.execute("SELECT COUNT(*) FROM path_search").fetchone()[0]
+        self.assertEqual(count, 1)
+
+    def test_step_writes_queue_one_refresh(self):
+        """Test that step writes only queue their path for reindexing."""
+        self.path_repo.search_ranked("vpn")  # Index the setUp paths
+        path_id = self.path_repo.create(Path(title="Long path"))
+        self.step_repo.create_bulk([
+            Step(path_id=path_id, step_number=i, instructions=f"step {i} printer")
+            for i in range(1, 51)
+        ])
+        with self.db.connection() as conn:
+            dirty = [row[0] for row in conn.execute("SELECT path_id FROM path_search_dirty")]
+        self.assertEqual(dirty, [path_id])
+
+        self.assertEqual([r.id for r in self.path_repo.search_ranked("printer")], [path_id])
+        with self.db.connection() as conn:
+            self.assertIsNone(conn.execute("SELECT 1 FROM path_search_dirty").fetchone())
+
+    def test_substring_fallback(self):
+        """Test that queries with no word matches fall back to substrings."""
+        hello_id = self.path_repo.create(Path(title="hello world"))
+        self.assertEqual([p.id for p in self.path_repo.search("ell")], [hello_id])
+        self.assertEqual([s.id for s in self.path_repo.get_summaries(query="ell")], [hello_id])
+        # Word matches are preferred when there are any
+        self.assertEqual([p.id for p in self.path_repo.search("hello")], [hello_id])
+
+    def test_operators_are_literal(self):
+        """Test that FTS syntax in user input doesn't raise."""
+        self.assertEqual(self.path_repo.search_ranked('"vpn OR ('), [])
+        self.assertEqual(len(self.path_repo.search_ranked('vpn" OR')), 0)
+
+    def test_summaries_search(self):
+        """Test that summary listings use the index."""
+        summaries = self.path_repo.get_summaries(query="gateway")
+        self.assertEqual([s.id for s in summaries], [self.other_id, self.vpn_id])
+        self.assertEqual(summaries[1].step_count, 2)
+
+    def test_backfill_existing_database(self):
+        """Test that an index created on an existing database is populated."""
+        with self.db.connection() as conn:
+            conn.execute("DROP TABLE path_search")
+            conn.execute("DELETE FROM schema_version WHERE version >= 3")
+        self.db.initialize()
+        self.assertEqual(len(self.path_repo.search_ranked("client")), 1)
+
+
+class TestLegacyDocumentIndex(unittest.TestCase):
+    """Test the cached team folder scanner."""
+
+    def setUp(self):
+        """Create a temporary database and team folder."""
+        self.temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        self.temp_file.close()
+        self.db = Database(self.temp_file.name)
+        self.db.initialize()
+        self.index = LegacyDocumentIndex(self.db)
+        self.folder = tempfile.mkdtemp()
+        self._write("guide.docx")
+        self._write("How-tos/setup.pdf")
+        self._write("notes.md")
+        self._write(".hidden/secret.pdf")
+        self._write("converted/deck/deck.pdf")
+
+    def tearDown(self):
+        """Clean up the temporary database and folder."""
+        self.db.close_all()
+        os.unlink(self.temp_file.name)
+        shutil.rmtree(self.folder)
+
+    def _write(self, relpath, data=b"x"):
+        filepath = os.path.join(self.folder, relpath)
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        with open(filepath, 'wb') as f:
+            f.write(data)
+        return filepath
+
+    def _names(self, index=None):
+        return sorted(doc.filename for doc in (index or self.index).scan(self.folder))
+
+    def test_scan_recurses_into_subfolders(self):
+        """Test that subfolders are scanned and skipped folders ignored."""
+        self.assertEqual(self._names(), ["guide.docx", "setup.pdf"])
+
+    def test_picks_up_added_and_removed_files(self):
+        """Test that changed folders are re-listed on the next scan."""
+        self._names()
+        self._write("How-tos/More/extra.pptx")
+        os.unlink(os.path.join(self.folder, "guide.docx"))
+
+        self.assertEqual(self._names(), ["extra.pptx", "setup.pdf"])
+
+        shutil.rmtree(os.path.join(self.folder, "How-tos"))
+        self.assertEqual(self._names(), [])
+
+    def test_unchanged_folders_are_not_relisted(self):
+        """Test that a scan of an unchanged tree only stats directories."""
+        self._names()
+        with unittest.mock.patch('os.scandir') as scandir:
+            self.assertEqual(self._names(), ["guide.docx", "setup.pdf"])
+        scandir.assert_not_called()
+
+    def test_invalidate_refreshes_modified_file(self):
+        """Test that invalidating a file re-reads its size."""
+        self._names()
+        filepath = self._write("guide.docx", b"longer contents")
+        self.index.invalidate(filepath)
+
+        doc = next(d for d in self.index.scan(self.folder) if d.filename == "guide.docx")
+        self.assertEqual(doc.size_bytes, len(b"longer contents"))
+
+    def test_check_files_finds_in_place_edits(self):
+        """Test that check_files catches edits without re-listing unchanged folders."""
+        self._names()
+        filepath = os.path.join(self.folder, "guide.docx")
+        with open(filepath, 'ab') as f:  # Doesn't change the folder's mtime
+            f.write(b" more")
+
+        # A plain scan only stats folders and misses the edit
+        with unittest.mock.patch('os.scandir') as scandir:
+            self.index.scan(self.folder)
+        scandir.assert_not_called()
+
+        # Only the edited document's folder is re-listed
+        with unittest.mock.patch.object(self.index, '_relist', wraps=self.index._relist) as relist:
+            docs = self.index.scan(self.folder, check_files=True)
+        self.assertEqual([call.args[0] for call in relist.call_args_list], [os.path.dirname(filepath)])
+        doc = next(d for d in docs if d.filename == "guide.docx")
+        self.assertEqual(doc.size_bytes, len(b"x more"))
+
+    def test_index_persists_between_instances(self):
+        """Test that a new index loads the stored scan instead of re-listing."""
+        self._names()
+        with unittest.mock.patch('os.scandir') as scandir:
+            self.assertEqual(self._names(LegacyDocumentIndex(self.db)), ["guide.docx", "setup.pdf"])
+        scandir.assert_not_called()
+
 
 class TestStepRepository(unittest.TestCase):
     """Test the StepRepository class."""
@@ -216,6 +771,7 @@ class TestStepRepository(unittest.TestCase):
 
     def tearDown(self):
         """Clean up the temporary database."""
+        self.db.close_all()
         os.unlink(self.temp_file.name)
 
     def test_create_step(self):
@@ -300,6 +856,80 @@ class TestStepRepository(unittest.TestCase):
         self.assertEqual(len(all_steps), 3)
 
 
+class TestAnnotationLayerCleanup(unittest.TestCase):
+    """Test that annotation layers go when their screenshot is no longer used."""
+
+    def setUp(self):
+        """Create a temporary data service and screenshot folder."""
+        self.temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        self.temp_file.close()
+        self.service = DataService(self.temp_file.name)
+        self.folder = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Clean up the temporary database and folder."""
+        self.service.db.close_all()
+        os.unlink(self.temp_file.name)
+        shutil.rmtree(self.folder)
+
+    def _shot(self, name):
+        """Create an annotated screenshot and return its path."""
+        image_path = os.path.join(self.folder, f"{name}.png")
+        for path in (image_path, annotation_layers.original_path(image_path),
+                     annotation_layers.sidecar_path(image_path), annotation_layers.clean_path(image_path)):
+            with open(path, 'wb') as f:
+                f.write(b"x")
+        return image_path
+
+    def _has_layers(self, image_path):
+        self.assertTrue(os.path.exists(image_path))
+        return os.path.exists(annotation_layers.sidecar_path(image_path))
+
+    def _path(self, *screenshots):
+        path_id = self.service.create_path(Path(title="P"))
+        for i, screenshot in enumerate(screenshots, start=1):
+            self.service.create_step(Step(path_id=path_id, step_number=i, screenshot_path=screenshot))
+        return path_id
+
+    def test_delete_step(self):
+        """Test that deleting a step removes its screenshot's layers."""
+        shot = self._shot("a")
+        path_id = self._path(shot)
+        step = self.service.get_steps_for_path(path_id)[0]
+
+        self.assertTrue(self.service.delete_step(step.id))
+        self.assertFalse(self._has_layers(shot))
+        self.assertFalse(os.path.exists(annotation_layers.original_path(shot)))
+        self.assertFalse(os.path.exists(annotation_layers.clean_path(shot)))
+
+    def test_shared_screenshot(self):
+        """Test that a duplicated path keeps the layers until its last user goes."""
+        shot = self._shot("a")
+        path_id = self._path(shot)
+        copy_id = self.service.duplicate_path(path_id)
+
+        self.service.delete_path(path_id)
+        self.assertTrue(self._has_layers(shot))
+        self.service.delete_path(copy_id)
+        self.assertFalse(self._has_layers(shot))
+
+    def test_replaced_screenshot(self):
+        """Test that replacing or dropping screenshots on save removes their layers."""
+        old, new, kept = self._shot("old"), self._shot("new"), self._shot("kept")
+        path_id = self._path(old, kept)
+        path = self.service.get_path(path_id)
+
+        self.service.save_path_with_steps(path, [Step(path_id=path_id, step_number=1, screenshot_path=new)])
+        self.assertFalse(self._has_layers(old))
+        self.assertFalse(self._has_layers(kept))
+        self.assertTrue(self._has_layers(new))
+
+        step = self.service.get_steps_for_path(path_id)[0]
+        step.screenshot_path = old
+        self.service.update_step(step)
+        self.assertFalse(self._has_layers(new))
+
+
 if __name__ == '__main__':
     print("Running FlowPath Persistence Layer Tests...")
     print("=" * 60)
@@ -0,0 +1,440 @@
+"""
+Tests for the FlowPath background services.
+
+Run with: python -m pytest tests/test_services.py -v
+Or simply: python tests/test_services.py
+"""
+
+import os
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+import unittest.mock
+from datetime import datetime
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt6.QtCore import QSize
+from PyQt6.QtGui import QColor, QImage
+from PyQt6.QtWidgets import QApplication
+
+from flowpath.models import LegacyDocument
+from flowpath.services import batch_converter
+from flowpath.services.batch_converter import BatchConverter
+from flowpath.services import office_server
+from flowpath.services.converter import ConversionResult, LegacyConverter
+from flowpath.services.office_server import OfficeServer, OfficeServerUnavailable
+from flowpath.services.thumbnail_cache import ThumbnailCache
+
+
+def setUpModule():
+    """Queued signals need an application; run it offscreen."""
+    global _app
+    _app = QApplication.instance() or QApplication([])
+
+
+def _wait_for(condition, timeout=10.0):
+    """Process events until condition() holds."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("timed out")
+        QApplication.processEvents()
+        time.sleep(0.005)
+
+
+class TestThumbnailCache(unittest.TestCase):
+    """Test the in-memory and disk thumbnail caches."""
+
+    SIZE = QSize(50, 50)
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.folder, 'cache')
+        self.cache = self._cache()
+
+    def tearDown(self):
+        self.cache.clear()
+        shutil.rmtree(self.folder)
+
+    def _cache(self):
+        cache = ThumbnailCache(self.cache_dir)
+        cache.thumbnail_ready.connect(lambda path, size, pixmap: self.ready.append((path, pixmap)))
+        self.ready = []
+        return cache
+
+    def _image(self, name, color='red', size=100):
+        path = os.path.join(self.folder, f"{name}.png")
+        image = QImage(size, size, QImage.Format.Format_RGB32)
+        image.fill(QColor(color))
+        image.save(path)
+        return path
+
+    def _load(self, path, cache=True):
+        """Request a thumbnail and wait for it."""
+        pixmap = self.cache.thumbnail(path, self.SIZE, cache)
+        if pixmap is None:
+            count = len(self.ready)
+            _wait_for(lambda: len(self.ready) > count)
+            pixmap = self.ready[-1][1]
+        self.cache._pool.waitForDone()  # Disk cache writes
+        return pixmap
+
+    def _disk_files(self):
+        return [name for name in os.listdir(self.cache_dir) if name.endswith('.png')]
+
+    def test_decodes_at_target_size(self):
+        """Test that a thumbnail is scaled down and then served from memory."""
+        path = self._image('a')
+        pixmap = self._load(path)
+        self.assertEqual(pixmap.size(), self.SIZE)
+        self.assertEqual(self.cache.thumbnail(path, self.SIZE).cacheKey(), pixmap.cacheKey())
+
+    def test_missing_file(self):
+        """Test that a missing file gives a null pixmap right away."""
+        pixmap = self.cache.thumbnail(os.path.join(self.folder, 'none.png'), self.SIZE)
+        self.assertTrue(pixmap.isNull())
+
+    def test_lru_eviction(self):
+        """Test that the least recently used thumbnails go first."""
+        paths = [self._image(name) for name in 'abc']
+        first = self._load(paths[0])
+        self.cache.MEMORY_LIMIT_BYTES = 2 * ThumbnailCache._cost(first)
+        self._load(paths[1])
+        self.cache.thumbnail(paths[0], self.SIZE)  # Touch a, so b is oldest
+        self._load(paths[2])
+
+        self.assertIsNotNone(self.cache.thumbnail(paths[0], self.SIZE))
+        self.assertIsNotNone(self.cache.thumbnail(paths[2], self.SIZE))
+        self.assertIsNone(self.cache.thumbnail(paths[1], self.SIZE))
+        self.assertLessEqual(self.cache._memory_bytes, self.cache.MEMORY_LIMIT_BYTES)
+
+    def test_memory_budget_keeps_latest(self):
+        """Test that a thumbnail over the whole budget is still kept on its own."""
+        self.cache.MEMORY_LIMIT_BYTES = 1
+        paths = [self._image(name) for name in 'ab']
+        for path in paths:
+            self._load(path)
+        self.assertEqual(list(key[0] for key in self.cache._pixmaps), [paths[1]])
+        self.assertEqual(self.cache._memory_bytes, ThumbnailCache._cost(self.cache._pixmaps.popitem()[1]))
+
+    def test_disk_cache(self):
+        """Test that a new cache reads thumbnails back from disk."""
+        path = self._image('a', 'red')
+        self._load(path)
+        self.assertEqual(len(self._disk_files()), 1)
+
+        # Same mtime, new pixels: a disk hit still shows the old thumbnail
+        stat = os.stat(path)
+        self._image('a', 'blue')
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        self.cache.clear()
+        self.cache = self._cache()
+        pixmap = self._load(path)
+        self.assertEqual(pixmap.toImage().pixelColor(0, 0), QColor('red'))
+
+    def test_uncached_request(self):
+        """Test that cache=False keeps the thumbnail out of memory and off disk."""
+        path = self._image('a')
+        self.assertFalse(self._load(path, cache=False).isNull())
+        self.assertEqual(self._disk_files(), [])
+        self.assertEqual(len(self.cache._pixmaps), 0)
+
+    def test_request_upgraded_to_cached(self):
+        """Test that a cached request joining an uncached one gets it written to disk."""
+        path = self._image('a')
+        self.assertIsNone(self.cache.thumbnail(path, self.SIZE, cache=False))
+        self.assertIsNone(self.cache.thumbnail(path, self.SIZE, cache=True))
+        _wait_for(lambda: self.ready)
+        self.cache._pool.waitForDone()
+        self.assertEqual(len(self.ready), 1)
+        self.assertEqual(len(self._disk_files()), 1)
+        self.assertIsNotNone(self.cache.thumbnail(path, self.SIZE))
+
+    def test_prune_disk_cache(self):
+        """Test that pruning keeps the disk cache under its limit, newest first."""
+        paths = [self._image(name) for name in 'abc']
+        for path in paths:
+            self._load(path)
+            time.sleep(0.01)
+        sizes = sorted(os.path.getsize(os.path.join(self.cache_dir, f)) for f in self._disk_files())
+        self.cache.DISK_LIMIT_BYTES = sizes[-1] * 2
+        self.cache.prune_disk_cache()
+        self.assertEqual(len(self._disk_files()), 2)
+
+
+class _StubConverter:
+    """Stands in for LegacyConverter, recording what runs at once."""
+
+    lock = threading.Lock()
+    running = []       # Base names being converted right now
+    overlaps = []      # Snapshots of running when a conversion starts
+    release = None     # threading.Event conversions wait for, if set
+
+    def __init__(self, output_dir, profile_dir=None):
+        self.profile_dir = profile_dir
+        self.cancelled = threading.Event()
+
+    def convert(self, filepath):
+        name = os.path.basename(filepath).lower()
+        with self.lock:
+            self.running.append(name)
+            self.overlaps.append(list(self.running))
+        try:
+            if self.release is not None:
+                while not (self.release.is_set() or self.cancelled.is_set()):
+                    time.sleep(0.005)
+            else:
+                time.sleep(0.02)
+        finally:
+            with self.lock:
+                self.running.remove(name)
+        if self.cancelled.is_set():
+            return ConversionResult(success=False, error="Conversion cancelled", cancelled=True)
+        return ConversionResult(success=True, title=name)
+
+    def cancel(self):
+        self.cancelled.set()
+
+
+def _document(filepath):
+    return LegacyDocument(
+        filepath=filepath, filename=os.path.basename(filepath), file_type='word',
+        type_label='Word', modified_at=datetime(2024, 1, 1), size_bytes=1
+    )
+
+
+class TestBatchConverter(unittest.TestCase):
+    """Test BatchConverter scheduling with a stub converter."""
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        _StubConverter.running = []
+        _StubConverter.overlaps = []
+        _StubConverter.release = None
+        patcher = unittest.mock.patch.object(batch_converter, 'LegacyConverter', _StubConverter)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def _batch(self, workers):
+        batch = BatchConverter(self.folder, max_workers=workers, profile_root=self.folder)
+        self.events = []
+        batch.file_started.connect(lambda path: self.events.append(('started', os.path.basename(path))))
+        batch.file_finished.connect(lambda path, result: self.events.append(('finished', os.path.basename(path), result)))
+        batch.progress.connect(lambda done, total: self.events.append(('progress', done, total)))
+        batch.finished.connect(lambda cancelled: self.events.append(('done', cancelled)))
+        self.addCleanup(batch.stop)
+        return batch
+
+    def _results(self):
+        return {event[1]: event[2] for event in self.events if event[0] == 'finished'}
+
+    def test_default_workers_capped(self):
+        """Test that the default number of LibreOffice instances is capped."""
+        with unittest.mock.patch('os.cpu_count', return_value=64):
+            batch = BatchConverter(self.folder, profile_root=self.folder)
+        self.assertEqual(batch.max_workers, BatchConverter.DEFAULT_MAX_WORKERS)
+        batch.stop()
+
+    def test_progress(self):
+        """Test that every document is reported and progress counts up to the total."""
+        batch = self._batch(2)
+        docs = [_document(os.path.join(self.folder, name)) for name in ('a.docx', 'b.pptx', 'c.txt', 'd.pdf')]
+        batch.start(docs)
+        _wait_for(lambda: ('done', False) in self.events)
+
+        self.assertEqual([e[1:] for e in self.events if e[0] == 'progress'], [(i, 3) for i in range(4)])
+        self.assertEqual(set(self._results()), {'a.docx', 'b.pptx', 'c.txt'})  # PDFs aren't convertible
+        self.assertTrue(all(result.success for result in self._results().values()))
+        self.assertEqual(self.events[-1], ('done', False))
+        self.assertFalse(batch.is_running())
+
+    def test_same_name_serialized(self):
+        """Test that documents converting into the same folder never run together."""
+        batch = self._batch(3)
+        docs = [_document(os.path.join(self.folder, sub, name))
+                for sub, name in (('x', 'guide.docx'), ('y', 'Guide.docx'), ('z', 'other.docx'))]
+        batch.start(docs)
+        _wait_for(lambda: ('done', False) in self.events)
+
+        for running in _StubConverter.overlaps:
+            self.assertEqual(len(running), len(set(running)), running)
+        self.assertEqual(len(self._results()), 3)
+
+    def test_servers_stopped_when_finished(self):
+        """Test that the workers' LibreOffice servers are stopped after a batch."""
+        with unittest.mock.patch.object(OfficeServer, 'stop_profiles') as stop_profiles:
+            batch = self._batch(2)
+            batch.start([_document(os.path.join(self.folder, 'a.docx'))])
+            _wait_for(lambda: stop_profiles.called)
+        self.assertEqual(
+            stop_profiles.call_args.args[0],
+            [os.path.join(self.folder, 'worker-0'), os.path.join(self.folder, 'worker-1')]
+        )
+
+    def test_cancel(self):
+        """Test that cancel() stops running and waiting documents, reporting each."""
+        _StubConverter.release = threading.Event()
+        batch = self._batch(1)
+        batch.start([_document(os.path.join(self.folder, f"{name}.docx")) for name in 'abc'])
+        _wait_for(lambda: _StubConverter.running)
+        batch.cancel()
+        _wait_for(lambda: ('done', True) in self.events)
+
+        results = self._results()
+        self.assertEqual(len(results), 3)
+        self.assertTrue(all(result.cancelled and not result.success for result in results.values()))
+        self.assertEqual(len(_StubConverter.overlaps), 1)  # Waiting documents never started
+        self.assertEqual([e[1:] for e in self.events if e[0] == 'progress'][-1], (3, 3))
+
+
+# Stand-in for soffice: listens where --accept says, like a running server.
+# With --convert-to it writes the PDF itself, like a one-off soffice.
+_FAKE_SOFFICE = '''#!{python}
+import os, re, shutil, socket, sys
+args = ' '.join(sys.argv)
+if '--convert-to' in sys.argv:
+    source = sys.argv[-1]
+    outdir = sys.argv[sys.argv.index('--outdir') + 1]
+    shutil.copy(source, os.path.join(outdir, os.path.splitext(os.path.basename(source))[0] + '.pdf'))
+    sys.exit(0)
+if {broken}:
+    sys.exit(1)
+server = socket.create_server(('127.0.0.1', int(re.search(r'port=(\\d+)', args).group(1))))
+while True:
+    server.accept()[0].close()
+'''
+
+# Stand-in for LibreOffice's python running uno_convert.py: "imports uno",
+# answers pings and "converts" by copying, if the server is reachable
+_FAKE_UNO_PYTHON = '''#!{python}
+import shutil, socket, sys
+if sys.argv[1] == '-c':
+    sys.exit(0)
+try:
+    socket.create_connection(('127.0.0.1', int(sys.argv[3])), timeout=2).close()
+except OSError:
+    sys.exit(2)
+if sys.argv[4] != '--ping':
+    shutil.copy(sys.argv[4], sys.argv[5])
+'''
+
+
+def _run(args, timeout):
+    return subprocess.run(args, capture_output=True, timeout=timeout)
+
+
+@unittest.skipUnless(os.name == 'posix', "stand-in scripts need a POSIX shell")
+class TestOfficeServer(unittest.TestCase):
+    """Test the LibreOffice server against stand-in soffice and uno processes."""
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.profile = os.path.join(self.folder, 'profile')
+        self.document = os.path.join(self.folder, 'guide.docx')
+        with open(self.document, 'w') as f:
+            f.write('document')
+        self.soffice = self._script('soffice', _FAKE_SOFFICE.format(python=sys.executable, broken=False))
+        self._script('python', _FAKE_UNO_PYTHON.format(python=sys.executable))
+
+    def tearDown(self):
+        OfficeServer.stop_all()
+        OfficeServer._servers.clear()
+        office_server._uno_pythons.clear()
+        shutil.rmtree(self.folder)
+
+    def _script(self, name, content):
+        path = os.path.join(self.folder, name)
+        with open(path, 'w') as f:
+            f.write(content)
+        os.chmod(path, 0o755)
+        return path
+
+    def _convert(self, server, name='out.pdf'):
+        output = os.path.join(self.folder, name)
+        return server.convert_to_pdf(Path(self.document), Path(output), _run)
+
+    def test_server_reused(self):
+        """Test that conversions with one profile share one running server."""
+        server = OfficeServer.for_profile(self.soffice, self.profile)
+        self.assertIs(OfficeServer.for_profile(self.soffice, self.profile + os.sep), server)
+        self.assertEqual(server.python, os.path.join(self.folder, 'python'))
+
+        self.assertTrue(self._convert(server, 'one.pdf'))
+        pid = server._process.pid
+        self.assertTrue(self._convert(server, 'two.pdf'))
+        self.assertEqual(server._process.pid, pid)
+        self.assertTrue(os.path.exists(os.path.join(self.folder, 'two.pdf')))
+
+    def test_restart_after_kill(self):
+        """Test that a server that died is started again by the next conversion."""
+        server = OfficeServer.for_profile(self.soffice, self.profile)
+        self.assertTrue(self._convert(server))
+        killed = server._process
+        os.killpg(killed.pid, signal.SIGKILL)
+        killed.wait()
+
+        self.assertTrue(self._convert(server, 'again.pdf'))
+        self.assertNotEqual(server._process.pid, killed.pid)
+        self.assertTrue(server.is_available())
+
+    def test_fallback_after_start_failures(self):
+        """Test that a server that won't start is given up on and soffice is run per document."""
+        self.soffice = self._script('soffice', _FAKE_SOFFICE.format(python=sys.executable, broken=True))
+        server = OfficeServer.for_profile(self.soffice, self.profile)
+        for attempt in range(OfficeServer.MAX_START_FAILURES):
+            self.assertTrue(server.is_available())
+            with self.assertRaises(OfficeServerUnavailable):
+                self._convert(server)
+        self.assertFalse(server.is_available())
+
+        converter = LegacyConverter(os.path.join(self.folder, 'converted'), self.profile)
+        converter._soffice = self.soffice
+        with unittest.mock.patch.object(OfficeServer, '_start') as start:
+            pdf = converter._convert_to_pdf(Path(self.document), converter.output_dir)
+        start.assert_not_called()
+        self.assertEqual(pdf, converter.output_dir / 'guide.pdf')
+        self.assertTrue(pdf.exists())
+
+    def test_idle_server_stopped(self):
+        """Test that an unused server is stopped after IDLE_TIMEOUT."""
+        server = OfficeServer.for_profile(self.soffice, self.profile)
+        server.IDLE_TIMEOUT = 1.0
+        self.assertTrue(self._convert(server))
+        process = server._process
+        time.sleep(0.6)
+        self.assertTrue(self._convert(server, 'again.pdf'))  # Restarts the countdown
+        time.sleep(0.6)
+        self.assertIs(server._process, process)
+        self.assertIsNone(process.poll())
+
+        process.wait(timeout=10)
+        self.assertIsNone(server._process)
+        self.assertTrue(self._convert(server, 'later.pdf'))
+
+    def test_stop_profiles(self):
+        """Test that only the servers of the given profiles are stopped."""
+        first = OfficeServer.for_profile(self.soffice, self.profile)
+        second = OfficeServer.for_profile(self.soffice, os.path.join(self.folder, 'other'))
+        self.assertTrue(self._convert(first, 'one.pdf'))
+        self.assertTrue(self._convert(second, 'two.pdf'))
+
+        OfficeServer.stop_profiles([self.profile])
+        self.assertIsNone(first._process)
+        self.assertIsNotNone(second._process)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,489 @@
+"""
+Tests for the FlowPath widgets.
+
+Run with: python -m pytest tests/test_widgets.py -v
+Or simply: python tests/test_widgets.py
+"""
+
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+import unittest.mock
+from datetime import datetime
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt6.QtCore import QPoint, QRect
+from PyQt6.QtGui import QColor, QImage, QPainter, QPixmap
+from PyQt6.QtWidgets import QApplication
+
+from flowpath.models import Path, PathSummary, Step
+from flowpath.services import ThumbnailCache, annotation_layers
+from flowpath.widgets.annotation_editor import (
+    Annotation, AnnotationEditor, AnnotationStore, BlurMode, CanvasCommand, ScaledAnnotationCanvas,
+    Tool, gaussian_blur_region, pixelate_region
+)
+from flowpath.widgets.library_list import LibraryListModel
+from flowpath.widgets.presentation_view import PresentationView
+
+
+def setUpModule():
+    """Widgets need an application; run it offscreen."""
+    global _app
+    _app = QApplication.instance() or QApplication([])
+
+
+def _summary(path_id, steps=0):
+    stamp = datetime(2024, 1, 1)
+    path = Path(id=path_id, title=f"Path {path_id}", created_at=stamp, updated_at=stamp)
+    return PathSummary(path=path, step_count=steps)
+
+
+class TestLibraryListModel(unittest.TestCase):
+    """Test that set_items() emits the minimal row changes."""
+
+    def setUp(self):
+        """Record the model's change signals and replay them on a copy."""
+        self.model = LibraryListModel()
+        self.mirror = []
+        self.events = []
+        self.model.rowsRemoved.connect(self._on_removed)
+        self.model.rowsInserted.connect(self._on_inserted)
+        self.model.dataChanged.connect(self._on_changed)
+        self.model.modelReset.connect(lambda: self.events.append(('reset',)))
+
+    def _on_removed(self, parent, first, last):
+        self.events.append(('remove', first, last))
+        del self.mirror[first:last + 1]
+
+    def _on_inserted(self, parent, first, last):
+        self.events.append(('insert', first, last))
+        self.mirror[first:first] = [self.model.item_at(row) for row in range(first, last + 1)]
+
+    def _on_changed(self, top_left, bottom_right):
+        for row in range(top_left.row(), bottom_right.row() + 1):
+            self.events.append(('change', row))
+            self.mirror[row] = self.model.item_at(row)
+
+    def _load(self, ids):
+        self.model.set_items([_summary(i) for i in ids])
+        self.events.clear()
+
+    def _set(self, items):
+        self.model.set_items(items)
+        self.assertEqual(self.mirror, items)
+        self.assertEqual(self.model.rowCount(), len(items))
+        self.assertNotIn(('reset',), self.events)
+
+    def test_insert(self):
+        """Test that new rows are inserted in place, in runs."""
+        self._load([1, 2, 3])
+        self._set([_summary(i) for i in (1, 7, 8, 2, 3, 9)])
+        self.assertEqual(self.events, [('insert', 1, 2), ('insert', 5, 5)])
+
+    def test_remove(self):
+        """Test that removed rows go in contiguous runs."""
+        self._load([1, 2, 3, 4, 5])
+        self._set([_summary(i) for i in (1, 4)])
+        self.assertEqual(self.events, [('remove', 4, 4), ('remove', 1, 2)])
+
+    def test_move(self):
+        """Test that a moved row is removed and re-inserted; the rest stay."""
+        self._load([1, 2, 3, 4])
+        self._set([_summary(i) for i in (4, 1, 2, 3)])
+        self.assertEqual(self.events, [('remove', 3, 3), ('insert', 0, 0)])
+
+    def test_update(self):
+        """Test that rows whose data changed are refreshed, not replaced."""
+        self._load([1, 2, 3])
+        self._set([_summary(1), _summary(2, steps=5), _summary(3)])
+        self.assertEqual(self.events, [('change', 1)])
+
+    def test_unchanged(self):
+        """Test that setting the same items emits nothing."""
+        self._load([1, 2, 3])
+        self._set([_summary(i) for i in (1, 2, 3)])
+        self.assertEqual(self.events, [])
+
+    def test_shuffles(self):
+        """Test that arbitrary edits end with the model matching the new list."""
+        rng = random.Random(7)
+        ids = list(range(30))
+        self._load(ids)
+        for _ in range(50):
+            ids = rng.sample(range(40), rng.randint(0, 35))
+            self._set([_summary(i, steps=rng.randint(0, 2)) for i in ids])
+
+
+def _image(width, height, color=lambda x, y: QColor(x * 10 % 256, y * 10 % 256, 0)):
+    image = QImage(width, height, QImage.Format.Format_RGB32)
+    for x in range(width):
+        for y in range(height):
+            image.setPixelColor(x, y, color(x, y))
+    return image
+
+
+def _reds(image, y=0):
+    return [image.pixelColor(x, y).red() for x in range(image.width())]
+
+
+class TestPixelate(unittest.TestCase):
+    """Test pixelate_region()."""
+
+    def test_blocks_average_their_own_pixels(self):
+        """Test that each block is the mean of exactly the pixels it covers."""
+        image = _image(10, 4)  # red is 10 * x
+        pixelate_region(image, QRect(0, 0, 10, 4), 4)
+        self.assertEqual(_reds(image), [15] * 4 + [55] * 4 + [85] * 2)
+        self.assertEqual(_reds(image, 3), _reds(image, 0))
+
+    def test_partial_blocks_at_region_edge(self):
+        """Test that cut-off blocks at the right and bottom edges keep their own colour."""
+        image = _image(9, 9, lambda x, y: QColor(255, 255, 255) if x < 8 and y < 8 else QColor(0, 0, 0))
+        pixelate_region(image, QRect(0, 0, 9, 9), 4)
+        self.assertEqual(_reds(image, 0), [255] * 8 + [0])
+        self.assertEqual(_reds(image, 8), [0] * 9)
+
+    def test_blocks_start_at_region(self):
+        """Test that blocks line up with the region, not the image origin."""
+        image = _image(12, 2)
+        pixelate_region(image, QRect(2, 0, 8, 2), 4)
+        self.assertEqual(_reds(image), [0, 10, 35, 35, 35, 35, 75, 75, 75, 75, 100, 110])
+
+    def test_region_outside_image(self):
+        """Test that a region hanging over the border is clipped to the image."""
+        image = _image(6, 6)
+        pixelate_region(image, QRect(-4, -4, 8, 8), 4)
+        self.assertEqual(_reds(image), [15] * 4 + [40, 50])
+        self.assertEqual(image.pixelColor(0, 4).green(), 40)
+
+
+class TestGaussianBlur(unittest.TestCase):
+    """Test gaussian_blur_region()."""
+
+    def _checkerboard(self):
+        return _image(40, 40, lambda x, y: QColor(255, 255, 255) if (x + y) % 2 else QColor(0, 0, 0))
+
+    def test_only_region_changes(self):
+        """Test that pixels outside the region are left alone."""
+        image = self._checkerboard()
+        original = image.copy()
+        gaussian_blur_region(image, QRect(10, 10, 10, 10), 3)
+        for x in range(40):
+            for y in range(40):
+                if not QRect(10, 10, 10, 10).contains(x, y):
+                    self.assertEqual(image.pixel(x, y), original.pixel(x, y))
+        self.assertTrue(all(60 < red < 190 for red in _reds(image, 15)[10:20]))
+
+    def test_region_at_border(self):
+        """Test that a region touching the border is blurred all the way to it."""
+        image = self._checkerboard()
+        gaussian_blur_region(image, QRect(0, 0, 10, 10), 4)
+        corner = [image.pixelColor(x, y).red() for x in range(3) for y in range(3)]
+        self.assertTrue(all(60 < red < 190 for red in corner), corner)
+
+    def test_solid_colour_at_border(self):
+        """Test that the blur doesn't fade out near the image border."""
+        image = _image(30, 30, lambda x, y: QColor(200, 100, 50))
+        gaussian_blur_region(image, QRect(0, 0, 30, 30), 5)
+        for x, y in ((0, 0), (29, 0), (15, 15), (29, 29)):
+            color = image.pixelColor(x, y)
+            self.assertAlmostEqual(color.red(), 200, delta=10)
+            self.assertAlmostEqual(color.green(), 100, delta=10)
+
+
+def _box(x, y, size=40):
+    return Annotation(tool=Tool.RECTANGLE, color=QColor('red'), start=QPoint(x, y), end=QPoint(x + size, y + size))
+
+
+class TestAnnotationStore(unittest.TestCase):
+    """Test the annotation store's spatial index."""
+
+    def test_hit_test_topmost(self):
+        """Test that the last-drawn annotation under a point wins."""
+        store = AnnotationStore([_box(0, 0), _box(20, 20), _box(500, 500)])
+        self.assertEqual(store.hit_test(QPoint(30, 30)), 1)
+        self.assertEqual(store.hit_test(QPoint(5, 5)), 0)
+        self.assertEqual(store.hit_test(QPoint(510, 510)), 2)
+        self.assertIsNone(store.hit_test(QPoint(300, 300)))
+
+    def test_spanning_cells(self):
+        """Test that an annotation straddling cells is found from each of them."""
+        size = AnnotationStore.CELL_SIZE
+        store = AnnotationStore([_box(size - 20, size - 20)])
+        for point in (QPoint(size - 10, size - 10), QPoint(size + 10, size + 10),
+                      QPoint(size - 10, size + 10), QPoint(size + 10, size - 10)):
+            self.assertEqual(store.hit_test(point), 0)
+
+    def test_move_across_cells(self):
+        """Test that refresh() re-indexes an annotation moved in place."""
+        store = AnnotationStore([_box(0, 0), _box(1000, 1000)])
+        store[0].move_by(QPoint(600, 0))
+        store.refresh(0)
+        self.assertIsNone(store.hit_test(QPoint(10, 10)))
+        self.assertEqual(store.hit_test(QPoint(610, 10)), 0)
+        self.assertEqual(store.hit_test(QPoint(1010, 1010)), 1)
+
+    def test_remove_and_replace(self):
+        """Test that deleted and replaced annotations leave the index."""
+        store = AnnotationStore([_box(0, 0), _box(300, 0), _box(600, 0)])
+        del store[0]
+        self.assertIsNone(store.hit_test(QPoint(10, 10)))
+        self.assertEqual(store.hit_test(QPoint(310, 10)), 0)
+        self.assertEqual(store.hit_test(QPoint(610, 10)), 1)
+
+        store[0] = _box(0, 300)
+        self.assertIsNone(store.hit_test(QPoint(310, 10)))
+        self.assertEqual(store.hit_test(QPoint(10, 310)), 0)
+
+        store.insert(0, _box(600, 0))
+        self.assertEqual(store.hit_test(QPoint(610, 10)), 2)
+        self.assertEqual(store.pop(2).start, QPoint(600, 0))
+        self.assertEqual(store.hit_test(QPoint(610, 10)), 0)
+        self.assertEqual(len(store._cells_of), len(store))
+
+    def test_same_object_twice(self):
+        """Test that entries are tracked separately even for one object."""
+        box = _box(0, 0)
+        store = AnnotationStore([box, box])
+        self.assertEqual(store.hit_test(QPoint(10, 10)), 1)
+        del store[1]
+        self.assertEqual(store.hit_test(QPoint(10, 10)), 0)
+
+    def test_freed_annotations(self):
+        """Test that the index isn't confused by recycled objects."""
+        store = AnnotationStore()
+        for i in range(200):
+            store.append(_box(i % 5 * 200, 0))
+            if i % 3:
+                del store[0]
+        for x in range(0, 1000, 200):
+            index = store.hit_test(QPoint(x + 1, 1))
+            expected = max(i for i in range(len(store)) if store[i].start.x() == x)
+            self.assertEqual(index, expected)
+
+
+class TestCanvasHistory(unittest.TestCase):
+    """Test the annotation canvas undo/redo history."""
+
+    def setUp(self):
+        self.canvas = ScaledAnnotationCanvas(QPixmap.fromImage(_image(200, 100)))
+
+    def _arrow(self, x=10):
+        return Annotation(tool=Tool.ARROW, color=QColor('red'), start=QPoint(x, 10), end=QPoint(x + 40, 50))
+
+    def test_command_is_abstract(self):
+        """Test that a command must implement undo and redo."""
+        with self.assertRaises(TypeError):
+            CanvasCommand()
+
+    def test_add_and_remove(self):
+        """Test undoing and redoing added and deleted annotations."""
+        canvas = self.canvas
+        canvas._add_annotation(self._arrow(10), canvas.callout_counter)
+        canvas.add_callout_annotation(QPoint(100, 50))
+        self.assertEqual(canvas.callout_counter, 2)
+
+        canvas.selected_index = 0
+        canvas.delete_selected()
+        self.assertEqual([a.tool for a in canvas.annotations], [Tool.CALLOUT])
+
+        self.assertTrue(canvas.undo())
+        self.assertEqual([a.tool for a in canvas.annotations], [Tool.ARROW, Tool.CALLOUT])
+        self.assertTrue(canvas.undo())
+        self.assertEqual(len(canvas.annotations), 1)
+        self.assertEqual(canvas.callout_counter, 1)
+
+        self.assertTrue(canvas.redo())
+        self.assertEqual(canvas.callout_counter, 2)
+        self.assertEqual(canvas.annotations[1].number, 1)
+        # The restored annotations are indexed for hit-testing again
+        self.assertEqual(canvas._find_annotation_at(QPoint(100, 50)), 1)
+
+    def test_new_edit_clears_redo(self):
+        """Test that an edit after undo discards the undone edits."""
+        canvas = self.canvas
+        canvas._add_annotation(self._arrow(10), canvas.callout_counter)
+        canvas.undo()
+        self.assertTrue(canvas.can_redo())
+        canvas._add_annotation(self._arrow(60), canvas.callout_counter)
+        self.assertFalse(canvas.can_redo())
+        self.assertFalse(canvas.redo())
+
+    def test_blur(self):
+        """Test that undoing a blur restores the pixels and the edit list."""
+        canvas = self.canvas
+        original = canvas.base_pixmap.toImage()
+        canvas.apply_blur(QRect(20, 20, 40, 40))
+        blurred = canvas.base_pixmap.toImage()
+        self.assertNotEqual(blurred, original)
+        self.assertEqual(len(canvas.pixel_edits), 1)
+
+        canvas.undo()
+        self.assertEqual(canvas.base_pixmap.toImage(), original)
+        self.assertEqual(canvas.pixel_edits, [])
+        canvas.redo()
+        self.assertEqual(canvas.base_pixmap.toImage(), blurred)
+        self.assertEqual(canvas.pixel_edits[0]['op'], 'blur')
+
+    def test_crop(self):
+        """Test that undoing a crop restores the image and the annotations."""
+        canvas = self.canvas
+        original = canvas.base_pixmap.toImage()
+        canvas._add_annotation(self._arrow(100), canvas.callout_counter)
+        canvas.apply_crop(QRect(50, 0, 100, 80))
+        self.assertEqual(canvas.base_pixmap.size().width(), 100)
+        self.assertEqual(canvas.annotations[0].start, QPoint(50, 10))
+
+        canvas.undo()
+        self.assertEqual(canvas.base_pixmap.toImage(), original)
+        self.assertEqual(canvas.annotations[0].start, QPoint(100, 10))
+        self.assertEqual(canvas.pixel_edits, [])
+
+        canvas.redo()
+        self.assertEqual(canvas.base_pixmap.toImage(), original.copy(QRect(50, 0, 100, 80)))
+        self.assertEqual(canvas.annotations[0].start, QPoint(50, 10))
+        self.assertEqual(canvas.size().width(), 100)
+
+    def test_history_budget(self):
+        """Test that the oldest edits are dropped once the history is over budget."""
+        canvas = self.canvas
+        canvas.history_budget = 1
+        canvas.apply_blur(QRect(0, 0, 50, 50))
+        canvas.apply_blur(QRect(100, 0, 50, 50))
+        self.assertEqual(len(canvas.undo_stack), 1)  # The latest edit is always kept
+        self.assertEqual(canvas.history_cost, canvas.undo_stack[0].cost)
+
+        canvas.history_budget = canvas.history_cost * 2
+        for x in (0, 50, 100):
+            canvas._add_annotation(self._arrow(x), canvas.callout_counter)
+        self.assertLessEqual(canvas.history_cost, canvas.history_budget)
+        self.assertEqual(len(canvas.undo_stack), 4)
+
+        canvas.apply_blur(QRect(0, 50, 50, 50))
+        self.assertLessEqual(canvas.history_cost, canvas.history_budget)
+        self.assertEqual(type(canvas.undo_stack[0]).__name__, 'AddAnnotationCommand')
+        # Undo stops where the history was trimmed
+        while canvas.undo():
+            pass
+        self.assertEqual(len(canvas.pixel_edits), 2)
+
+
+class TestBlurPreview(unittest.TestCase):
+    """Test the live preview of the Blur tool."""
+
+    def _preview(self, ratio):
+        # White, with a red bottom-right quadrant
+        image = _image(200, 100, lambda x, y: QColor('red') if x >= 100 and y >= 50 else QColor('white'))
+        canvas = ScaledAnnotationCanvas(QPixmap.fromImage(image))
+        canvas.blur_mode = BlurMode.PIXELATE
+        blur = Annotation(tool=Tool.BLUR, color=QColor('red'), start=QPoint(120, 60), end=QPoint(180, 90))
+
+        target = QImage(canvas.size(), QImage.Format.Format_RGB32)
+        target.fill(QColor('black'))
+        with unittest.mock.patch.object(ScaledAnnotationCanvas, 'devicePixelRatioF', return_value=ratio):
+            painter = QPainter(target)
+            canvas._draw_blur_preview(painter, blur, canvas.scale)
+            painter.end()
+        return target
+
+    def test_preview_shows_region(self):
+        """Test that the preview shows the blurred region itself."""
+        self.assertEqual(self._preview(1.0).pixelColor(150, 75).name(), '#ff0000')
+
+    def test_preview_shows_region_on_hidpi(self):
+        """Test that the preview shows the right region at device pixel ratio 2."""
+        preview = self._preview(2.0)
+        self.assertEqual(preview.pixelColor(150, 75).name(), '#ff0000')
+        self.assertEqual(preview.pixelColor(125, 65).name(), '#ff0000')
+        self.assertEqual(preview.pixelColor(175, 85).name(), '#ff0000')
+        self.assertEqual(preview.pixelColor(110, 75).name(), '#000000')  # Nothing drawn outside it
+
+
+class TestAnnotationEditorLayers(unittest.TestCase):
+    """Test how the annotation editor keeps its original and sidecar."""
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.shot = os.path.join(self.folder, "shot.png")
+        _image(60, 40, lambda x, y: QColor('red')).save(self.shot)
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def _annotate(self, x):
+        editor = AnnotationEditor(self.shot)
+        editor.canvas._add_annotation(_box(x, 5, 10), editor.canvas.callout_counter)
+        editor._on_save()
+        return editor
+
+    def test_reopen_replays_layers(self):
+        """Test that a saved screenshot reopens from its original with its annotations."""
+        self._annotate(5)
+        editor = AnnotationEditor(self.shot)
+        self.assertEqual(len(editor.canvas.annotations), 1)
+        self.assertEqual(editor.canvas.base_pixmap.toImage().pixelColor(5, 5), QColor('red'))
+
+    def test_lost_sidecar(self):
+        """Test that edits made without a readable sidecar replace a stale original."""
+        _image(60, 40, lambda x, y: QColor('blue')).save(annotation_layers.original_path(self.shot))
+        with open(annotation_layers.sidecar_path(self.shot), 'w') as f:
+            f.write("not json")
+
+        self._annotate(30)
+        original = QImage(annotation_layers.original_path(self.shot))
+        self.assertEqual(original.pixelColor(0, 0), QColor('red'))
+
+        editor = AnnotationEditor(self.shot)
+        self.assertEqual([a.start.x() for a in editor.canvas.annotations], [30])
+        self.assertEqual(editor.canvas.get_annotated_pixmap().toImage().pixelColor(0, 0), QColor('red'))
+
+
+class TestPresentationView(unittest.TestCase):
+    """Test that the presentation view shows images the cache already has."""
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self._shared = ThumbnailCache._instance
+        ThumbnailCache._instance = ThumbnailCache(os.path.join(self.folder, 'cache'))
+        self.view = PresentationView()
+
+    def tearDown(self):
+        ThumbnailCache._instance.clear()
+        ThumbnailCache._instance = self._shared
+        shutil.rmtree(self.folder)
+
+    def test_missing_screenshot(self):
+        """Test that a missing file is reported instead of loading forever."""
+        self.view.set_steps([Step(path_id=1, step_number=1, screenshot_path=os.path.join(self.folder, 'gone.png'))])
+        self.assertEqual(self.view.image_label.text(), "Screenshot could not be loaded")
+
+    def test_cached_screenshot(self):
+        """Test that an image already in the cache is shown right away."""
+        shot = os.path.join(self.folder, 'shot.png')
+        _image(40, 30).save(shot)
+        cache = ThumbnailCache.instance()
+        size = self.view._current_target_size()
+        ready = []
+        cache.thumbnail_ready.connect(lambda *args: ready.append(args))
+        cache.thumbnail(shot, size)
+        deadline = time.monotonic() + 10
+        while not ready and time.monotonic() < deadline:
+            QApplication.processEvents()
+            time.sleep(0.005)
+
+        self.view.set_steps([Step(path_id=1, step_number=1, screenshot_path=shot)])
+        self.assertIsNotNone(self.view.image_label.pixmap())
+        self.assertFalse(self.view.image_label.pixmap().isNull())
+        self.assertEqual(self.view.image_label.text(), "")
+
+
+if __name__ == '__main__':
+    unittest.main()